@@ -23,11 +23,15 @@ S1000D Applicability Model:
 from __future__ import annotations
 
 import logging
+import math
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -477,6 +481,429 @@ class CCT:
         return "\n".join(lines)
 
 
+# Serial ranges: (from, to); to=None means "AND ON"
+SerialRange = Tuple[int, Optional[int]]
+
+_AND_ON_PATTERN = re.compile(r"(\d+)\s*AND\s*ON")
+
+
+@lru_cache(maxsize=4096)
+def _parse_effectivity(effectivity: str) -> Tuple[SerialRange, ...]:
+    """Parse an effectivity string once; see parse_effectivity_string."""
+    ranges: List[SerialRange] = []
+    
+    # Handle "AND ON" syntax
+    if "AND ON" in effectivity.upper():
+        match = _AND_ON_PATTERN.search(effectivity.upper())
+        if match:
+            return ((int(match.group(1)), None),)
+    
+    # Handle comma-separated ranges
+    for part in effectivity.split(","):
+        part = part.strip()
+        
+        # Handle range (e.g., "001-100")
+        if "-" in part:
+            from_to = part.split("-")
+            try:
+                ranges.append((int(from_to[0]), int(from_to[1])))
+            except (ValueError, IndexError):
+                continue
+        
+        # Handle single value
+        else:
+            try:
+                val = int(part)
+                ranges.append((val, val))
+            except ValueError:
+                continue
+    
+    return tuple(ranges)
+
+
+def _applies_to_product(
+    item_applicability: Dict[str, Any],
+    product: ProductInstance,
+) -> bool:
+    """Check if item applies to a specific product."""
+    # If no applicability specified, applies to all
+    if not item_applicability:
+        return True
+    
+    # Check product list
+    applicable_products = item_applicability.get("products", [])
+    if applicable_products and product.id not in applicable_products:
+        return False
+    
+    # Check property criteria
+    criteria = item_applicability.get("criteria", {})
+    for prop, value in criteria.items():
+        if prop in product.properties:
+            if product.properties[prop] != value:
+                return False
+    
+    return True
+
+
+def _effectivity_matches(
+    item_effectivity: Dict[str, Any],
+    serial_from: int,
+    serial_to: Optional[int],
+) -> bool:
+    """Check if serial range is within item effectivity."""
+    # If no effectivity specified, applies to all
+    if not item_effectivity:
+        return True
+    
+    item_from = item_effectivity.get("from")
+    item_to = item_effectivity.get("to")
+    
+    # Parse effectivity string if present
+    eff_string = item_effectivity.get("string")
+    if eff_string:
+        check_to = serial_to if serial_to is not None else serial_from
+        for range_from, range_to in _parse_effectivity(eff_string):
+            if range_to is None:
+                # "AND ON" - applies from range_from onwards
+                if serial_from >= range_from:
+                    return True
+            elif serial_from <= range_to and check_to >= range_from:
+                return True
+        return False
+    
+    # Simple from/to check
+    if item_from is not None and serial_from < item_from:
+        return False
+    if item_to is not None:
+        check_to = serial_to if serial_to is not None else serial_from
+        if check_to > item_to:
+            return False
+    
+    return True
+
+
+def _product_serial(product: ProductInstance) -> Optional[int]:
+    """Numeric serial number of a product instance, if assigned."""
+    try:
+        return int(product.properties["serialno"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class IntervalIndex:
+    """
+    Static centered interval tree over closed serial ranges.
+    
+    Answers "which ranges contain serial N" (stab) and "which ranges
+    intersect serials A..B" (overlap) in O(log n + k). Each range carries
+    an integer key; open-ended ranges use ``math.inf`` bounds.
+    """
+    
+    def __init__(self, intervals: Iterable[Tuple[float, float, int]]):
+        """
+        Build the tree.
+        
+        Args:
+            intervals: (low, high, key) triples with low <= high
+        """
+        intervals = list(intervals)
+        self._root = self._build(intervals)
+        starts = sorted((low, key) for low, _, key in intervals)
+        self._lows = [low for low, _ in starts]
+        self._low_keys = [key for _, key in starts]
+    
+    def __len__(self) -> int:
+        return len(self._lows)
+    
+    @classmethod
+    def _build(cls, intervals: List[Tuple[float, float, int]]) -> Optional[tuple]:
+        if not intervals:
+            return None
+        
+        lows = sorted(low for low, _, _ in intervals)
+        center = lows[len(lows) // 2]
+        
+        left, here, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        
+        by_low = sorted((low, key) for low, _, key in here)
+        by_high = sorted(((high, key) for _, high, key in here), reverse=True)
+        return (center, by_low, by_high, cls._build(left), cls._build(right))
+    
+    def stab(self, point: float) -> Set[int]:
+        """Keys of ranges containing point."""
+        found: Set[int] = set()
+        node = self._root
+        while node is not None:
+            center, by_low, by_high, left, right = node
+            if point < center:
+                for low, key in by_low:
+                    if low > point:
+                        break
+                    found.add(key)
+                node = left
+            elif point > center:
+                for high, key in by_high:
+                    if high < point:
+                        break
+                    found.add(key)
+                node = right
+            else:
+                found.update(key for _, key in by_low)
+                break
+        return found
+    
+    def overlap(self, low: float, high: float) -> Set[int]:
+        """Keys of ranges intersecting [low, high]."""
+        # Ranges containing low, plus ranges starting inside (low, high]
+        found = self.stab(low)
+        found.update(self._low_keys[bisect_right(self._lows, low):bisect_right(self._lows, high)])
+        return found
+
+
+class ApplicabilityIndex:
+    """
+    Items compiled once for repeated applicability filtering.
+    
+    Product lists and property criteria are indexed by value, and
+    effectivity ranges are held in interval trees, so filtering for a
+    product or serial range looks up the applicable items instead of
+    re-evaluating every item. Results are identical to per-item
+    evaluation; unusual values (non-numeric bounds, unhashable criteria)
+    fall back to it.
+    
+    Example:
+        >>> index = processor.build_index(dm_list)
+        >>> for product_id in processor.pct.instances:
+        ...     result = processor.filter_by_product(index, product_id)
+    """
+    
+    def __init__(self, items: List[Dict[str, Any]]):
+        """
+        Compile items.
+        
+        Args:
+            items: Items (DMs, etc.) with ``applicability`` / ``effectivity``
+        """
+        self.item_ids: List[str] = [
+            item.get("dm_code", item.get("id", "unknown")) for item in items
+        ]
+        
+        # Product applicability
+        self._any_product: Set[int] = set()
+        self._by_product: Dict[Any, Set[int]] = {}
+        self._constrained: Dict[str, Set[int]] = {}          # prop -> items with criterion
+        self._by_value: Dict[Tuple[str, Any], Set[int]] = {}  # (prop, value) -> items
+        self._criteria: Dict[int, Dict[str, Any]] = {}
+        self._product_fallback: Dict[int, Dict[str, Any]] = {}
+        
+        # Effectivity
+        self._always: Set[int] = set()
+        self._effectivity: Dict[int, Dict[str, Any]] = {}
+        self._effectivity_fallback: Set[int] = set()
+        closed: List[Tuple[float, float, int]] = []
+        open_starts: List[Tuple[int, int]] = []
+        bounds: List[Tuple[float, float, int]] = []
+        
+        for index, item in enumerate(items):
+            self._compile_product(index, item.get("applicability", {}))
+            
+            effectivity = item.get("effectivity", {})
+            if not effectivity:
+                self._always.add(index)
+                continue
+            self._effectivity[index] = effectivity
+            
+            eff_string = effectivity.get("string")
+            if eff_string:
+                for low, high in _parse_effectivity(eff_string):
+                    if high is None:
+                        open_starts.append((low, index))
+                    elif low <= high:
+                        closed.append((low, high, index))
+                    else:
+                        self._effectivity_fallback.add(index)
+                continue
+            
+            low, high = effectivity.get("from"), effectivity.get("to")
+            if (low is None or _is_number(low)) and (high is None or _is_number(high)):
+                low = -math.inf if low is None else low
+                high = math.inf if high is None else high
+                if low <= high:
+                    bounds.append((low, high, index))
+            else:
+                self._effectivity_fallback.add(index)
+        
+        self._closed = IntervalIndex(closed)
+        self._bounds = IntervalIndex(bounds)
+        self._ranges = closed + bounds + [(low, math.inf, key) for low, key in open_starts]
+        open_starts.sort()
+        self._open_lows = [low for low, _ in open_starts]
+        self._open_keys = [key for _, key in open_starts]
+    
+    def __len__(self) -> int:
+        return len(self.item_ids)
+    
+    def _compile_product(self, index: int, applicability: Dict[str, Any]) -> None:
+        if not applicability:
+            self._any_product.add(index)
+            return
+        
+        products = applicability.get("products", [])
+        criteria = applicability.get("criteria", {})
+        try:
+            if products and not isinstance(products, (list, tuple, set, frozenset)):
+                raise TypeError("membership test is not set-like")
+            for prop, value in criteria.items():
+                hash(value)
+        except TypeError:
+            self._product_fallback[index] = applicability
+            return
+        
+        if products:
+            for product_id in products:
+                self._by_product.setdefault(product_id, set()).add(index)
+        else:
+            self._any_product.add(index)
+        
+        if criteria:
+            self._criteria[index] = criteria
+            for prop, value in criteria.items():
+                self._constrained.setdefault(prop, set()).add(index)
+                self._by_value.setdefault((prop, value), set()).add(index)
+    
+    def for_product(self, product: ProductInstance) -> List[int]:
+        """
+        Indices of items applicable to a product, in input order.
+        
+        Args:
+            product: PCT product instance
+        """
+        return sorted(self.product_matches(product))
+    
+    def product_matches(self, product: ProductInstance) -> Set[int]:
+        """
+        Indices of items applicable to a product, unordered.
+        
+        Args:
+            product: PCT product instance
+        """
+        applicable = self._any_product | self._by_product.get(product.id, set())
+        
+        for prop, constrained in self._constrained.items():
+            if prop not in product.properties:
+                continue
+            value = product.properties[prop]
+            try:
+                matching = self._by_value.get((prop, value), set())
+            except TypeError:
+                matching = {i for i in constrained if self._criteria[i][prop] == value}
+            applicable -= constrained - matching
+        
+        applicable.update(
+            index for index, applicability in self._product_fallback.items()
+            if _applies_to_product(applicability, product)
+        )
+        return applicable
+    
+    def for_serials(self, serial_from: int, serial_to: Optional[int] = None) -> List[int]:
+        """
+        Indices of items effective for a serial range, in input order.
+        
+        Args:
+            serial_from: Starting serial number
+            serial_to: Ending serial number (default: serial_from)
+        """
+        check_to = serial_to if serial_to is not None else serial_from
+        if check_to < serial_from:
+            # Inverted range: evaluate each item as written
+            return [
+                index for index in range(len(self.item_ids))
+                if index in self._always
+                or _effectivity_matches(self._effectivity[index], serial_from, serial_to)
+            ]
+        
+        applicable = set(self._always)
+        applicable |= self._closed.overlap(serial_from, check_to)
+        applicable.update(self._open_keys[:bisect_right(self._open_lows, serial_from)])
+        if len(self._bounds):
+            applicable |= self._bounds.stab(serial_from) & self._bounds.stab(check_to)
+        applicable.update(
+            index for index in self._effectivity_fallback
+            if _effectivity_matches(self._effectivity[index], serial_from, serial_to)
+        )
+        return sorted(applicable)
+    
+    def sweep_serials(self, serials: Iterable[float]) -> Dict[float, Set[int]]:
+        """
+        Items effective at each serial, in one sweep over all ranges.
+        
+        Range starts and ends are sorted once and swept in serial order,
+        so the per-serial cost is only the size of the answer.
+        
+        Args:
+            serials: Serial numbers (e.g. one per PCT product instance)
+            
+        Returns:
+            Mapping of serial -> indices of effective items
+        """
+        starts = sorted((low, key) for low, _, key in self._ranges)
+        ends = sorted((high, key) for _, high, key in self._ranges)
+        active: Dict[int, int] = {}  # item -> number of ranges covering the sweep point
+        next_start = next_end = 0
+        effective: Dict[float, Set[int]] = {}
+        
+        for serial in sorted(set(serials)):
+            while next_start < len(starts) and starts[next_start][0] <= serial:
+                key = starts[next_start][1]
+                active[key] = active.get(key, 0) + 1
+                next_start += 1
+            while next_end < len(ends) and ends[next_end][0] < serial:
+                key = ends[next_end][1]
+                if active[key] == 1:
+                    del active[key]
+                else:
+                    active[key] -= 1
+                next_end += 1
+            
+            items = self._always.union(active)
+            items.update(
+                index for index in self._effectivity_fallback
+                if _effectivity_matches(self._effectivity[index], serial, None)
+            )
+            effective[serial] = items
+        
+        return effective
+    
+    def to_result(
+        self,
+        applicable: List[int],
+        filter_criteria: Dict[str, Any],
+    ) -> FilterResult:
+        """Build a FilterResult from applicable indices (sorted)."""
+        excluded = bytearray(b"\x01") * len(self.item_ids)
+        for i in applicable:
+            excluded[i] = 0
+        return FilterResult(
+            input_count=len(self.item_ids),
+            output_count=len(applicable),
+            filtered_out=len(self.item_ids) - len(applicable),
+            applicable_items=list(map(self.item_ids.__getitem__, applicable)),
+            excluded_items=list(compress(self.item_ids, excluded)),
+            filter_criteria=filter_criteria,
+        )
+
+
 class ApplicabilityProcessor:
     """
     S1000D Applicability Processor.
@@ -603,16 +1030,30 @@ class ApplicabilityProcessor:
         )
         self.cct.add_condition(cond)
     
+    def build_index(self, items: List[Dict[str, Any]]) -> ApplicabilityIndex:
+        """
+        Compile items once for repeated filtering.
+        
+        Args:
+            items: List of items (DMs, etc.) with applicability/effectivity
+            
+        Returns:
+            ApplicabilityIndex accepted by filter_by_product and
+            filter_by_effectivity in place of the item list
+        """
+        return ApplicabilityIndex(items)
+    
     def filter_by_product(
         self,
-        items: List[Dict[str, Any]],
+        items: Union[List[Dict[str, Any]], ApplicabilityIndex],
         product_id: str,
     ) -> FilterResult:
         """
         Filter items by product applicability.
         
         Args:
-            items: List of items (DMs, etc.) with applicability
+            items: List of items (DMs, etc.) with applicability, or an
+                   index from build_index() when filtering repeatedly
             product_id: Target product identifier
             
         Returns:
@@ -628,31 +1069,19 @@ class ApplicabilityProcessor:
                 filter_criteria={"product_id": product_id},
             )
         
-        applicable = []
-        excluded = []
+        criteria = {"product_id": product_id}
+        if isinstance(items, ApplicabilityIndex):
+            return items.to_result(items.for_product(product), criteria)
         
-        for item in items:
-            item_id = item.get("dm_code", item.get("id", "unknown"))
-            item_applicability = item.get("applicability", {})
-            
-            # Check if item applies to this product
-            if self._item_applies_to_product(item_applicability, product):
-                applicable.append(item_id)
-            else:
-                excluded.append(item_id)
-        
-        return FilterResult(
-            input_count=len(items),
-            output_count=len(applicable),
-            filtered_out=len(excluded),
-            applicable_items=applicable,
-            excluded_items=excluded,
-            filter_criteria={"product_id": product_id},
+        return self._scan(
+            items,
+            lambda item: _applies_to_product(item.get("applicability", {}), product),
+            criteria,
         )
     
     def filter_by_effectivity(
         self,
-        items: List[Dict[str, Any]],
+        items: Union[List[Dict[str, Any]], ApplicabilityIndex],
         serial_from: int,
         serial_to: Optional[int] = None,
     ) -> FilterResult:
@@ -660,21 +1089,42 @@ class ApplicabilityProcessor:
         Filter items by serial number effectivity range.
         
         Args:
-            items: List of items with effectivity
+            items: List of items with effectivity, or an index from
+                   build_index() when filtering repeatedly
             serial_from: Starting serial number
             serial_to: Ending serial number (optional)
             
         Returns:
             FilterResult with applicable items
         """
+        criteria = {
+            "serial_from": serial_from,
+            "serial_to": serial_to,
+        }
+        if isinstance(items, ApplicabilityIndex):
+            return items.to_result(items.for_serials(serial_from, serial_to), criteria)
+        
+        return self._scan(
+            items,
+            lambda item: _effectivity_matches(
+                item.get("effectivity", {}), serial_from, serial_to
+            ),
+            criteria,
+        )
+    
+    def _scan(
+        self,
+        items: List[Dict[str, Any]],
+        predicate: Callable[[Dict[str, Any]], bool],
+        filter_criteria: Dict[str, Any],
+    ) -> FilterResult:
+        """Single-pass filter for one-off queries (no index build)."""
         applicable = []
         excluded = []
         
         for item in items:
             item_id = item.get("dm_code", item.get("id", "unknown"))
-            item_effectivity = item.get("effectivity", {})
-            
-            if self._check_effectivity(item_effectivity, serial_from, serial_to):
+            if predicate(item):
                 applicable.append(item_id)
             else:
                 excluded.append(item_id)
@@ -685,11 +1135,55 @@ class ApplicabilityProcessor:
             filtered_out=len(excluded),
             applicable_items=applicable,
             excluded_items=excluded,
-            filter_criteria={
-                "serial_from": serial_from,
-                "serial_to": serial_to,
-            },
+            filter_criteria=filter_criteria,
+        )
+    
+    def filter_all_products(
+        self,
+        items: Union[List[Dict[str, Any]], ApplicabilityIndex],
+        criteria: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, FilterResult]:
+        """
+        Filter items for every PCT product instance at once.
+        
+        Combines product applicability with serial effectivity at each
+        product's ``serialno``. Effectivity for all products is resolved
+        in a single sweep over the items' serial ranges, so tailoring
+        hundreds of per-MSN publications costs little more than one.
+        Products without a numeric ``serialno`` are filtered by product
+        applicability only.
+        
+        Args:
+            items: List of items, or an index from build_index()
+            criteria: Optional PCT property criteria selecting products
+            
+        Returns:
+            Mapping of product id -> FilterResult, in PCT order
+        """
+        index = items if isinstance(items, ApplicabilityIndex) else self.build_index(items)
+        products = self.pct.find_instances(criteria or {})
+        
+        serials = {product.id: _product_serial(product) for product in products}
+        effective = index.sweep_serials(
+            serial for serial in serials.values() if serial is not None
+        )
+        
+        results: Dict[str, FilterResult] = {}
+        for product in products:
+            serial = serials[product.id]
+            applicable = index.product_matches(product)
+            if serial is not None:
+                applicable &= effective[serial]
+            results[product.id] = index.to_result(
+                sorted(applicable),
+                {"product_id": product.id, "serial": serial},
+            )
+        
+        logger.info(
+            f"Filtered {len(index)} items for {len(results)} products "
+            f"({len(effective)} distinct serials)"
         )
+        return results
     
     def annotate_dm(
         self,
@@ -746,37 +1240,7 @@ class ApplicabilityProcessor:
         Returns:
             List of (from, to) tuples
         """
-        ranges = []
-        
-        # Handle "AND ON" syntax
-        if "AND ON" in effectivity.upper():
-            match = re.search(r"(\d+)\s*AND\s*ON", effectivity.upper())
-            if match:
-                ranges.append((int(match.group(1)), None))
-                return ranges
-        
-        # Handle comma-separated ranges
-        parts = effectivity.split(",")
-        for part in parts:
-            part = part.strip()
-            
-            # Handle range (e.g., "001-100")
-            if "-" in part:
-                from_to = part.split("-")
-                try:
-                    ranges.append((int(from_to[0]), int(from_to[1])))
-                except (ValueError, IndexError):
-                    continue
-            
-            # Handle single value
-            else:
-                try:
-                    val = int(part)
-                    ranges.append((val, val))
-                except ValueError:
-                    continue
-        
-        return ranges
+        return list(_parse_effectivity(effectivity))
     
     def generate_act_xml(self) -> str:
         """Generate S1000D ACT XML."""
@@ -796,23 +1260,7 @@ class ApplicabilityProcessor:
         product: ProductInstance,
     ) -> bool:
         """Check if item applies to a specific product."""
-        # If no applicability specified, applies to all
-        if not item_applicability:
-            return True
-        
-        # Check product list
-        applicable_products = item_applicability.get("products", [])
-        if applicable_products and product.id not in applicable_products:
-            return False
-        
-        # Check property criteria
-        criteria = item_applicability.get("criteria", {})
-        for prop, value in criteria.items():
-            if prop in product.properties:
-                if product.properties[prop] != value:
-                    return False
-        
-        return True
+        return _applies_to_product(item_applicability, product)
     
     def _check_effectivity(
         self,
@@ -821,39 +1269,7 @@ class ApplicabilityProcessor:
         serial_to: Optional[int],
     ) -> bool:
         """Check if serial range is within item effectivity."""
-        # If no effectivity specified, applies to all
-        if not item_effectivity:
-            return True
-        
-        item_from = item_effectivity.get("from")
-        item_to = item_effectivity.get("to")
-        
-        # Parse effectivity string if present
-        eff_string = item_effectivity.get("string")
-        if eff_string:
-            ranges = self.parse_effectivity_string(eff_string)
-            for range_from, range_to in ranges:
-                if range_to is None:
-                    # "AND ON" - applies from range_from onwards
-                    if serial_from >= range_from:
-                        return True
-                else:
-                    # Check overlap
-                    if serial_to is None:
-                        serial_to = serial_from
-                    if serial_from <= range_to and serial_to >= range_from:
-                        return True
-            return False
-        
-        # Simple from/to check
-        if item_from is not None and serial_from < item_from:
-            return False
-        if item_to is not None:
-            check_to = serial_to if serial_to is not None else serial_from
-            if check_to > item_to:
-                return False
-        
-        return True
+        return _effectivity_matches(item_effectivity, serial_from, serial_to)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get processor statistics."""
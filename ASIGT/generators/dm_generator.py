@@ -29,9 +29,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from xml.etree import ElementTree as ET
 
+if TYPE_CHECKING:
+    from .icn_handler import ICNHandler
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,6 +192,7 @@ class DMGenerator:
         contract: Dict[str, Any],
         config: Dict[str, Any],
         template_path: Optional[Path] = None,
+        icn_handler: Optional[ICNHandler] = None,
     ):
         """
         Initialize DM Generator.
@@ -197,6 +201,8 @@ class DMGenerator:
             contract: ASIT transformation contract (required)
             config: Generator configuration
             template_path: Path to S1000D XML templates
+            icn_handler: Optional ICN handler whose reference index is
+                         updated from every generated DM
             
         Raises:
             ValueError: If contract is missing or invalid
@@ -207,6 +213,7 @@ class DMGenerator:
         self.contract = contract
         self.config = config
         self.template_path = template_path or Path("ASIGT/s1000d_templates")
+        self.icn_handler = icn_handler
         
         # Extract contract parameters
         self.contract_id = contract.get("id", "UNKNOWN")
@@ -319,14 +326,14 @@ class DMGenerator:
         xml_content = self._serialize_xml(root)
         output_hash = self._compute_hash(xml_content)
         
-        return GenerationResult(
+        return self._index_icn_refs(GenerationResult(
             success=True,
             dm_code=str(dmc),
             xml_content=xml_content,
             source_refs=[source.get("id", "unknown")],
             input_hash=input_hash,
             output_hash=output_hash,
-        )
+        ))
     
     def generate_procedural(
         self,
@@ -365,14 +372,14 @@ class DMGenerator:
         xml_content = self._serialize_xml(root)
         output_hash = self._compute_hash(xml_content)
         
-        return GenerationResult(
+        return self._index_icn_refs(GenerationResult(
             success=True,
             dm_code=str(dmc),
             xml_content=xml_content,
             source_refs=[source.get("id", "unknown")],
             input_hash=input_hash,
             output_hash=output_hash,
-        )
+        ))
     
     def generate_fault_isolation(
         self,
@@ -410,14 +417,14 @@ class DMGenerator:
         xml_content = self._serialize_xml(root)
         output_hash = self._compute_hash(xml_content)
         
-        return GenerationResult(
+        return self._index_icn_refs(GenerationResult(
             success=True,
             dm_code=str(dmc),
             xml_content=xml_content,
             source_refs=[source.get("id", "unknown")],
             input_hash=input_hash,
             output_hash=output_hash,
-        )
+        ))
     
     def generate_ipd(
         self,
@@ -455,14 +462,14 @@ class DMGenerator:
         xml_content = self._serialize_xml(root)
         output_hash = self._compute_hash(xml_content)
         
-        return GenerationResult(
+        return self._index_icn_refs(GenerationResult(
             success=True,
             dm_code=str(dmc),
             xml_content=xml_content,
             source_refs=[source.get("id", "unknown")],
             input_hash=input_hash,
             output_hash=output_hash,
-        )
+        ))
     
     def _build_dmc(self, source: Dict[str, Any], info_code: str) -> DMCode:
         """Build DMC from source artifact."""
@@ -643,6 +650,10 @@ class DMGenerator:
         title = ET.SubElement(figure, "title")
         title.text = source.get("figure_title", "Parts Breakdown")
         
+        if source.get("icn"):
+            graphic = ET.SubElement(figure, "graphic")
+            graphic.set("infoEntityIdent", source["icn"])
+        
         # Parts list
         catalog_seq = ET.SubElement(ipd, "catalogSeqNumber")
         
@@ -660,6 +671,13 @@ class DMGenerator:
         
         return content
     
+    def _index_icn_refs(self, result: GenerationResult) -> GenerationResult:
+        """Update the ICN handler's reference index from a generated DM."""
+        if self.icn_handler is not None:
+            missing = self.icn_handler.index_data_module(result.dm_code, result.xml_content)
+            result.warnings.extend(f"Unregistered ICN referenced: {icn}" for icn in missing)
+        return result
+    
     def _serialize_xml(self, root: ET.Element) -> str:
         """Serialize XML element to string."""
         ET.indent(root, space="  ")
@@ -22,18 +22,35 @@ Supported Formats:
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import mimetypes
+import os
 import shutil
+import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from xml.etree import ElementTree as ET
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Read size for file hashing (hashlib releases the GIL on large buffers)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Linux FICLONE ioctl (btrfs, XFS reflink) for copy-on-write clones
+_FICLONE = 0x40049409
+
 
 class GraphicFormat(Enum):
     """Supported graphic formats."""
@@ -58,13 +75,25 @@ class ICNType(Enum):
     LEGEND = "legend"               # Legend/key graphic
 
 
-@dataclass
+# Frozen (and, on 3.10+, slotted) so ICNCode can key registries and indexes
+_CODE_DATACLASS: Dict[str, bool] = {"frozen": True, "order": True}
+if sys.version_info >= (3, 10):
+    _CODE_DATACLASS["slots"] = True
+
+# Bounded LRU size for ICNCode.from_string()
+ICN_PARSE_CACHE_SIZE = 16384
+
+
+@dataclass(**_CODE_DATACLASS)
 class ICNCode:
     """
     S1000D Information Control Number (ICN) structure.
     
     Format: ICN-CAGE-MODEL-SYSTEM-GRAPHIC-VARIANT-ISSUE
     Example: ICN-00000-HJ1-28-G0001-A-001-01
+    
+    Immutable, hashable and ordered by component; ``from_string`` is
+    memoized and returns a shared instance per distinct ICN string.
     """
     cage_code: str = "00000"        # CAGE code (5 chars)
     model_ident_code: str = "XXX"   # Model identification
@@ -73,36 +102,44 @@ class ICNCode:
     variant_code: str = "A"         # Variant
     issue_number: str = "001"       # Issue number
     security_classification: str = "01"  # Security class
+    _code: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_code", sys.intern(
+            f"ICN-{self.cage_code}-{self.model_ident_code}-{self.system_code}-"
+            f"{self.graphic_number}-{self.variant_code}-{self.issue_number}-"
+            f"{self.security_classification}"
+        ))
     
     def __str__(self) -> str:
         """Generate ICN string representation."""
-        return f"ICN-{self.cage_code}-{self.model_ident_code}-{self.system_code}-{self.graphic_number}-{self.variant_code}-{self.issue_number}-{self.security_classification}"
+        return self._code
+    
+    def __hash__(self) -> int:
+        return hash(self._code)
     
     @classmethod
     def from_string(cls, icn_string: str) -> "ICNCode":
-        """Parse ICN from string representation."""
-        if icn_string.startswith("ICN-"):
-            icn_string = icn_string[4:]
-        
-        parts = icn_string.split("-")
-        if len(parts) < 7:
-            raise ValueError(f"Invalid ICN format: {icn_string}")
-        
-        return cls(
-            cage_code=parts[0],
-            model_ident_code=parts[1],
-            system_code=parts[2],
-            graphic_number=parts[3],
-            variant_code=parts[4],
-            issue_number=parts[5],
-            security_classification=parts[6] if len(parts) > 6 else "01",
-        )
+        """Parse ICN from string representation (cached)."""
+        return _parse_icn_code(icn_string)
     
     def get_filename(self, extension: str = "cgm") -> str:
         """Get standardized filename for this ICN."""
         return f"{self}.{extension.lower()}"
 
 
+@lru_cache(maxsize=ICN_PARSE_CACHE_SIZE)
+def _parse_icn_code(icn_string: str) -> ICNCode:
+    """Parse and intern an ICN string; shared instance per distinct string."""
+    code = icn_string[4:] if icn_string.startswith("ICN-") else icn_string
+    
+    parts = code.split("-")
+    if len(parts) < 7:
+        raise ValueError(f"Invalid ICN format: {code}")
+    
+    return ICNCode(*map(sys.intern, parts[:7]))
+
+
 @dataclass
 class ICNEntry:
     """Registered ICN entry in the graphics database."""
@@ -150,10 +187,187 @@ class ICNRegistrationResult:
     registered_path: Optional[str] = None
     format: Optional[str] = None
     file_hash: Optional[str] = None
+    duplicate_of: Optional[str] = None  # ICN already holding identical content
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
 
+class LinkMode(Enum):
+    """How repository files are materialized."""
+    AUTO = "auto"           # Hard link duplicates, reflink or copy new content
+    HARDLINK = "hardlink"   # Hard link duplicates, copy new content
+    REFLINK = "reflink"     # Copy-on-write clone where supported
+    COPY = "copy"           # Always copy (previous behaviour)
+
+
+class ICNReferenceIndex:
+    """
+    Bidirectional ICN <-> DMC reference index.
+    
+    Maintained incrementally as data modules are generated, so "which DMs
+    use this ICN", "which ICNs does this DM use" and "which ICNs are
+    unreferenced" are lookups instead of scans over every DM.
+    
+    Example:
+        >>> index = ICNReferenceIndex()
+        >>> index.register_icn("ICN-00000-HJ1-28-G0001-A-001-01")
+        >>> index.set_dm_references(
+        ...     "HJ1-A-28-10-00-00A-040A-A", ["ICN-00000-HJ1-28-G0001-A-001-01"]
+        ... )
+        >>> index.dms_for("ICN-00000-HJ1-28-G0001-A-001-01")
+        frozenset({'HJ1-A-28-10-00-00A-040A-A'})
+    """
+    
+    def __init__(self):
+        self._dms_by_icn: Dict[str, Set[str]] = {}
+        self._icns_by_dm: Dict[str, Set[str]] = {}
+        self._registered: Set[str] = set()
+        self._unreferenced: Set[str] = set()
+    
+    def register_icn(self, icn_code: str) -> None:
+        """Track a registered ICN (unreferenced until a DM uses it)."""
+        self._registered.add(icn_code)
+        if not self._dms_by_icn.get(icn_code):
+            self._unreferenced.add(icn_code)
+    
+    def add(self, icn_code: str, dm_code: str) -> bool:
+        """
+        Record that a DM references an ICN.
+        
+        Returns:
+            True if the reference is new
+        """
+        dms = self._dms_by_icn.setdefault(icn_code, set())
+        if dm_code in dms:
+            return False
+        dms.add(dm_code)
+        self._icns_by_dm.setdefault(dm_code, set()).add(icn_code)
+        self._unreferenced.discard(icn_code)
+        return True
+    
+    def discard(self, icn_code: str, dm_code: str) -> bool:
+        """
+        Remove a DM -> ICN reference.
+        
+        Returns:
+            True if the reference existed
+        """
+        dms = self._dms_by_icn.get(icn_code)
+        if not dms or dm_code not in dms:
+            return False
+        dms.remove(dm_code)
+        if not dms:
+            del self._dms_by_icn[icn_code]
+            if icn_code in self._registered:
+                self._unreferenced.add(icn_code)
+        
+        icns = self._icns_by_dm[dm_code]
+        icns.remove(icn_code)
+        if not icns:
+            del self._icns_by_dm[dm_code]
+        return True
+    
+    def set_dm_references(
+        self,
+        dm_code: str,
+        icn_codes: Iterable[str],
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Replace the ICN references of one DM, applying only the difference.
+        
+        Args:
+            dm_code: Data Module code
+            icn_codes: ICNs the current issue of the DM references
+            
+        Returns:
+            Tuple of (added ICNs, removed ICNs)
+        """
+        new = set(icn_codes)
+        old = set(self._icns_by_dm.get(dm_code, ()))
+        
+        for icn_code in old - new:
+            self.discard(icn_code, dm_code)
+        for icn_code in new - old:
+            self.add(icn_code, dm_code)
+        return new - old, old - new
+    
+    def remove_dm(self, dm_code: str) -> Set[str]:
+        """Drop all references of a deleted DM; returns the ICNs it used."""
+        return self.set_dm_references(dm_code, ())[1]
+    
+    def dms_for(self, icn_code: str) -> FrozenSet[str]:
+        """DMs that reference an ICN."""
+        return frozenset(self._dms_by_icn.get(icn_code, ()))
+    
+    def icns_for(self, dm_code: str) -> FrozenSet[str]:
+        """ICNs referenced by a DM."""
+        return frozenset(self._icns_by_dm.get(dm_code, ()))
+    
+    def is_referenced(self, icn_code: str) -> bool:
+        return bool(self._dms_by_icn.get(icn_code))
+    
+    def unreferenced(self) -> FrozenSet[str]:
+        """Registered ICNs that no DM references."""
+        return frozenset(self._unreferenced)
+    
+    def dangling(self) -> FrozenSet[str]:
+        """Referenced ICNs that are not registered."""
+        return frozenset(self._dms_by_icn.keys() - self._registered)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize as {"registered": [...], "references": {dmc: [icn, ...]}}."""
+        return {
+            "registered": sorted(self._registered),
+            "references": {
+                dm_code: sorted(icns)
+                for dm_code, icns in sorted(self._icns_by_dm.items())
+            },
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ICNReferenceIndex":
+        """Rebuild an index from ``to_dict`` output."""
+        index = cls()
+        for icn_code in data.get("registered", []):
+            index.register_icn(icn_code)
+        for dm_code, icn_codes in data.get("references", {}).items():
+            for icn_code in icn_codes:
+                index.add(icn_code, dm_code)
+        return index
+    
+    def save(self, path: Path) -> Path:
+        """Write the index as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+    
+    @classmethod
+    def load(cls, path: Path) -> "ICNReferenceIndex":
+        """Read an index written by ``save``."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def extract_icn_refs(dm: Any) -> Set[str]:
+    """
+    Collect ICNs referenced by ``graphic`` elements of a data module.
+    
+    Args:
+        dm: XML string, bytes or parsed Element
+        
+    Returns:
+        Set of infoEntityIdent values
+    """
+    root = dm if isinstance(dm, ET.Element) else ET.fromstring(dm)
+    return {
+        icn
+        for elem in root.iter()
+        if isinstance(elem.tag, str) and elem.tag.rsplit("}", 1)[-1] == "graphic"
+        for icn in (elem.get("infoEntityIdent"),)
+        if icn
+    }
+
+
 class ICNHandler:
     """
     S1000D Information Control Number Handler.
@@ -161,6 +375,10 @@ class ICNHandler:
     Manages graphics and multimedia content for S1000D publications.
     Handles ICN generation, registration, and reference tracking.
     
+    The registry, ICN counters and content deduplication cover the
+    graphics registered through this handler instance only; files already
+    in ``graphics_path`` from earlier sessions are not hashed or matched.
+    
     Attributes:
         contract: ASIT transformation contract
         config: Handler configuration
@@ -196,6 +414,7 @@ class ICNHandler:
         contract: Dict[str, Any],
         config: Dict[str, Any],
         graphics_path: Optional[Path] = None,
+        allocator: Optional[Any] = None,
     ):
         """
         Initialize ICN Handler.
@@ -204,6 +423,10 @@ class ICNHandler:
             contract: ASIT transformation contract (required)
             config: Handler configuration
             graphics_path: Path to graphics storage
+            allocator: Optional shared sequence allocator with an
+                       ``allocate(key) -> int`` method (e.g.
+                       aerospacemodel.ampel360.SequenceAllocator) so several
+                       processes can number graphics without collisions
             
         Raises:
             ValueError: If contract is missing or invalid
@@ -223,6 +446,17 @@ class ICNHandler:
         # ICN registry
         self._icn_registry: Dict[str, ICNEntry] = {}
         self._icn_counter: Dict[str, int] = {}  # Per-system counter
+        self.allocator = allocator
+        
+        # Bidirectional ICN <-> DMC references
+        self.references = ICNReferenceIndex()
+        
+        # Content-addressed store: file hash -> (first ICN, repository path),
+        # for files stored in this session
+        self._content_index: Dict[str, Tuple[str, Path]] = {}
+        # File hash -> every ICN registered with that content in this session
+        self._hash_index: Dict[str, List[str]] = {}
+        self.link_mode = LinkMode(config.get("link_mode", LinkMode.AUTO.value))
         
         logger.info(
             f"ICNHandler initialized: contract={self.contract_id}, "
@@ -273,82 +507,107 @@ class ICNHandler:
                 errors=[f"Unsupported graphic format: {source_path.suffix}"],
             )
         
-        # Generate ICN
-        system_code = str(ata_chapter).zfill(2)
-        icn = self._generate_icn(system_code)
-        
-        # Calculate file hash
-        file_hash = self._compute_file_hash(source_path)
-        file_size = source_path.stat().st_size
-        
-        # Create registry entry
-        entry = ICNEntry(
-            icn=icn,
-            source_path=source_path,
-            format=graphic_format,
-            icn_type=icn_type,
+        return self._register(
+            source_path,
+            graphic_format,
+            ata_chapter,
             title=title,
             description=description,
-            file_hash=file_hash,
-            file_size_bytes=file_size,
-        )
-        
-        # Copy to repository if requested
-        registered_path = None
-        if copy_to_repository:
-            registered_path = self._copy_to_repository(source_path, icn, graphic_format)
-        
-        # Register ICN
-        self._icn_registry[str(icn)] = entry
-        
-        # Check for format warnings
-        warnings = []
-        if graphic_format not in self.RECOMMENDED_FORMATS:
-            warnings.append(
-                f"Format {graphic_format.value} is not recommended for S1000D. "
-                f"Consider converting to CGM, PNG, or SVG."
-            )
-        
-        return ICNRegistrationResult(
-            success=True,
-            icn=str(icn),
-            source_path=str(source_path),
-            registered_path=str(registered_path) if registered_path else None,
-            format=graphic_format.value,
-            file_hash=file_hash,
-            warnings=warnings,
+            icn_type=icn_type,
+            copy_to_repository=copy_to_repository,
+            file_hash=self._compute_file_hash(source_path),
         )
     
     def register_batch(
         self,
         graphics: List[Dict[str, Any]],
+        workers: Optional[int] = None,
+        copy_to_repository: bool = True,
     ) -> List[ICNRegistrationResult]:
         """
         Register multiple graphics in batch.
         
+        Files are hashed in parallel first; ICNs are then assigned in input
+        order, so numbering matches serial registration. Graphics whose
+        content was already stored by this handler are linked to the
+        existing file instead of copied (see ``link_mode``).
+        
         Args:
             graphics: List of graphic specifications with keys:
                 - source_path: Path to graphic
                 - ata_chapter: ATA chapter
                 - title: Optional title
                 - description: Optional description
+            workers: Hashing threads (default: ThreadPoolExecutor default)
+            copy_to_repository: Whether to store files in the repository
                 
         Returns:
-            List of ICNRegistrationResult
+            List of ICNRegistrationResult, in input order
         """
-        results = []
+        results: List[Optional[ICNRegistrationResult]] = [None] * len(graphics)
+        pending: List[Tuple[int, Path, GraphicFormat]] = []
         
-        for graphic in graphics:
-            result = self.register_graphic(
-                source_path=Path(graphic["source_path"]),
-                ata_chapter=graphic.get("ata_chapter", "00"),
+        for index, graphic in enumerate(graphics):
+            source_path = Path(graphic["source_path"])
+            if not source_path.is_file():
+                results[index] = ICNRegistrationResult(
+                    success=False,
+                    icn="",
+                    source_path=str(source_path),
+                    errors=[f"Source file not found: {source_path}"],
+                )
+                continue
+            
+            graphic_format = self._detect_format(source_path)
+            if graphic_format is None:
+                results[index] = ICNRegistrationResult(
+                    success=False,
+                    icn="",
+                    source_path=str(source_path),
+                    errors=[f"Unsupported graphic format: {source_path.suffix}"],
+                )
+                continue
+            
+            pending.append((index, source_path, graphic_format))
+        
+        # Hash each distinct source file once, in parallel
+        unique_paths = list(dict.fromkeys(path for _, path, _ in pending))
+        if len(unique_paths) > 1 and workers != 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                hashes = dict(zip(unique_paths, pool.map(self._compute_file_hash, unique_paths)))
+        else:
+            hashes = {path: self._compute_file_hash(path) for path in unique_paths}
+        
+        for index, source_path, graphic_format in pending:
+            graphic = graphics[index]
+            results[index] = self._register(
+                source_path,
+                graphic_format,
+                graphic.get("ata_chapter", "00"),
                 title=graphic.get("title", ""),
                 description=graphic.get("description", ""),
                 icn_type=ICNType(graphic.get("icn_type", "figure")),
+                copy_to_repository=copy_to_repository,
+                file_hash=hashes[source_path],
             )
-            results.append(result)
         
-        return results
+        logger.info(
+            f"Registered {len(pending)}/{len(graphics)} graphics "
+            f"({len(unique_paths)} files hashed, {len(self._content_index)} unique contents)"
+        )
+        return results  # type: ignore[return-value]
+    
+    def find_by_hash(self, file_hash: str) -> List[ICNEntry]:
+        """
+        Get all ICNs registered by this handler with the given content hash.
+        
+        Args:
+            file_hash: SHA-256 of the graphic file
+            
+        Returns:
+            List of matching ICNEntry
+        """
+        return [self._icn_registry[icn] for icn in self._hash_index.get(file_hash, [])]
     
     def get_icn(self, icn_code: str) -> Optional[ICNEntry]:
         """
@@ -401,11 +660,78 @@ class ICNHandler:
         """
         entry = self._icn_registry.get(icn_code)
         if entry:
-            if dm_code not in entry.referenced_by:
+            if self.references.add(icn_code, dm_code):
                 entry.referenced_by.append(dm_code)
             return True
         return False
     
+    def update_dm_references(self, dm_code: str, icn_codes: Iterable[str]) -> List[str]:
+        """
+        Set the ICNs referenced by a (re)generated DM.
+        
+        References the DM no longer makes are dropped; only the difference
+        against the previous issue is applied.
+        
+        Args:
+            dm_code: Data Module code
+            icn_codes: ICNs referenced by the DM
+            
+        Returns:
+            ICN codes that are not registered
+        """
+        icn_codes = set(icn_codes)
+        added, removed = self.references.set_dm_references(dm_code, icn_codes)
+        
+        for icn_code in removed:
+            entry = self._icn_registry.get(icn_code)
+            if entry and dm_code in entry.referenced_by:
+                entry.referenced_by.remove(dm_code)
+        for icn_code in added:
+            entry = self._icn_registry.get(icn_code)
+            if entry:
+                entry.referenced_by.append(dm_code)
+        
+        return sorted(icn for icn in icn_codes if icn not in self._icn_registry)
+    
+    def index_data_module(self, dm_code: str, dm: Any) -> List[str]:
+        """
+        Update references from a generated DM's ``graphic`` elements.
+        
+        Args:
+            dm_code: Data Module code
+            dm: DM XML string, bytes or parsed Element
+            
+        Returns:
+            ICN codes that are not registered
+        """
+        return self.update_dm_references(dm_code, extract_icn_refs(dm))
+    
+    def get_referencing_dms(self, icn_code: str) -> FrozenSet[str]:
+        """Get the DMs that reference an ICN."""
+        return self.references.dms_for(icn_code)
+    
+    def get_unreferenced_icns(self) -> FrozenSet[str]:
+        """Get registered ICNs that no DM references."""
+        return self.references.unreferenced()
+    
+    def save_references(self, path: Optional[Path] = None) -> Path:
+        """
+        Persist the reference index next to the graphics repository.
+        
+        Args:
+            path: Target file (default: <graphics_path>/icn_references.json)
+        """
+        return self.references.save(path or self.graphics_path / "icn_references.json")
+    
+    def load_references(self, path: Optional[Path] = None) -> None:
+        """Load a persisted reference index and re-sync entry reference lists."""
+        self.references = ICNReferenceIndex.load(
+            path or self.graphics_path / "icn_references.json"
+        )
+        for icn_code, entry in self._icn_registry.items():
+            self.references.register_icn(icn_code)
+            entry.referenced_by = sorted(self.references.dms_for(icn_code))
+    
     def generate_icn_reference(
         self,
         icn_code: str,
@@ -473,9 +799,13 @@ class ICNHandler:
         """
         Export the ICN registry.
         
+        The reference index is saved alongside (see ``save_references``)
+        so it survives the session with the registry.
+        
         Returns:
             Dictionary of all registered ICNs
         """
+        self.save_references()
         return {
             "contract_id": self.contract_id,
             "model_code": self.model_code,
@@ -485,6 +815,7 @@ class ICNHandler:
                 icn: entry.to_dict()
                 for icn, entry in self._icn_registry.items()
             },
+            "references": self.references.to_dict(),
         }
     
     def validate_references(
@@ -521,15 +852,84 @@ class ICNHandler:
             "invalid_references": invalid,
         }
     
+    def _register(
+        self,
+        source_path: Path,
+        graphic_format: GraphicFormat,
+        ata_chapter: str,
+        title: str,
+        description: str,
+        icn_type: ICNType,
+        copy_to_repository: bool,
+        file_hash: str,
+    ) -> ICNRegistrationResult:
+        """Register a validated graphic whose hash is already known."""
+        # Generate ICN
+        system_code = str(ata_chapter).zfill(2)
+        icn = self._generate_icn(system_code)
+        
+        # Create registry entry
+        entry = ICNEntry(
+            icn=icn,
+            source_path=source_path,
+            format=graphic_format,
+            icn_type=icn_type,
+            title=title,
+            description=description,
+            file_hash=file_hash,
+            file_size_bytes=source_path.stat().st_size,
+        )
+        
+        # Copy to repository if requested
+        registered_path = None
+        duplicate = self._content_index.get(file_hash)
+        if copy_to_repository:
+            registered_path = self._copy_to_repository(
+                source_path, icn, graphic_format, file_hash
+            )
+        
+        # Register ICN
+        self._icn_registry[str(icn)] = entry
+        self._hash_index.setdefault(file_hash, []).append(str(icn))
+        self.references.register_icn(str(icn))
+        
+        # Check for format warnings
+        warnings = []
+        if graphic_format not in self.RECOMMENDED_FORMATS:
+            warnings.append(
+                f"Format {graphic_format.value} is not recommended for S1000D. "
+                f"Consider converting to CGM, PNG, or SVG."
+            )
+        if duplicate:
+            warnings.append(f"Content identical to {duplicate[0]}")
+        
+        return ICNRegistrationResult(
+            success=True,
+            icn=str(icn),
+            source_path=str(source_path),
+            registered_path=str(registered_path) if registered_path else None,
+            format=graphic_format.value,
+            file_hash=file_hash,
+            duplicate_of=duplicate[0] if duplicate else None,
+            warnings=warnings,
+        )
+    
     def _generate_icn(self, system_code: str) -> ICNCode:
         """Generate a new ICN for the given system code."""
-        # Initialize counter for system if needed
-        if system_code not in self._icn_counter:
-            self._icn_counter[system_code] = 0
+        if self.allocator is not None:
+            sequence = self.allocator.allocate(
+                f"ICN:{self.cage_code}:{self.model_code}:{system_code}"
+            )
+        else:
+            # Initialize counter for system if needed
+            if system_code not in self._icn_counter:
+                self._icn_counter[system_code] = 0
+            
+            # Increment counter
+            self._icn_counter[system_code] += 1
+            sequence = self._icn_counter[system_code]
         
-        # Increment counter
-        self._icn_counter[system_code] += 1
-        graphic_number = f"G{self._icn_counter[system_code]:04d}"
+        graphic_number = f"G{sequence:04d}"
         
         return ICNCode(
             cage_code=self.cage_code,
@@ -557,8 +957,15 @@ class ICNHandler:
         source_path: Path,
         icn: ICNCode,
         format: GraphicFormat,
+        file_hash: Optional[str] = None,
     ) -> Path:
-        """Copy graphic file to repository with standardized name."""
+        """
+        Store graphic file in repository with standardized name.
+        
+        Content already stored by this handler (same hash) is hard-linked
+        to the existing file so duplicates take no extra space; new content
+        is reflinked where the filesystem supports it, otherwise copied.
+        """
         # Create repository directory if needed
         repo_dir = self.graphics_path / icn.system_code
         repo_dir.mkdir(parents=True, exist_ok=True)
@@ -567,17 +974,58 @@ class ICNHandler:
         target_filename = icn.get_filename(format.value)
         target_path = repo_dir / target_filename
         
-        # Copy file
-        shutil.copy2(source_path, target_path)
+        existing = self._content_index.get(file_hash) if file_hash else None
+        if existing and existing[1].exists() and self._link(existing[1], target_path):
+            logger.debug(f"Linked {target_path} to {existing[1]}")
+            return target_path
+        
+        self._clone(source_path, target_path)
+        if file_hash:
+            self._content_index[file_hash] = (str(icn), target_path)
         
         logger.info(f"Copied {source_path} to {target_path}")
         return target_path
     
+    def _link(self, existing: Path, target: Path) -> bool:
+        """Hard link target to an existing repository file."""
+        if self.link_mode not in (LinkMode.AUTO, LinkMode.HARDLINK):
+            return False
+        
+        try:
+            if target.exists() or target.is_symlink():
+                if os.path.samefile(existing, target):
+                    return True
+                target.unlink()
+            os.link(existing, target)
+            return True
+        except OSError as e:
+            # Cross-device, unsupported filesystem or link limit reached
+            logger.debug(f"Hard link failed for {target}: {e}")
+            return False
+    
+    def _clone(self, source: Path, target: Path) -> None:
+        """Copy source to target, as a copy-on-write clone when possible."""
+        target.unlink(missing_ok=True)      # never write through a hard link
+        if (
+            self.link_mode in (LinkMode.AUTO, LinkMode.REFLINK)
+            and fcntl is not None
+            and sys.platform.startswith("linux")
+        ):
+            try:
+                with open(source, "rb") as src, open(target, "wb") as dst:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                shutil.copystat(source, target)
+                return
+            except OSError:
+                pass  # Not a reflink-capable filesystem; fall back to copy
+        
+        shutil.copy2(source, target)
+    
     def _compute_file_hash(self, path: Path) -> str:
         """Compute SHA-256 hash of file."""
         sha256_hash = hashlib.sha256()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
     
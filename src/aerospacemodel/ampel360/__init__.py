@@ -21,6 +21,13 @@ from .identifiers import (
     create_identifier,
 )
 
+from .allocation import (
+    SequenceBlock,
+    MemorySequenceStore,
+    SQLiteSequenceStore,
+    SequenceAllocator,
+)
+
 from .pbs_wbs import (
     PBSID,
     WBSID,
@@ -47,6 +54,11 @@ __all__ = [
     "parse_identifier",
     "validate_identifier",
     "create_identifier",
+    # Sequence allocation
+    "SequenceBlock",
+    "MemorySequenceStore",
+    "SQLiteSequenceStore",
+    "SequenceAllocator",
     # PBS/WBS
     "PBSID",
     "WBSID",
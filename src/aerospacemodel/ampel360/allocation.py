@@ -0,0 +1,244 @@
+"""
+AMPEL360 Q100 Sequence Allocation Module
+
+Collision-free sequence numbers for identifiers generated by several
+processes at once (IDGenerator sequences, ICN graphic numbers).
+
+Sequence numbers are reserved in blocks: a worker claims a contiguous
+range from a shared store in one transaction and then hands numbers out
+locally, so there is no round trip per identifier. The SQLite store
+serializes reservations across processes with an IMMEDIATE transaction.
+
+For reproducible numbering, reserve blocks in input order in the parent
+process and pass each block to the worker that handles that chunk.
+
+Author: ASIT (Aircraft Systems Information Transponder)
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+
+@dataclass(frozen=True)
+class SequenceBlock:
+    """A reserved, contiguous range of sequence numbers [start, stop)."""
+    key: str
+    start: int
+    stop: int
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.stop))
+
+    def __contains__(self, sequence: object) -> bool:
+        return isinstance(sequence, int) and self.start <= sequence < self.stop
+
+
+class MemorySequenceStore:
+    """Per-key sequence counters held in process memory."""
+
+    def __init__(self):
+        """Initialize the store."""
+        self._next: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, count: int = 1) -> SequenceBlock:
+        """
+        Reserve the next `count` sequence numbers for a key.
+
+        Args:
+            key: Sequence series key
+            count: Block size (>= 1)
+
+        Returns:
+            Reserved SequenceBlock
+        """
+        if count < 1:
+            raise ValueError(f"Block size must be >= 1, got {count}")
+
+        with self._lock:
+            start = self._next.get(key, 1)
+            self._next[key] = start + count
+        return SequenceBlock(key, start, start + count)
+
+    def peek(self, key: str) -> int:
+        """Return the next unreserved sequence number for a key."""
+        return self._next.get(key, 1)
+
+    def reset(self, key: str) -> None:
+        """Restart a key's sequence at 1."""
+        with self._lock:
+            self._next.pop(key, None)
+
+    def __getstate__(self):
+        return {"_next": dict(self._next)}
+
+    def __setstate__(self, state):
+        self._next = state["_next"]
+        self._lock = threading.Lock()
+
+
+class SQLiteSequenceStore:
+    """
+    Per-key sequence counters in a SQLite database file.
+
+    Safe for concurrent processes on the same host; each reservation is a
+    single IMMEDIATE transaction. A connection is opened per reservation,
+    so instances can be pickled into worker processes.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30.0):
+        """
+        Initialize the store.
+
+        Args:
+            path: Database file (created if missing)
+            timeout: Seconds to wait for the database lock
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sequences "
+                "(key TEXT PRIMARY KEY, next INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+
+    def reserve(self, key: str, count: int = 1) -> SequenceBlock:
+        """
+        Reserve the next `count` sequence numbers for a key.
+
+        Args:
+            key: Sequence series key
+            count: Block size (>= 1)
+
+        Returns:
+            Reserved SequenceBlock
+        """
+        if count < 1:
+            raise ValueError(f"Block size must be >= 1, got {count}")
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT next FROM sequences WHERE key = ?", (key,)
+            ).fetchone()
+            start = row[0] if row else 1
+            conn.execute(
+                "INSERT OR REPLACE INTO sequences (key, next) VALUES (?, ?)",
+                (key, start + count),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        return SequenceBlock(key, start, start + count)
+
+    def peek(self, key: str) -> int:
+        """Return the next unreserved sequence number for a key."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT next FROM sequences WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else 1
+
+    def reset(self, key: str) -> None:
+        """Restart a key's sequence at 1."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM sequences WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+
+SequenceStore = Union[MemorySequenceStore, SQLiteSequenceStore]
+
+
+class SequenceAllocator:
+    """
+    Hand out sequence numbers from locally cached blocks.
+
+    Numbers left in a block when the process exits are skipped, never
+    reused, so identifiers stay unique across workers.
+
+    Example:
+        >>> allocator = SequenceAllocator(SQLiteSequenceStore("build/sequences.db"))
+        >>> allocator.allocate("MSN001:28-10-00:LC02:REQ")
+        1
+    """
+
+    def __init__(self, store: Optional[SequenceStore] = None, block_size: int = 16):
+        """
+        Initialize the allocator.
+
+        Args:
+            store: Backing store (default: in-memory, single process)
+            block_size: Numbers claimed per store round trip
+        """
+        if block_size < 1:
+            raise ValueError(f"Block size must be >= 1, got {block_size}")
+
+        self.store = store if store is not None else MemorySequenceStore()
+        self.block_size = block_size
+        self._blocks: Dict[str, Iterator[int]] = {}
+        self._lock = threading.Lock()
+
+    def allocate(self, key: str) -> int:
+        """
+        Return the next sequence number for a key.
+
+        Args:
+            key: Sequence series key
+
+        Returns:
+            Sequence number unique for the key across all store users
+        """
+        with self._lock:
+            sequence = next(self._blocks.get(key, iter(())), None)
+            if sequence is None:
+                block = iter(self.store.reserve(key, self.block_size))
+                self._blocks[key] = block
+                sequence = next(block)
+            return sequence
+
+    def reserve(self, key: str, count: int) -> SequenceBlock:
+        """Reserve an explicit block from the store (e.g. one per worker chunk)."""
+        return self.store.reserve(key, count)
+
+    def use_block(self, block: SequenceBlock) -> None:
+        """Serve `block.key` from a block reserved elsewhere, replacing any cached one."""
+        with self._lock:
+            self._blocks[block.key] = iter(block)
+
+    def reset(self, key: str) -> None:
+        """Drop the cached block and restart the key's sequence at 1."""
+        with self._lock:
+            self._blocks.pop(key, None)
+            self.store.reset(key)
+
+    def __getstate__(self):
+        # Cached blocks stay with this process; workers claim their own
+        return {"store": self.store, "block_size": self.block_size}
+
+    def __setstate__(self, state):
+        self.store = state["store"]
+        self.block_size = state["block_size"]
+        self._blocks = {}
+        self._lock = threading.Lock()
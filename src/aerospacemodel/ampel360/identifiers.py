@@ -21,6 +21,8 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 from enum import Enum
 
+from .allocation import SequenceAllocator
+
 
 class IDFormat(Enum):
     """Identifier format options."""
@@ -281,9 +283,16 @@ class IDParser:
 class IDGenerator:
     """Generate AMPEL360 Q100 identifiers with auto-sequencing."""
     
-    def __init__(self):
-        """Initialize the ID generator."""
-        self._sequence_counters = {}
+    def __init__(self, allocator: Optional[SequenceAllocator] = None):
+        """
+        Initialize the ID generator.
+        
+        Args:
+            allocator: Sequence allocator; pass one backed by a
+                       SQLiteSequenceStore to share sequences between
+                       processes (default: in-process counters)
+        """
+        self.allocator = allocator or SequenceAllocator(block_size=1)
     
     def _get_base_key(self, msn: str, ata_chapter: str, section: str, 
                       subject: str, lc_phase: str, artifact_type: str) -> str:
@@ -312,10 +321,7 @@ class IDGenerator:
             # Auto-sequence
             base_key = self._get_base_key(msn, ata_chapter, section, subject, 
                                           lc_phase, artifact_type)
-            if base_key not in self._sequence_counters:
-                self._sequence_counters[base_key] = 0
-            self._sequence_counters[base_key] += 1
-            sequence = self._sequence_counters[base_key]
+            sequence = self.allocator.allocate(base_key)
         
         if not (1 <= sequence <= 999):
             raise ValueError(f"Sequence must be 1-999, got {sequence}")
@@ -335,8 +341,7 @@ class IDGenerator:
         """Reset sequence counter for a specific artifact series."""
         base_key = self._get_base_key(msn, ata_chapter, section, subject, 
                                       lc_phase, artifact_type)
-        if base_key in self._sequence_counters:
-            del self._sequence_counters[base_key]
+        self.allocator.reset(base_key)
 
 
 # Convenience functions
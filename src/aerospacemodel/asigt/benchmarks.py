@@ -0,0 +1,476 @@
+"""
+ASIGT Generator Benchmarks
+
+Offline micro-benchmarks for the S1000D generators in ``generators.py``.
+
+Synthetic KDB sources of configurable shape are generated in memory
+(no files, no network) and fed to each generator at several sizes, so
+results describe a scaling curve rather than a single point:
+
+    - descriptive:      N system interfaces
+    - procedural:       N procedure steps
+    - ipd:              N parts (catalog items)
+    - fault_isolation:  N isolation steps
+
+Each case records throughput (documents/s), peak traced memory and
+output bytes. Results are JSON documents comparable across commits;
+``compare`` flags regressions against a stored baseline.
+
+Usage:
+    python -m aerospacemodel.asigt.benchmarks --output bench.json
+    python -m aerospacemodel.asigt.benchmarks --baseline bench-main.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+from .engine import ArtifactType, SourceArtifact
+from .generators import (
+    BaseGenerator,
+    DescriptiveDMGenerator,
+    FaultIsolationDMGenerator,
+    GeneratorConfig,
+    IPDGenerator,
+    ProceduralDMGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+BENCHMARK_SCHEMA_VERSION = 1
+
+DEFAULT_SIZES = (10, 100, 1000)
+
+# Relative change that counts as a regression (10 %)
+DEFAULT_THRESHOLD = 0.10
+
+# Target number of list items generated per timing sample
+ITEMS_PER_SAMPLE = 2000
+
+
+# =============================================================================
+# SOURCE SYNTHESIS
+# =============================================================================
+
+
+def _descriptive(size: int) -> Dict[str, Any]:
+    return {
+        "type": "description",
+        "title": f"Synthetic System ({size} interfaces)",
+        "ata_chapter": "28",
+        "ata_section": "1",
+        "general_description": "Synthetic description paragraph. " * 8,
+        "system_overview": "Synthetic overview.",
+        "functional_description": "Synthetic functional description.",
+        "theory_of_operation": "Synthetic theory of operation.",
+        "system_interfaces": [
+            {"system": f"ATA {20 + i % 60}", "description": f"Interface {i}"}
+            for i in range(size)
+        ],
+    }
+
+
+def _procedural(size: int) -> Dict[str, Any]:
+    return {
+        "type": "procedure",
+        "task_title": f"Synthetic Task ({size} steps)",
+        "ata_chapter": "28",
+        "ata_section": "2",
+        "info_code": "520",
+        "tools_required": [{"name": "Torque wrench", "part_number": "TW-001"}],
+        "safety_warnings": ["Depressurize the system."],
+        "steps": [
+            {
+                "text": f"Synthetic instruction {i}.",
+                "notes": ["Check torque."] if i % 10 == 0 else [],
+                "sub_steps": [f"Sub-step {i}.1", f"Sub-step {i}.2"] if i % 5 == 0 else [],
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def _ipd(size: int) -> Dict[str, Any]:
+    return {
+        "type": "ipd",
+        "title": f"Synthetic Assembly ({size} parts)",
+        "ata_chapter": "28",
+        "ata_section": "3",
+        "figure": {"icn": "ICN-AERO-28-00001-00001-00", "title": "Synthetic Assembly"},
+        "parts": [
+            {
+                "part_number": f"PN-{i:06d}",
+                "description": f"Synthetic part {i}",
+                "cage_code": "00000",
+                "quantity": 1 + i % 4,
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def _fault_isolation(size: int) -> Dict[str, Any]:
+    return {
+        "type": "fault_isolation",
+        "title": f"Synthetic Fault ({size} steps)",
+        "ata_chapter": "28",
+        "ata_section": "4",
+        "fault_code": "FC28001",
+        "fault_description": "Synthetic fault condition.",
+        "isolation_steps": [f"Check item {i}." for i in range(size)],
+    }
+
+
+@dataclass(frozen=True)
+class SourceShape:
+    """A generator paired with a synthetic source builder."""
+    generator_class: Type[BaseGenerator]
+    build: Callable[[int], Dict[str, Any]]
+    artifact_type: ArtifactType
+
+
+SHAPES: Dict[str, SourceShape] = {
+    "descriptive": SourceShape(DescriptiveDMGenerator, _descriptive, ArtifactType.REQUIREMENT),
+    "procedural": SourceShape(ProceduralDMGenerator, _procedural, ArtifactType.TASK),
+    "ipd": SourceShape(IPDGenerator, _ipd, ArtifactType.REQUIREMENT),
+    "fault_isolation": SourceShape(
+        FaultIsolationDMGenerator, _fault_isolation, ArtifactType.REQUIREMENT
+    ),
+}
+
+
+def synthesize_source(kind: str, size: int) -> SourceArtifact:
+    """
+    Build an in-memory KDB source of the given shape.
+
+    Args:
+        kind: One of SHAPES ("descriptive", "procedural", "ipd", "fault_isolation")
+        size: Number of list items (interfaces, steps, parts)
+
+    Returns:
+        SourceArtifact with content populated (no file is read)
+    """
+    if kind not in SHAPES:
+        raise ValueError(f"Unknown source shape: {kind} (expected one of {sorted(SHAPES)})")
+
+    shape = SHAPES[kind]
+    return SourceArtifact(
+        id=f"BENCH-{kind.upper()}-{size}",
+        path=Path(f"bench/{kind}-{size}.yaml"),
+        artifact_type=shape.artifact_type,
+        content=shape.build(size),
+    )
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one (generator, size) case."""
+    name: str
+    kind: str
+    generator: str
+    size: int
+    samples: int
+    docs_per_sample: int
+    seconds_per_doc: float              # Median over samples
+    docs_per_second: float
+    peak_memory_bytes: int              # tracemalloc peak for one document
+    output_bytes: int
+
+
+@dataclass
+class Regression:
+    """A metric that moved past the threshold against the baseline."""
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float                       # Relative change, signed
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.6g} -> {self.current:.6g} "
+            f"({self.change:+.1%})"
+        )
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+
+def _benchmark_config() -> GeneratorConfig:
+    return GeneratorConfig(
+        model_ident_code="BENCH",
+        organization_name="Benchmark",
+        organization_cage="00000",
+    )
+
+
+def run_case(
+    kind: str,
+    size: int,
+    samples: int = 5,
+    config: Optional[GeneratorConfig] = None,
+) -> BenchmarkResult:
+    """
+    Benchmark one generator at one source size.
+
+    Args:
+        kind: Source shape (see SHAPES)
+        size: List items per source
+        samples: Timing samples; the median is reported
+        config: Generator configuration (default: synthetic)
+
+    Returns:
+        BenchmarkResult
+    """
+    shape = SHAPES[kind]
+    generator = shape.generator_class(config or _benchmark_config())
+    source = synthesize_source(kind, size)
+    docs_per_sample = max(1, ITEMS_PER_SAMPLE // max(size, 1))
+
+    # Warm-up, output size and correctness check
+    result = generator.generate(source)
+    if not result.success:
+        raise RuntimeError(f"{kind}-{size} generation failed: {result.errors}")
+    output_bytes = len(result.xml_content.encode("utf-8"))
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(docs_per_sample):
+            generator.generate(source)
+        timings.append((time.perf_counter() - start) / docs_per_sample)
+
+    # Memory is traced separately; tracemalloc distorts timings
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+    generator.generate(source)
+    peak_memory = tracemalloc.get_traced_memory()[1] - baseline_memory
+    if not tracing:
+        tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+    return BenchmarkResult(
+        name=f"{kind}-{size}",
+        kind=kind,
+        generator=shape.generator_class.__name__,
+        size=size,
+        samples=samples,
+        docs_per_sample=docs_per_sample,
+        seconds_per_doc=seconds,
+        docs_per_second=1.0 / seconds if seconds else float("inf"),
+        peak_memory_bytes=peak_memory,
+        output_bytes=output_bytes,
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_suite(
+    kinds: Optional[Sequence[str]] = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    samples: int = 5,
+) -> Dict[str, Any]:
+    """
+    Run all cases and return a JSON-serializable report.
+
+    Args:
+        kinds: Source shapes to run (default: all)
+        sizes: Source sizes per shape (scaling curve points)
+        samples: Timing samples per case
+
+    Returns:
+        Report dict with environment metadata and per-case results
+    """
+    results = []
+    for kind in kinds or list(SHAPES):
+        for size in sizes:
+            result = run_case(kind, size, samples=samples)
+            logger.info(
+                f"{result.name}: {result.docs_per_second:.1f} docs/s, "
+                f"{result.peak_memory_bytes / 1024:.0f} KiB peak, {result.output_bytes} B"
+            )
+            results.append(asdict(result))
+
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Flag cases that got slower, used more memory, or grew their output.
+
+    Only cases present in both reports are compared.
+
+    Args:
+        current: Report from run_suite
+        baseline: Stored report to compare against
+        threshold: Relative change tolerated before flagging
+
+    Returns:
+        List of Regression, empty if none
+    """
+    previous = {r["name"]: r for r in baseline.get("results", [])}
+    regressions = []
+
+    for result in current.get("results", []):
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+
+        # Throughput: lower is worse; memory/output: higher is worse
+        for metric, worse_if_lower in (
+            ("docs_per_second", True),
+            ("peak_memory_bytes", False),
+            ("output_bytes", False),
+        ):
+            old, new = float(base[metric]), float(result[metric])
+            if old <= 0:
+                continue
+            change = (new - old) / old
+            if (-change if worse_if_lower else change) > threshold:
+                regressions.append(Regression(result["name"], metric, old, new, change))
+
+    return regressions
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    """Read a report written by ``main`` / ``json.dump(run_suite())``."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmark suite from the command line.
+
+    Returns:
+        0 on success, 1 if regressions were flagged against --baseline
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m aerospacemodel.asigt.benchmarks",
+        description="ASIGT generator micro-benchmarks",
+    )
+    parser.add_argument("--kinds", nargs="+", choices=sorted(SHAPES), help="Source shapes to run")
+    parser.add_argument(
+        "--sizes", type=lambda v: [int(s) for s in v.split(",")],
+        default=list(DEFAULT_SIZES), help="Comma-separated source sizes (default: 10,100,1000)",
+    )
+    parser.add_argument("--samples", type=int, default=5, help="Timing samples per case")
+    parser.add_argument("--output", type=Path, help="Write JSON report to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a stored JSON report")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Relative change flagged as regression (default: 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_suite(kinds=args.kinds, sizes=args.sizes, samples=args.samples)
+
+    for result in report["results"]:
+        print(
+            f"{result['name']:<24} {result['docs_per_second']:>10.1f} docs/s "
+            f"{result['peak_memory_bytes'] / 1024:>10.0f} KiB {result['output_bytes']:>10} B"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "BENCHMARK_SCHEMA_VERSION",
+    "DEFAULT_SIZES",
+    "DEFAULT_THRESHOLD",
+    "SHAPES",
+    "SourceShape",
+    "BenchmarkResult",
+    "Regression",
+    "synthesize_source",
+    "run_case",
+    "run_suite",
+    "compare",
+    "load_report",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,582 @@
+"""
+ASIGT BREX Trend Store
+
+Columnar, append-only store of BREX violations accumulated across runs.
+
+BREXValidator and BREXAuditLog only hold violations for the current run.
+This module persists one compact row per (rule, DMC) occurrence count per
+run, together with the run's contract, baseline and ATA chapter, so that
+trend questions can be answered with vectorized pandas operations:
+
+    - How many violations of each rule did each run produce?
+    - Which rules regressed since the previous baseline?
+    - Which ATA chapters or DMCs carry the most findings over time?
+
+A run with no violations is stored as a single zero-count marker row, so
+clean runs still appear in the history.
+
+Storage layout (Parquet via pandas/pyarrow):
+
+    <root>/
+        history.parquet          # Compacted history (optional)
+        runs/<run_id>.parquet    # One file per recorded run
+
+String columns are stored as categoricals, so years of history with a
+few hundred rules stay small and load in well under a second.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from .validators import BREXValidator, BREXViolation
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+TREND_COLUMNS = [
+    "run_id",
+    "run_timestamp",
+    "contract_id",
+    "baseline_id",
+    "rule_id",
+    "severity",
+    "category",
+    "dmc",
+    "ata_chapter",
+    "count",
+]
+
+CATEGORICAL_COLUMNS = [
+    "run_id",
+    "contract_id",
+    "baseline_id",
+    "rule_id",
+    "severity",
+    "category",
+    "dmc",
+    "ata_chapter",
+]
+
+# rule_id of the zero-count row that records a run without violations
+RUN_MARKER_RULE = "__run__"
+
+HISTORY_FILE = "history.parquet"
+RUNS_DIR = "runs"
+
+# MODEL-SDC-CHAPTER-... with an optional leading "DMC-"
+_DMC_ATA_PATTERN = re.compile(r"^(?:DMC-)?[A-Z0-9]{2,14}-[A-Z0-9]{1,4}-([0-9]{2})-")
+
+
+def ata_chapter_from_dmc(dmc: str) -> str:
+    """
+    Extract the ATA chapter (system code) from a Data Module Code.
+
+    Args:
+        dmc: DMC string, e.g. "AERO-A-28-10-00-00A-040A-A"
+
+    Returns:
+        Two-digit chapter, or empty string if it cannot be determined
+    """
+    match = _DMC_ATA_PATTERN.match(dmc or "")
+    return match.group(1) if match else ""
+
+
+def _safe_filename(run_id: str) -> str:
+    """Return a filesystem-safe file stem for a run ID."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", run_id)
+
+
+# =============================================================================
+# TREND STORE
+# =============================================================================
+
+
+class BREXTrendStore:
+    """
+    Columnar store of BREX violations across runs.
+
+    Rows are buffered per run with ``record`` and written with ``flush``.
+    Each row holds the number of violations of one rule in one DMC; a run
+    that recorded none is kept as a RUN_MARKER_RULE row with count 0.
+
+    Usage:
+        >>> store = BREXTrendStore(Path(".asigt/brex-trends"))
+        >>> validator.validate(dm_path)
+        >>> store.record_validator(
+        ...     "RUN-20260301-0001", validator, dmc="AERO-A-28-10-00-00A-040A-A",
+        ...     contract_id="KITDM-CTR-LM-CSDB_ATA28", baseline_id="FBL-2026-Q1-003",
+        ... )
+        >>> store.flush()
+        >>> store.regressions()
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize trend store.
+
+        Args:
+            root: Directory holding the Parquet files (created on flush)
+        """
+        self.root = Path(root)
+        self.logger = logging.getLogger("asigt.brex.trends")
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._frame: Optional[pd.DataFrame] = None
+
+    @property
+    def runs_dir(self) -> Path:
+        """Directory holding per-run Parquet files."""
+        return self.root / RUNS_DIR
+
+    @property
+    def history_path(self) -> Path:
+        """Path of the compacted history file."""
+        return self.root / HISTORY_FILE
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record(
+        self,
+        run_id: str,
+        violations: Iterable[BREXViolation],
+        dmc: str = "",
+        contract_id: str = "",
+        baseline_id: str = "",
+        run_timestamp: Optional[datetime] = None,
+    ) -> int:
+        """
+        Buffer violations of one DMC for a run.
+
+        Args:
+            run_id: Run identifier
+            violations: BREX violations found in the DMC
+            dmc: Data Module Code the violations belong to
+            contract_id: Governing contract
+            baseline_id: Baseline the run was executed against
+            run_timestamp: Run start time (defaults to now)
+
+        Returns:
+            Number of violations recorded
+        """
+        counts: Dict[str, Dict[str, Any]] = {}
+        for violation in violations:
+            rule = violation.rule
+            row = counts.get(rule.id)
+            if row is None:
+                counts[rule.id] = row = {
+                    "rule_id": rule.id,
+                    "severity": rule.severity.value,
+                    "category": rule.category.value,
+                    "count": 0,
+                }
+            row["count"] += 1
+
+        return self._buffer(
+            run_id, counts.values(), dmc, contract_id, baseline_id, run_timestamp
+        )
+
+    def record_validator(
+        self,
+        run_id: str,
+        validator: BREXValidator,
+        dmc: str = "",
+        **kwargs: Any,
+    ) -> int:
+        """Buffer the violations from a validator's last validation."""
+        return self.record(run_id, validator.violations, dmc=dmc, **kwargs)
+
+    def record_audit_entries(
+        self,
+        run_id: str,
+        entries: Iterable[Dict[str, Any]],
+        dmc: str = "",
+        contract_id: str = "",
+        baseline_id: str = "",
+        run_timestamp: Optional[datetime] = None,
+    ) -> int:
+        """
+        Buffer failed decisions from BREXAuditLog entries.
+
+        Args:
+            run_id: Run identifier
+            entries: ``BREXAuditLog.entries``; only failed decisions are kept
+            dmc: Data Module Code the decisions apply to
+            contract_id: Governing contract
+            baseline_id: Baseline the run was executed against
+            run_timestamp: Run start time (defaults to now)
+
+        Returns:
+            Number of violations recorded
+        """
+        counts: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            if entry.get("type") != "decision" or entry.get("passed", True):
+                continue
+            rule_id = entry.get("rule_id", "")
+            row = counts.get(rule_id)
+            if row is None:
+                counts[rule_id] = row = {
+                    "rule_id": rule_id,
+                    "severity": str(entry.get("action", "")).upper(),
+                    "category": "decision",
+                    "count": 0,
+                }
+            row["count"] += 1
+
+        return self._buffer(
+            run_id, counts.values(), dmc, contract_id, baseline_id, run_timestamp
+        )
+
+    def _buffer(
+        self,
+        run_id: str,
+        rows: Iterable[Dict[str, Any]],
+        dmc: str,
+        contract_id: str,
+        baseline_id: str,
+        run_timestamp: Optional[datetime],
+    ) -> int:
+        """Attach run/DMC context to aggregated rows and buffer them."""
+        pending = self._pending.setdefault(run_id, [])
+        timestamp = run_timestamp or (
+            pending[0]["run_timestamp"] if pending else datetime.now()
+        )
+        ata_chapter = ata_chapter_from_dmc(dmc)
+
+        rows = list(rows)
+        if not rows and not pending:
+            rows = [{
+                "rule_id": RUN_MARKER_RULE,
+                "severity": "",
+                "category": "",
+                "count": 0,
+            }]
+
+        total = 0
+        for row in rows:
+            row.update(
+                run_id=run_id,
+                run_timestamp=timestamp,
+                contract_id=contract_id,
+                baseline_id=baseline_id,
+                dmc=dmc,
+                ata_chapter=ata_chapter,
+            )
+            pending.append(row)
+            total += row["count"]
+        return total
+
+    def flush(self) -> List[Path]:
+        """
+        Write buffered runs to Parquet.
+
+        Rows for a run that already has a file are appended to it. The
+        zero-count marker is dropped once the run has real violation rows.
+
+        Returns:
+            Paths of the files written
+        """
+        written = []
+        if not self._pending:
+            return written
+
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        for run_id, rows in self._pending.items():
+            rows = [row for row in rows if row["count"]] or rows
+            if not rows:
+                continue
+            path = self.runs_dir / f"{_safe_filename(run_id)}.parquet"
+            frame = _to_frame(rows)
+            if path.exists():
+                frame = pd.concat([_read(path), frame], ignore_index=True)
+            _write(_categorize(frame), path)
+            written.append(path)
+
+        self._pending.clear()
+        self._frame = None
+        self.logger.info(f"Flushed {len(written)} run(s) to {self.runs_dir}")
+        return written
+
+    def compact(self) -> Path:
+        """
+        Merge all per-run files into the history file.
+
+        Returns:
+            Path of the compacted history file
+        """
+        frame = self.load()
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write(frame, self.history_path)
+        for path in self.runs_dir.glob("*.parquet"):
+            path.unlink()
+        self._frame = frame
+        return self.history_path
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load the full violation history.
+
+        Returns:
+            DataFrame with TREND_COLUMNS, ordered by run timestamp
+        """
+        if self._frame is not None:
+            return self._frame
+
+        parts = []
+        if self.history_path.exists():
+            parts.append(_read(self.history_path))
+        if self.runs_dir.exists():
+            parts.extend(_read(path) for path in sorted(self.runs_dir.glob("*.parquet")))
+
+        if parts:
+            frame = pd.concat(parts, ignore_index=True)
+        else:
+            frame = _to_frame([])
+
+        frame = _categorize(frame)
+        if not frame["run_timestamp"].is_monotonic_increasing:
+            frame = frame.sort_values("run_timestamp", kind="stable", ignore_index=True)
+        self._frame = frame
+        return frame
+
+    def runs(self) -> pd.DataFrame:
+        """
+        List recorded runs.
+
+        Returns:
+            DataFrame with run_id, run_timestamp, contract_id, baseline_id
+            and total violation count, ordered by run timestamp
+        """
+        frame = self.load()
+        keys = ["run_id", "run_timestamp", "contract_id", "baseline_id"]
+        return (
+            frame.groupby(keys, observed=True, sort=False)["count"]
+            .sum()
+            .reset_index()
+            .sort_values("run_timestamp", kind="stable", ignore_index=True)
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def counts(
+        self,
+        by: Union[str, Sequence[str]] = "rule_id",
+        contract_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Violation counts per run.
+
+        Args:
+            by: Column(s) to group by (rule_id, dmc, ata_chapter, ...)
+            contract_id: Restrict to one contract
+
+        Returns:
+            DataFrame indexed by ``by`` with one column per run, in
+            chronological order
+        """
+        frame = self._filter(contract_id)
+        by = [by] if isinstance(by, str) else list(by)
+        table = _violations(frame).pivot_table(
+            index=by,
+            columns="run_id",
+            values="count",
+            aggfunc="sum",
+            fill_value=0,
+            observed=True,
+        )
+        return table.reindex(columns=self._run_order(frame), fill_value=0)
+
+    def trend(
+        self,
+        rule_id: Optional[str] = None,
+        ata_chapter: Optional[str] = None,
+        contract_id: Optional[str] = None,
+    ) -> pd.Series:
+        """
+        Total violations per run, optionally for a single rule or chapter.
+
+        Returns:
+            Series indexed by run_timestamp
+        """
+        frame = self._filter(contract_id)
+        if rule_id is not None:
+            frame = frame[frame["rule_id"] == rule_id]
+        if ata_chapter is not None:
+            frame = frame[frame["ata_chapter"] == ata_chapter]
+
+        totals = frame.groupby("run_timestamp")["count"].sum()
+        all_runs = self._filter(contract_id)["run_timestamp"].unique()
+        return totals.reindex(sorted(all_runs), fill_value=0)
+
+    def regressions(
+        self,
+        current_run: Optional[str] = None,
+        previous_run: Optional[str] = None,
+        by: Union[str, Sequence[str]] = "rule_id",
+        contract_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Groups whose violation count increased between two runs.
+
+        By default ``current_run`` is the latest run and ``previous_run``
+        is the latest earlier run recorded against a different baseline
+        (falling back to the immediately preceding run).
+
+        Args:
+            current_run: Run to evaluate
+            previous_run: Run to compare against
+            by: Column(s) to compare on
+            contract_id: Restrict to one contract
+
+        Returns:
+            DataFrame indexed by ``by`` with previous, current and delta
+            columns, sorted by delta descending
+        """
+        frame = self._filter(contract_id)
+        by = [by] if isinstance(by, str) else list(by)
+        empty = pd.DataFrame(
+            columns=["previous", "current", "delta"], dtype="int64"
+        ).rename_axis(by[0] if len(by) == 1 else None)
+
+        order = self._run_order(frame)
+        if not order:
+            return empty
+        current_run = current_run or order[-1]
+        if previous_run is None:
+            previous_run = self._previous_baseline_run(frame, order, current_run)
+            if previous_run is None:
+                return empty
+
+        # Aggregate only the two runs being compared
+        pair = _violations(frame)
+        pair = pair[pair["run_id"].isin([previous_run, current_run])]
+        table = pair.pivot_table(
+            index=by,
+            columns="run_id",
+            values="count",
+            aggfunc="sum",
+            fill_value=0,
+            observed=True,
+        )
+        compared = pd.DataFrame({
+            "previous": _column(table, previous_run),
+            "current": _column(table, current_run),
+        })
+        compared["delta"] = compared["current"] - compared["previous"]
+        regressed = compared[compared["delta"] > 0]
+        return regressed.sort_values("delta", ascending=False, kind="stable")
+
+    def _filter(self, contract_id: Optional[str]) -> pd.DataFrame:
+        """Return history restricted to a contract, if given."""
+        frame = self.load()
+        if contract_id is not None:
+            frame = frame[frame["contract_id"] == contract_id]
+        return frame
+
+    @staticmethod
+    def _run_order(frame: pd.DataFrame) -> List[str]:
+        """Return run IDs in chronological order."""
+        firsts = frame.groupby("run_id", observed=True)["run_timestamp"].min()
+        return [str(run) for run in firsts.sort_values(kind="stable").index]
+
+    @staticmethod
+    def _previous_baseline_run(
+        frame: pd.DataFrame,
+        order: List[str],
+        current_run: str,
+    ) -> Optional[str]:
+        """Find the latest run before ``current_run`` on a different baseline."""
+        if current_run not in order:
+            return None
+        index = order.index(current_run)
+        if index == 0:
+            return None
+
+        baselines = (
+            frame.drop_duplicates("run_id")
+            .set_index("run_id")["baseline_id"]
+            .astype(str)
+        )
+        current_baseline = baselines.get(current_run, "")
+        for run in reversed(order[:index]):
+            if baselines.get(run, "") != current_baseline:
+                return run
+        return order[index - 1]
+
+
+# =============================================================================
+# FRAME HELPERS
+# =============================================================================
+
+
+def _to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a trend frame with the canonical column order and dtypes."""
+    frame = pd.DataFrame(rows, columns=TREND_COLUMNS)
+    frame["run_timestamp"] = pd.to_datetime(frame["run_timestamp"])
+    frame["count"] = frame["count"].astype("int64")
+    return frame
+
+
+def _violations(frame: pd.DataFrame) -> pd.DataFrame:
+    """Drop the zero-count markers of runs without violations."""
+    return frame[frame["rule_id"] != RUN_MARKER_RULE]
+
+
+def _categorize(frame: pd.DataFrame) -> pd.DataFrame:
+    """Store string columns as categoricals."""
+    frame = frame.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            continue
+        frame[column] = frame[column].astype(str).astype("category")
+    return frame
+
+
+def _column(table: pd.DataFrame, run_id: str) -> pd.Series:
+    """Return a run's column from a counts table, or zeros if absent."""
+    if run_id in table.columns:
+        return table[run_id].astype("int64")
+    return pd.Series(0, index=table.index, dtype="int64")
+
+
+def _read(path: Path) -> pd.DataFrame:
+    """Read a trend Parquet file."""
+    return pd.read_parquet(path)
+
+
+def _write(frame: pd.DataFrame, path: Path) -> None:
+    """Write a trend Parquet file atomically."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    frame.to_parquet(tmp_path, index=False)
+    tmp_path.replace(path)
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "TREND_COLUMNS",
+    "BREXTrendStore",
+    "ata_chapter_from_dmc",
+]
@@ -27,17 +27,22 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
+import sys
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, date
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -46,9 +51,9 @@ from typing import (
     Tuple,
     Type,
     Union,
+    TYPE_CHECKING,
 )
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
 
 import yaml
 
@@ -58,10 +63,15 @@ from .engine import (
     OutputArtifact,
     TraceLink,
     ExecutionContext,
+    BREXValidationResult,
+    SchemaValidationResult,
     ASIGTError,
     ASIGTTransformationError,
 )
 
+if TYPE_CHECKING:
+    from .validators import CombinedValidator
+
 
 logger = logging.getLogger(__name__)
 
@@ -159,13 +169,32 @@ class QualityAssuranceStatus(Enum):
 # =============================================================================
 
 
-@dataclass
+# Code value types are immutable, hashable and ordered so they can key
+# DML, xref and search indexes directly; slotted where supported (3.10+).
+_CODE_DATACLASS: Dict[str, bool] = {"frozen": True, "order": True}
+if sys.version_info >= (3, 10):
+    _CODE_DATACLASS["slots"] = True
+
+# Bounded LRU size for from_string() parse caches
+CODE_PARSE_CACHE_SIZE = 16384
+
+_DMC_PATTERN = re.compile(
+    r"^([A-Z0-9]+)-([A-Z0-9]+)-(\d{2,3})-(\d)(\d)-([A-Z0-9]{2,4})-"
+    r"([A-Z0-9]{2})([A-Z0-9])-(\d{3})([A-Z0-9])-([A-Z])$"
+)
+
+
+@dataclass(**_CODE_DATACLASS)
 class DMCode:
     """
     S1000D Data Module Code structure.
     
     Format: MODEL-SYSDIFF-SYSTEM-SUBSYS-SUBSUBSYS-ASSY-DISASSY-DISASSYVAR-INFO-INFOVAR-ITEMLOC
     Example: HJONE-A-28-10-00-00A-510A-D
+    
+    Instances are immutable and hash/compare by component, so a DMCode can
+    be used directly as a dict or set key. ``from_string`` is memoized and
+    returns the same shared instance for a repeated code string.
     """
     model_ident_code: str               # 2-14 alphanumeric
     system_diff_code: str = "A"         # 1-4 alphanumeric
@@ -178,39 +207,27 @@ class DMCode:
     info_code: str = "040"              # 3 alphanumeric
     info_code_variant: str = "A"        # 1 alphanumeric
     item_location_code: str = "D"       # 1 alphanumeric (A=wing, B=fuselage, etc.)
+    _code: str = field(default="", init=False, repr=False, compare=False)
     
-    def __str__(self) -> str:
-        """Return full DMC string."""
-        return (
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_code", sys.intern(
             f"{self.model_ident_code}-{self.system_diff_code}-"
             f"{self.system_code}-{self.subsystem_code}{self.sub_subsystem_code}-"
             f"{self.assy_code}-{self.disassy_code}{self.disassy_code_variant}-"
             f"{self.info_code}{self.info_code_variant}-{self.item_location_code}"
-        )
+        ))
+    
+    def __str__(self) -> str:
+        """Return full DMC string."""
+        return self._code
+    
+    def __hash__(self) -> int:
+        return hash(self._code)
     
     @classmethod
     def from_string(cls, dmc_str: str) -> "DMCode":
-        """Parse DMC from string."""
-        # Pattern: MODEL-SYSDIFF-SYSTEM-SUBSYS-ASSY-DISASSY-INFO-LOC
-        pattern = r"^([A-Z0-9]+)-([A-Z0-9]+)-(\d{2,3})-(\d)(\d)-([A-Z0-9]{2,4})-([A-Z0-9]{2})([A-Z0-9])-(\d{3})([A-Z0-9])-([A-Z])$"
-        match = re.match(pattern, dmc_str.upper())
-        
-        if not match:
-            raise ValueError(f"Invalid DMC format: {dmc_str}")
-        
-        return cls(
-            model_ident_code=match.group(1),
-            system_diff_code=match.group(2),
-            system_code=match.group(3),
-            subsystem_code=match.group(4),
-            sub_subsystem_code=match.group(5),
-            assy_code=match.group(6),
-            disassy_code=match.group(7),
-            disassy_code_variant=match.group(8),
-            info_code=match.group(9),
-            info_code_variant=match.group(10),
-            item_location_code=match.group(11)
-        )
+        """Parse DMC from string (cached)."""
+        return _parse_dm_code(dmc_str)
     
     def to_xml_attributes(self) -> Dict[str, str]:
         """Return attributes for dmCode XML element."""
@@ -229,7 +246,7 @@ class DMCode:
         }
 
 
-@dataclass
+@dataclass(**_CODE_DATACLASS)
 class PMCode:
     """
     S1000D Publication Module Code structure.
@@ -240,9 +257,23 @@ class PMCode:
     pm_issuer: str                      # Organization issuing the PM
     pm_number: str                      # Publication number
     pm_volume: str = "00"               # Volume number
+    _code: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_code", sys.intern(
+            f"{self.model_ident_code}-{self.pm_issuer}-{self.pm_number}-{self.pm_volume}"
+        ))
     
     def __str__(self) -> str:
-        return f"{self.model_ident_code}-{self.pm_issuer}-{self.pm_number}-{self.pm_volume}"
+        return self._code
+    
+    def __hash__(self) -> int:
+        return hash(self._code)
+    
+    @classmethod
+    def from_string(cls, pmc_str: str) -> "PMCode":
+        """Parse PMC from string, with or without the PMC- prefix (cached)."""
+        return _parse_pm_code(pmc_str)
     
     def to_xml_attributes(self) -> Dict[str, str]:
         """Return attributes for pmCode XML element."""
@@ -285,7 +316,7 @@ class DMLCode:
         }
 
 
-@dataclass
+@dataclass(**_CODE_DATACLASS)
 class ICNCode:
     """
     Information Control Number for graphics.
@@ -298,9 +329,24 @@ class ICNCode:
     sheet_number: str = "00001"
     variant: str = "00"
     language_code: str = "SX"           # SX = no language
+    _code: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_code", sys.intern(
+            f"ICN-{self.model_ident_code}-{self.system_code}-{self.figure_number}-"
+            f"{self.sheet_number}-{self.variant}"
+        ))
     
     def __str__(self) -> str:
-        return f"ICN-{self.model_ident_code}-{self.system_code}-{self.figure_number}-{self.sheet_number}-{self.variant}"
+        return self._code
+    
+    def __hash__(self) -> int:
+        return hash(self._code)
+    
+    @classmethod
+    def from_string(cls, icn_str: str) -> "ICNCode":
+        """Parse ICN from its short or full (with language) form (cached)."""
+        return _parse_icn_code(icn_str)
     
     @property
     def full_code(self) -> str:
@@ -308,6 +354,40 @@ class ICNCode:
         return f"ICN-{self.model_ident_code}-{self.system_code}-{self.figure_number}-{self.sheet_number}-{self.language_code}-{self.variant}"
 
 
+@lru_cache(maxsize=CODE_PARSE_CACHE_SIZE)
+def _parse_dm_code(dmc_str: str) -> DMCode:
+    """Parse and intern a DMC string; shared instance per distinct string."""
+    match = _DMC_PATTERN.match(dmc_str.upper())
+    if not match:
+        raise ValueError(f"Invalid DMC format: {dmc_str}")
+    return DMCode(*map(sys.intern, match.groups()))
+
+
+@lru_cache(maxsize=CODE_PARSE_CACHE_SIZE)
+def _parse_pm_code(pmc_str: str) -> PMCode:
+    """Parse and intern a PMC string; shared instance per distinct string."""
+    parts = (pmc_str[4:] if pmc_str.startswith("PMC-") else pmc_str).split("-")
+    if len(parts) != 4 or not all(parts):
+        raise ValueError(f"Invalid PMC format: {pmc_str}")
+    return PMCode(*map(sys.intern, parts))
+
+
+@lru_cache(maxsize=CODE_PARSE_CACHE_SIZE)
+def _parse_icn_code(icn_str: str) -> ICNCode:
+    """Parse and intern an ICN string; shared instance per distinct string."""
+    parts = (icn_str[4:] if icn_str.startswith("ICN-") else icn_str).split("-")
+    if len(parts) == 5:
+        model, system, figure, sheet, variant = parts
+        language = "SX"
+    elif len(parts) == 6:
+        model, system, figure, sheet, language, variant = parts
+    else:
+        raise ValueError(f"Invalid ICN format: {icn_str}")
+    return ICNCode(
+        *map(sys.intern, (model, system, figure, sheet, variant, language))
+    )
+
+
 # =============================================================================
 # DATA CLASSES - GENERATION CONTEXT
 # =============================================================================
@@ -334,21 +414,84 @@ class GeneratorConfig:
     include_comments: bool = False
 
 
-@dataclass
+# Results are slotted where supported (3.10+); large contracts hold one per DM
+_RESULT_DATACLASS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RESULT_DATACLASS)
 class GenerationResult:
-    """Result of a generation operation."""
+    """
+    Result of a generation operation.
+    
+    Generators return the element tree only; ``xml_content`` is
+    serialized from it on first access and cached until ``xml_element``
+    is replaced (edits made in place to the tree after that access are
+    not reflected). A lean result (see ``release``) keeps only the DMC,
+    the artifact's output path, hash and size, trace links and
+    diagnostics; the XML string and element tree are dropped once the DM
+    is on disk.
+    """
     success: bool
     artifact: Optional[OutputArtifact] = None
-    xml_content: str = ""
+    xml_content: InitVar[str] = ""  # See the xml_content property below
+    xml_element: Optional[ET.Element] = None  # In-memory tree (validators skip re-parse)
     dmc: str = ""
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     trace_links: List[TraceLink] = field(default_factory=list)
     generation_time: Optional[datetime] = None
     
+    # Inline validation (populated when a validator is attached to DMGenerator)
+    brex_result: Optional[BREXValidationResult] = None
+    schema_result: Optional[SchemaValidationResult] = None
+    
+    # (tree it was serialized from, text) of xml_content; None for set text
+    _xml: Tuple[Optional[ET.Element], str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self, xml_content: str) -> None:
+        self._xml = (None, xml_content)
+    
     @property
     def has_errors(self) -> bool:
         return len(self.errors) > 0
+    
+    @property
+    def validated(self) -> bool:
+        """Check if inline validation was performed."""
+        return self.brex_result is not None or self.schema_result is not None
+    
+    @property
+    def lean(self) -> bool:
+        """Check if the XML payload has been released."""
+        return self.xml_element is None and not self.xml_content
+    
+    def release(self) -> "GenerationResult":
+        """Drop the XML string and element tree; returns self."""
+        self.xml_content = ""
+        self.xml_element = None
+        return self
+
+
+def _get_xml_content(self: GenerationResult) -> str:
+    """Pretty-printed XML, serialized from ``xml_element`` on first access."""
+    tree, text = self._xml
+    element = self.xml_element
+    if element is not None and (not text or (tree is not None and tree is not element)):
+        text = _prettify(element, BaseGenerator.INDENT, BaseGenerator.XML_DECLARATION)
+        self._xml = (element, text)
+    return text
+
+
+def _set_xml_content(self: GenerationResult, value: str) -> None:
+    self._xml = (None, value)
+
+
+# Installed after @dataclass, which reads the class attribute as the InitVar default
+GenerationResult.xml_content = property(  # type: ignore[assignment]
+    _get_xml_content, _set_xml_content, doc=_get_xml_content.__doc__
+)
 
 
 @dataclass
@@ -426,6 +569,29 @@ class CatalogSeqNumber:
 # =============================================================================
 
 
+def _prettify(element: ET.Element, indent: str, declaration: str) -> str:
+    """Indent an element in place and serialize it with an XML declaration."""
+    ET.indent(element, space=indent)
+    return declaration + ET.tostring(element, encoding="unicode") + "\n"
+
+
+class _HashingWriter:
+    """Binary file wrapper that hashes and counts bytes as they are written."""
+    
+    def __init__(self, file: Any):
+        self._file = file
+        self._digest = hashlib.sha256()
+        self.size = 0
+    
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+    
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
 class BaseGenerator(ABC):
     """
     Abstract base class for all ASIGT generators.
@@ -435,6 +601,8 @@ class BaseGenerator(ABC):
     
     S1000D_NS = "http://www.s1000d.org/S1000D_5-0"
     XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+    XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+    INDENT = "  "
     
     def __init__(self, config: GeneratorConfig, context: Optional[ExecutionContext] = None):
         """
@@ -492,10 +660,67 @@ class BaseGenerator(ABC):
         return elem
     
     def prettify_xml(self, element: ET.Element) -> str:
-        """Return pretty-printed XML string."""
-        rough_string = ET.tostring(element, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        """
+        Return pretty-printed XML string.
+        
+        The element is indented in place (whitespace-only text and tails
+        are normalized), so repeated calls and ``write_xml`` produce the
+        same bytes for the same tree.
+        """
+        return _prettify(element, self.INDENT, self.XML_DECLARATION)
+    
+    def write_xml(self, element: ET.Element, path: Path) -> Tuple[str, int]:
+        """
+        Stream pretty-printed XML to a file, hashing bytes as they are written.
+        
+        Produces exactly ``prettify_xml(element).encode("utf-8")`` without
+        building the document string in memory.
+        
+        Args:
+            element: Root element to write
+            path: Output file path
+            
+        Returns:
+            Tuple of (SHA-256 hex digest, size in bytes)
+        """
+        ET.indent(element, space=self.INDENT)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            writer = _HashingWriter(f)
+            writer.write(self.XML_DECLARATION.encode("utf-8"))
+            ET.ElementTree(element).write(writer, encoding="utf-8", xml_declaration=False)
+            writer.write(b"\n")
+        return writer.hexdigest(), writer.size
+    
+    def write_result(self, result: GenerationResult, output_dir: Path) -> Optional[Path]:
+        """
+        Write a generation result's XML under an output directory.
+        
+        The tree is streamed to disk (see ``write_xml``), so the document
+        string is never built. The artifact path, hash and size, and the
+        target of its trace links, are updated from the written bytes, so
+        no re-read is needed to compute the hash.
+        
+        Args:
+            result: Successful GenerationResult carrying ``xml_element``
+            output_dir: Directory to write into
+            
+        Returns:
+            Path written, or None if the result has no tree or artifact
+        """
+        if result.xml_element is None or result.artifact is None:
+            return None
+        
+        path = output_dir / result.artifact.path.name
+        digest, size = self.write_xml(result.xml_element, path)
+        result.artifact.path = path
+        result.artifact.hash_sha256 = digest
+        result.artifact.size_bytes = size
+        for trace in result.trace_links:
+            if trace.target_id == result.artifact.id:
+                trace.target_path = str(path)
+                trace.target_hash = digest
+        return path
     
     def create_dm_address(
         self, 
@@ -780,8 +1005,8 @@ class DescriptiveDMGenerator(BaseGenerator):
             # Generate content structure
             self._generate_description_content(description, content)
             
-            # Serialize
-            xml_string = self.prettify_xml(dmodule)
+            # Indent in place; xml_content is serialized on first access
+            ET.indent(dmodule, space=self.INDENT)
             
             # Create output artifact
             output = OutputArtifact(
@@ -799,7 +1024,7 @@ class DescriptiveDMGenerator(BaseGenerator):
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = dmodule
             result.dmc = str(metadata.dmc)
             result.trace_links = [trace]
             
@@ -1026,8 +1251,8 @@ class ProceduralDMGenerator(BaseGenerator):
             close_text = content.get("close_requirements", "Task complete. Return aircraft to service.")
             self.create_sub_element(req_cond_dm, "reqCond", text=close_text)
             
-            # Serialize
-            xml_string = self.prettify_xml(dmodule)
+            # Indent in place; xml_content is serialized on first access
+            ET.indent(dmodule, space=self.INDENT)
             
             # Create output artifact
             output = OutputArtifact(
@@ -1045,7 +1270,7 @@ class ProceduralDMGenerator(BaseGenerator):
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = dmodule
             result.dmc = str(metadata.dmc)
             result.trace_links = [trace]
             
@@ -1422,8 +1647,8 @@ class IPDGenerator(BaseGenerator):
             for csn in csn_entries:
                 self._generate_csn(ipd, csn)
             
-            # Serialize
-            xml_string = self.prettify_xml(dmodule)
+            # Indent in place; xml_content is serialized on first access
+            ET.indent(dmodule, space=self.INDENT)
             
             # Create output artifact
             output = OutputArtifact(
@@ -1441,7 +1666,7 @@ class IPDGenerator(BaseGenerator):
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = dmodule
             result.dmc = str(metadata.dmc)
             result.trace_links = [trace]
             
@@ -1625,7 +1850,7 @@ class FaultIsolationDMGenerator(BaseGenerator):
             # Generate fault isolation content
             self._generate_fault_content(fault_iso, content)
             
-            xml_string = self.prettify_xml(dmodule)
+            ET.indent(dmodule, space=self.INDENT)
             
             output = OutputArtifact(
                 id=f"DM-{metadata.dmc}",
@@ -1641,7 +1866,7 @@ class FaultIsolationDMGenerator(BaseGenerator):
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = dmodule
             result.dmc = str(metadata.dmc)
             result.trace_links = [trace]
             
@@ -1700,6 +1925,145 @@ class FaultIsolationDMGenerator(BaseGenerator):
                 self.create_sub_element(action, "para", text=f"{i}. {step}")
 
 
+# =============================================================================
+# STREAMING LIST WRITER
+# =============================================================================
+
+
+class XMLEntryStream:
+    """
+    Incremental writer for list-structured documents (DML, PM).
+    
+    The document header is serialized once and split around the entry
+    container. Each added entry is built, indented, written and dropped,
+    so memory use does not grow with the number of entries. Output bytes
+    are identical to serializing the full tree with ``prettify_xml``, and
+    the SHA-256 digest is computed while writing.
+    
+    Created by ``DMLGenerator.open_stream`` and ``PMGenerator.open_stream``.
+    """
+    
+    _MARKER = "asigt-stream-entries"
+    
+    def __init__(
+        self,
+        generator: BaseGenerator,
+        root: ET.Element,
+        container: ET.Element,
+        level: int,
+        make_entry: Callable[[DMCode], ET.Element],
+        path: Path,
+        artifact: OutputArtifact
+    ):
+        """
+        Initialize stream and open the output file.
+        
+        Args:
+            generator: Generator owning the document
+            root: Document root with header built
+            container: Element entries are appended to
+            level: Indentation level of entries
+            make_entry: Builds one detached entry element from a DMCode
+            path: Output file path
+            artifact: Output artifact to update on close
+        """
+        self.generator = generator
+        self.path = path
+        self.count = 0
+        self.result = GenerationResult(
+            success=False,
+            artifact=artifact,
+            dmc=artifact.dmc or "",
+            generation_time=datetime.now()
+        )
+        
+        self._root = root
+        self._level = level
+        self._make_entry = make_entry
+        self._separator = "\n" + generator.INDENT * level
+        self._namespace_decl = f' xmlns="{generator.S1000D_NS}"'
+        
+        # Serialize header once with a marker where entries go
+        marker = ET.Comment(self._MARKER)
+        container_text = container.text
+        container.append(marker)
+        ET.indent(root, space=generator.INDENT)
+        header = ET.tostring(root, encoding="unicode")
+        container.remove(marker)
+        container.text = container_text
+        self._prefix, self._suffix = header.split(f"<!--{self._MARKER}-->")
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "wb")
+        self._writer = _HashingWriter(self._file)
+    
+    def __enter__(self) -> "XMLEntryStream":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort(str(exc))
+    
+    def add(self, dmc: Union[DMCode, str]) -> None:
+        """Write one entry for a DMC."""
+        if isinstance(dmc, str):
+            dmc = DMCode.from_string(dmc)
+        
+        entry = self._make_entry(dmc)
+        entry.tail = None
+        ET.indent(entry, space=self.generator.INDENT, level=self._level)
+        # Entries inherit the default namespace declared on the root
+        fragment = ET.tostring(entry, encoding="unicode").replace(self._namespace_decl, "", 1)
+        
+        if self.count == 0:
+            self._write(self.generator.XML_DECLARATION + self._prefix)
+        else:
+            self._write(self._separator)
+        self._write(fragment)
+        self.count += 1
+    
+    def add_all(self, dmcs: Iterable[Union[DMCode, str]]) -> int:
+        """Write entries for every DMC in an iterable; returns the count added."""
+        added = 0
+        for dmc in dmcs:
+            self.add(dmc)
+            added += 1
+        return added
+    
+    def close(self) -> GenerationResult:
+        """Finish the document and record hash and size on the artifact."""
+        if self._file.closed:
+            return self.result
+        
+        if self.count == 0:
+            # No entries: identical to the in-memory serialization
+            self._write(self.generator.prettify_xml(self._root))
+        else:
+            self._write(self._suffix + "\n")
+        self._file.close()
+        
+        artifact = self.result.artifact
+        artifact.path = self.path
+        artifact.hash_sha256 = self._writer.hexdigest()
+        artifact.size_bytes = self._writer.size
+        self.result.success = True
+        self.generator.logger.info(f"Streamed {self.count} entries to {self.path}")
+        return self.result
+    
+    def abort(self, reason: str = "") -> GenerationResult:
+        """Close and remove the partial file."""
+        if not self._file.closed:
+            self._file.close()
+            self.path.unlink(missing_ok=True)
+        self.result.errors.append(f"Stream aborted: {reason}" if reason else "Stream aborted")
+        return self.result
+    
+    def _write(self, text: str) -> None:
+        self._writer.write(text.encode("utf-8"))
+
+
 # =============================================================================
 # PUBLICATION MODULE GENERATOR
 # =============================================================================
@@ -1749,50 +2113,21 @@ class PMGenerator(BaseGenerator):
         
         try:
             content = source.content if source else {}
+            pm_code = pm_code or self._default_pm_code()
             
-            # Build PM code if not provided
-            if pm_code is None:
-                pm_code = PMCode(
-                    model_ident_code=self.config.model_ident_code,
-                    pm_issuer=self.config.organization_cage,
-                    pm_number=self._get_pm_number_for_type(),
-                    pm_volume="00"
-                )
-            
-            # Build title
-            if title is None:
-                title = content.get("title", self._get_title_for_type())
-            
-            # Create PM root
-            pm = self.create_xml_element("pm")
-            
-            # Ident and status section
-            ident_status = self.create_sub_element(pm, "identAndStatusSection")
-            self._create_pm_address(ident_status, pm_code, title)
-            self._create_pm_status(ident_status, pm_code)
-            
-            # Content section
-            content_elem = self.create_sub_element(pm, "content")
-            root_entry = self.create_sub_element(content_elem, "pmEntry")
+            # Build PM root, ident/status and front matter/chapters
+            pm, root_entry = self._build_pm(content, pm_code, title)
             
-            # Generate PM structure based on type
-            self._generate_pm_structure(root_entry, content, dm_refs or [])
+            # Add DM references
+            for dmc in (dm_refs or []):
+                self._add_dm_reference(root_entry, dmc)
             
-            xml_string = self.prettify_xml(pm)
-            
-            output = OutputArtifact(
-                id=f"PM-{pm_code}",
-                path=Path(f"{pm_code}.xml"),
-                artifact_type=ArtifactType.PM,
-                dmc=str(pm_code),
-                source_refs=[source.id] if source else [],
-                generated_at=datetime.now(),
-                valid=True
-            )
+            ET.indent(pm, space=self.INDENT)
+            output = self._pm_artifact(pm_code, source)
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = pm
             result.dmc = str(pm_code)
             
             self.logger.info(f"Generated PM: {pm_code}")
@@ -1803,6 +2138,126 @@ class PMGenerator(BaseGenerator):
         
         return result
     
+    def open_stream(
+        self,
+        path: Path,
+        source: Optional[SourceArtifact] = None,
+        pm_code: Optional[PMCode] = None,
+        title: Optional[str] = None
+    ) -> "XMLEntryStream":
+        """
+        Open a streaming PM writer.
+        
+        The PM header, front matter and chapters are written first; DM
+        references are then appended to disk one by one as they arrive,
+        so memory use stays flat for very large publications.
+        
+        Args:
+            path: Output file path
+            source: Optional source artifact (publication definition)
+            pm_code: Publication module code
+            title: Publication title
+            
+        Returns:
+            XMLEntryStream accepting DMCode (or DMC string) entries
+            
+        Usage:
+            >>> with pm_generator.open_stream(out / "PM.xml") as stream:
+            ...     for result in dm_generator.generate_many(sources):
+            ...         stream.add(result.dmc)
+            >>> stream.result.artifact.hash_sha256
+        """
+        content = source.content if source else {}
+        pm_code = pm_code or self._default_pm_code()
+        pm, root_entry = self._build_pm(content, pm_code, title)
+        
+        return XMLEntryStream(
+            generator=self,
+            root=pm,
+            container=root_entry,
+            level=3,
+            make_entry=self._make_dm_reference,
+            path=path,
+            artifact=self._pm_artifact(pm_code, source),
+        )
+    
+    def generate_stream(
+        self,
+        path: Path,
+        dm_refs: Iterable[Union[DMCode, str]],
+        source: Optional[SourceArtifact] = None,
+        pm_code: Optional[PMCode] = None,
+        title: Optional[str] = None
+    ) -> GenerationResult:
+        """
+        Stream a PM to disk, consuming DM references lazily.
+        
+        Args:
+            path: Output file path
+            dm_refs: DM references (any iterable, e.g. a generator)
+            source: Optional source artifact
+            pm_code: Publication module code
+            title: Publication title
+            
+        Returns:
+            GenerationResult (without in-memory XML); on error the result
+            is failed and no partial file is left
+        """
+        stream = self.open_stream(path, source, pm_code, title)
+        try:
+            stream.add_all(dm_refs)
+        except Exception as e:
+            self.logger.error(f"Error streaming PM: {e}")
+            return stream.abort(str(e))
+        return stream.close()
+    
+    def _default_pm_code(self) -> PMCode:
+        """Build the PM code for this publication type."""
+        return PMCode(
+            model_ident_code=self.config.model_ident_code,
+            pm_issuer=self.config.organization_cage,
+            pm_number=self._get_pm_number_for_type(),
+            pm_volume="00"
+        )
+    
+    def _build_pm(
+        self,
+        content: Dict[str, Any],
+        pm_code: PMCode,
+        title: Optional[str]
+    ) -> Tuple[ET.Element, ET.Element]:
+        """Build the PM tree up to (and excluding) DM references."""
+        if title is None:
+            title = content.get("title", self._get_title_for_type())
+        
+        # Create PM root
+        pm = self.create_xml_element("pm")
+        
+        # Ident and status section
+        ident_status = self.create_sub_element(pm, "identAndStatusSection")
+        self._create_pm_address(ident_status, pm_code, title)
+        self._create_pm_status(ident_status, pm_code)
+        
+        # Content section
+        content_elem = self.create_sub_element(pm, "content")
+        root_entry = self.create_sub_element(content_elem, "pmEntry")
+        
+        # Generate PM structure based on type
+        self._generate_pm_structure(root_entry, content)
+        return pm, root_entry
+    
+    def _pm_artifact(self, pm_code: PMCode, source: Optional[SourceArtifact]) -> OutputArtifact:
+        """Create the output artifact for a PM."""
+        return OutputArtifact(
+            id=f"PM-{pm_code}",
+            path=Path(f"{pm_code}.xml"),
+            artifact_type=ArtifactType.PM,
+            dmc=str(pm_code),
+            source_refs=[source.id] if source else [],
+            generated_at=datetime.now(),
+            valid=True
+        )
+    
     def _get_pm_number_for_type(self) -> str:
         """Get PM number based on publication type."""
         pm_numbers = {
@@ -1888,8 +2343,7 @@ class PMGenerator(BaseGenerator):
     def _generate_pm_structure(
         self, 
         root_entry: ET.Element, 
-        content: Dict[str, Any],
-        dm_refs: List[DMCode]
+        content: Dict[str, Any]
     ) -> None:
         """Generate PM entry structure based on publication type."""
         # Front matter
@@ -1903,16 +2357,17 @@ class PMGenerator(BaseGenerator):
                 chapter_entry = self.create_sub_element(root_entry, "pmEntry", attrib={"pmEntryType": "pmt52"})
                 self.create_sub_element(chapter_entry, "pmEntryTitle", 
                                         text=f"ATA {chapter.get('ata_chapter', '00')} - {chapter.get('title', 'Chapter')}")
-        
-        # Add DM references
-        for dmc in dm_refs:
-            self._add_dm_reference(root_entry, dmc)
     
-    def _add_dm_reference(self, parent: ET.Element, dmc: DMCode) -> None:
+    def _add_dm_reference(self, parent: ET.Element, dmc: DMCode) -> ET.Element:
         """Add DM reference to PM entry."""
         dm_ref = self.create_sub_element(parent, "dmRef")
         dm_ref_ident = self.create_sub_element(dm_ref, "dmRefIdent")
         self.create_sub_element(dm_ref_ident, "dmCode", attrib=dmc.to_xml_attributes())
+        return dm_ref
+    
+    def _make_dm_reference(self, dmc: DMCode) -> ET.Element:
+        """Build a detached dmRef element for streaming."""
+        return self._add_dm_reference(self.create_xml_element("pmEntry"), dmc)
 
 
 # =============================================================================
@@ -1963,47 +2418,21 @@ class DMLGenerator(BaseGenerator):
         )
         
         try:
-            # Build DML code if not provided
-            if dml_code is None:
-                dml_code = DMLCode(
-                    model_ident_code=self.config.model_ident_code,
-                    sender_ident=self.config.organization_cage,
-                    dml_type=self.dml_type.value
-                )
+            dml_code = dml_code or self._default_dml_code()
             
-            if title is None:
-                title = f"Data Module List - {self.dml_type.name}"
-            
-            # Create DML root
-            dml = self.create_xml_element("dml")
-            
-            # Ident and status section
-            ident_status = self.create_sub_element(dml, "identAndStatusSection")
-            self._create_dml_address(ident_status, dml_code, title)
-            self._create_dml_status(ident_status, dml_code)
-            
-            # Content section
-            dml_content = self.create_sub_element(dml, "dmlContent")
+            # Create DML root, ident/status and content section
+            dml, dml_content = self._build_dml(dml_code, title)
             
             # Add DM entries
             for dmc in (dm_list or []):
                 self._add_dml_entry(dml_content, dmc)
             
-            xml_string = self.prettify_xml(dml)
-            
-            output = OutputArtifact(
-                id=f"DML-{dml_code}",
-                path=Path(f"{dml_code}.xml"),
-                artifact_type=ArtifactType.DML,
-                dmc=str(dml_code),
-                source_refs=[source.id] if source else [],
-                generated_at=datetime.now(),
-                valid=True
-            )
+            ET.indent(dml, space=self.INDENT)
+            output = self._dml_artifact(dml_code, source)
             
             result.success = True
             result.artifact = output
-            result.xml_content = xml_string
+            result.xml_element = dml
             result.dmc = str(dml_code)
             
             self.logger.info(f"Generated DML: {dml_code}")
@@ -2014,6 +2443,118 @@ class DMLGenerator(BaseGenerator):
         
         return result
     
+    def open_stream(
+        self,
+        path: Path,
+        source: Optional[SourceArtifact] = None,
+        dml_code: Optional[DMLCode] = None,
+        title: Optional[str] = None
+    ) -> "XMLEntryStream":
+        """
+        Open a streaming DML writer.
+        
+        The DML header is written first; ``dmlEntry`` elements are then
+        appended to disk one by one as DMCs arrive, so memory use stays
+        flat for fleet-wide lists.
+        
+        Args:
+            path: Output file path
+            source: Optional source artifact
+            dml_code: DML code
+            title: DML title
+            
+        Returns:
+            XMLEntryStream accepting DMCode (or DMC string) entries
+            
+        Usage:
+            >>> with dml_generator.open_stream(out / "DML.xml") as stream:
+            ...     for result in dm_generator.generate_many(sources):
+            ...         stream.add(result.dmc)
+        """
+        dml_code = dml_code or self._default_dml_code()
+        dml, dml_content = self._build_dml(dml_code, title)
+        
+        return XMLEntryStream(
+            generator=self,
+            root=dml,
+            container=dml_content,
+            level=2,
+            make_entry=self._make_dml_entry,
+            path=path,
+            artifact=self._dml_artifact(dml_code, source),
+        )
+    
+    def generate_stream(
+        self,
+        path: Path,
+        dm_list: Iterable[Union[DMCode, str]],
+        source: Optional[SourceArtifact] = None,
+        dml_code: Optional[DMLCode] = None,
+        title: Optional[str] = None
+    ) -> GenerationResult:
+        """
+        Stream a DML to disk, consuming DMCs lazily.
+        
+        Args:
+            path: Output file path
+            dm_list: DMCs to include (any iterable, e.g. a generator)
+            source: Optional source artifact
+            dml_code: DML code
+            title: DML title
+            
+        Returns:
+            GenerationResult (without in-memory XML); on error the result
+            is failed and no partial file is left
+        """
+        stream = self.open_stream(path, source, dml_code, title)
+        try:
+            stream.add_all(dm_list)
+        except Exception as e:
+            self.logger.error(f"Error streaming DML: {e}")
+            return stream.abort(str(e))
+        return stream.close()
+    
+    def _default_dml_code(self) -> DMLCode:
+        """Build the DML code for this DML type."""
+        return DMLCode(
+            model_ident_code=self.config.model_ident_code,
+            sender_ident=self.config.organization_cage,
+            dml_type=self.dml_type.value
+        )
+    
+    def _build_dml(
+        self,
+        dml_code: DMLCode,
+        title: Optional[str]
+    ) -> Tuple[ET.Element, ET.Element]:
+        """Build the DML tree with an empty dmlContent section."""
+        if title is None:
+            title = f"Data Module List - {self.dml_type.name}"
+        
+        # Create DML root
+        dml = self.create_xml_element("dml")
+        
+        # Ident and status section
+        ident_status = self.create_sub_element(dml, "identAndStatusSection")
+        self._create_dml_address(ident_status, dml_code, title)
+        self._create_dml_status(ident_status, dml_code)
+        
+        # Content section
+        dml_content = self.create_sub_element(dml, "dmlContent")
+        return dml, dml_content
+    
+    def _dml_artifact(self, dml_code: DMLCode, source: Optional[SourceArtifact]) -> OutputArtifact:
+        """Create the output artifact for a DML."""
+        return OutputArtifact(
+            id=f"DML-{dml_code}",
+            path=Path(f"{dml_code}.xml"),
+            artifact_type=ArtifactType.DML,
+            dmc=str(dml_code),
+            source_refs=[source.id] if source else [],
+            generated_at=datetime.now(),
+            valid=True
+        )
+    
     def _create_dml_address(
         self, 
         ident_status: ET.Element, 
@@ -2059,7 +2600,11 @@ class DMLGenerator(BaseGenerator):
         qa = self.create_sub_element(dml_status, "qualityAssurance")
         self.create_sub_element(qa, "unverified")
     
-    def _add_dml_entry(self, dml_content: ET.Element, dmc: DMCode) -> None:
+    def _make_dml_entry(self, dmc: DMCode) -> ET.Element:
+        """Build a detached dmlEntry element for streaming."""
+        return self._add_dml_entry(self.create_xml_element("dmlContent"), dmc)
+    
+    def _add_dml_entry(self, dml_content: ET.Element, dmc: DMCode) -> ET.Element:
         """Add DML entry for a DM."""
         dml_entry = self.create_sub_element(dml_content, "dmlEntry")
         
@@ -2086,6 +2631,7 @@ class DMLGenerator(BaseGenerator):
         self.create_sub_element(entry_status, "security", attrib={
             "securityClassification": self.config.security_classification.value
         })
+        return dml_entry
 
 
 # =============================================================================
@@ -2319,11 +2865,38 @@ class DMGenerator:
     
     Provides a single entry point for generating all DM types.
     Delegates to specific generators based on content type.
+    
+    When a validator is attached, each generated DM is validated
+    immediately against its in-memory element tree, in the same worker,
+    so no serialize/parse round trip is needed before validation.
+    
+    Large contracts can be generated across processes with
+    ``generate_many``; DMCs are derived from source content only, so
+    results are identical to serial generation and returned in input order.
+    
+    With ``output_dir``, each DM is written as soon as it is generated
+    (and validated) and a lean result is returned, so live memory does
+    not grow with the number of DMs; pooled workers send back only the
+    lean result.
+    
+    Usage:
+        >>> validator = CombinedValidator(ValidatorConfig(base_brex_path=brex))
+        >>> generator = DMGenerator(config, context, validator=validator)
+        >>> result = generator.generate(source)
+        >>> result.schema_result.passed
+        >>> results = generator.generate_many(sources, workers=8)
+        >>> results = generator.generate_many(sources, output_dir=Path("out/dm"))
     """
     
-    def __init__(self, config: GeneratorConfig, context: Optional[ExecutionContext] = None):
+    def __init__(
+        self,
+        config: GeneratorConfig,
+        context: Optional[ExecutionContext] = None,
+        validator: Optional["CombinedValidator"] = None,
+    ):
         self.config = config
         self.context = context
+        self.validator = validator
         self.logger = logging.getLogger("asigt.generator.dm")
         
         # Initialize specialized generators
@@ -2332,7 +2905,12 @@ class DMGenerator:
         self._ipd = IPDGenerator(config, context)
         self._fault_isolation = FaultIsolationDMGenerator(config, context)
     
-    def generate(self, source: SourceArtifact, **kwargs) -> GenerationResult:
+    def generate(
+        self,
+        source: SourceArtifact,
+        output_dir: Optional[Path] = None,
+        **kwargs
+    ) -> GenerationResult:
         """
         Generate DM based on source artifact type.
         
@@ -2340,6 +2918,7 @@ class DMGenerator:
         
         Args:
             source: Source artifact
+            output_dir: Write the DM here and return a lean result
             **kwargs: Additional parameters
             
         Returns:
@@ -2352,33 +2931,118 @@ class DMGenerator:
         
         # Delegate to appropriate generator
         if dm_type == DMType.DESCRIPTIVE:
-            return self._descriptive.generate(source, **kwargs)
+            generator = self._descriptive
         elif dm_type == DMType.PROCEDURAL:
-            return self._procedural.generate(source, **kwargs)
+            generator = self._procedural
         elif dm_type == DMType.IPD:
-            return self._ipd.generate(source, **kwargs)
+            generator = self._ipd
         elif dm_type == DMType.FAULT_ISOLATION:
-            return self._fault_isolation.generate(source, **kwargs)
+            generator = self._fault_isolation
         else:
             result = GenerationResult(success=False)
             result.errors.append(f"Unsupported DM type: {dm_type}")
             return result
+        
+        result = self._validate_inline(generator.generate(source, **kwargs))
+        return self._write_lean(generator, result, output_dir)
+    
+    def generate_many(
+        self,
+        sources: Iterable[SourceArtifact],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        output_dir: Optional[Path] = None,
+        **kwargs
+    ) -> List[GenerationResult]:
+        """
+        Generate DMs for many sources on a bounded process pool.
+        
+        Each worker builds its own generators (and validator, if one is
+        attached) once, then generates and validates its share of sources.
+        
+        Args:
+            sources: Source artifacts
+            workers: Worker processes (default: CPU count); 1 runs serially
+            chunksize: Sources sent to a worker per task (default: balanced)
+            output_dir: Write each DM here and return lean results
+            **kwargs: Additional parameters passed to ``generate``
+            
+        Returns:
+            List of GenerationResult, in the same order as ``sources``
+        """
+        sources = list(sources)
+        workers = min(workers or os.cpu_count() or 1, len(sources))
+        
+        if workers <= 1:
+            return [self.generate(source, output_dir, **kwargs) for source in sources]
+        
+        if chunksize is None:
+            chunksize = max(1, len(sources) // (workers * 4))
+        
+        validator_config = self.validator.config if self.validator is not None else None
+        self.logger.info(f"Generating {len(sources)} DMs on {workers} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_generation_worker,
+            initargs=(self.config, self.context, validator_config),
+        ) as pool:
+            return list(pool.map(
+                partial(_generate_in_worker, output_dir=output_dir, **kwargs),
+                sources,
+                chunksize=chunksize,
+            ))
     
     def generate_descriptive(self, source: SourceArtifact, **kwargs) -> GenerationResult:
         """Generate descriptive DM."""
-        return self._descriptive.generate(source, **kwargs)
+        return self._validate_inline(self._descriptive.generate(source, **kwargs))
     
     def generate_procedural(self, source: SourceArtifact, **kwargs) -> GenerationResult:
         """Generate procedural DM."""
-        return self._procedural.generate(source, **kwargs)
+        return self._validate_inline(self._procedural.generate(source, **kwargs))
     
     def generate_ipd(self, source: SourceArtifact, **kwargs) -> GenerationResult:
         """Generate IPD DM."""
-        return self._ipd.generate(source, **kwargs)
+        return self._validate_inline(self._ipd.generate(source, **kwargs))
     
     def generate_fault_isolation(self, source: SourceArtifact, **kwargs) -> GenerationResult:
         """Generate fault isolation DM."""
-        return self._fault_isolation.generate(source, **kwargs)
+        return self._validate_inline(self._fault_isolation.generate(source, **kwargs))
+    
+    def _validate_inline(self, result: GenerationResult) -> GenerationResult:
+        """Validate a successful result in memory if a validator is attached."""
+        if self.validator is None or not result.success:
+            return result
+        try:
+            self.validator.validate_generation(result)
+        except Exception as e:
+            self.logger.error(f"Inline validation failed for {result.dmc}: {e}")
+            result.warnings.append(f"Inline validation not completed: {e}")
+        return result
+    
+    def _write_lean(
+        self,
+        generator: BaseGenerator,
+        result: GenerationResult,
+        output_dir: Optional[Path]
+    ) -> GenerationResult:
+        """
+        Write a successful result under output_dir with the generator that
+        produced it, and release its XML once it is on disk.
+        """
+        if output_dir is None or not result.success:
+            return result
+        try:
+            path = generator.write_result(result, Path(output_dir))
+        except OSError as e:
+            self.logger.error(f"Failed to write {result.dmc}: {e}")
+            result.success = False
+            result.errors.append(f"Failed to write DM: {e}")
+            return result
+        if path is None:
+            result.warnings.append("DM not written: result has no element tree or artifact")
+            return result
+        return result.release()
     
     def _determine_dm_type(self, source: SourceArtifact) -> DMType:
         """Determine DM type from source artifact."""
@@ -2410,6 +3074,34 @@ class DMGenerator:
         return DMType.DESCRIPTIVE
 
 
+# =============================================================================
+# PROCESS POOL WORKERS
+# =============================================================================
+
+
+# Per-process generator, built once by the pool initializer
+_WORKER_GENERATOR: Optional[DMGenerator] = None
+
+
+def _init_generation_worker(
+    config: GeneratorConfig,
+    context: Optional[ExecutionContext],
+    validator_config: Optional[Any],
+) -> None:
+    """Build the DMGenerator (and validator) used by a worker process."""
+    global _WORKER_GENERATOR
+    validator = None
+    if validator_config is not None:
+        from .validators import CombinedValidator
+        validator = CombinedValidator(validator_config, context)
+    _WORKER_GENERATOR = DMGenerator(config, context, validator=validator)
+
+
+def _generate_in_worker(source: SourceArtifact, **kwargs) -> GenerationResult:
+    """Generate one DM with the worker's generator."""
+    return _WORKER_GENERATOR.generate(source, **kwargs)
+
+
 # =============================================================================
 # MODULE EXPORTS
 # =============================================================================
@@ -2445,6 +3137,7 @@ __all__ = [
     
     # Generators
     "BaseGenerator",
+    "XMLEntryStream",
     "DescriptiveDMGenerator",
     "ProceduralDMGenerator",
     "IPDGenerator",
@@ -20,12 +20,14 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+from xml.etree import ElementTree as ET
 
 import yaml
 
 from .engine import (
     ASIGTEngine,
     ArtifactType,
+    ErrorSeverity,
     ExecutionContext,
     ExecutionMetrics,
     OutputArtifact,
@@ -35,10 +37,43 @@ from .engine import (
     StageResult,
     StageStatus,
 )
+from .templates import DMSkeletonLibrary, info_code_from_dmc
+from .validators import CombinedValidator, ValidatorConfig
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _parse_citation(entry: Any) -> Tuple[str, str]:
+    """Return (code, title) from a string or dict ref entry.
+
+    Key lookup uses explicit None and empty-string checks so that a
+    key present with a falsy value does not mask a later key that
+    carries a real value.
+    """
+    if isinstance(entry, str):
+        return entry, ""
+    if isinstance(entry, dict):
+        code = ""
+        for key in ("standard", "code", "name"):
+            val = entry.get(key)
+            if val is not None and val != "":
+                code = str(val)
+                break
+        title = ""
+        for key in ("title", "description"):
+            val = entry.get(key)
+            if val is not None and val != "":
+                title = str(val)
+                break
+        return code, title
+    return "", ""
+
+
 # =============================================================================
 # PIPELINE STAGES
 # =============================================================================
@@ -458,11 +493,30 @@ class TransformStage:
     - Apply SNS coding
     - Handle ICN (graphics) references
     - Generate DMC codes
+    
+    Stage options (``PipelineStageConfig.config``):
+        validate_inline: Validate each DM against BREX and schema while its
+            XML is still in memory, instead of re-reading the written files
+            in a later stage. Invalid DMs are flagged on the artifact and
+            reported as stage warnings.
+        skeleton_dir: Directory of precompiled DM skeletons
+            (default: the built-in ``asigt/skeletons``).
     """
     
     def __init__(self, config: PipelineStageConfig):
         self.config = config
         self.logger = logging.getLogger("asigt.pipeline.transform")
+        self.validate_inline = bool(config.config.get("validate_inline", False))
+        self._validator: Optional[CombinedValidator] = None
+        self._skeletons: Optional[DMSkeletonLibrary] = None
+    
+    @property
+    def skeletons(self) -> DMSkeletonLibrary:
+        """Compiled DM skeleton library (built on first use)."""
+        if self._skeletons is None:
+            skeleton_dir = self.config.config.get("skeleton_dir")
+            self._skeletons = DMSkeletonLibrary(Path(skeleton_dir) if skeleton_dir else None)
+        return self._skeletons
     
     def execute(
         self, 
@@ -495,7 +549,12 @@ class TransformStage:
                 status=StageStatus.COMPLETED,
                 start_time=start_time,
                 end_time=end_time,
-                artifacts_produced=len(data_modules)
+                artifacts_produced=len(data_modules),
+                warnings=[
+                    f"{dm.dmc}: {error}"
+                    for dm in data_modules if not dm.valid
+                    for error in dm.validation_errors
+                ]
             )
             
             self.logger.info(f"TRANSFORM completed: {len(data_modules)} DMs generated")
@@ -539,9 +598,12 @@ class TransformStage:
             )
             
             # Generate S1000D XML (simplified)
-            self._generate_dm_xml(artifact, source)
+            xml_content = self._generate_dm_xml(artifact, source)
             artifact.compute_hash()
             
+            if self.validate_inline:
+                self._validate_dm(artifact, xml_content, context)
+            
             data_modules.append(artifact)
         
         return data_modules
@@ -568,18 +630,69 @@ class TransformStage:
         
         return mapping.get(source_type, ArtifactType.DM_DESCRIPTIVE)
     
-    def _generate_dm_xml(self, artifact: OutputArtifact, source: Dict[str, Any]) -> None:
-        """Generate S1000D XML for data module."""
-        from xml.sax.saxutils import escape
-
-        # Simplified XML generation
+    def _validate_dm(
+        self,
+        artifact: OutputArtifact,
+        xml_content: str,
+        context: ExecutionContext
+    ) -> None:
+        """Validate generated DM content in memory and flag the artifact."""
+        if self._validator is None:
+            self._validator = CombinedValidator(ValidatorConfig(
+                base_brex_path=context.brex_rules_path,
+                schema_path=context.schema_path,
+            ))
+        
+        try:
+            root = ET.fromstring(xml_content)
+        except ET.ParseError as e:
+            artifact.valid = False
+            artifact.validation_errors.append(f"XML parse error: {e}")
+            return
+        
+        # Parse once, validate the same tree against BREX and schema
+        brex_result = self._validator.brex_validator.validate_result(root)
+        schema_result = self._validator.schema_validator.validate_result(root)
+        
+        errors = [
+            issue.message for issue in brex_result.issues + schema_result.issues
+            if issue.severity in (ErrorSeverity.ERROR, ErrorSeverity.FATAL)
+        ]
+        if errors:
+            artifact.valid = False
+            artifact.validation_errors.extend(errors)
+    
+    def _generate_dm_xml(self, artifact: OutputArtifact, source: Dict[str, Any]) -> str:
+        """Generate S1000D XML for data module and return the written content."""
+        content = source.get("content", {})
+        
+        xml_content = self.skeletons.render(
+            artifact.artifact_type,
+            info_code_from_dmc(artifact.dmc),
+            dmc=artifact.dmc,
+            issue_date=datetime.now(),
+            title=content.get("title", "Untitled"),
+            description=content.get("description", ""),
+            citations=self._collect_citations(source),
+        )
+        
+        # Write XML to file
+        with open(artifact.path, "w", encoding="utf-8") as f:
+            f.write(xml_content)
+        
+        return xml_content
+    
+    @staticmethod
+    def _collect_citations(source: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Collect (code, title) citations for a source, skipping empty codes.
+        
+        Regulatory references come from the enrichment dict when available
+        (set by ValidateEnrichStage); otherwise from raw content. Both
+        'regulatory_refs' and 'standards' are merged so neither is silently
+        ignored when both are present.
+        """
         content = source.get("content", {})
-        title = escape(content.get("title", "Untitled"))
-        description = escape(content.get("description", ""))
-
-        # Collect regulatory references from the enrichment dict when available (set by
-        # ValidateEnrichStage); otherwise fall back to raw content.  Both 'regulatory_refs'
-        # and 'standards' are merged so neither is silently ignored when both are present.
         enrichment = source.get("enrichment", {})
         if enrichment.get("regulatory_refs") is not None:
             reg_refs: list = list(enrichment["regulatory_refs"])
@@ -596,105 +709,12 @@ class TransformStage:
         else:
             best_practices = list(content.get("best_practices") or [])
 
-        all_citations = reg_refs + best_practices
-
-        def _parse(entry: Any):
-            """Return (code, title) from a string or dict ref entry.
-
-            Key lookup uses explicit None and empty-string checks so that a
-            key present with a falsy value does not mask a later key that
-            carries a real value.
-            """
-            if isinstance(entry, str):
-                return entry, ""
-            if isinstance(entry, dict):
-                code = ""
-                for key in ("standard", "code", "name"):
-                    val = entry.get(key)
-                    if val is not None and val != "":
-                        code = str(val)
-                        break
-                title = ""
-                for key in ("title", "description"):
-                    val = entry.get(key)
-                    if val is not None and val != "":
-                        title = str(val)
-                        break
-                return code, title
-            return "", ""
-
-        # Build refs XML block for dmStatus (single loop via shared _parse helper)
-        refs_xml = ""
-        if all_citations:
-            ref_lines = []
-            for entry in all_citations:
-                code, pub_title = _parse(entry)
-                if not code:
-                    continue
-                title_elem = (
-                    f"\n          <externalPubTitle>{escape(pub_title)}</externalPubTitle>"
-                    if pub_title else ""
-                )
-                ref_lines.append(
-                    f"      <externalPubRef>\n"
-                    f"        <externalPubRefIdent>\n"
-                    f"          <externalPubCode>{escape(code)}</externalPubCode>"
-                    f"{title_elem}\n"
-                    f"        </externalPubRefIdent>\n"
-                    f"      </externalPubRef>"
-                )
-            if ref_lines:
-                refs_xml = "\n    <refs>\n" + "\n".join(ref_lines) + "\n    </refs>"
-
-        # Build inline citations content block (reuses _parse helper, no duplication)
-        citations_xml = ""
-        if all_citations:
-            citation_lines = []
-            for entry in all_citations:
-                code, pub_title = _parse(entry)
-                if not code:
-                    continue
-                text = f"[{escape(code)}] {escape(pub_title)}" if pub_title else f"[{escape(code)}]"
-                citation_lines.append(f"      <para>{text}</para>")
-            if citation_lines:
-                citations_xml = (
-                    "\n      <levelledPara>\n"
-                    "        <title>Regulatory References and Industry Best Practices</title>\n"
-                    + "\n".join(citation_lines)
-                    + "\n      </levelledPara>"
-                )
-
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<dmodule xmlns="http://www.s1000d.org/S1000D_5-0">
-  <identAndStatusSection>
-    <dmAddress>
-      <dmIdent>
-        <dmCode dmCode="{artifact.dmc}"/>
-        <language languageIsoCode="en" countryIsoCode="US"/>
-        <issueInfo issueNumber="001" inWork="00"/>
-      </dmIdent>
-      <dmAddressItems>
-        <issueDate year="{datetime.now().year}" month="{datetime.now().month}" day="{datetime.now().day}"/>
-        <dmTitle>
-          <techName>{title}</techName>
-          <infoName>Description</infoName>
-        </dmTitle>
-      </dmAddressItems>
-    </dmAddress>
-    <dmStatus issueType="new">{refs_xml}
-    </dmStatus>
-  </identAndStatusSection>
-  <content>
-    <description>
-      <para>{description}</para>{citations_xml}
-    </description>
-  </content>
-</dmodule>
-"""
-
-        # Write XML to file
-        with open(artifact.path, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+        citations = []
+        for entry in reg_refs + best_practices:
+            code, pub_title = _parse_citation(entry)
+            if code:
+                citations.append((code, pub_title))
+        return citations
     
     def _link_icn_references(
         self, 
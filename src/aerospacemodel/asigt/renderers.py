@@ -21,20 +21,28 @@ Rendering Flow:
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import io
 import json
 import logging
+import os
 import shutil
+import time
 import zipfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -50,6 +58,9 @@ from .engine import (
     ExecutionContext,
     ASIGTError,
 )
+from .search import DEFAULT_SHARDS, SHARD_GLOB, SearchIndex
+from .xref import DanglingRef, XrefGraph, dm_ref_code
+from ..asit.integrity import hash_file
 
 
 logger = logging.getLogger(__name__)
@@ -130,6 +141,10 @@ class PDFRenderOptions:
     include_page_numbers: bool = True
     include_revision_marks: bool = False
     
+    # Publication chunking: None renders one document; "dm" or "chapter"
+    # (top-level pmEntry) renders each part separately and merges them
+    chunk_by: Optional[str] = None
+    
     # Header/Footer
     header_text: Optional[str] = None
     footer_text: Optional[str] = None
@@ -249,6 +264,8 @@ class PDFRenderResult:
     page_count: int = 0
     file_size_bytes: int = 0
     dm_codes: List[str] = field(default_factory=list)
+    dm_pages: Dict[str, int] = field(default_factory=dict)     # DM -> first page (chunked)
+    chunk_count: int = 0
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     rendered_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -268,6 +285,8 @@ class PDFRenderResult:
             "file_size_bytes": self.file_size_bytes,
             "file_size_mb": self.file_size_mb,
             "dm_codes": self.dm_codes,
+            "dm_pages": self.dm_pages,
+            "chunk_count": self.chunk_count,
             "errors": self.errors,
             "warnings": self.warnings,
             "rendered_at": self.rendered_at,
@@ -288,6 +307,8 @@ class HTMLRenderResult:
     rendered_at: str = field(default_factory=lambda: datetime.now().isoformat())
     render_time_seconds: float = 0.0
     file_size_bytes: int = 0
+    dm_timings: Dict[str, float] = field(default_factory=dict)  # DM code -> seconds
+    unchanged_dms: List[str] = field(default_factory=list)      # Reused from manifest
     
     @property
     def file_size_kb(self) -> float:
@@ -307,6 +328,8 @@ class HTMLRenderResult:
             "render_time_seconds": self.render_time_seconds,
             "file_size_bytes": self.file_size_bytes,
             "file_size_kb": self.file_size_kb,
+            "dm_timings": self.dm_timings,
+            "unchanged_dms": self.unchanged_dms,
         }
 
 
@@ -320,6 +343,8 @@ class IETPPackageResult:
     icn_count: int = 0
     multimedia_count: int = 0
     total_size_bytes: int = 0
+    unchanged_dms: List[str] = field(default_factory=list)      # Reused from manifest
+    dangling_refs: List[DanglingRef] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     packaged_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -341,6 +366,8 @@ class IETPPackageResult:
             "multimedia_count": self.multimedia_count,
             "total_size_bytes": self.total_size_bytes,
             "total_size_mb": self.total_size_mb,
+            "unchanged_dms": self.unchanged_dms,
+            "dangling_refs": [asdict(ref) for ref in self.dangling_refs],
             "errors": self.errors,
             "warnings": self.warnings,
             "packaged_at": self.packaged_at,
@@ -348,11 +375,499 @@ class IETPPackageResult:
         }
 
 
+# =============================================================================
+# RENDER MANIFEST
+# =============================================================================
+
+
+# Version of the converters, page templates and stylesheets. Part of every
+# manifest key; bump it when rendered output changes to force a full re-render.
+STYLESHEET_VERSION = "1"
+
+
+def content_hash(content: Union[str, ET.Element]) -> str:
+    """SHA-256 of DM XML content (strings hashed as-is, trees serialized)."""
+    if not isinstance(content, str):
+        content = ET.tostring(content, encoding="unicode")
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def hashed_asset_name(name: str, text: str) -> str:
+    """Put a content hash into an asset file name (styles.css -> styles.<hash>.css)."""
+    stem, _, suffix = name.rpartition(".")
+    return f"{stem}.{hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]}.{suffix}"
+
+
+def manifest_key(*parts: str) -> str:
+    """Combine the inputs of an output page into one manifest key."""
+    digest = hashlib.sha256(STYLESHEET_VERSION.encode("utf-8"))
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderManifest:
+    """
+    Input hashes of previously rendered output files.
+    
+    Each entry maps an output file (relative to the output directory) to
+    the key of the inputs it was rendered from, plus data needed to reuse
+    the file without re-reading its source (e.g. the DM title). A file is
+    re-rendered only when its key changes or it is missing on disk.
+    
+    Usage:
+        >>> manifest = RenderManifest(Path("out/html/.render-manifest.json"))
+        >>> renderer.render_pm(pm, dms, Path("out/html"), manifest=manifest)
+    """
+    
+    def __init__(self, manifest_path: Optional[Path] = None):
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.manifest_path is not None and self.manifest_path.exists():
+            self.load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+    
+    def names(self) -> List[str]:
+        """Return recorded output file names."""
+        return list(self._entries)
+    
+    def lookup(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry data for an output file if its key is unchanged, else None."""
+        entry = self._entries.get(name)
+        if entry is None or entry["key"] != key:
+            return None
+        return entry
+    
+    def store(self, name: str, key: str, **data: Any) -> None:
+        """Record the key (and reusable data) an output file was rendered from."""
+        self._entries[name] = {"key": key, **data}
+        self._dirty = True
+    
+    def discard(self, name: str) -> None:
+        """Forget an output file."""
+        if self._entries.pop(name, None) is not None:
+            self._dirty = True
+    
+    def prune(self, output_dir: Path, keep: Set[str]) -> List[str]:
+        """
+        Delete recorded output files that are no longer produced.
+        
+        Args:
+            output_dir: Directory the names are relative to
+            keep: Names produced by the current render
+            
+        Returns:
+            Names removed
+        """
+        removed = [name for name in self._entries if name not in keep]
+        for name in removed:
+            (output_dir / name).unlink(missing_ok=True)
+            del self._entries[name]
+        if removed:
+            self._dirty = True
+        return removed
+    
+    def clear(self) -> None:
+        """Drop all entries, forcing a full re-render."""
+        self._entries.clear()
+        self._dirty = True
+    
+    def load(self) -> None:
+        """Load entries from the manifest file."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable render manifest {self.manifest_path}: {e}")
+            return
+        self._entries = dict(data.get("entries", {}))
+        self._dirty = False
+    
+    def save(self) -> None:
+        """Persist entries to the manifest file if anything changed."""
+        if self.manifest_path is None or not self._dirty:
+            return
+        data = {
+            "stylesheet_version": STYLESHEET_VERSION,
+            "entries": dict(sorted(self._entries.items())),
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+
+# =============================================================================
+# DOCUMENT CACHE
+# =============================================================================
+
+
+# Default bound on the XML source size of cached documents (parsed trees
+# take several times more memory than their source)
+DEFAULT_DOCUMENT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class DocumentCache:
+    """
+    Parsed DM trees shared by the renderers of one publishing run.
+    
+    Entries are keyed by DM code and a hash of the XML text and are only
+    returned when the cached text is equal, so an edited DM is parsed
+    again. Least recently used entries are evicted once the cached XML
+    source exceeds ``max_bytes``. Cached trees are shared between
+    renderers and must be treated as read-only.
+    
+    Usage:
+        >>> documents = DocumentCache()
+        >>> pdf = PDFRenderer(contract, config, documents=documents)
+        >>> html = HTMLRenderer(contract, config, documents=documents)
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_DOCUMENT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[str, ET.Element]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def parse(self, content: Union[str, ET.Element], dm_code: str = "") -> ET.Element:
+        """
+        Return the parsed tree of DM content, parsing it on a miss.
+        
+        Args:
+            content: DM XML text (elements are returned as given)
+            dm_code: DM code the content belongs to
+            
+        Returns:
+            Root element
+            
+        Raises:
+            ET.ParseError: If the content is not well-formed
+        """
+        if not isinstance(content, str):
+            return content
+        
+        key = (dm_code, hash(content))
+        entry = self._entries.get(key)
+        if entry is not None and (entry[0] is content or entry[0] == content):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        
+        self.misses += 1
+        root = ET.fromstring(content)
+        if len(content) <= self.max_bytes:
+            if entry is not None:
+                self.size_bytes -= len(entry[0])
+            self._entries[key] = (content, root)
+            self.size_bytes += len(content)
+            while self.size_bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+                self.evictions += 1
+        return root
+    
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        self._entries.clear()
+        self.size_bytes = 0
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "documents": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# =============================================================================
+# PACKAGE WRITERS
+# =============================================================================
+
+
+# Asset file types collected from graphics and multimedia trees
+GRAPHIC_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".svg", ".cgm", ".tif", ".tiff",
+})
+MULTIMEDIA_EXTENSIONS = frozenset({
+    ".mp4", ".webm", ".mp3", ".wav", ".pdf",
+})
+
+# Already-compressed media; deflating these costs time and saves nothing
+STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".mp4", ".webm", ".mp3", ".zip",
+})
+
+
+# Linux FICLONE ioctl: clone a file's extents copy-on-write (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _hard_link(source: Path, target: Path) -> bool:
+    """Hard-link target to source; False where links are unsupported."""
+    try:
+        os.link(source, target)
+    except OSError:
+        return False
+    return True
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone source to target copy-on-write; False where unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+class PackageWriter(ABC):
+    """
+    Destination of IETP package entries.
+    
+    Entries are written as they are produced, under POSIX-style names
+    relative to the package root (``content/DMC.xml``). Uncompressed
+    entry sizes are accumulated in ``total_bytes``.
+    
+    Usage:
+        >>> with ZipPackageWriter(Path("AMM.zip")) as writer:
+        ...     writer.write_text("index.html", html)
+        ...     writer.copy_file(Path("gfx/ICN-001.png"), "graphics/ICN-001.png")
+    """
+    
+    def __init__(self):
+        self.total_bytes = 0
+        self.entry_count = 0
+    
+    def write_text(self, name: str, text: str) -> None:
+        """Write a UTF-8 text entry."""
+        self.write_bytes(name, text.encode("utf-8"))
+    
+    @abstractmethod
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """Write a binary entry."""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def copy_file(self, source: Path, name: str) -> None:
+        """Copy a file into the package."""
+        raise NotImplementedError
+    
+    def add_asset(self, source: Path, name: str) -> None:
+        """Add a graphic or multimedia file (copied unless overridden)."""
+        self.copy_file(source, name)
+    
+    def remove(self, pattern: str) -> None:
+        """Delete existing entries matching a glob (no-op for new archives)."""
+        pass
+    
+    def close(self) -> None:
+        """Finish the package."""
+        pass
+    
+    def abort(self) -> None:
+        """Discard an unfinished package."""
+        pass
+    
+    def _count(self, size: int) -> None:
+        self.total_bytes += size
+        self.entry_count += 1
+    
+    def __enter__(self) -> "PackageWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class DirectoryPackageWriter(PackageWriter):
+    """
+    Writes package entries as files under a directory.
+    
+    Assets are hard-linked to their source where possible, so packages
+    built from one graphics tree share its storage. Across filesystems
+    an asset is linked to an identical (by SHA-256) asset already in the
+    package, else cloned copy-on-write (reflink) where supported, else
+    copied. An asset whose target already holds the same content is left
+    in place.
+    """
+    
+    def __init__(self, root: Path, link_assets: bool = True):
+        super().__init__()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.link_assets = link_assets
+        self.assets_linked = 0
+        self.assets_reused = 0
+        self._asset_digests: Dict[str, Path] = {}      # SHA-256 -> package file
+    
+    def write_bytes(self, name: str, data: bytes) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self._count(len(data))
+    
+    def copy_file(self, source: Path, name: str) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)        # never write through a hard link
+        shutil.copy2(source, path)
+        self._count(path.stat().st_size)
+    
+    def add_asset(self, source: Path, name: str) -> None:
+        path = self.root / name
+        size = source.stat().st_size
+        digest = None
+        if path.exists():
+            if os.path.samefile(source, path):
+                self.assets_reused += 1
+                self._count(size)
+                return
+            if path.stat().st_size == size:
+                digest = hash_file(source)
+                if hash_file(path) == digest:
+                    self._asset_digests.setdefault(digest, path)
+                    self.assets_reused += 1
+                    self._count(size)
+                    return
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if self.link_assets:
+            if _hard_link(source, path):
+                self.assets_linked += 1
+                self._count(size)
+                return
+            digest = digest or hash_file(source)
+            same = self._asset_digests.get(digest)
+            if same is not None and _hard_link(same, path):
+                self.assets_linked += 1
+                self._count(size)
+                return
+            if not _reflink(source, path):
+                shutil.copy2(source, path)
+        else:
+            shutil.copy2(source, path)
+        if digest is not None:
+            self._asset_digests.setdefault(digest, path)
+        self._count(size)
+    
+    def keep(self, name: str) -> bool:
+        """Count an entry left in place from a previous run; False if missing."""
+        try:
+            self._count((self.root / name).stat().st_size)
+        except OSError:
+            return False
+        return True
+    
+    def remove(self, pattern: str) -> None:
+        for path in self.root.glob(pattern):
+            if path.is_file():
+                path.unlink()
+
+
+class ZipPackageWriter(PackageWriter):
+    """
+    Streams package entries straight into a ZIP archive.
+    
+    The archive is built next to ``archive_path`` and moved into place
+    by ``close``, so a failed run never leaves a truncated package.
+    Entries with a STORED_EXTENSIONS suffix are stored, the rest deflated.
+    A repeated entry name keeps the first entry.
+    """
+    
+    def __init__(self, archive_path: Path):
+        super().__init__()
+        self.archive_path = Path(archive_path)
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.archive_path.with_name(self.archive_path.name + ".tmp")
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", zipfile.ZIP_DEFLATED)
+        self._names: Set[str] = set()
+    
+    @staticmethod
+    def _compression(name: str) -> int:
+        if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+    
+    def _claim(self, name: str) -> bool:
+        if name in self._names:
+            logger.warning(f"Duplicate package entry skipped: {name}")
+            return False
+        self._names.add(name)
+        return True
+    
+    def write_bytes(self, name: str, data: bytes) -> None:
+        if self._claim(name):
+            self._zip.writestr(name, data, compress_type=self._compression(name))
+            self._count(len(data))
+    
+    def copy_file(self, source: Path, name: str) -> None:
+        if self._claim(name):
+            self._zip.write(source, name, compress_type=self._compression(name))
+            self._count(self._zip.getinfo(name).file_size)
+    
+    def close(self) -> None:
+        self._zip.close()
+        os.replace(self._tmp_path, self.archive_path)
+    
+    def abort(self) -> None:
+        self._zip.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
 # =============================================================================
 # BASE RENDERER CLASS
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rpartition("}")[2]
+
+
+def _escape_html(text: str) -> str:
+    """Escape HTML special characters."""
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
+
 class BaseRenderer(ABC):
     """
     Abstract base class for all ASIGT renderers.
@@ -362,11 +877,16 @@ class BaseRenderer(ABC):
     
     S1000D_NS = "http://www.s1000d.org/S1000D_5-0"
     
+    # Element local name -> converter method name; others use _write_default.
+    # Resolved once per namespace-qualified tag into self._dispatch.
+    CONVERTERS: Dict[str, str] = {}
+    
     def __init__(
         self, 
         contract: Dict[str, Any], 
         config: Dict[str, Any],
-        context: Optional[ExecutionContext] = None
+        context: Optional[ExecutionContext] = None,
+        documents: Optional[DocumentCache] = None,
     ):
         """
         Initialize renderer.
@@ -375,6 +895,8 @@ class BaseRenderer(ABC):
             contract: ASIT transformation contract (required)
             config: Renderer configuration
             context: Execution context from ASIT
+            documents: Parsed-document cache to share with other renderers
+                       (default: a private cache)
             
         Raises:
             ValueError: If contract is missing
@@ -393,6 +915,17 @@ class BaseRenderer(ABC):
         
         # Statistics
         self._render_count = 0
+        
+        # Parsed DM trees, shared across renderers of one run
+        self.documents = documents if documents is not None else DocumentCache(
+            config.get("document_cache_bytes", DEFAULT_DOCUMENT_CACHE_BYTES)
+        )
+        
+        # Qualified tag -> bound converter (see _resolve_converter)
+        self._dispatch: Dict[str, Callable[[ET.Element, Any, List[str]], None]] = {}
+        
+        # (asset name, options fingerprint) -> (hashed file name, text)
+        self._assets: Dict[Tuple[str, str], Tuple[str, str]] = {}
     
     @abstractmethod
     def render(self, content: Any, output_path: Optional[Path] = None) -> Any:
@@ -412,6 +945,34 @@ class BaseRenderer(ABC):
     # Common XML Helpers
     # =========================================================================
     
+    def _parse_document(
+        self,
+        content: Union[str, ET.Element],
+        dm_code: str = ""
+    ) -> ET.Element:
+        """Parse XML content through the shared document cache."""
+        return self.documents.parse(content, dm_code)
+    
+    def _cached_asset(
+        self,
+        name: str,
+        fingerprint: str,
+        build: Callable[[], str]
+    ) -> Tuple[str, str]:
+        """
+        Return the content-hashed file name and text of a generated asset.
+        
+        ``build`` runs once per (name, fingerprint); later calls reuse the
+        text and its hash. The fingerprint is typically the options repr,
+        which covers every option field.
+        """
+        key = (name, fingerprint)
+        asset = self._assets.get(key)
+        if asset is None:
+            text = build()
+            asset = self._assets[key] = (hashed_asset_name(name, text), text)
+        return asset
+    
     def _find_element(
         self, 
         root: ET.Element, 
@@ -419,8 +980,7 @@ class BaseRenderer(ABC):
     ) -> Optional[ET.Element]:
         """Find element by local name (ignoring namespace)."""
         for elem in root.iter():
-            local_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-            if local_name == name:
+            if _local_name(elem.tag) == name:
                 return elem
         return None
     
@@ -442,16 +1002,30 @@ class BaseRenderer(ABC):
         name: str
     ) -> List[ET.Element]:
         """Find all elements by local name."""
-        results = []
-        for elem in root.iter():
-            local_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-            if local_name == name:
-                results.append(elem)
-        return results
+        return [elem for elem in root.iter() if _local_name(elem.tag) == name]
     
-    def _get_local_name(self, element: ET.Element) -> str:
-        """Get local name of element (without namespace)."""
-        return element.tag.split("}")[-1] if "}" in element.tag else element.tag
+    # =========================================================================
+    # Element Conversion
+    # =========================================================================
+    
+    def _element_to_html(self, element: ET.Element, options: Any) -> str:
+        """Convert XML element to HTML recursively."""
+        out: List[str] = []
+        self._write_element(element, options, out)
+        return "".join(out)
+    
+    def _write_element(self, element: ET.Element, options: Any, out: List[str]) -> None:
+        """Append the HTML for an XML element (and its subtree) to out."""
+        convert = self._dispatch.get(element.tag)
+        if convert is None:
+            convert = self._resolve_converter(element.tag)
+        convert(element, options, out)
+    
+    def _resolve_converter(self, tag: str) -> Callable[[ET.Element, Any, List[str]], None]:
+        """Look up the converter for a (namespace-qualified) tag and cache it."""
+        convert = getattr(self, self.CONVERTERS.get(_local_name(tag), "_write_default"))
+        self._dispatch[tag] = convert
+        return convert
     
     def _extract_dm_code(self, root: ET.Element) -> str:
         """Extract DM code from XML."""
@@ -490,22 +1064,11 @@ class BaseRenderer(ABC):
     
     def _build_dmc_string(self, dm_code: ET.Element) -> str:
         """Build DMC string from dmCode element."""
-        parts = [
-            dm_code.get("modelIdentCode", ""),
-            dm_code.get("systemCode", ""),
-            dm_code.get("infoCode", ""),
-        ]
-        return "-".join(p for p in parts if p) or "UNKNOWN"
+        return dm_ref_code(dm_code)
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;")
-        )
+        return _escape_html(text)
     
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize filename by removing invalid characters."""
@@ -517,6 +1080,14 @@ class BaseRenderer(ABC):
 # =============================================================================
 
 
+# Chunked rendering: chunk pages carry the header, the overlay the footer
+PDF_NO_FOOTER_CSS = "\n@page { @bottom-center { content: none; } }"
+PDF_FOOTER_ONLY_CSS = (
+    "\n@page { @top-center { content: none; } }"
+    "\n.footer-page + .footer-page { break-before: page; }"
+)
+
+
 class PDFRenderer(BaseRenderer):
     """
     S1000D PDF Renderer.
@@ -539,13 +1110,34 @@ class PDFRenderer(BaseRenderer):
         >>> result = renderer.render_dm(dm_xml, Path("output/AMM.pdf"))
     """
     
+    CONVERTERS = {
+        "description": "_write_description",
+        "procedure": "_write_procedure",
+        "levelledPara": "_write_levelled_para",
+        "para": "_write_para",
+        "title": "_write_title",
+        "warning": "_write_warning",
+        "caution": "_write_caution",
+        "note": "_write_note",
+        "table": "_write_table",
+        "figure": "_write_figure",
+        "proceduralStep": "_write_procedural_step",
+        "internalRef": "_write_internal_ref",
+        "externalPubRef": "_write_external_ref",
+        "dmRef": "_write_dm_ref",
+        "randomList": "_write_random_list",
+        "sequentialList": "_write_sequential_list",
+        "definitionList": "_write_definition_list",
+    }
+    
     def __init__(
         self,
         contract: Dict[str, Any],
         config: Dict[str, Any],
-        context: Optional[ExecutionContext] = None
+        context: Optional[ExecutionContext] = None,
+        documents: Optional[DocumentCache] = None,
     ):
-        super().__init__(contract, config, context)
+        super().__init__(contract, config, context, documents)
         
         # Parse options
         self.options = PDFRenderOptions(
@@ -563,6 +1155,7 @@ class PDFRenderer(BaseRenderer):
             margin_bottom_mm=config.get("margin_bottom_mm", 25.0),
             margin_left_mm=config.get("margin_left_mm", 20.0),
             margin_right_mm=config.get("margin_right_mm", 20.0),
+            chunk_by=config.get("chunk_by"),
         )
         
         # Statistics
@@ -607,10 +1200,7 @@ class PDFRenderer(BaseRenderer):
         
         # Parse XML
         try:
-            if isinstance(dm_content, str):
-                root = ET.fromstring(dm_content)
-            else:
-                root = dm_content
+            root = self._parse_document(dm_content)
         except ET.ParseError as e:
             result.errors.append(f"XML parse error: {e}")
             return result
@@ -629,10 +1219,9 @@ class PDFRenderer(BaseRenderer):
         
         # Render to PDF
         try:
-            pdf_data = self._html_to_pdf(html_content, options)
+            pdf_data, result.page_count, _ = self._layout_pdf(html_content, options)
             result.pdf_data = pdf_data
             result.file_size_bytes = len(pdf_data)
-            result.page_count = self._estimate_page_count(pdf_data)
             result.success = True
         except Exception as e:
             result.errors.append(f"PDF generation error: {e}")
@@ -663,15 +1252,23 @@ class PDFRenderer(BaseRenderer):
         dm_contents: Dict[str, Union[str, ET.Element]],
         output_path: Optional[Path] = None,
         options: Optional[PDFRenderOptions] = None,
+        workers: Optional[int] = None,
     ) -> PDFRenderResult:
         """
         Render a Publication Module with all DMs to PDF.
         
+        With ``options.chunk_by`` set, each DM or chapter is laid out once
+        as its own document (on a process pool when ``workers`` > 1) and
+        the parts are merged; TOC, LEP and footers carry the page numbers
+        of the merged document.
+        
         Args:
             pm_content: Publication Module XML
             dm_contents: Dictionary mapping DM codes to DM XML content
             output_path: Output PDF path
             options: Rendering options
+            workers: Worker processes for chunked rendering (default:
+                     config "workers", else 1; 0 uses every CPU)
             
         Returns:
             PDFRenderResult
@@ -682,10 +1279,7 @@ class PDFRenderer(BaseRenderer):
         
         # Parse PM XML
         try:
-            if isinstance(pm_content, str):
-                pm_root = ET.fromstring(pm_content)
-            else:
-                pm_root = pm_content
+            pm_root = self._parse_document(pm_content)
         except ET.ParseError as e:
             result.errors.append(f"PM parse error: {e}")
             return result
@@ -695,58 +1289,16 @@ class PDFRenderer(BaseRenderer):
         dm_refs = self._extract_dm_refs(pm_root)
         result.dm_codes = dm_refs
         
-        # Build combined HTML document
-        html_parts = []
-        
-        # Cover page
-        html_parts.append(self._generate_cover_page(pm_title, options))
-        
-        # Table of contents
-        if options.include_toc:
-            html_parts.append(self._generate_toc(dm_refs, dm_contents, options))
-        
-        # List of effective pages
-        if options.include_lep:
-            html_parts.append(self._generate_lep(dm_refs))
-        
-        # Render each DM
-        for dm_ref in dm_refs:
-            if dm_ref in dm_contents:
-                try:
-                    dm_xml = dm_contents[dm_ref]
-                    if isinstance(dm_xml, str):
-                        dm_root = ET.fromstring(dm_xml)
-                    else:
-                        dm_root = dm_xml
-                    
-                    dm_title = self._find_element_text(dm_root, "techName", dm_ref)
-                    dm_html = self._dm_content_to_html(dm_root, options)
-                    
-                    # Page break before each DM
-                    html_parts.append('<div class="page-break"></div>')
-                    html_parts.append(f'<section class="data-module" id="{self._sanitize_filename(dm_ref)}">')
-                    html_parts.append(f'<h1>{self._escape_html(dm_title)}</h1>')
-                    html_parts.append(dm_html)
-                    html_parts.append('</section>')
-                    
-                except Exception as e:
-                    result.warnings.append(f"Failed to render DM {dm_ref}: {e}")
-            else:
-                result.warnings.append(f"DM content not found: {dm_ref}")
-        
-        # Combine HTML
-        full_html = self._wrap_html_document(
-            "\n".join(html_parts), 
-            pm_title, 
-            options
-        )
-        
-        # Render to PDF
+        # Render to PDF, as one document or in chunks
         try:
-            pdf_data = self._html_to_pdf(full_html, options)
+            if options.chunk_by:
+                pdf_data = self._render_chunked(
+                    pm_root, pm_title, dm_refs, dm_contents, options, workers, result
+                )
+            else:
+                pdf_data = self._render_single(pm_title, dm_refs, dm_contents, options, result)
             result.pdf_data = pdf_data
             result.file_size_bytes = len(pdf_data)
-            result.page_count = self._estimate_page_count(pdf_data)
             result.success = True
         except Exception as e:
             result.errors.append(f"PDF generation error: {e}")
@@ -769,6 +1321,244 @@ class PDFRenderer(BaseRenderer):
         
         return result
     
+    def _render_single(
+        self,
+        pm_title: str,
+        dm_refs: List[str],
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        options: PDFRenderOptions,
+        result: PDFRenderResult,
+    ) -> bytes:
+        """Render the publication as one HTML document."""
+        html_parts = [self._generate_front_matter(pm_title, dm_refs, dm_contents, options)]
+        
+        # Render each DM, page break before each
+        for dm_ref in dm_refs:
+            section = self._dm_section(dm_ref, dm_contents, options, result)
+            if section is not None:
+                html_parts.append('<div class="page-break"></div>')
+                html_parts.append(section[1])
+        
+        full_html = self._wrap_html_document("\n".join(html_parts), pm_title, options)
+        pdf_data, result.page_count, _ = self._layout_pdf(full_html, options)
+        return pdf_data
+    
+    def _render_chunked(
+        self,
+        pm_root: ET.Element,
+        pm_title: str,
+        dm_refs: List[str],
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        options: PDFRenderOptions,
+        workers: Optional[int],
+        result: PDFRenderResult,
+    ) -> bytes:
+        """
+        Render the publication in independently laid-out chunks.
+        
+        Each chunk is laid out and written once, without page numbers in
+        its footer. The front matter is re-laid out until its own length
+        is stable; the body footers ("Page N of M") are then laid out as
+        one overlay of empty pages and stamped onto the chunk pages when
+        the parts are merged. Body layout is therefore done once, as in
+        unchunked rendering.
+        """
+        if self._engine_available:
+            self._check_merge_available()
+        
+        # Chunk bodies: (DM refs, DM titles, HTML)
+        chunks: List[Tuple[List[str], List[str], str]] = []
+        for group in self._plan_chunks(pm_root, dm_refs, options.chunk_by):
+            refs, titles, sections = [], [], []
+            for dm_ref in group:
+                section = self._dm_section(dm_ref, dm_contents, options, result)
+                if section is not None:
+                    if sections:
+                        sections.append('<div class="page-break"></div>')
+                    sections.append(section[1])
+                    refs.append(dm_ref)
+                    titles.append(section[0])
+            if refs:
+                chunks.append((refs, titles, "\n".join(sections)))
+        result.chunk_count = len(chunks)
+        
+        if workers is None:
+            workers = self.config.get("workers", 1)
+        workers = min(workers or os.cpu_count() or 1, max(len(chunks), 1))
+        pool = None
+        if workers > 1:
+            self.logger.info(f"Rendering {len(chunks)} PDF chunks on {workers} worker processes")
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_pdf_worker,
+                initargs=(self.contract, self.config, self.context),
+            )
+        
+        try:
+            # Each chunk laid out once, footer left blank for the overlay
+            rendered = self._layout_chunks(
+                [
+                    self._wrap_html_document(body, pm_title, options, extra_css=PDF_NO_FOOTER_CSS)
+                    for _, _, body in chunks
+                ],
+                options, True, pool, workers,
+            )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        # Page each DM starts on within the body
+        body_pages = 0
+        dm_pages: Dict[str, int] = {}
+        for (refs, _, _), (_, count, anchors) in zip(chunks, rendered):
+            for dm_ref in refs:
+                anchor = self._sanitize_filename(dm_ref)
+                dm_pages.setdefault(dm_ref, body_pages + anchors.get(anchor, 0) + 1)
+            body_pages += count
+        
+        # Front matter sized around the final page numbers
+        def layout_front(front_pages: int) -> Tuple[Optional[bytes], int]:
+            result.dm_pages = {dm: page + front_pages for dm, page in dm_pages.items()}
+            front_html = self._wrap_html_document(
+                self._generate_front_matter(
+                    pm_title, dm_refs, dm_contents, options, result.dm_pages
+                ),
+                pm_title, options, 0, front_pages + body_pages,
+            )
+            front_pdf, count, _ = self._layout_pdf(front_html, options)
+            return front_pdf, count
+        
+        front_pages = 0
+        for _ in range(4):
+            front_pdf, count = layout_front(front_pages)
+            if count == front_pages:
+                break
+            front_pages = count
+        else:
+            # Lay out with the final numbering so it matches the body footers
+            front_pdf, count = layout_front(front_pages)
+            if count != front_pages:
+                result.warnings.append(
+                    f"Front matter page count did not settle ({front_pages} numbered, "
+                    f"{count} laid out); page numbers may be off by {count - front_pages}"
+                )
+        total = front_pages + body_pages
+        
+        # Body footers numbered within the merged document
+        footers = None
+        if body_pages and self._engine_available:
+            footers, footer_count, _ = self._layout_pdf(
+                self._wrap_html_document(
+                    '<div class="footer-page"></div>' * body_pages,
+                    pm_title, options, front_pages, total, extra_css=PDF_FOOTER_ONLY_CSS,
+                ),
+                options,
+            )
+            if footer_count != body_pages:
+                result.warnings.append(
+                    f"Footer overlay has {footer_count} pages for {body_pages} body pages"
+                )
+        
+        result.page_count = total
+        outline = [
+            (title, result.dm_pages[dm_ref] - 1)
+            for refs, titles, _ in chunks
+            for dm_ref, title in zip(refs, titles)
+        ]
+        return self._merge_pdfs(
+            [front_pdf] + [pdf for pdf, _, _ in rendered], outline, options,
+            overlay=footers, overlay_start=front_pages,
+        )
+    
+    def _plan_chunks(
+        self,
+        pm_root: ET.Element,
+        dm_refs: List[str],
+        chunk_by: str
+    ) -> List[List[str]]:
+        """Group DM refs into chunks: one per DM or per top-level pmEntry."""
+        if chunk_by == "dm":
+            return [[dm_ref] for dm_ref in dm_refs]
+        if chunk_by != "chapter":
+            raise ValueError(f"Unknown chunk_by: {chunk_by}")
+        
+        content = self._find_element(pm_root, "content")
+        chunks = []
+        for entry in (content if content is not None else pm_root):
+            refs = self._extract_dm_refs(entry)
+            if refs:
+                chunks.append(refs)
+        
+        # DM refs outside the content section become chunks of their own
+        covered = {dm_ref for chunk in chunks for dm_ref in chunk}
+        chunks.extend([dm_ref] for dm_ref in dm_refs if dm_ref not in covered)
+        return chunks
+    
+    def _layout_chunks(
+        self,
+        htmls: List[str],
+        options: PDFRenderOptions,
+        write: bool,
+        pool: Optional[ProcessPoolExecutor],
+        workers: int,
+    ) -> List[Tuple[Optional[bytes], int, Dict[str, int]]]:
+        """Lay out chunk documents serially or on the pool."""
+        if pool is None:
+            return [self._layout_pdf(html, options, write) for html in htmls]
+        return list(pool.map(
+            partial(_layout_pdf_in_worker, options=options, write=write),
+            htmls,
+            chunksize=max(1, len(htmls) // (workers * 4)),
+        ))
+    
+    def _dm_section(
+        self,
+        dm_ref: str,
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        options: PDFRenderOptions,
+        result: PDFRenderResult,
+    ) -> Optional[Tuple[str, str]]:
+        """Render one DM as a publication section; returns (title, HTML) or None."""
+        if dm_ref not in dm_contents:
+            result.warnings.append(f"DM content not found: {dm_ref}")
+            return None
+        try:
+            dm_root = self._parse_document(dm_contents[dm_ref], dm_ref)
+            
+            dm_title = self._find_element_text(dm_root, "techName", dm_ref)
+            dm_html = self._dm_content_to_html(dm_root, options)
+        except Exception as e:
+            result.warnings.append(f"Failed to render DM {dm_ref}: {e}")
+            return None
+        
+        return dm_title, "\n".join([
+            f'<section class="data-module" id="{self._sanitize_filename(dm_ref)}">',
+            f'<h1>{self._escape_html(dm_title)}</h1>',
+            dm_html,
+            '</section>',
+        ])
+    
+    def _generate_front_matter(
+        self,
+        pm_title: str,
+        dm_refs: List[str],
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        options: PDFRenderOptions,
+        pages: Optional[Dict[str, int]] = None
+    ) -> str:
+        """Generate cover page, TOC and LEP HTML."""
+        html_parts = [self._generate_cover_page(pm_title, options)]
+        
+        # Table of contents
+        if options.include_toc:
+            html_parts.append(self._generate_toc(dm_refs, dm_contents, options, pages))
+        
+        # List of effective pages
+        if options.include_lep:
+            html_parts.append(self._generate_lep(dm_refs, pages))
+        
+        return "\n".join(html_parts)
+    
     def _check_engine_available(self) -> bool:
         """Check if the selected PDF engine is available."""
         if self.options.engine == PDFEngine.WEASYPRINT:
@@ -822,108 +1612,96 @@ class PDFRenderer(BaseRenderer):
         
         return "\n".join(html_parts)
     
-    def _element_to_html(
-        self, 
-        element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
-        """Convert XML element to HTML recursively."""
-        local_name = self._get_local_name(element)
-        
-        # Specialized converters
-        converters = {
-            "description": self._convert_description,
-            "procedure": self._convert_procedure,
-            "levelledPara": self._convert_levelled_para,
-            "para": self._convert_para,
-            "title": self._convert_title,
-            "warning": lambda e, o: self._convert_admonition(e, o, "warning"),
-            "caution": lambda e, o: self._convert_admonition(e, o, "caution"),
-            "note": lambda e, o: self._convert_admonition(e, o, "note"),
-            "table": self._convert_table,
-            "figure": self._convert_figure,
-            "proceduralStep": self._convert_procedural_step,
-            "internalRef": self._convert_internal_ref,
-            "externalPubRef": self._convert_external_ref,
-            "dmRef": self._convert_dm_ref,
-            "randomList": self._convert_random_list,
-            "sequentialList": self._convert_sequential_list,
-            "definitionList": self._convert_definition_list,
-        }
-        
-        if local_name in converters:
-            return converters[local_name](element, options)
-        
-        # Default: process children
-        return self._convert_default(element, options)
-    
-    def _convert_description(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_description(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert description content."""
-        children_html = "".join(self._element_to_html(child, options) for child in element)
-        return f'<div class="description">{children_html}</div>'
+        out.append('<div class="description">')
+        for child in element:
+            self._write_element(child, options, out)
+        out.append('</div>')
     
-    def _convert_procedure(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_procedure(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert procedure content."""
-        children_html = "".join(self._element_to_html(child, options) for child in element)
-        return f'<div class="procedure">{children_html}</div>'
+        out.append('<div class="procedure">')
+        for child in element:
+            self._write_element(child, options, out)
+        out.append('</div>')
     
-    def _convert_levelled_para(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_levelled_para(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert levelled paragraph."""
-        html_parts = []
+        out.append('<section class="levelled-para">')
+        separator = ""
         
         title = self._find_element(element, "title")
         if title is not None:
-            html_parts.append(f'<h2>{self._escape_html(title.text or "")}</h2>')
+            out.append(f'<h2>{_escape_html(title.text or "")}</h2>')
+            separator = "\n"
         
         for child in element:
-            child_name = self._get_local_name(child)
-            if child_name != "title":
-                html_parts.append(self._element_to_html(child, options))
+            if _local_name(child.tag) != "title":
+                out.append(separator)
+                self._write_element(child, options, out)
+                separator = "\n"
         
-        return f'<section class="levelled-para">{chr(10).join(html_parts)}</section>'
+        out.append('</section>')
     
-    def _convert_para(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_para(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert paragraph."""
-        text = self._get_text_with_children(element, options)
-        return f'<p class="para">{text}</p>'
+        out.append('<p class="para">')
+        self._write_text_with_children(element, options, out)
+        out.append('</p>')
     
-    def _convert_title(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_title(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert title."""
-        text = self._get_text_with_children(element, options)
-        return f'<h2 class="title">{text}</h2>'
+        out.append('<h2 class="title">')
+        self._write_text_with_children(element, options, out)
+        out.append('</h2>')
+    
+    def _write_warning(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
+        """Convert warning."""
+        self._write_admonition(element, options, out, "warning")
+    
+    def _write_caution(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
+        """Convert caution."""
+        self._write_admonition(element, options, out, "caution")
     
-    def _convert_admonition(
+    def _write_note(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
+        """Convert note."""
+        self._write_admonition(element, options, out, "note")
+    
+    def _write_admonition(
         self, 
         element: ET.Element, 
         options: PDFRenderOptions,
+        out: List[str],
         admonition_type: str
-    ) -> str:
+    ) -> None:
         """Convert warning/caution/note."""
         icons = {"warning": "⚠️", "caution": "⚡", "note": "ℹ️"}
         labels = {"warning": "WARNING", "caution": "CAUTION", "note": "NOTE"}
         
-        text = self._get_text_with_children(element, options)
         icon = icons.get(admonition_type, "")
         label = labels.get(admonition_type, "")
         
-        return f'''
+        out.append(f'''
         <div class="admonition {admonition_type}">
             <div class="admonition-icon">{icon}</div>
             <div class="admonition-content">
                 <strong>{label}</strong>
-                <div>{text}</div>
+                <div>''')
+        self._write_text_with_children(element, options, out)
+        out.append('''</div>
             </div>
         </div>
-        '''
+        ''')
     
-    def _convert_table(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_table(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert table."""
-        html = ['<table class="s1000d-table">']
+        out.append('<table class="s1000d-table">')
         
         # Caption
         title = self._find_element(element, "title")
         if title is not None:
-            html.append(f'<caption>{self._escape_html(title.text or "")}</caption>')
+            out.append(f'\n<caption>{_escape_html(title.text or "")}</caption>')
         
         # Process tgroup
         tgroup = self._find_element(element, "tgroup")
@@ -931,156 +1709,167 @@ class PDFRenderer(BaseRenderer):
             # Header
             thead = self._find_element(tgroup, "thead")
             if thead is not None:
-                html.append('<thead>')
+                out.append('\n<thead>')
                 for row in self._find_all_elements(thead, "row"):
-                    html.append('<tr>')
+                    out.append('\n<tr>')
                     for entry in self._find_all_elements(row, "entry"):
-                        text = self._get_text_with_children(entry, options)
-                        html.append(f'<th>{text}</th>')
-                    html.append('</tr>')
-                html.append('</thead>')
+                        out.append('\n<th>')
+                        self._write_text_with_children(entry, options, out)
+                        out.append('</th>')
+                    out.append('\n</tr>')
+                out.append('\n</thead>')
             
             # Body
             tbody = self._find_element(tgroup, "tbody")
             if tbody is not None:
-                html.append('<tbody>')
+                out.append('\n<tbody>')
                 for row in self._find_all_elements(tbody, "row"):
-                    html.append('<tr>')
+                    out.append('\n<tr>')
                     for entry in self._find_all_elements(row, "entry"):
-                        text = self._get_text_with_children(entry, options)
-                        html.append(f'<td>{text}</td>')
-                    html.append('</tr>')
-                html.append('</tbody>')
+                        out.append('\n<td>')
+                        self._write_text_with_children(entry, options, out)
+                        out.append('</td>')
+                    out.append('\n</tr>')
+                out.append('\n</tbody>')
         
-        html.append('</table>')
-        return "\n".join(html)
+        out.append('\n</table>')
     
-    def _convert_figure(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_figure(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert figure with graphic."""
-        html = ['<figure class="s1000d-figure">']
+        out.append('<figure class="s1000d-figure">')
         
         # Graphic
         graphic = self._find_element(element, "graphic")
         if graphic is not None:
             icn = graphic.get("infoEntityIdent", "")
             if icn:
-                html.append(f'<img src="{icn}" alt="{icn}" class="figure-graphic">')
+                out.append(f'\n<img src="{icn}" alt="{icn}" class="figure-graphic">')
         
         # Caption
         title = self._find_element(element, "title")
         if title is not None:
-            html.append(f'<figcaption>{self._escape_html(title.text or "")}</figcaption>')
+            out.append(f'\n<figcaption>{_escape_html(title.text or "")}</figcaption>')
         
-        html.append('</figure>')
-        return "\n".join(html)
+        out.append('\n</figure>')
     
-    def _convert_procedural_step(
+    def _write_procedural_step(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert procedural step."""
-        html_parts = ['<li class="procedural-step">']
+        out.append('<li class="procedural-step">')
         
         for child in element:
-            html_parts.append(self._element_to_html(child, options))
+            out.append("\n")
+            self._write_element(child, options, out)
         
-        html_parts.append('</li>')
-        return "\n".join(html_parts)
+        out.append('\n</li>')
     
-    def _convert_internal_ref(
+    def _write_internal_ref(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert internal reference."""
         ref_id = element.get("internalRefId", "")
         text = element.text or ref_id
-        return f'<a href="#{ref_id}" class="internal-ref">{self._escape_html(text)}</a>'
+        out.append(f'<a href="#{ref_id}" class="internal-ref">{_escape_html(text)}</a>')
     
-    def _convert_external_ref(
+    def _write_external_ref(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert external publication reference."""
-        text = self._get_text_with_children(element, options)
-        return f'<span class="external-ref">{text}</span>'
+        out.append('<span class="external-ref">')
+        self._write_text_with_children(element, options, out)
+        out.append('</span>')
     
-    def _convert_dm_ref(self, element: ET.Element, options: PDFRenderOptions) -> str:
+    def _write_dm_ref(self, element: ET.Element, options: PDFRenderOptions, out: List[str]) -> None:
         """Convert DM reference."""
         dm_code = self._find_element(element, "dmCode")
         if dm_code is not None:
             dmc = self._build_dmc_string(dm_code)
-            return f'<a href="#{self._sanitize_filename(dmc)}" class="dm-ref">{dmc}</a>'
-        return ""
+            out.append(f'<a href="#{self._sanitize_filename(dmc)}" class="dm-ref">{dmc}</a>')
     
-    def _convert_random_list(
+    def _write_random_list(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert random (unordered) list."""
-        items = []
+        out.append('<ul class="random-list">')
         for item in self._find_all_elements(element, "listItem"):
-            text = self._get_text_with_children(item, options)
-            items.append(f'<li>{text}</li>')
-        return f'<ul class="random-list">{"".join(items)}</ul>'
+            out.append('<li>')
+            self._write_text_with_children(item, options, out)
+            out.append('</li>')
+        out.append('</ul>')
     
-    def _convert_sequential_list(
+    def _write_sequential_list(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert sequential (ordered) list."""
-        items = []
+        out.append('<ol class="sequential-list">')
         for item in self._find_all_elements(element, "listItem"):
-            text = self._get_text_with_children(item, options)
-            items.append(f'<li>{text}</li>')
-        return f'<ol class="sequential-list">{"".join(items)}</ol>'
+            out.append('<li>')
+            self._write_text_with_children(item, options, out)
+            out.append('</li>')
+        out.append('</ol>')
     
-    def _convert_definition_list(
+    def _write_definition_list(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Convert definition list."""
-        html = ['<dl class="definition-list">']
+        out.append('<dl class="definition-list">')
         for item in self._find_all_elements(element, "definitionListItem"):
             term = self._find_element(item, "listItemTerm")
             defn = self._find_element(item, "listItemDefinition")
             if term is not None:
-                html.append(f'<dt>{self._escape_html(term.text or "")}</dt>')
+                out.append(f'\n<dt>{_escape_html(term.text or "")}</dt>')
             if defn is not None:
-                html.append(f'<dd>{self._get_text_with_children(defn, options)}</dd>')
-        html.append('</dl>')
-        return "\n".join(html)
+                out.append('\n<dd>')
+                self._write_text_with_children(defn, options, out)
+                out.append('</dd>')
+        out.append('\n</dl>')
     
-    def _convert_default(
+    def _write_default(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
         """Default element conversion."""
-        children_html = "".join(self._element_to_html(child, options) for child in element)
-        text = element.text or ""
-        tail = element.tail or ""
-        return f"{text}{children_html}{tail}"
+        if element.text:
+            out.append(element.text)
+        for child in element:
+            self._write_element(child, options, out)
+        if element.tail:
+            out.append(element.tail)
     
-    def _get_text_with_children(
+    def _write_text_with_children(
         self, 
         element: ET.Element, 
-        options: PDFRenderOptions
-    ) -> str:
-        """Get element text including inline children."""
-        parts = []
+        options: PDFRenderOptions,
+        out: List[str]
+    ) -> None:
+        """Append element text including inline children."""
         if element.text:
-            parts.append(self._escape_html(element.text))
+            out.append(_escape_html(element.text))
         for child in element:
-            parts.append(self._element_to_html(child, options))
+            self._write_element(child, options, out)
             if child.tail:
-                parts.append(self._escape_html(child.tail))
-        return "".join(parts)
+                out.append(_escape_html(child.tail))
     
     def _generate_cover_page(self, title: str, options: PDFRenderOptions) -> str:
         """Generate cover page HTML."""
@@ -1104,37 +1893,39 @@ class PDFRenderer(BaseRenderer):
         self, 
         dm_refs: List[str],
         dm_contents: Dict[str, Union[str, ET.Element]],
-        options: PDFRenderOptions
+        options: PDFRenderOptions,
+        pages: Optional[Dict[str, int]] = None
     ) -> str:
-        """Generate table of contents HTML."""
+        """Generate table of contents HTML, with DM start pages if known."""
         html = ['<div class="toc">', '<h1>Table of Contents</h1>', '<nav class="toc-list">']
         
         for i, dm_ref in enumerate(dm_refs, 1):
             title = dm_ref
             if dm_ref in dm_contents:
-                dm_xml = dm_contents[dm_ref]
-                if isinstance(dm_xml, str):
-                    try:
-                        root = ET.fromstring(dm_xml)
-                        title = self._find_element_text(root, "techName", dm_ref)
-                    except:
-                        pass
-                else:
-                    title = self._find_element_text(dm_xml, "techName", dm_ref)
+                try:
+                    root = self._parse_document(dm_contents[dm_ref], dm_ref)
+                    title = self._find_element_text(root, "techName", dm_ref)
+                except ET.ParseError:
+                    pass
             
             anchor = self._sanitize_filename(dm_ref)
-            html.append(f'<div class="toc-entry"><a href="#{anchor}">{i}. {self._escape_html(title)}</a></div>')
+            page = ""
+            if pages and dm_ref in pages:
+                page = f'<span class="toc-page">{pages[dm_ref]}</span>'
+            html.append(f'<div class="toc-entry"><a href="#{anchor}">{i}. {self._escape_html(title)}</a>{page}</div>')
         
         html.extend(['</nav>', '</div>'])
         return "\n".join(html)
     
-    def _generate_lep(self, dm_refs: List[str]) -> str:
-        """Generate list of effective pages HTML."""
+    def _generate_lep(self, dm_refs: List[str], pages: Optional[Dict[str, int]] = None) -> str:
+        """Generate list of effective pages HTML, with DM start pages if known."""
         html = ['<div class="lep">', '<h1>List of Effective Pages</h1>', '<table class="lep-table">']
-        html.append('<tr><th>Data Module</th><th>Revision</th><th>Date</th></tr>')
+        page_th = '<th>Page</th>' if pages else ''
+        html.append(f'<tr><th>Data Module</th><th>Revision</th><th>Date</th>{page_th}</tr>')
         
         for dm_ref in dm_refs:
-            html.append(f'<tr><td>{self._escape_html(dm_ref)}</td><td>001</td><td>{datetime.now().strftime("%Y-%m-%d")}</td></tr>')
+            page_td = f'<td>{pages.get(dm_ref, "")}</td>' if pages else ''
+            html.append(f'<tr><td>{self._escape_html(dm_ref)}</td><td>001</td><td>{datetime.now().strftime("%Y-%m-%d")}</td>{page_td}</tr>')
         
         html.extend(['</table>', '</div>'])
         return "\n".join(html)
@@ -1143,10 +1934,16 @@ class PDFRenderer(BaseRenderer):
         self, 
         body_content: str, 
         title: str, 
-        options: PDFRenderOptions
+        options: PDFRenderOptions,
+        page_offset: int = 0,
+        page_total: Optional[int] = None,
+        extra_css: str = ""
     ) -> str:
-        """Wrap content in complete HTML document with CSS."""
-        css = self._generate_pdf_css(options)
+        """Wrap content in complete HTML document with CSS (see _generate_pdf_css)."""
+        _, css = self._cached_asset(
+            "pdf.css", repr(options), lambda: self._generate_pdf_css(options)
+        )
+        css += self._pdf_page_rules(options, page_offset, page_total) + extra_css
         
         return f'''<!DOCTYPE html>
 <html lang="en">
@@ -1160,8 +1957,35 @@ class PDFRenderer(BaseRenderer):
 </body>
 </html>'''
     
+    def _pdf_page_rules(
+        self,
+        options: PDFRenderOptions,
+        page_offset: int = 0,
+        page_total: Optional[int] = None
+    ) -> str:
+        """
+        Generate the per-chunk page numbering rules appended to the PDF CSS.
+        
+        A chunk of a larger publication numbers its pages from
+        ``page_offset`` + 1 out of ``page_total``. The first page also
+        increments the counter explicitly: a page that resets ``page``
+        does not get the automatic increment.
+        """
+        rules = []
+        if page_total is not None:
+            footer = options.footer_text or ""
+            rules.append(
+                f'@page {{ @bottom-center {{ content: "{footer} Page " '
+                f'counter(page) " of " "{page_total}"; }} }}'
+            )
+        if page_offset:
+            rules.append(
+                f"@page :first {{ counter-reset: page {page_offset}; counter-increment: page 1; }}"
+            )
+        return "".join(f"\n{rule}" for rule in rules)
+    
     def _generate_pdf_css(self, options: PDFRenderOptions) -> str:
-        """Generate CSS for PDF rendering."""
+        """Generate CSS for PDF rendering (page numbering: see _pdf_page_rules)."""
         return f'''
 /* S1000D PDF Stylesheet */
 /* Contract: {self.contract_id} */
@@ -1260,6 +2084,10 @@ h2 {{
     text-decoration: none;
 }}
 
+.toc-page {{
+    float: right;
+}}
+
 /* LEP */
 .lep {{
     page-break-after: always;
@@ -1420,21 +2248,78 @@ figcaption {{
     
     def _html_to_pdf(self, html: str, options: PDFRenderOptions) -> bytes:
         """Convert HTML to PDF using selected engine."""
+        return self._layout_pdf(html, options)[0]
+    
+    def _layout_pdf(
+        self,
+        html: str,
+        options: PDFRenderOptions,
+        write: bool = True
+    ) -> Tuple[Optional[bytes], int, Dict[str, int]]:
+        """
+        Lay out HTML as PDF pages.
+        
+        Args:
+            html: Complete HTML document
+            options: Rendering options
+            write: Serialize the PDF (False only counts pages)
+            
+        Returns:
+            (PDF bytes or None, page count, anchor id -> 0-based page index)
+        """
+        if not self._engine_available:
+            self.logger.warning("PDF engine not available, returning placeholder")
+            return (b"%PDF-1.4 placeholder" if write else None), 1, {}
+        
+        if options.engine == PDFEngine.WEASYPRINT:
+            import weasyprint
+            document = weasyprint.HTML(string=html).render()
+            anchors: Dict[str, int] = {}
+            for index, page in enumerate(document.pages):
+                for anchor in page.anchors:
+                    anchors.setdefault(anchor, index)
+            pdf_data = document.write_pdf() if write else None
+            return pdf_data, len(document.pages), anchors
+        
+        raise NotImplementedError(f"Engine {options.engine.value} not implemented")
+    
+    def _check_merge_available(self) -> None:
+        """Chunked rendering merges parts with pypdf."""
+        if importlib.util.find_spec("pypdf") is None:
+            raise RuntimeError("Chunked PDF rendering needs pypdf. Install with: pip install pypdf")
+    
+    def _merge_pdfs(
+        self,
+        parts: List[bytes],
+        outline: List[Tuple[str, int]],
+        options: PDFRenderOptions,
+        overlay: Optional[bytes] = None,
+        overlay_start: int = 0
+    ) -> bytes:
+        """
+        Concatenate PDF parts and add an outline entry (title, page index) per DM.
+        
+        Pages of ``overlay`` are stamped onto the merged pages from index
+        ``overlay_start`` on.
+        """
         if not self._engine_available:
-            # Fallback: return placeholder
-            self.logger.warning("PDF engine not available, returning placeholder")
             return b"%PDF-1.4 placeholder"
         
-        if options.engine == PDFEngine.WEASYPRINT:
-            import weasyprint
-            return weasyprint.HTML(string=html).write_pdf()
+        from pypdf import PdfReader, PdfWriter
+        writer = PdfWriter()
+        for data in parts:
+            writer.append(PdfReader(io.BytesIO(data)))
+        if overlay:
+            stamps = PdfReader(io.BytesIO(overlay)).pages
+            for page, stamp in zip(writer.pages[overlay_start:], stamps):
+                page.merge_page(stamp)
+        if options.include_bookmarks:
+            for title, page_index in outline:
+                writer.add_outline_item(title, page_index)
         
-        raise NotImplementedError(f"Engine {options.engine.value} not implemented")
-    
-    def _estimate_page_count(self, pdf_data: bytes) -> int:
-        """Estimate page count from PDF data size."""
-        # Rough approximation: ~10KB per page
-        return max(1, len(pdf_data) // 10000)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get rendering statistics."""
@@ -1447,6 +2332,29 @@ figcaption {{
         }
 
 
+# Per-process renderer, built once by the pool initializer
+_WORKER_PDF_RENDERER: Optional[PDFRenderer] = None
+
+
+def _init_pdf_worker(
+    contract: Dict[str, Any],
+    config: Dict[str, Any],
+    context: Optional[ExecutionContext],
+) -> None:
+    """Build the PDFRenderer used by a worker process."""
+    global _WORKER_PDF_RENDERER
+    _WORKER_PDF_RENDERER = PDFRenderer(contract, config, context)
+
+
+def _layout_pdf_in_worker(
+    html: str,
+    options: PDFRenderOptions,
+    write: bool,
+) -> Tuple[Optional[bytes], int, Dict[str, int]]:
+    """Lay out one PDF chunk on the worker's renderer."""
+    return _WORKER_PDF_RENDERER._layout_pdf(html, options, write)
+
+
 # =============================================================================
 # HTML RENDERER
 # =============================================================================
@@ -1469,13 +2377,32 @@ class HTMLRenderer(BaseRenderer):
         >>> result = renderer.render_dm(dm_xml, Path("output/AMM.html"))
     """
     
+    CONVERTERS = {
+        "description": "_write_section",
+        "procedure": "_write_section",
+        "levelledPara": "_write_levelled_para",
+        "para": "_write_para",
+        "title": "_write_title",
+        "warning": "_write_warning",
+        "caution": "_write_caution",
+        "note": "_write_note",
+        "table": "_write_table",
+        "figure": "_write_figure",
+        "proceduralStep": "_write_step",
+        "internalRef": "_write_internal_ref",
+        "externalPubRef": "_write_external_ref",
+        "randomList": "_write_ul",
+        "sequentialList": "_write_ol",
+    }
+    
     def __init__(
         self,
         contract: Dict[str, Any],
         config: Dict[str, Any],
-        context: Optional[ExecutionContext] = None
+        context: Optional[ExecutionContext] = None,
+        documents: Optional[DocumentCache] = None,
     ):
-        super().__init__(contract, config, context)
+        super().__init__(contract, config, context, documents)
         
         # Parse options
         self.options = HTMLRenderOptions(
@@ -1532,10 +2459,7 @@ class HTMLRenderer(BaseRenderer):
         
         # Parse XML
         try:
-            if isinstance(dm_content, str):
-                root = ET.fromstring(dm_content)
-            else:
-                root = dm_content
+            root = self._parse_document(dm_content)
         except ET.ParseError as e:
             result.errors.append(f"XML parse error: {e}")
             return result
@@ -1564,19 +2488,12 @@ class HTMLRenderer(BaseRenderer):
                 output_path.write_text(full_html, encoding='utf-8')
                 result.output_path = output_path
                 
-                # Generate external CSS if not inline
+                # External CSS and JavaScript, as linked from the page
                 if not options.inline_css:
-                    css_path = output_path.with_suffix('.css')
-                    css_content = self._generate_css(options)
-                    css_path.write_text(css_content, encoding='utf-8')
-                    result.asset_files.append(css_path)
-                
-                # Generate JavaScript if enabled
-                if options.include_javascript:
-                    js_path = output_path.with_suffix('.js')
-                    js_content = self._generate_javascript(options)
-                    js_path.write_text(js_content, encoding='utf-8')
-                    result.asset_files.append(js_path)
+                    for name, text in self._page_assets(options):
+                        asset_path = output_path.parent / name
+                        asset_path.write_text(text, encoding='utf-8')
+                        result.asset_files.append(asset_path)
                     
             except Exception as e:
                 result.warnings.append(f"Failed to write files: {e}")
@@ -1593,17 +2510,37 @@ class HTMLRenderer(BaseRenderer):
         dm_contents: Dict[str, Union[str, ET.Element]],
         output_dir: Optional[Path] = None,
         options: Optional[HTMLRenderOptions] = None,
+        workers: Optional[int] = None,
+        manifest: Optional[RenderManifest] = None,
     ) -> HTMLRenderResult:
         """
         Render a Publication Module to HTML.
         
         Generates index page and individual HTML pages for each DM.
         
+        DM pages are independent apart from navigation, which is computed
+        once from the DM ref list, so with ``workers`` > 1 pages are parsed,
+        converted and written on a process pool. Per-DM render times are
+        reported in ``dm_timings``.
+        
+        With a ``manifest``, a DM page is rewritten only when its DM
+        content, navigation (neighbours), options or stylesheet version
+        changed; unchanged pages are listed in ``unchanged_dms``. Pages of
+        DMs no longer in the publication are deleted.
+        
+        Written pages link one content-hashed stylesheet and script shared
+        by the whole publication, also with ``inline_css``, instead of
+        embedding them in every page.
+        
         Args:
             pm_content: Publication Module XML
             dm_contents: Dictionary of DM codes to DM XML content
             output_dir: Output directory for HTML files
             options: Rendering options
+            workers: Worker processes (default: config "workers", else 1;
+                     0 uses the CPU count)
+            manifest: Render manifest for incremental re-rendering
+                      (used when output_dir is given; saved on completion)
             
         Returns:
             HTMLRenderResult
@@ -1614,10 +2551,7 @@ class HTMLRenderer(BaseRenderer):
         
         # Parse PM XML
         try:
-            if isinstance(pm_content, str):
-                pm_root = ET.fromstring(pm_content)
-            else:
-                pm_root = pm_content
+            pm_root = self._parse_document(pm_content)
         except ET.ParseError as e:
             result.errors.append(f"PM parse error: {e}")
             return result
@@ -1632,9 +2566,72 @@ class HTMLRenderer(BaseRenderer):
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Navigation precomputed once
+        navigation = self._build_navigation(dm_refs)
+        if not output_dir:
+            manifest = None
+        
+        # Reuse pages whose inputs are unchanged since the last render
+        titles: Dict[str, str] = {}
+        page_keys: Dict[str, str] = {}
+        if manifest is not None:
+            settings = self._manifest_settings(options)
+            asset_names = [name for name, _ in self._page_assets(options)]
+            for dm_ref, nav_html in navigation.items():
+                if dm_ref not in dm_contents:
+                    continue
+                name = self._sanitize_filename(dm_ref) + ".html"
+                key = manifest_key(
+                    settings, content_hash(dm_contents[dm_ref]), nav_html, *asset_names
+                )
+                page_keys[dm_ref] = key
+                entry = manifest.lookup(name, key)
+                if entry is not None and (output_dir / name).exists():
+                    titles[dm_ref] = entry["title"]
+        
+        # Render each remaining DM
+        pages = [
+            (dm_ref, dm_contents[dm_ref], navigation[dm_ref])
+            for dm_ref in navigation if dm_ref in dm_contents and dm_ref not in titles
+        ]
+        rendered = {
+            page.dm_ref: page
+            for page in self._render_pages(pages, output_dir, options, workers)
+        }
+        
+        for dm_ref in navigation:
+            if dm_ref in titles:
+                result.unchanged_dms.append(dm_ref)
+                result.asset_files.append(output_dir / (self._sanitize_filename(dm_ref) + ".html"))
+                continue
+            page = rendered.get(dm_ref)
+            if page is None:
+                result.warnings.append(f"DM content not found: {dm_ref}")
+                continue
+            titles[dm_ref] = page.title
+            result.dm_timings[dm_ref] = page.seconds
+            if page.error:
+                result.warnings.append(f"Failed to render DM {dm_ref}: {page.error}")
+                if manifest is not None:
+                    manifest.discard(self._sanitize_filename(dm_ref) + ".html")
+            elif page.path is not None:
+                result.asset_files.append(page.path)
+                if manifest is not None:
+                    manifest.store(page.path.name, page_keys[dm_ref], title=page.title)
+        
+        if manifest is not None:
+            manifest.prune(output_dir, {
+                self._sanitize_filename(dm_ref) + ".html"
+                for dm_ref in navigation if dm_ref in dm_contents
+            })
+            manifest.save()
+        
         # Generate index page
         try:
-            index_html = self._generate_index_page(pm_title, dm_refs, dm_contents, options)
+            index_html = self._generate_index_page(
+                pm_title, dm_refs, dm_contents, options, titles=titles,
+                shared_assets=output_dir is not None,
+            )
             if output_dir:
                 index_path = output_dir / "index.html"
                 index_path.write_text(index_html, encoding='utf-8')
@@ -1644,51 +2641,19 @@ class HTMLRenderer(BaseRenderer):
             result.errors.append(f"Index page error: {e}")
             return result
         
-        # Render each DM
-        for dm_ref in dm_refs:
-            if dm_ref in dm_contents:
-                try:
-                    dm_xml = dm_contents[dm_ref]
-                    if isinstance(dm_xml, str):
-                        dm_root = ET.fromstring(dm_xml)
-                    else:
-                        dm_root = dm_xml
-                    
-                    dm_title = self._find_element_text(dm_root, "techName", dm_ref)
-                    dm_html_body = self._dm_to_html(dm_root, options)
-                    
-                    # Add navigation
-                    nav_html = self._generate_dm_navigation(dm_ref, dm_refs)
-                    full_dm_html = self._build_html_document(
-                        dm_title,
-                        nav_html + dm_html_body,
-                        options
-                    )
-                    
-                    if output_dir:
-                        dm_filename = self._sanitize_filename(dm_ref) + ".html"
-                        dm_path = output_dir / dm_filename
-                        dm_path.write_text(full_dm_html, encoding='utf-8')
-                        result.asset_files.append(dm_path)
-                        
-                except Exception as e:
-                    result.warnings.append(f"Failed to render DM {dm_ref}: {e}")
-            else:
-                result.warnings.append(f"DM content not found: {dm_ref}")
-        
-        # Generate shared assets
+        # Generate shared assets; a content-hashed file already on disk is current
         if output_dir:
-            # CSS
-            if not options.inline_css:
-                css_path = output_dir / "styles.css"
-                css_path.write_text(self._generate_css(options), encoding='utf-8')
-                result.asset_files.append(css_path)
-            
-            # JavaScript
-            if options.include_javascript:
-                js_path = output_dir / "scripts.js"
-                js_path.write_text(self._generate_javascript(options), encoding='utf-8')
-                result.asset_files.append(js_path)
+            assets = self._page_assets(options)
+            current = {name for name, _ in assets}
+            for pattern in ("styles.*.css", "scripts.*.js"):
+                for stale in output_dir.glob(pattern):
+                    if stale.name not in current:
+                        stale.unlink()
+            for name, text in assets:
+                asset_path = output_dir / name
+                if not asset_path.exists():
+                    asset_path.write_text(text, encoding='utf-8')
+                result.asset_files.append(asset_path)
         
         result.success = True
         result.file_size_bytes = len(index_html.encode('utf-8'))
@@ -1697,6 +2662,81 @@ class HTMLRenderer(BaseRenderer):
         
         return result
     
+    def _manifest_settings(self, options: HTMLRenderOptions) -> str:
+        """Fingerprint the options and contract metadata that shape every page."""
+        return json.dumps(
+            {
+                "options": asdict(options),
+                "contract_id": self.contract_id,
+                "baseline_ref": self.baseline_ref,
+            },
+            sort_keys=True,
+            default=str,
+        )
+    
+    def _render_pages(
+        self,
+        pages: List[Tuple[str, Union[str, ET.Element], str]],
+        output_dir: Optional[Path],
+        options: HTMLRenderOptions,
+        workers: Optional[int],
+    ) -> List[_RenderedPage]:
+        """Render (dm_ref, dm_xml, nav_html) pages serially or on a process pool."""
+        if workers is None:
+            workers = self.config.get("workers", 1)
+        workers = min(workers or os.cpu_count() or 1, len(pages))
+        
+        if workers <= 1:
+            return [
+                self._render_page(dm_ref, dm_xml, nav_html, output_dir, options)
+                for dm_ref, dm_xml, nav_html in pages
+            ]
+        
+        self.logger.info(f"Rendering {len(pages)} DM pages on {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_html_worker,
+            initargs=(self.contract, self.config, self.context),
+        ) as pool:
+            return list(pool.map(
+                partial(_render_page_in_worker, output_dir=output_dir, options=options),
+                pages,
+                chunksize=max(1, len(pages) // (workers * 4)),
+            ))
+    
+    def _render_page(
+        self,
+        dm_ref: str,
+        dm_xml: Union[str, ET.Element],
+        nav_html: str,
+        output_dir: Optional[Path],
+        options: HTMLRenderOptions,
+    ) -> _RenderedPage:
+        """Parse, convert and write one DM page of a publication."""
+        start = time.perf_counter()
+        page = _RenderedPage(dm_ref=dm_ref, title=dm_ref)
+        try:
+            dm_root = self._parse_document(dm_xml, dm_ref)
+            
+            page.title = self._find_element_text(dm_root, "techName", dm_ref)
+            dm_html_body = self._dm_to_html(dm_root, options)
+            full_dm_html = self._build_html_document(
+                page.title,
+                nav_html + dm_html_body,
+                options,
+                shared_assets=output_dir is not None,
+            )
+            
+            if output_dir:
+                dm_path = output_dir / (self._sanitize_filename(dm_ref) + ".html")
+                dm_path.write_text(full_dm_html, encoding='utf-8')
+                page.path = dm_path
+        except Exception as e:
+            page.error = str(e)
+        
+        page.seconds = time.perf_counter() - start
+        return page
+    
     def _dm_to_html(self, root: ET.Element, options: HTMLRenderOptions) -> str:
         """Convert Data Module to HTML body content."""
         html_parts = ['<article class="data-module">']
@@ -1719,201 +2759,212 @@ class HTMLRenderer(BaseRenderer):
         html_parts.append('</article>')
         return "\n".join(html_parts)
     
-    def _element_to_html(self, element: ET.Element, options: HTMLRenderOptions) -> str:
-        """Convert XML element to HTML recursively."""
-        local_name = self._get_local_name(element)
-        
-        converters = {
-            "description": self._convert_section,
-            "procedure": self._convert_section,
-            "levelledPara": self._convert_levelled_para,
-            "para": self._convert_para,
-            "title": self._convert_title,
-            "warning": lambda e, o: self._convert_alert(e, o, "warning"),
-            "caution": lambda e, o: self._convert_alert(e, o, "caution"),
-            "note": lambda e, o: self._convert_alert(e, o, "note"),
-            "table": self._convert_table,
-            "figure": self._convert_figure,
-            "proceduralStep": self._convert_step,
-            "internalRef": self._convert_internal_ref,
-            "externalPubRef": self._convert_external_ref,
-            "randomList": self._convert_ul,
-            "sequentialList": self._convert_ol,
-        }
-        
-        if local_name in converters:
-            return converters[local_name](element, options)
-        
-        return self._convert_default(element, options)
-    
-    def _convert_section(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_section(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert section element."""
-        local_name = self._get_local_name(element)
-        children = "".join(self._element_to_html(c, options) for c in element)
-        return f'<section class="{local_name}">{children}</section>'
+        out.append(f'<section class="{_local_name(element.tag)}">')
+        for child in element:
+            self._write_element(child, options, out)
+        out.append('</section>')
     
-    def _convert_levelled_para(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_levelled_para(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert levelled paragraph."""
-        html_parts = ['<div class="levelled-para">']
+        out.append('<div class="levelled-para">')
         title = self._find_element(element, "title")
         if title is not None:
-            html_parts.append(f'<h2>{self._escape_html(title.text or "")}</h2>')
+            out.append(f'\n<h2>{_escape_html(title.text or "")}</h2>')
         for child in element:
-            if self._get_local_name(child) != "title":
-                html_parts.append(self._element_to_html(child, options))
-        html_parts.append('</div>')
-        return "\n".join(html_parts)
+            if _local_name(child.tag) != "title":
+                out.append("\n")
+                self._write_element(child, options, out)
+        out.append('\n</div>')
     
-    def _convert_para(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_para(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert paragraph."""
-        text = self._get_text_with_children(element, options)
-        return f'<p class="para">{text}</p>'
+        out.append('<p class="para">')
+        self._write_text_with_children(element, options, out)
+        out.append('</p>')
     
-    def _convert_title(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_title(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert title."""
-        text = self._get_text_with_children(element, options)
-        return f'<h2 class="title">{text}</h2>'
+        out.append('<h2 class="title">')
+        self._write_text_with_children(element, options, out)
+        out.append('</h2>')
+    
+    def _write_warning(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
+        """Convert warning."""
+        self._write_alert(element, options, out, "warning")
     
-    def _convert_alert(
+    def _write_caution(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
+        """Convert caution."""
+        self._write_alert(element, options, out, "caution")
+    
+    def _write_note(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
+        """Convert note."""
+        self._write_alert(element, options, out, "note")
+    
+    def _write_alert(
         self, 
         element: ET.Element, 
         options: HTMLRenderOptions,
+        out: List[str],
         alert_type: str
-    ) -> str:
+    ) -> None:
         """Convert warning/caution/note to alert box."""
         icons = {"warning": "⚠️", "caution": "⚡", "note": "ℹ️"}
-        text = self._get_text_with_children(element, options)
         
-        return f'''
+        out.append(f'''
         <div class="alert alert-{alert_type}">
             <div class="alert-icon">{icons.get(alert_type, "")}</div>
             <div class="alert-content">
                 <strong>{alert_type.upper()}</strong>
-                {text}
+                ''')
+        self._write_text_with_children(element, options, out)
+        out.append('''
             </div>
         </div>
-        '''
+        ''')
     
-    def _convert_table(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_table(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert table."""
-        html = ['<table class="table">']
+        out.append('<table class="table">')
         
         title = self._find_element(element, "title")
         if title is not None:
-            html.append(f'<caption>{self._escape_html(title.text or "")}</caption>')
+            out.append(f'\n<caption>{_escape_html(title.text or "")}</caption>')
         
         tgroup = self._find_element(element, "tgroup")
         if tgroup is not None:
             thead = self._find_element(tgroup, "thead")
-            if thead:
-                html.append('<thead>')
+            if thead is not None and len(thead):
+                out.append('\n<thead>')
                 for row in self._find_all_elements(thead, "row"):
-                    html.append('<tr>')
+                    out.append('\n<tr>')
                     for entry in self._find_all_elements(row, "entry"):
-                        html.append(f'<th>{self._get_text_with_children(entry, options)}</th>')
-                    html.append('</tr>')
-                html.append('</thead>')
+                        out.append('\n<th>')
+                        self._write_text_with_children(entry, options, out)
+                        out.append('</th>')
+                    out.append('\n</tr>')
+                out.append('\n</thead>')
             
             tbody = self._find_element(tgroup, "tbody")
-            if tbody:
-                html.append('<tbody>')
+            if tbody is not None and len(tbody):
+                out.append('\n<tbody>')
                 for row in self._find_all_elements(tbody, "row"):
-                    html.append('<tr>')
+                    out.append('\n<tr>')
                     for entry in self._find_all_elements(row, "entry"):
-                        html.append(f'<td>{self._get_text_with_children(entry, options)}</td>')
-                    html.append('</tr>')
-                html.append('</tbody>')
+                        out.append('\n<td>')
+                        self._write_text_with_children(entry, options, out)
+                        out.append('</td>')
+                    out.append('\n</tr>')
+                out.append('\n</tbody>')
         
-        html.append('</table>')
-        return "\n".join(html)
+        out.append('\n</table>')
     
-    def _convert_figure(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_figure(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert figure."""
-        html = ['<figure class="figure">']
+        out.append('<figure class="figure">')
         
         graphic = self._find_element(element, "graphic")
         if graphic is not None:
             icn = graphic.get("infoEntityIdent", "")
             if icn:
-                html.append(f'<img src="{icn}.png" alt="{icn}" class="figure-img">')
+                out.append(f'\n<img src="{icn}.png" alt="{icn}" class="figure-img">')
         
         title = self._find_element(element, "title")
         if title is not None:
-            html.append(f'<figcaption>{self._escape_html(title.text or "")}</figcaption>')
+            out.append(f'\n<figcaption>{_escape_html(title.text or "")}</figcaption>')
         
-        html.append('</figure>')
-        return "\n".join(html)
+        out.append('\n</figure>')
     
-    def _convert_step(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_step(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert procedural step."""
-        children = "".join(self._element_to_html(c, options) for c in element)
-        return f'<li class="step">{children}</li>'
+        out.append('<li class="step">')
+        for child in element:
+            self._write_element(child, options, out)
+        out.append('</li>')
     
-    def _convert_internal_ref(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_internal_ref(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert internal reference."""
         ref_id = element.get("internalRefId", "")
         text = element.text or ref_id
         self._cross_refs.add(ref_id)
-        return f'<a href="#{ref_id}" class="internal-ref">{self._escape_html(text)}</a>'
+        out.append(f'<a href="#{ref_id}" class="internal-ref">{_escape_html(text)}</a>')
     
-    def _convert_external_ref(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_external_ref(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert external reference."""
-        text = self._get_text_with_children(element, options)
-        return f'<span class="external-ref">{text}</span>'
+        out.append('<span class="external-ref">')
+        self._write_text_with_children(element, options, out)
+        out.append('</span>')
     
-    def _convert_ul(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_ul(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert unordered list."""
-        items = []
+        out.append('<ul class="list">')
         for item in self._find_all_elements(element, "listItem"):
-            items.append(f'<li>{self._get_text_with_children(item, options)}</li>')
-        return f'<ul class="list">{"".join(items)}</ul>'
+            out.append('<li>')
+            self._write_text_with_children(item, options, out)
+            out.append('</li>')
+        out.append('</ul>')
     
-    def _convert_ol(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_ol(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Convert ordered list."""
-        items = []
+        out.append('<ol class="list">')
         for item in self._find_all_elements(element, "listItem"):
-            items.append(f'<li>{self._get_text_with_children(item, options)}</li>')
-        return f'<ol class="list">{"".join(items)}</ol>'
+            out.append('<li>')
+            self._write_text_with_children(item, options, out)
+            out.append('</li>')
+        out.append('</ol>')
     
-    def _convert_default(self, element: ET.Element, options: HTMLRenderOptions) -> str:
+    def _write_default(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
         """Default element conversion."""
-        local_name = self._get_local_name(element)
-        children = "".join(self._element_to_html(c, options) for c in element)
-        text = element.text or ""
-        tail = element.tail or ""
-        return f'<div class="{local_name}">{text}{children}</div>{tail}'
-    
-    def _get_text_with_children(self, element: ET.Element, options: HTMLRenderOptions) -> str:
-        """Get element text including inline children."""
-        parts = []
+        out.append(f'<div class="{_local_name(element.tag)}">')
+        if element.text:
+            out.append(element.text)
+        for child in element:
+            self._write_element(child, options, out)
+        out.append('</div>')
+        if element.tail:
+            out.append(element.tail)
+    
+    def _write_text_with_children(self, element: ET.Element, options: HTMLRenderOptions, out: List[str]) -> None:
+        """Append element text including inline children."""
         if element.text:
-            parts.append(self._escape_html(element.text))
+            out.append(_escape_html(element.text))
         for child in element:
-            parts.append(self._element_to_html(child, options))
+            self._write_element(child, options, out)
             if child.tail:
-                parts.append(self._escape_html(child.tail))
-        return "".join(parts)
+                out.append(_escape_html(child.tail))
     
     def _build_html_document(
         self, 
         title: str, 
         body_content: str, 
-        options: HTMLRenderOptions
+        options: HTMLRenderOptions,
+        shared_assets: bool = False
     ) -> str:
-        """Build complete HTML document."""
+        """
+        Build complete HTML document.
+        
+        CSS and JavaScript are inlined with ``inline_css`` unless
+        ``shared_assets`` is set; otherwise the page links their
+        content-hashed files (see _page_assets).
+        """
+        inline = options.inline_css and not shared_assets
+        
         # CSS
-        if options.inline_css:
-            css_block = f"<style>{self._generate_css(options)}</style>"
+        css_name, css = self._stylesheet(options)
+        if inline:
+            css_block = f"<style>{css}</style>"
         else:
-            css_block = '<link rel="stylesheet" href="styles.css">'
+            css_block = f'<link rel="stylesheet" href="{css_name}">'
         
         # JavaScript
         js_block = ""
         if options.include_javascript:
-            if options.inline_css:
-                js_block = f"<script>{self._generate_javascript(options)}</script>"
+            js_name, js = self._script(options)
+            if inline:
+                js_block = f"<script>{js}</script>"
             else:
-                js_block = '<script src="scripts.js"></script>'
+                js_block = f'<script src="{js_name}"></script>'
         
         return f'''<!DOCTYPE html>
 <html lang="en">
@@ -1937,22 +2988,27 @@ class HTMLRenderer(BaseRenderer):
         pm_title: str,
         dm_refs: List[str],
         dm_contents: Dict[str, Union[str, ET.Element]],
-        options: HTMLRenderOptions
+        options: HTMLRenderOptions,
+        titles: Optional[Dict[str, str]] = None,
+        shared_assets: bool = False,
     ) -> str:
-        """Generate index page for publication module."""
+        """
+        Generate index page for publication module.
+        
+        Titles already extracted while rendering DM pages can be passed
+        in ``titles`` so DM content is not parsed a second time.
+        """
         toc_items = []
         for dm_ref in dm_refs:
             title = dm_ref
-            if dm_ref in dm_contents:
-                dm_xml = dm_contents[dm_ref]
-                if isinstance(dm_xml, str):
-                    try:
-                        root = ET.fromstring(dm_xml)
-                        title = self._find_element_text(root, "techName", dm_ref)
-                    except:
-                        pass
-                else:
-                    title = self._find_element_text(dm_xml, "techName", dm_ref)
+            if titles is not None:
+                title = titles.get(dm_ref, dm_ref)
+            elif dm_ref in dm_contents:
+                try:
+                    root = self._parse_document(dm_contents[dm_ref], dm_ref)
+                    title = self._find_element_text(root, "techName", dm_ref)
+                except ET.ParseError:
+                    pass
             
             filename = self._sanitize_filename(dm_ref) + ".html"
             toc_items.append(f'<li><a href="{filename}">{self._escape_html(title)}</a></li>')
@@ -1970,24 +3026,46 @@ class HTMLRenderer(BaseRenderer):
         </div>
         '''
         
-        return self._build_html_document(pm_title, body, options)
+        return self._build_html_document(pm_title, body, options, shared_assets)
     
-    def _generate_dm_navigation(self, current_dm: str, all_dms: List[str]) -> str:
-        """Generate navigation bar for DM page."""
-        nav_items = ['<li><a href="index.html">← Index</a></li>']
+    def _build_navigation(self, dm_refs: List[str]) -> Dict[str, str]:
+        """
+        Precompute the navigation bar of every DM page in one pass.
         
-        try:
-            idx = all_dms.index(current_dm)
+        Returns a dict keyed by unique DM ref in publication order; a
+        repeated ref links to the neighbours of its first occurrence.
+        """
+        filenames = [self._sanitize_filename(dm_ref) + ".html" for dm_ref in dm_refs]
+        navigation: Dict[str, str] = {}
+        for idx, dm_ref in enumerate(dm_refs):
+            if dm_ref in navigation:
+                continue
+            nav_items = ['<li><a href="index.html">← Index</a></li>']
             if idx > 0:
-                prev_file = self._sanitize_filename(all_dms[idx - 1]) + ".html"
-                nav_items.append(f'<li><a href="{prev_file}">← Previous</a></li>')
-            if idx < len(all_dms) - 1:
-                next_file = self._sanitize_filename(all_dms[idx + 1]) + ".html"
-                nav_items.append(f'<li><a href="{next_file}">Next →</a></li>')
-        except ValueError:
-            pass
-        
-        return f'<nav class="navigation"><ul>{"".join(nav_items)}</ul></nav>'
+                nav_items.append(f'<li><a href="{filenames[idx - 1]}">← Previous</a></li>')
+            if idx < len(dm_refs) - 1:
+                nav_items.append(f'<li><a href="{filenames[idx + 1]}">Next →</a></li>')
+            navigation[dm_ref] = f'<nav class="navigation"><ul>{"".join(nav_items)}</ul></nav>'
+        return navigation
+    
+    def _stylesheet(self, options: HTMLRenderOptions) -> Tuple[str, str]:
+        """Return the hashed file name and text of the stylesheet, memoized per options."""
+        return self._cached_asset(
+            "styles.css", repr(options), lambda: self._generate_css(options)
+        )
+    
+    def _script(self, options: HTMLRenderOptions) -> Tuple[str, str]:
+        """Return the hashed file name and text of the script, memoized per options."""
+        return self._cached_asset(
+            "scripts.js", repr(options), lambda: self._generate_javascript(options)
+        )
+    
+    def _page_assets(self, options: HTMLRenderOptions) -> List[Tuple[str, str]]:
+        """Return the (hashed file name, text) of every asset a page links."""
+        assets = [self._stylesheet(options)]
+        if options.include_javascript:
+            assets.append(self._script(options))
+        return assets
     
     def _generate_css(self, options: HTMLRenderOptions) -> str:
         """Generate CSS stylesheet."""
@@ -2215,6 +3293,39 @@ document.addEventListener('DOMContentLoaded', function() {
         }
 
 
+@dataclass
+class _RenderedPage:
+    """Outcome of rendering one DM page of a publication."""
+    dm_ref: str
+    title: str
+    path: Optional[Path] = None
+    error: str = ""
+    seconds: float = 0.0
+
+
+# Per-process renderer, built once by the pool initializer
+_WORKER_HTML_RENDERER: Optional[HTMLRenderer] = None
+
+
+def _init_html_worker(
+    contract: Dict[str, Any],
+    config: Dict[str, Any],
+    context: Optional[ExecutionContext],
+) -> None:
+    """Build the HTMLRenderer used by a worker process."""
+    global _WORKER_HTML_RENDERER
+    _WORKER_HTML_RENDERER = HTMLRenderer(contract, config, context)
+
+
+def _render_page_in_worker(
+    page: Tuple[str, Union[str, ET.Element], str],
+    output_dir: Optional[Path],
+    options: HTMLRenderOptions,
+) -> _RenderedPage:
+    """Render one (dm_ref, dm_xml, nav_html) page with the worker's renderer."""
+    return _WORKER_HTML_RENDERER._render_page(*page, output_dir, options)
+
+
 # =============================================================================
 # IETP PACKAGER
 # =============================================================================
@@ -2250,9 +3361,10 @@ class IETPPackager(BaseRenderer):
         self,
         contract: Dict[str, Any],
         config: Dict[str, Any],
-        context: Optional[ExecutionContext] = None
+        context: Optional[ExecutionContext] = None,
+        documents: Optional[DocumentCache] = None,
     ):
-        super().__init__(contract, config, context)
+        super().__init__(contract, config, context, documents)
         
         # Parse IETP config
         self.ietp_config = IETPConfig(
@@ -2294,17 +3406,32 @@ class IETPPackager(BaseRenderer):
         package_format: IETPFormat = IETPFormat.DIRECTORY,
         graphics_dir: Optional[Path] = None,
         multimedia_dir: Optional[Path] = None,
+        manifest: Optional[RenderManifest] = None,
     ) -> IETPPackageResult:
         """
         Package a publication module into IETP format.
         
+        Archive formats (zip, csp) are streamed: entries go straight into
+        the archive as they are produced, with no staging directory.
+        Directory packages hard-link graphics and multimedia to their
+        sources where possible (config "link_assets", default True).
+        
+        With a ``manifest`` and the directory format, a packaged DM is
+        rewritten only when its content hash changed; unchanged DMs are
+        listed in ``unchanged_dms`` and DMs dropped from the publication
+        are deleted from the package.
+        
         Args:
             pm_content: Publication Module XML
             dm_contents: Dictionary of DM codes to DM XML content
             output_path: Output path for IETP package
             package_format: Package format (directory, zip, csp)
-            graphics_dir: Directory containing graphics files
-            multimedia_dir: Directory containing multimedia files
+            graphics_dir: Directory containing graphics files; only ICNs
+                          referenced by packaged DMs are added unless
+                          config "referenced_assets_only" is False
+            multimedia_dir: Directory containing multimedia files (same rule)
+            manifest: Render manifest for incremental repackaging
+                      (directory format only; saved on completion)
             
         Returns:
             IETPPackageResult
@@ -2314,10 +3441,7 @@ class IETPPackager(BaseRenderer):
         
         # Parse PM
         try:
-            if isinstance(pm_content, str):
-                pm_root = ET.fromstring(pm_content)
-            else:
-                pm_root = pm_content
+            pm_root = self._parse_document(pm_content)
         except ET.ParseError as e:
             result.errors.append(f"PM parse error: {e}")
             return result
@@ -2328,105 +3452,32 @@ class IETPPackager(BaseRenderer):
         self.ietp_config.title = pm_title
         result.dm_count = len(dm_refs)
         
-        # Setup package directory
+        # Setup package writer; archive formats stream entries straight
+        # into the archive instead of staging a directory tree
         output_path = Path(output_path)
         
         try:
-            # Create temporary directory for archive formats
-            if package_format in [IETPFormat.ZIP, IETPFormat.CSP]:
-                import tempfile
-                temp_dir = Path(tempfile.mkdtemp())
-                package_dir = temp_dir / "ietp_package"
+            if package_format == IETPFormat.ZIP:
+                writer: PackageWriter = ZipPackageWriter(output_path.with_suffix('.zip'))
+            elif package_format == IETPFormat.CSP:
+                writer = ZipPackageWriter(output_path.with_suffix('.csp'))
             else:
-                package_dir = output_path
-                temp_dir = None
-            
-            package_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create directory structure
-            self._create_structure(package_dir)
-            
-            # Package PM
-            pm_xml_str = ET.tostring(pm_root, encoding='unicode')
-            (package_dir / "content" / "publication.xml").write_text(pm_xml_str, encoding='utf-8')
-            
-            # Package DMs
-            for dm_ref in dm_refs:
-                if dm_ref in dm_contents:
-                    try:
-                        dm_xml = dm_contents[dm_ref]
-                        if isinstance(dm_xml, str):
-                            dm_root = ET.fromstring(dm_xml)
-                        else:
-                            dm_root = dm_xml
-                        
-                        # Save DM
-                        filename = self._sanitize_filename(dm_ref) + ".xml"
-                        dm_xml_str = ET.tostring(dm_root, encoding='unicode')
-                        (package_dir / "content" / filename).write_text(dm_xml_str, encoding='utf-8')
-                        
-                        # Extract ICN refs
-                        for graphic in self._find_all_elements(dm_root, "graphic"):
-                            icn = graphic.get("infoEntityIdent", "")
-                            if icn:
-                                self._icn_refs.add(icn)
-                                
-                    except Exception as e:
-                        result.warnings.append(f"Failed to package DM {dm_ref}: {e}")
-                else:
-                    result.warnings.append(f"DM not found: {dm_ref}")
-            
-            # Copy graphics
-            if graphics_dir and graphics_dir.exists():
-                result.icn_count = self._copy_files(
-                    graphics_dir,
-                    package_dir / "graphics",
-                    ['.png', '.jpg', '.jpeg', '.svg', '.cgm', '.tif', '.tiff']
+                writer = DirectoryPackageWriter(
+                    output_path, link_assets=self.config.get("link_assets", True)
                 )
+                self._create_structure(output_path)
             
-            # Copy multimedia
-            if multimedia_dir and multimedia_dir.exists():
-                result.multimedia_count = self._copy_files(
-                    multimedia_dir,
-                    package_dir / "multimedia",
-                    ['.mp4', '.webm', '.mp3', '.wav', '.pdf']
+            with writer:
+                self._write_package(
+                    writer, pm_root, dm_refs, dm_contents, result,
+                    graphics_dir, multimedia_dir, manifest,
                 )
             
-            # Generate configuration
-            self._generate_config(package_dir, dm_refs)
-            
-            # Generate viewer
-            self._generate_viewer(package_dir)
-            
-            # Generate search index
-            if self.ietp_config.enable_search:
-                self._generate_search_index(package_dir, dm_refs, dm_contents)
-            
-            # Generate cross-reference map
-            if self.ietp_config.cross_reference_resolution:
-                self._generate_xref_map(package_dir, dm_contents)
-            
-            # Calculate size
-            result.total_size_bytes = sum(
-                f.stat().st_size for f in package_dir.rglob('*') if f.is_file()
-            )
-            
-            # Create archive if needed
-            if package_format == IETPFormat.ZIP:
-                zip_path = output_path.with_suffix('.zip')
-                self._create_archive(package_dir, zip_path)
-                result.output_path = zip_path
-                if temp_dir:
-                    shutil.rmtree(temp_dir)
-            elif package_format == IETPFormat.CSP:
-                csp_path = output_path.with_suffix('.csp')
-                self._create_archive(package_dir, csp_path)
-                result.output_path = csp_path
-                if temp_dir:
-                    shutil.rmtree(temp_dir)
+            result.total_size_bytes = writer.total_bytes
+            if isinstance(writer, ZipPackageWriter):
+                result.output_path = writer.archive_path
             else:
-                result.output_path = package_dir
-            
+                result.output_path = output_path
             result.success = True
             
         except Exception as e:
@@ -2440,29 +3491,184 @@ class IETPPackager(BaseRenderer):
         
         return result
     
+    def _write_package(
+        self,
+        writer: PackageWriter,
+        pm_root: ET.Element,
+        dm_refs: List[str],
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        result: IETPPackageResult,
+        graphics_dir: Optional[Path],
+        multimedia_dir: Optional[Path],
+        manifest: Optional[RenderManifest],
+    ) -> None:
+        """Write all package entries through a package writer."""
+        # Package PM
+        pm_xml_str = ET.tostring(pm_root, encoding='unicode')
+        writer.write_text("content/publication.xml", pm_xml_str)
+        
+        # Package DMs, reusing unchanged ones when incremental
+        if not isinstance(writer, DirectoryPackageWriter):
+            manifest = None
+        indexed = self.ietp_config.enable_search or self.ietp_config.cross_reference_resolution
+        packaged: Set[str] = set()
+        roots: Dict[str, ET.Element] = {}       # Parsed once for search and xref
+        graphic_refs: Set[str] = set()
+        multimedia_refs: Set[str] = set()
+        for dm_ref in dm_refs:
+            if dm_ref in dm_contents:
+                name = "content/" + self._sanitize_filename(dm_ref) + ".xml"
+                try:
+                    dm_xml = dm_contents[dm_ref]
+                    
+                    if manifest is not None:
+                        key = manifest_key(content_hash(dm_xml))
+                        entry = manifest.lookup(name, key)
+                        if entry is not None and writer.keep(name):
+                            self._icn_refs.update(entry["icns"])
+                            graphic_refs.update(entry["icns"])
+                            multimedia_refs.update(entry.get("multimedia", []))
+                            result.unchanged_dms.append(dm_ref)
+                            packaged.add(name)
+                            if indexed:
+                                roots[dm_ref] = self._parse_document(dm_xml, dm_ref)
+                            continue
+                    
+                    dm_root = self._parse_document(dm_xml, dm_ref)
+                    roots[dm_ref] = dm_root
+                    
+                    # Save DM
+                    dm_xml_str = ET.tostring(dm_root, encoding='unicode')
+                    writer.write_text(name, dm_xml_str)
+                    
+                    # Extract ICN refs
+                    icns = self._extract_icns(dm_root, "graphic")
+                    multimedia = self._extract_icns(dm_root, "multimediaObject")
+                    self._icn_refs.update(icns)
+                    graphic_refs.update(icns)
+                    multimedia_refs.update(multimedia)
+                    
+                    packaged.add(name)
+                    if manifest is not None:
+                        manifest.store(name, key, icns=icns, multimedia=multimedia)
+                            
+                except Exception as e:
+                    result.warnings.append(f"Failed to package DM {dm_ref}: {e}")
+                    roots.pop(dm_ref, None)
+                    if manifest is not None:
+                        manifest.discard(name)
+            else:
+                result.warnings.append(f"DM not found: {dm_ref}")
+        
+        if manifest is not None:
+            manifest.prune(writer.root, packaged)
+            manifest.save()
+        
+        # Copy referenced graphics and multimedia
+        copy_all = not self.config.get("referenced_assets_only", True)
+        if graphics_dir and graphics_dir.exists():
+            result.icn_count = self._add_assets(
+                writer,
+                graphics_dir,
+                "graphics",
+                GRAPHIC_EXTENSIONS,
+                None if copy_all else graphic_refs,
+            )
+        
+        if multimedia_dir and multimedia_dir.exists():
+            result.multimedia_count = self._add_assets(
+                writer,
+                multimedia_dir,
+                "multimedia",
+                MULTIMEDIA_EXTENSIONS,
+                None if copy_all else multimedia_refs,
+            )
+        
+        if isinstance(writer, DirectoryPackageWriter):
+            self.logger.debug(
+                f"Assets: {writer.assets_linked} linked, {writer.assets_reused} unchanged"
+            )
+        
+        # Generate configuration
+        self._generate_config(writer, dm_refs)
+        
+        # Generate viewer
+        self._generate_viewer(writer)
+        
+        # Generate search index
+        if self.ietp_config.enable_search:
+            self._generate_search_index(writer, roots)
+        
+        # Generate cross-reference graph
+        if self.ietp_config.cross_reference_resolution:
+            graph = self._generate_xref_graph(writer, roots)
+            result.dangling_refs = graph.dangling()
+    
     def _create_structure(self, package_dir: Path) -> None:
         """Create IETP directory structure."""
         for subdir in ["content", "graphics", "multimedia", "css", "js", "index", "config"]:
             (package_dir / subdir).mkdir(parents=True, exist_ok=True)
     
-    def _copy_files(
-        self, 
-        source_dir: Path, 
-        target_dir: Path, 
-        extensions: List[str]
+    def _extract_icns(self, dm_root: ET.Element, element_name: str) -> List[str]:
+        """Return ICNs referenced by elements of one kind, in document order."""
+        icns = []
+        for element in self._find_all_elements(dm_root, element_name):
+            icn = element.get("infoEntityIdent", "")
+            if icn:
+                icns.append(icn)
+        return icns
+    
+    def _collect_assets(
+        self,
+        source_dir: Path,
+        extensions: FrozenSet[str],
+        wanted: Optional[Set[str]] = None,
+    ) -> Dict[str, Path]:
+        """
+        Collect asset files in one walk of a source tree.
+        
+        Args:
+            source_dir: Graphics or multimedia tree
+            extensions: Lowercase file suffixes to collect
+            wanted: ICNs to keep, matched against file stems (None keeps all)
+            
+        Returns:
+            Package file name -> source path; the tree is flattened by file
+            name, a later match replacing an earlier one
+        """
+        files: Dict[str, Path] = {}
+        for directory, _, names in os.walk(source_dir):
+            for file_name in sorted(names):
+                stem, ext = os.path.splitext(file_name)
+                if ext.lower() in extensions and (wanted is None or stem in wanted):
+                    files[file_name] = Path(directory, file_name)
+        return files
+    
+    def _add_assets(
+        self,
+        writer: PackageWriter,
+        source_dir: Path,
+        target: str,
+        extensions: FrozenSet[str],
+        wanted: Optional[Set[str]] = None,
     ) -> int:
-        """Copy files with specified extensions."""
+        """Add collected assets to a flat package folder; returns the count."""
+        files = self._collect_assets(source_dir, extensions, wanted)
+        if wanted is not None:
+            found = {os.path.splitext(file_name)[0] for file_name in files}
+            for icn in sorted(wanted - found):
+                self.logger.warning(f"Referenced ICN not found in {source_dir}: {icn}")
+        
         count = 0
-        for ext in extensions:
-            for file_path in source_dir.glob(f"**/*{ext}"):
-                try:
-                    shutil.copy2(file_path, target_dir / file_path.name)
-                    count += 1
-                except Exception as e:
-                    self.logger.warning(f"Failed to copy {file_path}: {e}")
+        for file_name, file_path in files.items():
+            try:
+                writer.add_asset(file_path, f"{target}/{file_name}")
+                count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to copy {file_path}: {e}")
         return count
     
-    def _generate_config(self, package_dir: Path, dm_refs: List[str]) -> None:
+    def _generate_config(self, writer: PackageWriter, dm_refs: List[str]) -> None:
         """Generate IETP configuration."""
         config = {
             "ietp": {
@@ -2489,16 +3695,25 @@ class IETPPackager(BaseRenderer):
                 "publication": "content/publication.xml",
                 "data_modules": [
                     f"content/{self._sanitize_filename(dm)}.xml" for dm in dm_refs
-                ]
+                ],
+                "search_index": "index/search",
             }
         }
+        if self.ietp_config.cross_reference_resolution:
+            config["content"]["xref_graph"] = "index/xref"
         
-        (package_dir / "config" / "ietp_config.json").write_text(
-            json.dumps(config, indent=2), encoding='utf-8'
-        )
+        writer.write_text("config/ietp_config.json", json.dumps(config, indent=2))
     
-    def _generate_viewer(self, package_dir: Path) -> None:
-        """Generate IETP viewer files."""
+    def _generate_viewer(self, writer: PackageWriter) -> None:
+        """
+        Generate IETP viewer files.
+        
+        The stylesheet and script are generated once per packager and
+        written under content-hashed names linked from ``index.html``.
+        """
+        css_name, viewer_css = self._cached_asset("viewer.css", "", self._generate_viewer_css)
+        js_name, viewer_js = self._cached_asset("viewer.js", "", self._generate_viewer_js)
+        
         # Index HTML
         index_html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -2506,7 +3721,7 @@ class IETPPackager(BaseRenderer):
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{self._escape_html(self.ietp_config.title)}</title>
-    <link rel="stylesheet" href="css/viewer.css">
+    <link rel="stylesheet" href="css/{css_name}">
 </head>
 <body>
     <div id="ietp-viewer">
@@ -2515,26 +3730,33 @@ class IETPPackager(BaseRenderer):
             <nav id="toolbar">
                 <button id="btn-home">Home</button>
                 <button id="btn-toc">TOC</button>
+                <input id="search-input" type="search" placeholder="Search">
                 <button id="btn-search">Search</button>
                 <button id="btn-print">Print</button>
             </nav>
         </header>
         <div id="container">
-            <aside id="sidebar"><div id="toc"></div></aside>
-            <main id="content"><div id="viewer-frame"></div></main>
+            <aside id="sidebar"><div id="search-results"></div><div id="toc"></div></aside>
+            <main id="content"><div id="viewer-frame"></div><div id="backlinks"></div></main>
         </div>
         <footer>
             <p>Contract: {self.contract_id} | Baseline: {self.baseline_ref}</p>
         </footer>
     </div>
-    <script src="js/viewer.js"></script>
+    <script src="js/{js_name}"></script>
 </body>
 </html>'''
         
-        (package_dir / "index.html").write_text(index_html, encoding='utf-8')
+        writer.write_text("index.html", index_html)
         
-        # CSS
-        viewer_css = '''
+        writer.remove("css/viewer.*.css")
+        writer.write_text(f"css/{css_name}", viewer_css)
+        writer.remove("js/viewer.*.js")
+        writer.write_text(f"js/{js_name}", viewer_js)
+    
+    def _generate_viewer_css(self) -> str:
+        """Generate the IETP viewer stylesheet."""
+        return '''
 * { margin: 0; padding: 0; box-sizing: border-box; }
 body { font-family: Arial, sans-serif; }
 #ietp-viewer { display: flex; flex-direction: column; height: 100vh; }
@@ -2542,6 +3764,10 @@ header { background: #2c3e50; color: white; padding: 15px 20px; display: flex; j
 header h1 { font-size: 20px; }
 #toolbar button { background: #34495e; color: white; border: none; padding: 8px 15px; margin-left: 10px; cursor: pointer; border-radius: 4px; }
 #toolbar button:hover { background: #415b76; }
+#toolbar input { padding: 7px 10px; margin-left: 10px; border: none; border-radius: 4px; }
+#search-results ol { margin: 0 0 20px 20px; }
+#backlinks { max-width: 1200px; margin: 30px auto 0; border-top: 1px solid #bdc3c7; padding-top: 10px; }
+#backlinks ul { margin-left: 20px; }
 #container { display: flex; flex: 1; overflow: hidden; }
 #sidebar { width: 300px; background: #ecf0f1; border-right: 1px solid #bdc3c7; overflow-y: auto; padding: 20px; }
 #content { flex: 1; overflow-y: auto; padding: 30px; }
@@ -2549,14 +3775,15 @@ header h1 { font-size: 20px; }
 footer { background: #ecf0f1; border-top: 1px solid #bdc3c7; padding: 10px; text-align: center; font-size: 12px; }
 @media (max-width: 768px) { #container { flex-direction: column; } #sidebar { width: 100%; max-height: 200px; } }
 '''
-        (package_dir / "css" / "viewer.css").write_text(viewer_css, encoding='utf-8')
-        
-        # JavaScript
-        viewer_js = '''
+    
+    def _generate_viewer_js(self) -> str:
+        """Generate the IETP viewer script."""
+        return '''
 class IETPViewer {
     constructor() { this.config = null; this.init(); }
     async init() {
         this.config = await fetch('config/ietp_config.json').then(r => r.json());
+        this.xref = this.config.content.xref_graph ? new IETPXref(this.config.content.xref_graph) : null;
         this.buildTOC();
         this.setupEvents();
         if (this.config.content.data_modules.length > 0) this.loadDM(this.config.content.data_modules[0]);
@@ -2580,8 +3807,29 @@ class IETPViewer {
             const xml = await fetch(path).then(r => r.text());
             const doc = new DOMParser().parseFromString(xml, 'text/xml');
             this.renderDM(doc);
+            await this.showBacklinks(path);
         } catch(e) { console.error('Load error:', e); }
     }
+    async showBacklinks(path) {
+        const box = document.getElementById('backlinks');
+        box.innerHTML = '';
+        if (!this.xref) return;
+        const links = await this.xref.backlinks(path);
+        if (!links.length) return;
+        const h = document.createElement('h3');
+        h.textContent = 'Referenced by';
+        const ul = document.createElement('ul');
+        links.forEach(link => {
+            const li = document.createElement('li');
+            const a = document.createElement('a');
+            a.href = '#';
+            a.textContent = link.dm;
+            a.onclick = e => { e.preventDefault(); this.loadDM(link.path); };
+            li.appendChild(a);
+            ul.appendChild(li);
+        });
+        box.append(h, ul);
+    }
     renderDM(doc) {
         const frame = document.getElementById('viewer-frame');
         const title = doc.querySelector('techName')?.textContent || 'Data Module';
@@ -2607,85 +3855,143 @@ class IETPViewer {
             s.style.display = s.style.display === 'none' ? 'block' : 'none';
         };
         document.getElementById('btn-print').onclick = () => window.print();
-        document.getElementById('btn-search').onclick = () => alert('Search - TBD');
+        const input = document.getElementById('search-input');
+        if (!this.config.viewer.features.search) {
+            input.style.display = 'none';
+            document.getElementById('btn-search').style.display = 'none';
+            return;
+        }
+        this.search = new IETPSearch(this.config.content.search_index);
+        const run = () => this.showResults(input.value);
+        document.getElementById('btn-search').onclick = run;
+        input.onkeydown = e => { if (e.key === 'Enter') run(); };
+    }
+    async showResults(query) {
+        const box = document.getElementById('search-results');
+        box.innerHTML = '';
+        const hits = await this.search.search(query);
+        const ol = document.createElement('ol');
+        hits.forEach(hit => {
+            const li = document.createElement('li');
+            const a = document.createElement('a');
+            a.href = '#';
+            a.textContent = hit.title + ' (' + hit.dm + ')';
+            a.onclick = e => { e.preventDefault(); this.loadDM(hit.path); };
+            li.appendChild(a);
+            ol.appendChild(li);
+        });
+        box.appendChild(ol);
+    }
+}
+// Inverted index search; mirrors aerospacemodel.asigt.search.SearchIndex.search
+class IETPSearch {
+    constructor(base) { this.base = base; this.manifest = null; this.docs = null; this.shards = new Map(); }
+    async load() {
+        if (this.manifest) return;
+        [this.manifest, this.docs] = await Promise.all([
+            fetch(this.base + '/manifest.json').then(r => r.json()),
+            fetch(this.base + '/docs.json').then(r => r.json()),
+        ]);
+        this.stopwords = new Set(this.manifest.stopwords);
+        this.encoder = new TextEncoder();
+    }
+    tokenize(text) {
+        return (text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || []).filter(t => !this.stopwords.has(t));
+    }
+    shardOf(term) {
+        let h = 0x811c9dc5;
+        for (const b of this.encoder.encode(term)) h = Math.imul(h ^ b, 0x01000193) >>> 0;
+        return h % this.manifest.shards;
+    }
+    async postings(term) {
+        const n = this.shardOf(term);
+        if (!this.shards.has(n)) {
+            const url = this.base + '/' + String(n).padStart(3, '0') + '.json';
+            this.shards.set(n, fetch(url).then(r => r.ok ? r.json() : {}).catch(() => ({})));
+        }
+        return (await this.shards.get(n))[term] || [];
+    }
+    async search(query, limit = 20) {
+        await this.load();
+        query = query.trim();
+        const phrase = query.length > 1 && query.startsWith('"') && query.endsWith('"');
+        const terms = this.tokenize(query);
+        if (!terms.length) return [];
+        const lists = await Promise.all(terms.map(t => this.postings(t)));
+        const maps = lists.map(l => new Map(l.map(p => [p[0], p])));
+        const idf = maps.map(m => Math.log(1 + this.manifest.doc_count / Math.max(m.size, 1)));
+        const hits = [];
+        for (const doc of maps[0].keys()) {
+            if (!maps.every(m => m.has(doc))) continue;
+            if (phrase && !this.hasPhrase(maps.map(m => m.get(doc)[2]))) continue;
+            const score = maps.reduce((s, m, i) => s + m.get(doc)[1] * idf[i], 0);
+            const d = this.docs[doc];
+            hits.push({dm: d.dm, title: d.title, path: d.path, score: score});
+        }
+        hits.sort((a, b) => b.score - a.score || (a.dm < b.dm ? -1 : a.dm > b.dm ? 1 : 0));
+        return hits.slice(0, limit);
+    }
+    hasPhrase(positions) {
+        const rest = positions.slice(1).map(p => new Set(p));
+        return positions[0].some(start => rest.every((set, i) => set.has(start + i + 1)));
+    }
+}
+// Cross-reference graph; reverse adjacency answers "what links here" directly
+class IETPXref {
+    constructor(base) { this.base = base; this.graph = null; }
+    load() {
+        if (!this.graph) this.graph = Promise.all([
+            fetch(this.base + '/nodes.json').then(r => r.json()),
+            fetch(this.base + '/reverse.json').then(r => r.json()),
+        ]).then(([nodes, reverse]) => ({
+            nodes: nodes, reverse: reverse, byPath: new Map(nodes.paths.map((p, i) => [p, i])),
+        }));
+        return this.graph;
+    }
+    async backlinks(path) {
+        const g = await this.load();
+        const i = g.byPath.get(path);
+        if (i === undefined) return [];
+        return g.reverse[i].map(j => ({dm: g.nodes.nodes[j], path: g.nodes.paths[j]}));
     }
 }
 document.addEventListener('DOMContentLoaded', () => new IETPViewer());
 '''
-        (package_dir / "js" / "viewer.js").write_text(viewer_js, encoding='utf-8')
     
     def _generate_search_index(
         self,
-        package_dir: Path,
-        dm_refs: List[str],
-        dm_contents: Dict[str, Union[str, ET.Element]]
-    ) -> None:
-        """Generate search index."""
-        entries = []
-        for dm_ref in dm_refs:
-            if dm_ref in dm_contents:
-                try:
-                    dm_xml = dm_contents[dm_ref]
-                    if isinstance(dm_xml, str):
-                        root = ET.fromstring(dm_xml)
-                    else:
-                        root = dm_xml
-                    
-                    title = self._find_element_text(root, "techName", dm_ref)
-                    text = " ".join(el.text.strip() for el in root.iter() if el.text)
-                    
-                    entries.append({
-                        "dm_code": dm_ref,
-                        "title": title,
-                        "content_preview": text[:200]
-                    })
-                except:
-                    pass
+        writer: PackageWriter,
+        roots: Dict[str, ET.Element]
+    ) -> SearchIndex:
+        """
+        Generate the sharded inverted search index under ``index/search``.
         
-        (package_dir / "index" / "search_index.json").write_text(
-            json.dumps(entries, indent=2), encoding='utf-8'
-        )
+        Shard count comes from config "search_shards" (default 64).
+        """
+        index = SearchIndex()
+        for dm_ref, root in roots.items():
+            path = f"content/{self._sanitize_filename(dm_ref)}.xml"
+            index.add_document(dm_ref, root, path)
+        
+        writer.remove(f"index/search/{SHARD_GLOB}")
+        shards = self.config.get("search_shards", DEFAULT_SHARDS)
+        for name, text in index.files(shards):
+            writer.write_text(f"index/search/{name}", text)
+        return index
     
-    def _generate_xref_map(
+    def _generate_xref_graph(
         self,
-        package_dir: Path,
-        dm_contents: Dict[str, Union[str, ET.Element]]
-    ) -> None:
-        """Generate cross-reference map."""
-        xref_map = {}
-        for dm_code, dm_xml in dm_contents.items():
-            try:
-                if isinstance(dm_xml, str):
-                    root = ET.fromstring(dm_xml)
-                else:
-                    root = dm_xml
-                
-                refs = []
-                for ref in self._find_all_elements(root, "internalRef"):
-                    ref_id = ref.get("internalRefId", "")
-                    if ref_id:
-                        refs.append({"type": "internal", "target": ref_id})
-                
-                for ref in self._find_all_elements(root, "dmRef"):
-                    dm_code_el = self._find_element(ref, "dmCode")
-                    if dm_code_el:
-                        refs.append({"type": "dm", "target": self._build_dmc_string(dm_code_el)})
-                
-                if refs:
-                    xref_map[dm_code] = refs
-            except:
-                pass
+        writer: PackageWriter,
+        roots: Dict[str, ET.Element]
+    ) -> XrefGraph:
+        """Generate forward/reverse cross-reference adjacency under ``index/xref``."""
+        graph = XrefGraph()
+        for dm_ref, root in roots.items():
+            graph.add_document(dm_ref, root, f"content/{self._sanitize_filename(dm_ref)}.xml")
         
-        (package_dir / "index" / "xref_map.json").write_text(
-            json.dumps(xref_map, indent=2), encoding='utf-8'
-        )
-    
-    def _create_archive(self, source_dir: Path, archive_path: Path) -> None:
-        """Create ZIP archive."""
-        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob('*'):
-                if file_path.is_file():
-                    zipf.write(file_path, file_path.relative_to(source_dir))
+        for name, text in graph.files():
+            writer.write_text(f"index/xref/{name}", text)
+        return graph
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get packaging statistics."""
@@ -2709,26 +4015,32 @@ class CombinedRenderer:
     Provides a single entry point for PDF, HTML, and IETP rendering
     under ASIT contract authority.
     
+    The renderers share one DocumentCache, so each DM is parsed once
+    however many formats it is rendered to.
+    
     Example:
         >>> renderer = CombinedRenderer(contract, config)
         >>> pdf_result = renderer.render_to_pdf(dm_xml, Path("output.pdf"))
         >>> html_result = renderer.render_to_html(dm_xml, Path("output.html"))
         >>> ietp_result = renderer.package_ietp(pm_xml, dm_dict, Path("output_ietp"))
+        >>> results = renderer.publish(pm_xml, dm_dict, Path("output"))
     """
     
     def __init__(
         self,
         contract: Dict[str, Any],
         config: RendererConfig,
-        context: Optional[ExecutionContext] = None
+        context: Optional[ExecutionContext] = None,
+        documents: Optional[DocumentCache] = None,
     ):
         self.contract = contract
         self.config = config
         self.context = context
+        self.documents = documents if documents is not None else DocumentCache()
         
-        self.pdf_renderer = PDFRenderer(contract, config.pdf.__dict__, context)
-        self.html_renderer = HTMLRenderer(contract, config.html.__dict__, context)
-        self.ietp_packager = IETPPackager(contract, config.ietp.__dict__, context)
+        self.pdf_renderer = PDFRenderer(contract, config.pdf.__dict__, context, self.documents)
+        self.html_renderer = HTMLRenderer(contract, config.html.__dict__, context, self.documents)
+        self.ietp_packager = IETPPackager(contract, config.ietp.__dict__, context, self.documents)
     
     def render_to_pdf(
         self,
@@ -2757,6 +4069,39 @@ class CombinedRenderer:
         return self.ietp_packager.package_publication(
             pm_content, dm_contents, output_path, package_format
         )
+    
+    def publish(
+        self,
+        pm_content: Union[str, ET.Element],
+        dm_contents: Dict[str, Union[str, ET.Element]],
+        output_dir: Path,
+        package_format: IETPFormat = IETPFormat.DIRECTORY
+    ) -> Dict[str, Any]:
+        """
+        Render a publication to PDF, HTML and IETP.
+        
+        Args:
+            pm_content: Publication Module XML
+            dm_contents: Dictionary of DM codes to DM XML content
+            output_dir: Receives publication.pdf, html/ and ietp
+            package_format: IETP package format
+            
+        Returns:
+            Results keyed "pdf", "html" and "ietp"
+        """
+        output_dir = Path(output_dir)
+        return {
+            "pdf": self.pdf_renderer.render_pm(
+                pm_content, dm_contents, output_dir / "publication.pdf"
+            ),
+            "html": self.html_renderer.render_pm(
+                pm_content, dm_contents, output_dir / "html"
+            ),
+            "ietp": self.ietp_packager.package_publication(
+                pm_content, dm_contents, output_dir / "ietp", package_format,
+                self.config.graphics_dir, self.config.multimedia_dir,
+            ),
+        }
 
 
 # =============================================================================
@@ -2784,6 +4129,25 @@ __all__ = [
     "HTMLRenderResult",
     "IETPPackageResult",
     
+    # Incremental rendering
+    "STYLESHEET_VERSION",
+    "RenderManifest",
+    "content_hash",
+    "hashed_asset_name",
+    "manifest_key",
+    
+    # Document cache
+    "DEFAULT_DOCUMENT_CACHE_BYTES",
+    "DocumentCache",
+    
+    # Package writers
+    "GRAPHIC_EXTENSIONS",
+    "MULTIMEDIA_EXTENSIONS",
+    "STORED_EXTENSIONS",
+    "PackageWriter",
+    "DirectoryPackageWriter",
+    "ZipPackageWriter",
+    
     # Renderers
     "BaseRenderer",
     "PDFRenderer",
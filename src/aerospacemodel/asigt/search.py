@@ -0,0 +1,366 @@
+"""
+ASIGT Search Module
+
+Inverted full-text index for IETP packages.
+
+Data modules are tokenized at package time into postings lists with
+token positions. Each occurrence is weighted by the field it appears in
+(DM title, section title, warning/caution, procedural step, body text),
+and the index is written as sharded JSON so the viewer only fetches the
+shards holding the query terms:
+
+    index/search/manifest.json     shard count, field weights, doc count
+    index/search/docs.json         doc id -> DM code, title, content path
+    index/search/NNN.json          term -> [[doc id, weight, [positions]]]
+
+A term's shard is FNV-1a(term) mod shard count. The viewer JavaScript in
+IETPPackager uses the same tokenizer, hash and scoring as ``search``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from xml.etree import ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+SEARCH_INDEX_VERSION = 1
+
+DEFAULT_SHARDS = 64
+
+# Postings shard file names: 000.json, 001.json, ...
+SHARD_GLOB = "[0-9][0-9][0-9].json"
+
+# Weight of one occurrence of a term, by field
+DEFAULT_FIELD_WEIGHTS: Dict[str, float] = {
+    "title": 5.0,
+    "warning": 3.0,
+    "step": 2.0,
+    "body": 1.0,
+}
+
+# Element local name -> field its text belongs to
+FIELD_ELEMENTS: Dict[str, str] = {
+    "techName": "title",
+    "infoName": "title",
+    "title": "title",
+    "warning": "warning",
+    "caution": "warning",
+    "proceduralStep": "step",
+    "isolationStep": "step",
+}
+
+DEFAULT_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "with",
+})
+
+# Letters and digits; matches the viewer's /[\p{L}\p{N}]+/gu
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str, stopwords: Iterable[str] = DEFAULT_STOPWORDS) -> List[str]:
+    """
+    Split text into lowercase index terms.
+
+    Args:
+        text: Text to tokenize
+        stopwords: Terms to drop
+
+    Returns:
+        Terms in order of appearance
+    """
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in stopwords]
+
+
+def shard_of(term: str, shards: int) -> int:
+    """Return the shard holding a term (32-bit FNV-1a of its UTF-8 bytes)."""
+    h = 0x811C9DC5
+    for byte in term.encode("utf-8"):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h % shards
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _to_json(data: object) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class SearchHit:
+    """A data module matching a query."""
+    dm_code: str
+    title: str
+    path: str
+    score: float
+
+
+# Posting: (doc id, weighted term frequency, positions)
+Posting = Tuple[int, float, List[int]]
+
+
+# =============================================================================
+# INVERTED INDEX
+# =============================================================================
+
+
+class SearchIndex:
+    """
+    Inverted index over data modules with positional, field-weighted postings.
+
+    Usage:
+        >>> index = SearchIndex()
+        >>> index.add_document("AERO-28-040", dm_root, "content/AERO-28-040.xml")
+        >>> index.search('fuel pump')
+        >>> index.search('"boost pump"')       # phrase
+        >>> index.write(package_dir / "index" / "search")
+    """
+
+    def __init__(
+        self,
+        field_weights: Optional[Dict[str, float]] = None,
+        stopwords: Iterable[str] = DEFAULT_STOPWORDS,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            field_weights: Weight per field (default: DEFAULT_FIELD_WEIGHTS)
+            stopwords: Terms left out of the index
+        """
+        self.field_weights = dict(field_weights or DEFAULT_FIELD_WEIGHTS)
+        self.stopwords: Set[str] = set(stopwords)
+        self.docs: List[Dict[str, str]] = []
+        self.postings: Dict[str, List[Posting]] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    def add_document(self, dm_code: str, root: ET.Element, path: str = "") -> int:
+        """
+        Tokenize a data module and add its postings.
+
+        Only the DM title, info name and ``content`` section are indexed.
+
+        Args:
+            dm_code: DM code shown in results
+            root: Parsed DM root element
+            path: Package-relative path of the DM
+
+        Returns:
+            Document id
+        """
+        doc_id = len(self.docs)
+        title = dm_code
+
+        # (term, field) in document order
+        tokens: List[Tuple[str, str]] = []
+        content = None
+        for element in root.iter():
+            name = _local_name(element.tag)
+            if name == "techName" and element.text:
+                title = element.text.strip() or dm_code
+                self._tokenize_into(element.text, "title", tokens)
+            elif name == "infoName" and element.text:
+                self._tokenize_into(element.text, "title", tokens)
+            elif name == "content":
+                content = element
+                break
+        if content is not None:
+            self._collect(content, "body", tokens)
+
+        self.docs.append({"dm": dm_code, "title": title, "path": path})
+
+        weights: Dict[str, float] = {}
+        positions: Dict[str, List[int]] = {}
+        for position, (term, field) in enumerate(tokens):
+            weights[term] = weights.get(term, 0.0) + self.field_weights.get(field, 1.0)
+            positions.setdefault(term, []).append(position)
+        for term, term_positions in positions.items():
+            self.postings.setdefault(term, []).append(
+                (doc_id, round(weights[term], 3), term_positions)
+            )
+
+        return doc_id
+
+    def _collect(self, element: ET.Element, field: str, tokens: List[Tuple[str, str]]) -> None:
+        """Tokenize an element's text, children and tails in document order."""
+        own = FIELD_ELEMENTS.get(_local_name(element.tag))
+        if own is not None and self.field_weights.get(own, 1.0) > self.field_weights.get(field, 1.0):
+            field = own
+        if element.text:
+            self._tokenize_into(element.text, field, tokens)
+        for child in element:
+            self._collect(child, field, tokens)
+            if child.tail:
+                self._tokenize_into(child.tail, field, tokens)
+
+    def _tokenize_into(self, text: str, field: str, tokens: List[Tuple[str, str]]) -> None:
+        tokens.extend((term, field) for term in tokenize(text, self.stopwords))
+
+    # =========================================================================
+    # Querying
+    # =========================================================================
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """
+        Find data modules containing every query term.
+
+        A query in double quotes matches the terms as a phrase. Hits are
+        ranked by the sum of weighted term frequency x idf.
+
+        Args:
+            query: Query text
+            limit: Maximum hits
+
+        Returns:
+            Hits, best first
+        """
+        query = query.strip()
+        phrase = len(query) > 1 and query.startswith('"') and query.endswith('"')
+        terms = tokenize(query, self.stopwords)
+        if not terms:
+            return []
+
+        postings = [{p[0]: p for p in self.postings.get(term, [])} for term in terms]
+        candidates = set(postings[0])
+        for term_postings in postings[1:]:
+            candidates &= term_postings.keys()
+
+        total = len(self.docs)
+        idf = [math.log(1 + total / max(len(p), 1)) for p in postings]
+
+        hits = []
+        for doc_id in candidates:
+            if phrase and not self._has_phrase([p[doc_id][2] for p in postings]):
+                continue
+            score = sum(p[doc_id][1] * w for p, w in zip(postings, idf))
+            doc = self.docs[doc_id]
+            hits.append(SearchHit(doc["dm"], doc["title"], doc["path"], round(score, 4)))
+
+        hits.sort(key=lambda h: (-h.score, h.dm_code))
+        return hits[:limit]
+
+    @staticmethod
+    def _has_phrase(positions: List[List[int]]) -> bool:
+        """Check that term i occurs at position start + i for some start."""
+        following = [set(p) for p in positions[1:]]
+        return any(
+            all(start + i in term_positions for i, term_positions in enumerate(following, 1))
+            for start in positions[0]
+        )
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def files(self, shards: int = DEFAULT_SHARDS) -> Iterator[Tuple[str, str]]:
+        """
+        Serialize the manifest, document table and postings shards.
+
+        Args:
+            shards: Number of postings shards
+
+        Yields:
+            (file name, JSON text) pairs; empty shards are omitted
+        """
+        buckets: List[Dict[str, List[Posting]]] = [{} for _ in range(shards)]
+        for term in sorted(self.postings):
+            buckets[shard_of(term, shards)][term] = self.postings[term]
+
+        manifest = {
+            "version": SEARCH_INDEX_VERSION,
+            "shards": shards,
+            "doc_count": len(self.docs),
+            "field_weights": self.field_weights,
+            "stopwords": sorted(self.stopwords),
+        }
+        yield "manifest.json", _to_json(manifest)
+        yield "docs.json", _to_json(self.docs)
+        for number, bucket in enumerate(buckets):
+            if bucket:
+                yield f"{number:03d}.json", _to_json(bucket)
+
+        logger.info(
+            f"Search index: {len(self.docs)} DMs, {len(self.postings)} terms, "
+            f"{sum(1 for bucket in buckets if bucket)} shards"
+        )
+
+    def write(self, directory: Path, shards: int = DEFAULT_SHARDS) -> List[Path]:
+        """
+        Write the manifest, document table and postings shards.
+
+        Args:
+            directory: Output directory (e.g. ``index/search``)
+            shards: Number of postings shards
+
+        Returns:
+            Paths written
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob(SHARD_GLOB):
+            stale.unlink()
+
+        written = []
+        for name, text in self.files(shards):
+            path = directory / name
+            path.write_text(text, encoding="utf-8")
+            written.append(path)
+        return written
+
+    @classmethod
+    def load(cls, directory: Path) -> "SearchIndex":
+        """Load a written index (all shards) back for querying."""
+        directory = Path(directory)
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        index = cls(manifest["field_weights"], manifest["stopwords"])
+        index.docs = json.loads((directory / "docs.json").read_text(encoding="utf-8"))
+        for shard in sorted(directory.glob(SHARD_GLOB)):
+            for term, postings in json.loads(shard.read_text(encoding="utf-8")).items():
+                index.postings[term] = [tuple(p) for p in postings]
+        return index
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "SEARCH_INDEX_VERSION",
+    "DEFAULT_SHARDS",
+    "SHARD_GLOB",
+    "DEFAULT_FIELD_WEIGHTS",
+    "FIELD_ELEMENTS",
+    "DEFAULT_STOPWORDS",
+    "SearchHit",
+    "SearchIndex",
+    "shard_of",
+    "tokenize",
+]
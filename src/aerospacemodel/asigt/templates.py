@@ -0,0 +1,180 @@
+"""
+ASIGT Templates Module
+
+Precompiled Jinja2 skeletons for pipeline-generated data modules.
+
+Built-in skeletons ship as package data under ``asigt/skeletons`` and use
+the same ``${...}`` placeholder syntax as the authoring templates in
+``ASIGT/s1000d_templates``.
+Each skeleton is compiled once per (DM type, info code) and then filled
+per data module, so per-DM generation cost is dominated by I/O.
+
+Skeleton resolution order for a DM type and info code:
+    1. ``<dm_type>_<info_code>.xml.j2``   e.g. dm_procedural_520.xml.j2
+    2. ``<dm_type>.xml.j2``               e.g. dm_procedural.xml.j2
+    3. ``dm.xml.j2``                      generic skeleton
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, PackageLoader, StrictUndefined, Template
+
+from .engine import ArtifactType, ASIGTTransformationError
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+# Built-in skeletons, shipped as package data (see pyproject package-data)
+SKELETON_PACKAGE = __package__
+SKELETON_RESOURCE = "skeletons"
+DEFAULT_SKELETON_DIR = Path(__file__).resolve().parent / SKELETON_RESOURCE
+
+GENERIC_SKELETON = "dm.xml.j2"
+SKELETON_SUFFIX = ".xml.j2"
+
+
+def info_code_from_dmc(dmc: str) -> str:
+    """
+    Extract the three-character info code from a Data Module Code.
+
+    Args:
+        dmc: DMC string, e.g. "AERO-A-28-00-00-00A-040A-A"
+
+    Returns:
+        Info code (e.g. "040"), or empty string if the DMC is too short
+    """
+    parts = (dmc or "").split("-")
+    if len(parts) < 3:
+        return ""
+    return parts[-2][:3]
+
+
+# =============================================================================
+# SKELETON LIBRARY
+# =============================================================================
+
+
+class DMSkeletonLibrary:
+    """
+    Cache of compiled DM skeleton templates.
+
+    Usage:
+        >>> library = DMSkeletonLibrary()
+        >>> xml = library.render(
+        ...     ArtifactType.DM_DESCRIPTIVE, "040",
+        ...     dmc="AERO-A-28-00-00-00A-040A-A", issue_date=datetime.now(),
+        ...     title="Fuel System", description="...", citations=[],
+        ... )
+    """
+
+    def __init__(self, skeleton_dir: Optional[Path] = None):
+        """
+        Initialize library.
+
+        Args:
+            skeleton_dir: Directory of ``*.xml.j2`` skeletons
+                          (default: the built-in package skeletons)
+        """
+        self.skeleton_dir = Path(skeleton_dir) if skeleton_dir else DEFAULT_SKELETON_DIR
+        self.logger = logging.getLogger("asigt.templates")
+        self._compiled: Dict[Tuple[str, str], Template] = {}
+        self._lock = threading.Lock()
+
+        loader: BaseLoader
+        if skeleton_dir:
+            if not self.skeleton_dir.is_dir():
+                raise ASIGTTransformationError(
+                    f"DM skeleton directory not found: {self.skeleton_dir}"
+                )
+            loader = FileSystemLoader(str(self.skeleton_dir))
+        else:
+            # Resolved through importlib, so zipped installs work too
+            loader = PackageLoader(SKELETON_PACKAGE, SKELETON_RESOURCE)
+
+        self.environment = Environment(
+            loader=loader,
+            autoescape=True,
+            auto_reload=False,
+            undefined=StrictUndefined,
+            variable_start_string="${",
+            variable_end_string="}",
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+        )
+        self._available = set(self.environment.list_templates())
+
+    def get(self, dm_type: Union[ArtifactType, str], info_code: str = "") -> Template:
+        """
+        Return the compiled skeleton for a DM type and info code.
+
+        Args:
+            dm_type: Output artifact type (or its value, e.g. "dm_procedural")
+            info_code: Three-character S1000D info code
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        type_name = dm_type.value if isinstance(dm_type, ArtifactType) else str(dm_type)
+        key = (type_name, info_code)
+
+        template = self._compiled.get(key)
+        if template is not None:
+            return template
+
+        with self._lock:
+            template = self._compiled.get(key)
+            if template is None:
+                name = self._resolve(type_name, info_code)
+                template = self.environment.get_template(name)
+                self._compiled[key] = template
+                self.logger.debug(f"Compiled skeleton {name} for {type_name}/{info_code}")
+        return template
+
+    def render(
+        self,
+        dm_type: Union[ArtifactType, str],
+        info_code: str = "",
+        **slots: Any
+    ) -> str:
+        """Fill the skeleton for a DM type and info code."""
+        return self.get(dm_type, info_code).render(**slots)
+
+    def _resolve(self, type_name: str, info_code: str) -> str:
+        """Pick the most specific skeleton file available."""
+        candidates: List[str] = []
+        if info_code:
+            candidates.append(f"{type_name}_{info_code}{SKELETON_SUFFIX}")
+        candidates.append(f"{type_name}{SKELETON_SUFFIX}")
+        candidates.append(GENERIC_SKELETON)
+
+        for name in candidates:
+            if name in self._available:
+                return name
+        raise ASIGTTransformationError(
+            f"No DM skeleton for {type_name}/{info_code} in {self.skeleton_dir}"
+        )
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "DEFAULT_SKELETON_DIR",
+    "SKELETON_PACKAGE",
+    "SKELETON_RESOURCE",
+    "DMSkeletonLibrary",
+    "info_code_from_dmc",
+]
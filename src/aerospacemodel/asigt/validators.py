@@ -48,6 +48,7 @@ from xml.etree import ElementTree as ET
 
 import yaml
 
+from ..asit.integrity import IntegrityStatus, IntegrityVerifier, normalize_hash
 from .engine import (
     ValidationStatus,
     ValidationIssue,
@@ -64,6 +65,7 @@ from .engine import (
     ASIGTError,
     ASIGTValidationError,
 )
+from .generators import GenerationResult
 
 
 logger = logging.getLogger(__name__)
@@ -293,6 +295,8 @@ class ValidatorConfig:
     allow_orphan_sources: bool = False
     allow_orphan_targets: bool = False
     verify_hashes: bool = True
+    verify_file_contents: bool = False  # Re-hash traced files on disk
+    hash_workers: Optional[int] = None  # Integrity verifier thread count
     
     # Validation options
     fail_on_warning: bool = False
@@ -412,12 +416,19 @@ class BREXValidator(BaseValidator):
         # Register custom validators
         self._register_custom_validators()
     
-    def validate(self, artifact: Union[OutputArtifact, Path, str, ET.Element]) -> bool:
+    def validate(
+        self,
+        artifact: Union[OutputArtifact, GenerationResult, Path, str, ET.Element, ET.ElementTree]
+    ) -> bool:
         """
         Validate artifact against BREX rules.
         
+        In-memory trees (Element, ElementTree, or a GenerationResult
+        carrying ``xml_element``) are validated directly without re-parsing.
+        
         Args:
-            artifact: The artifact to validate (path, XML string, or Element)
+            artifact: The artifact to validate (path, XML string, Element,
+                      or GenerationResult)
             
         Returns:
             True if validation passed, False if errors found
@@ -427,7 +438,12 @@ class BREXValidator(BaseValidator):
         
         # Parse XML
         try:
-            if isinstance(artifact, OutputArtifact):
+            in_memory = _in_memory_root(artifact)
+            if in_memory is not None:
+                root = in_memory
+            elif isinstance(artifact, GenerationResult):
+                root = ET.fromstring(artifact.xml_content)
+            elif isinstance(artifact, OutputArtifact):
                 if artifact.path.exists():
                     tree = ET.parse(artifact.path)
                     root = tree.getroot()
@@ -447,7 +463,7 @@ class BREXValidator(BaseValidator):
             self._errors.append(ValidationIssue(
                 rule_id="BREX-PARSE-ERROR",
                 severity=ErrorSeverity.FATAL,
-                artifact_id=str(artifact),
+                artifact_id=_artifact_label(artifact),
                 message=f"XML parse error: {e}",
                 location="document root"
             ))
@@ -476,6 +492,22 @@ class BREXValidator(BaseValidator):
         
         return not self.has_errors
     
+    def validate_result(
+        self,
+        result: Union[GenerationResult, ET.Element]
+    ) -> BREXValidationResult:
+        """
+        Validate a generator result (or parsed root) from its in-memory tree.
+        
+        Args:
+            result: GenerationResult from a DM/PM/DML generator, or a
+                    parsed root element
+            
+        Returns:
+            BREXValidationResult with detailed results
+        """
+        return self._build_result(self.validate(result))
+    
     def validate_file(self, file_path: Path) -> BREXValidationResult:
         """
         Validate a file and return structured result.
@@ -486,8 +518,10 @@ class BREXValidator(BaseValidator):
         Returns:
             BREXValidationResult with detailed results
         """
-        passed = self.validate(file_path)
-        
+        return self._build_result(self.validate(file_path))
+    
+    def _build_result(self, passed: bool) -> BREXValidationResult:
+        """Build a BREXValidationResult from the last run."""
         error_count = len([v for v in self._violations if v.rule.severity == BREXSeverity.ERROR])
         warning_count = len([v for v in self._violations if v.rule.severity == BREXSeverity.WARNING])
         
@@ -514,7 +548,7 @@ class BREXValidator(BaseValidator):
         Returns:
             BREXValidationResult
         """
-        return self.validate_file(xml_content)  # validate() handles strings
+        return self._build_result(self.validate(xml_content))
     
     def get_rule(self, rule_id: str) -> Optional[BREXRule]:
         """Get a rule by ID."""
@@ -1108,7 +1142,7 @@ class SchemaValidator(BaseValidator):
     
     Note: Full XSD validation requires lxml library.
     This implementation provides basic structural validation
-    when lxml is not available.
+    when lxml is not available or no schema file is configured.
     
     Usage:
         >>> config = ValidatorConfig(
@@ -1143,10 +1177,16 @@ class SchemaValidator(BaseValidator):
         self._schema_errors: List[SchemaError] = []
         self._use_lxml = self._check_lxml_available()
     
-    def validate(self, artifact: Union[OutputArtifact, Path, str]) -> bool:
+    def validate(
+        self,
+        artifact: Union[OutputArtifact, GenerationResult, Path, str, ET.Element, ET.ElementTree]
+    ) -> bool:
         """
         Validate artifact against XML schema.
         
+        In-memory trees (Element, ElementTree, or a GenerationResult
+        carrying ``xml_element``) are validated directly without re-parsing.
+        
         Args:
             artifact: The artifact to validate
             
@@ -1158,26 +1198,22 @@ class SchemaValidator(BaseValidator):
         
         # Parse XML
         try:
-            if isinstance(artifact, OutputArtifact):
-                xml_path = artifact.path
-            elif isinstance(artifact, Path):
-                xml_path = artifact
-            else:
-                # String content - write to temp or parse directly
-                xml_path = None
-                xml_content = artifact
-            
-            if xml_path:
-                tree = ET.parse(xml_path)
-                root = tree.getroot()
-            else:
-                root = ET.fromstring(xml_content)
+            root = _in_memory_root(artifact)
+            if root is None:
+                if isinstance(artifact, GenerationResult):
+                    root = ET.fromstring(artifact.xml_content)
+                elif isinstance(artifact, OutputArtifact):
+                    root = ET.parse(artifact.path).getroot()
+                elif isinstance(artifact, Path):
+                    root = ET.parse(artifact).getroot()
+                else:
+                    root = ET.fromstring(artifact)
                 
         except ET.ParseError as e:
             self._errors.append(ValidationIssue(
                 rule_id="SCHEMA-PARSE-ERROR",
                 severity=ErrorSeverity.FATAL,
-                artifact_id=str(artifact),
+                artifact_id=_artifact_label(artifact),
                 message=f"XML parse error: {e}",
                 location="document"
             ))
@@ -1185,12 +1221,29 @@ class SchemaValidator(BaseValidator):
         
         # Determine document type
         doc_type = self._determine_document_type(root)
+        artifact_id = _artifact_label(artifact)
         
         # Validate structure
         if self._use_lxml:
-            return self._validate_with_lxml(root, doc_type, str(artifact))
+            return self._validate_with_lxml(root, doc_type, artifact_id)
         else:
-            return self._validate_basic(root, doc_type, str(artifact))
+            return self._validate_basic(root, doc_type, artifact_id)
+    
+    def validate_result(
+        self,
+        result: Union[GenerationResult, ET.Element]
+    ) -> SchemaValidationResult:
+        """
+        Validate a generator result (or parsed root) from its in-memory tree.
+        
+        Args:
+            result: GenerationResult from a DM/PM/DML generator, or a
+                    parsed root element
+            
+        Returns:
+            SchemaValidationResult
+        """
+        return self._build_result(self.validate(result))
     
     def validate_file(self, file_path: Path) -> SchemaValidationResult:
         """
@@ -1202,8 +1255,10 @@ class SchemaValidator(BaseValidator):
         Returns:
             SchemaValidationResult
         """
-        valid = self.validate(file_path)
-        
+        return self._build_result(self.validate(file_path))
+    
+    def _build_result(self, valid: bool) -> SchemaValidationResult:
+        """Build a single-document SchemaValidationResult from the last run."""
         return SchemaValidationResult(
             status=ValidationStatus.PASS if valid else ValidationStatus.FAIL,
             schema_version=self.config.schema_version.value,
@@ -1278,26 +1333,24 @@ class SchemaValidator(BaseValidator):
         try:
             from lxml import etree
             
-            # Convert to lxml element
-            xml_string = ET.tostring(root, encoding="unicode")
-            lxml_root = etree.fromstring(xml_string.encode())
+            # Load schema (compiled once per schema file); without one,
+            # fall back to the structural checks
+            schema = self._load_schema(doc_type)
+            if schema is None:
+                return self._validate_basic(root, doc_type, artifact_id)
             
-            # Load schema
-            schema_file = self._get_schema_file(doc_type)
-            if schema_file and schema_file.exists():
-                schema_doc = etree.parse(str(schema_file))
-                schema = etree.XMLSchema(schema_doc)
-                
-                if not schema.validate(lxml_root):
-                    for error in schema.error_log:
-                        self._errors.append(ValidationIssue(
-                            rule_id="SCHEMA-VALIDATION",
-                            severity=ErrorSeverity.ERROR,
-                            artifact_id=artifact_id,
-                            message=str(error.message),
-                            location=f"Line {error.line}"
-                        ))
-                    return False
+            lxml_root = etree.fromstring(ET.tostring(root))
+            
+            if not schema.validate(lxml_root):
+                for error in schema.error_log:
+                    self._errors.append(ValidationIssue(
+                        rule_id="SCHEMA-VALIDATION",
+                        severity=ErrorSeverity.ERROR,
+                        artifact_id=artifact_id,
+                        message=str(error.message),
+                        location=f"Line {error.line}"
+                    ))
+                return False
             
             return True
             
@@ -1431,6 +1484,18 @@ class SchemaValidator(BaseValidator):
         
         return valid
     
+    def _load_schema(self, doc_type: str) -> Optional[Any]:
+        """Return the compiled lxml XMLSchema for a document type, if available."""
+        schema_file = self._get_schema_file(doc_type)
+        if not schema_file or not schema_file.exists():
+            return None
+        
+        key = str(schema_file)
+        if key not in self._schema_cache:
+            from lxml import etree
+            self._schema_cache[key] = etree.XMLSchema(etree.parse(key))
+        return self._schema_cache[key]
+    
     def _get_schema_file(self, doc_type: str) -> Optional[Path]:
         """Get schema file path for document type."""
         if not self.config.schema_path:
@@ -1473,9 +1538,22 @@ class TraceValidator(BaseValidator):
         >>> result = validator.validate(trace_matrix, sources, outputs)
     """
     
-    def __init__(self, config: ValidatorConfig, context: Optional[ExecutionContext] = None):
+    def __init__(
+        self,
+        config: ValidatorConfig,
+        context: Optional[ExecutionContext] = None,
+        verifier: Optional[IntegrityVerifier] = None,
+    ):
         super().__init__(config, context)
         self._issues: List[TraceIssue] = []
+        self._verifier = verifier
+    
+    @property
+    def verifier(self) -> IntegrityVerifier:
+        """Integrity verifier used for on-disk hash checks (lazy)."""
+        if self._verifier is None:
+            self._verifier = IntegrityVerifier(max_workers=self.config.hash_workers)
+        return self._verifier
     
     def validate(
         self, 
@@ -1644,6 +1722,56 @@ class TraceValidator(BaseValidator):
                             message=f"Output hash mismatch - content may have changed",
                             severity=ErrorSeverity.WARNING
                         ))
+        
+        if self.config.verify_file_contents:
+            self._verify_file_contents(trace_matrix, source_map, output_map)
+    
+    def _verify_file_contents(
+        self,
+        trace_matrix: TraceMatrix,
+        source_map: Dict[str, SourceArtifact],
+        output_map: Dict[str, OutputArtifact],
+    ) -> None:
+        """Re-hash traced files on disk and compare with recorded link hashes."""
+        checks: List[Tuple[str, str, Path, str]] = []
+        for entry in trace_matrix.entries:
+            source = source_map.get(entry.source_id)
+            source_path = source.path if source else entry.source_path
+            if source_path and entry.source_hash:
+                checks.append(("source", entry.source_id, Path(source_path), entry.source_hash))
+            
+            output = output_map.get(entry.target_id)
+            target_path = output.path if output else entry.target_path
+            if target_path and entry.target_hash:
+                checks.append(("output", entry.target_id, Path(target_path), entry.target_hash))
+        
+        # Each distinct file is read once, however many links reference it
+        digests = self.verifier.hash_many(sorted({path for _, _, path, _ in checks}))
+        
+        reported: Set[Tuple[str, str]] = set()
+        for artifact_type, artifact_id, path, expected in checks:
+            if (artifact_type, artifact_id) in reported:
+                continue
+            result = digests[path]
+            if result.status == IntegrityStatus.MISSING:
+                issue_type = "file_missing"
+                message = f"Traced {artifact_type} file not found: {path}"
+            elif result.status == IntegrityStatus.UNCHECKED:
+                issue_type = "file_unreadable"
+                message = f"Traced {artifact_type} file could not be read: {path}"
+            elif result.computed != normalize_hash(expected):
+                issue_type = "content_hash_mismatch"
+                message = f"On-disk {artifact_type} content differs from trace record: {path}"
+            else:
+                continue
+            reported.add((artifact_type, artifact_id))
+            self._issues.append(TraceIssue(
+                issue_type=issue_type,
+                artifact_id=artifact_id,
+                artifact_type=artifact_type,
+                message=message,
+                severity=ErrorSeverity.WARNING
+            ))
 
 
 # =============================================================================
@@ -1702,6 +1830,38 @@ class CombinedValidator:
         
         return brex_result, schema_result
     
+    def validate_generation(
+        self,
+        result: GenerationResult
+    ) -> Tuple[BREXValidationResult, SchemaValidationResult]:
+        """
+        Validate a generator result in memory, straight after generation.
+        
+        The BREX and schema results are recorded on the GenerationResult,
+        and its output artifact is flagged invalid on any error.
+        
+        Args:
+            result: GenerationResult carrying ``xml_element`` or ``xml_content``
+            
+        Returns:
+            Tuple of (BREXValidationResult, SchemaValidationResult)
+        """
+        brex_result = self.brex_validator.validate_result(result)
+        schema_result = self.schema_validator.validate_result(result)
+        
+        result.brex_result = brex_result
+        result.schema_result = schema_result
+        
+        errors = [
+            issue.message for issue in brex_result.issues + schema_result.issues
+            if issue.severity in (ErrorSeverity.ERROR, ErrorSeverity.FATAL)
+        ]
+        if errors and result.artifact is not None:
+            result.artifact.valid = False
+            result.artifact.validation_errors.extend(errors)
+        
+        return brex_result, schema_result
+    
     def validate_run(
         self,
         run_id: str,
@@ -1799,6 +1959,33 @@ class CombinedValidator:
         return report
 
 
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+
+def _in_memory_root(artifact: Any) -> Optional[ET.Element]:
+    """Return the root element if the artifact is already an in-memory tree."""
+    if isinstance(artifact, GenerationResult):
+        return artifact.xml_element
+    if isinstance(artifact, ET.ElementTree):
+        return artifact.getroot()
+    if isinstance(artifact, ET.Element):
+        return artifact
+    return None
+
+
+def _artifact_label(artifact: Any) -> str:
+    """Return a human-readable identifier for an artifact being validated."""
+    if isinstance(artifact, GenerationResult):
+        return artifact.dmc or "<generated>"
+    if isinstance(artifact, OutputArtifact):
+        return artifact.dmc or artifact.id
+    if isinstance(artifact, (ET.Element, ET.ElementTree)):
+        return "<in-memory>"
+    return str(artifact)
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -0,0 +1,268 @@
+"""
+ASIGT Cross-Reference Module
+
+Bidirectional cross-reference graph for IETP packages.
+
+The graph is built in one pass over already-parsed data modules. DM
+references (``dmRef``) become edges between DM nodes; internal
+references (``internalRef``) are checked against the ids defined in the
+same DM. Targets that are not packaged and internal ids that are not
+defined are reported as dangling.
+
+The graph is written as compact adjacency lists over node numbers, so
+the viewer answers "what links here" with one array lookup:
+
+    index/xref/nodes.json      DM codes (packaged DMs first), their paths
+    index/xref/forward.json    node -> [target nodes]   (packaged nodes)
+    index/xref/reverse.json    node -> [source nodes]   (all nodes)
+    index/xref/dangling.json   dangling DM and internal references
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from xml.etree import ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+XREF_GRAPH_VERSION = 1
+
+
+def dm_ref_code(dm_code: ET.Element) -> str:
+    """Build the DM key (modelIdentCode-systemCode-infoCode) of a dmCode element."""
+    parts = [
+        dm_code.get("modelIdentCode", ""),
+        dm_code.get("systemCode", ""),
+        dm_code.get("infoCode", ""),
+    ]
+    return "-".join(p for p in parts if p) or "UNKNOWN"
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _to_json(data: object) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class DanglingRef:
+    """A reference whose target is not in the package."""
+    source: str         # DM code holding the reference
+    target: str         # Referenced DM code or internal id
+    kind: str           # "dm" or "internal"
+
+
+# =============================================================================
+# CROSS-REFERENCE GRAPH
+# =============================================================================
+
+
+class XrefGraph:
+    """
+    Forward and reverse DM reference graph with dangling-reference detection.
+
+    Usage:
+        >>> graph = XrefGraph()
+        >>> graph.add_document("AERO-28-040", dm_root, "content/AERO-28-040.xml")
+        >>> graph.links("AERO-28-040")         # DMs it references
+        >>> graph.backlinks("AERO-28-520")     # DMs referencing it
+        >>> graph.dangling()
+    """
+
+    def __init__(self):
+        self.paths: Dict[str, str] = {}                 # DM code -> package path
+        self._forward: Dict[str, List[str]] = {}        # DM code -> target DM codes
+        self._internal: Dict[str, List[str]] = {}       # DM code -> undefined ids
+        self._reverse: Optional[Dict[str, List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, dm_code: str) -> bool:
+        return dm_code in self.paths
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    def add_document(self, dm_code: str, root: ET.Element, path: str = "") -> None:
+        """
+        Record the references of a data module.
+
+        Args:
+            dm_code: DM code of the data module
+            root: Parsed DM root element
+            path: Package-relative path of the DM
+        """
+        targets: Dict[str, None] = {}
+        internal: Dict[str, None] = {}
+        ids = set()
+        for element in root.iter():
+            name = _local_name(element.tag)
+            element_id = element.get("id")
+            if element_id:
+                ids.add(element_id)
+            if name == "dmRef":
+                for child in element.iter():
+                    if _local_name(child.tag) == "dmCode":
+                        target = dm_ref_code(child)
+                        if target != dm_code:
+                            targets[target] = None
+                        break
+            elif name == "internalRef":
+                ref_id = element.get("internalRefId", "")
+                if ref_id:
+                    internal[ref_id] = None
+
+        self.paths[dm_code] = path
+        self._forward[dm_code] = list(targets)
+        self._reverse = None
+        self._internal[dm_code] = [ref_id for ref_id in internal if ref_id not in ids]
+
+    # =========================================================================
+    # Querying
+    # =========================================================================
+
+    def links(self, dm_code: str) -> List[str]:
+        """Return the DMs a packaged DM references, in document order."""
+        return list(self._forward.get(dm_code, []))
+
+    def backlinks(self, dm_code: str) -> List[str]:
+        """Return the packaged DMs referencing a DM, in package order."""
+        if self._reverse is None:
+            self._reverse = {}
+            for source, targets in self._forward.items():
+                for target in targets:
+                    self._reverse.setdefault(target, []).append(source)
+        return list(self._reverse.get(dm_code, []))
+
+    def dangling(self) -> List[DanglingRef]:
+        """Return references to unpackaged DMs and undefined internal ids."""
+        refs = []
+        for source, targets in self._forward.items():
+            refs.extend(
+                DanglingRef(source, target, "dm")
+                for target in targets if target not in self.paths
+            )
+            refs.extend(
+                DanglingRef(source, ref_id, "internal")
+                for ref_id in self._internal[source]
+            )
+        return refs
+
+    def adjacency(self) -> Tuple[List[str], List[List[int]], List[List[int]]]:
+        """
+        Number the nodes and build adjacency lists.
+
+        Returns:
+            (nodes, forward, reverse): packaged DMs come first in ``nodes``,
+            followed by dangling targets; ``forward`` covers packaged nodes,
+            ``reverse`` covers all nodes
+        """
+        nodes = list(self.paths)
+        ids = {dm_code: i for i, dm_code in enumerate(nodes)}
+        forward = []
+        for source in self.paths:
+            row = []
+            for target in self._forward[source]:
+                if target not in ids:
+                    ids[target] = len(nodes)
+                    nodes.append(target)
+                row.append(ids[target])
+            forward.append(row)
+
+        reverse: List[List[int]] = [[] for _ in nodes]
+        for source, row in enumerate(forward):
+            for target in row:
+                reverse[target].append(source)
+        return nodes, forward, reverse
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Serialize the graph.
+
+        Yields:
+            (file name, JSON text) pairs
+        """
+        nodes, forward, reverse = self.adjacency()
+        dangling: Dict[str, Dict[str, List[str]]] = {"dm": {}, "internal": {}}
+        for ref in self.dangling():
+            dangling[ref.kind].setdefault(ref.source, []).append(ref.target)
+
+        yield "nodes.json", _to_json({
+            "version": XREF_GRAPH_VERSION,
+            "packaged": len(self.paths),
+            "nodes": nodes,
+            "paths": list(self.paths.values()),
+        })
+        yield "forward.json", _to_json(forward)
+        yield "reverse.json", _to_json(reverse)
+        yield "dangling.json", _to_json(dangling)
+
+        logger.info(
+            f"Xref graph: {len(self.paths)} DMs, {sum(map(len, forward))} links, "
+            f"{sum(map(len, dangling['dm'].values()))} dangling DM refs"
+        )
+
+    def write(self, directory: Path) -> List[Path]:
+        """Write the graph files to a directory; returns the paths written."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, text in self.files():
+            path = directory / name
+            path.write_text(text, encoding="utf-8")
+            written.append(path)
+        return written
+
+    @classmethod
+    def load(cls, directory: Path) -> "XrefGraph":
+        """Load a written graph back for querying."""
+        directory = Path(directory)
+        data = {
+            name: json.loads((directory / f"{name}.json").read_text(encoding="utf-8"))
+            for name in ("nodes", "forward", "dangling")
+        }
+        nodes = data["nodes"]["nodes"]
+        graph = cls()
+        for i, path in enumerate(data["nodes"]["paths"]):
+            dm_code = nodes[i]
+            graph.paths[dm_code] = path
+            graph._forward[dm_code] = [nodes[j] for j in data["forward"][i]]
+            graph._internal[dm_code] = data["dangling"]["internal"].get(dm_code, [])
+        return graph
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "XREF_GRAPH_VERSION",
+    "DanglingRef",
+    "XrefGraph",
+    "dm_ref_code",
+]
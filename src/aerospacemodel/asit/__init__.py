@@ -96,6 +96,15 @@ from .baselines import (
     BaselineStateError,
 )
 
+# Import integrity verification service (shared with ASIGT trace validation)
+from .integrity import (
+    IntegrityStatus,
+    IntegrityResult,
+    IntegrityCache,
+    IntegrityVerifier,
+    hash_file,
+)
+
 
 class Governance:
     """
@@ -280,4 +289,11 @@ __all__ = [
     "BaselineError",
     "BaselineIntegrityError",
     "BaselineStateError",
+    
+    # Re-exported from integrity module
+    "IntegrityStatus",
+    "IntegrityResult",
+    "IntegrityCache",
+    "IntegrityVerifier",
+    "hash_file",
 ]
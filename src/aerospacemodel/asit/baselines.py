@@ -25,6 +25,8 @@ from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import yaml
 
+from .integrity import IntegrityVerifier, hash_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,8 +121,7 @@ class BaselineArtifact:
             return ArtifactStatus.MISSING
         
         try:
-            content = file_path.read_bytes()
-            computed_hash = f"sha256:{hashlib.sha256(content).hexdigest()}"
+            computed_hash = f"sha256:{hash_file(file_path)}"
             
             if computed_hash == self.hash:
                 return ArtifactStatus.VALID
@@ -154,8 +155,7 @@ class BaselineArtifact:
         Returns:
             BaselineArtifact with computed hash
         """
-        content = file_path.read_bytes()
-        hash_value = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        hash_value = f"sha256:{hash_file(file_path)}"
         relative_path = str(file_path.relative_to(root_path))
         
         return cls(
@@ -424,12 +424,21 @@ class Baseline:
     # Integrity Verification
     # ==========================================================================
     
-    def verify_integrity(self, root_path: Path) -> Dict[str, Any]:
+    def verify_integrity(
+        self,
+        root_path: Path,
+        verifier: Optional[IntegrityVerifier] = None,
+    ) -> Dict[str, Any]:
         """
         Verify integrity of all baseline artifacts.
         
+        Artifacts are hashed in parallel with streaming digests. Pass a
+        configured verifier to control worker count, attach a skip cache
+        or receive progress callbacks.
+        
         Args:
             root_path: Root directory for artifact resolution
+            verifier: Optional integrity verifier (default: new instance)
             
         Returns:
             Dictionary with verification results:
@@ -451,8 +460,14 @@ class Baseline:
             "details": {},
         }
         
+        verifier = verifier or IntegrityVerifier()
+        checks = verifier.verify(
+            (artifact.artifact_id, root_path / artifact.path, artifact.hash)
+            for artifact in self.artifacts
+        )
+        
         for artifact in self.artifacts:
-            status = artifact.verify(root_path)
+            status = ArtifactStatus(checks[artifact.artifact_id].status.value)
             results["details"][artifact.artifact_id] = status.value
             
             if status == ArtifactStatus.VALID:
@@ -1061,7 +1076,8 @@ class BaselineManager:
     def verify_baseline(
         self,
         baseline_id: str,
-        root_path: Path
+        root_path: Path,
+        verifier: Optional[IntegrityVerifier] = None,
     ) -> Dict[str, Any]:
         """
         Verify baseline integrity.
@@ -1069,12 +1085,13 @@ class BaselineManager:
         Args:
             baseline_id: Baseline to verify
             root_path: Root path for artifact resolution
+            verifier: Optional integrity verifier (workers, cache, progress)
             
         Returns:
             Verification results
         """
         baseline = self.get_baseline(baseline_id)
-        return baseline.verify_integrity(root_path)
+        return baseline.verify_integrity(root_path, verifier=verifier)
     
     # =========================================================================
     # ID Validation
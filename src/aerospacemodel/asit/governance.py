@@ -14,7 +14,6 @@ GOVERNANCE controls:
 from __future__ import annotations
 
 import csv
-import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -24,6 +23,8 @@ from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
+from .integrity import IntegrityVerifier, hash_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,8 +130,7 @@ class BaselineContent:
         """Verify artifact integrity against stored hash."""
         if not file_path.exists():
             return False
-        content = file_path.read_bytes()
-        computed = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        computed = f"sha256:{hash_file(file_path)}"
         return computed == self.hash
 
 
@@ -202,13 +202,18 @@ class Baseline:
                 return content
         return None
     
-    def verify_integrity(self, root_path: Path) -> Dict[str, bool]:
-        """Verify all artifacts against stored hashes."""
-        results = {}
-        for content in self.contents:
-            file_path = root_path / content.path
-            results[content.artifact_id] = content.verify_hash(file_path)
-        return results
+    def verify_integrity(
+        self,
+        root_path: Path,
+        verifier: Optional[IntegrityVerifier] = None,
+    ) -> Dict[str, bool]:
+        """Verify all artifacts against stored hashes (parallel, streaming)."""
+        verifier = verifier or IntegrityVerifier()
+        checks = verifier.verify(
+            (content.artifact_id, root_path / content.path, content.hash)
+            for content in self.contents
+        )
+        return {artifact_id: check.valid for artifact_id, check in checks.items()}
     
     @classmethod
     def from_yaml(cls, data: Dict[str, Any]) -> "Baseline":
@@ -0,0 +1,388 @@
+"""
+ASIT Integrity Module
+
+Shared integrity-verification service for baselines and trace matrices.
+
+Provides:
+    - Chunked, streaming SHA-256 digests (constant memory per file)
+    - Parallel verification on a thread pool sized for I/O
+    - Progress callbacks for long-running verifications
+    - An mtime/size keyed skip cache so unchanged files are not re-read
+
+hashlib releases the GIL while digesting large buffers, so a thread pool
+keeps several disks/NFS streams busy at once and verification of large
+baseline trees becomes I/O-bound rather than single-core-bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB read buffer
+HASH_PREFIX = "sha256:"
+
+
+# =============================================================================
+# ENUMERATIONS
+# =============================================================================
+
+
+class IntegrityStatus(Enum):
+    """Outcome of verifying a single file against its recorded hash."""
+    VALID = "VALID"           # Hash verified, content intact
+    MODIFIED = "MODIFIED"     # Content changed since hash was recorded
+    MISSING = "MISSING"       # File not found
+    UNCHECKED = "UNCHECKED"   # File could not be read
+
+
+# =============================================================================
+# HASHING HELPERS
+# =============================================================================
+
+
+def hash_file(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Compute the SHA-256 hex digest of a file by streaming fixed-size chunks.
+
+    Args:
+        path: File to hash
+        chunk_size: Read buffer size in bytes
+
+    Returns:
+        Hex digest (without algorithm prefix)
+    """
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def normalize_hash(value: str) -> str:
+    """
+    Strip the algorithm prefix from a hash string.
+
+    Baselines record hashes as "sha256:<hex>" while trace links store
+    the bare hex digest; both compare equal after normalization.
+    """
+    if value.startswith(HASH_PREFIX):
+        return value[len(HASH_PREFIX):]
+    return value
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class IntegrityResult:
+    """Result of verifying (or hashing) a single file."""
+    key: Hashable
+    path: Path
+    status: IntegrityStatus
+    expected: str = ""
+    computed: str = ""
+    size_bytes: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        """Check if the file matched its expected hash."""
+        return self.status == IntegrityStatus.VALID
+
+
+ProgressCallback = Callable[[int, int, IntegrityResult], None]
+
+
+# =============================================================================
+# SKIP CACHE
+# =============================================================================
+
+
+class IntegrityCache:
+    """
+    Digest cache keyed by absolute path and validated by (size, mtime_ns).
+
+    A cached digest is reused only while the file's size and modification
+    time are unchanged; any difference forces a re-read. The cache can be
+    persisted to a JSON file between nightly runs.
+
+    Usage:
+        >>> cache = IntegrityCache(Path(".asit/integrity-cache.json"))
+        >>> verifier = IntegrityVerifier(cache=cache)
+        >>> verifier.verify(items)
+        >>> cache.save()
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if cache_path is not None and cache_path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, path: Path, stat: os.stat_result) -> Optional[str]:
+        """Return the cached digest if the file is unchanged, else None."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+        if entry is None:
+            return None
+        size, mtime_ns, digest = entry
+        if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+            return digest
+        return None
+
+    def store(self, path: Path, stat: os.stat_result, digest: str) -> None:
+        """Record the digest for a file at its current size and mtime."""
+        with self._lock:
+            self._entries[os.path.abspath(path)] = (stat.st_size, stat.st_mtime_ns, digest)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all cached digests."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def load(self) -> None:
+        """Load cached digests from the cache file."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable integrity cache {self.cache_path}: {e}")
+            return
+        with self._lock:
+            self._entries = {
+                path: (int(entry["size"]), int(entry["mtime_ns"]), entry["sha256"])
+                for path, entry in data.get("entries", {}).items()
+            }
+            self._dirty = False
+
+    def save(self) -> None:
+        """Persist cached digests to the cache file if anything changed."""
+        if self.cache_path is None or not self._dirty:
+            return
+        with self._lock:
+            data = {
+                "entries": {
+                    path: {"size": size, "mtime_ns": mtime_ns, "sha256": digest}
+                    for path, (size, mtime_ns, digest) in sorted(self._entries.items())
+                }
+            }
+            self._dirty = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+# =============================================================================
+# VERIFIER
+# =============================================================================
+
+
+class IntegrityVerifier:
+    """
+    Parallel, streaming file-integrity verifier.
+
+    Shared by ASIT baseline verification and ASIGT trace validation.
+
+    Usage:
+        >>> verifier = IntegrityVerifier(max_workers=16)
+        >>> results = verifier.verify([
+        ...     ("ART-001", root / "a.yaml", "sha256:ab12..."),
+        ...     ("ART-002", root / "b.yaml", "cd34..."),
+        ... ])
+        >>> all(r.valid for r in results.values())
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cache: Optional[IntegrityCache] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize verifier.
+
+        Args:
+            max_workers: Thread count; defaults to an I/O-oriented pool size
+            chunk_size: Read buffer size in bytes
+            cache: Optional mtime/size skip cache
+            progress_callback: Called as (completed, total, result) per file
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.progress_callback = progress_callback
+
+    def hash_path(self, path: Path) -> Tuple[str, int, bool]:
+        """
+        Hash a single file, consulting the skip cache.
+
+        Returns:
+            Tuple of (hex digest, size in bytes, served-from-cache flag)
+        """
+        stat = path.stat()
+        if self.cache is not None:
+            cached = self.cache.lookup(path, stat)
+            if cached is not None:
+                return cached, stat.st_size, True
+        digest = hash_file(path, self.chunk_size)
+        if self.cache is not None:
+            self.cache.store(path, stat, digest)
+        return digest, stat.st_size, False
+
+    def verify(
+        self,
+        items: Iterable[Tuple[Hashable, Path, str]],
+    ) -> Dict[Hashable, IntegrityResult]:
+        """
+        Verify files against expected hashes in parallel.
+
+        Args:
+            items: (key, path, expected hash) triples; expected hashes may
+                   carry the "sha256:" prefix or be bare hex digests. A
+                   file with an empty expected hash is reported MODIFIED.
+
+        Returns:
+            Mapping of key to IntegrityResult, in input order
+        """
+        work = list(items)
+        return self._run(work)
+
+    def hash_many(self, paths: Iterable[Path]) -> Dict[Path, IntegrityResult]:
+        """Compute digests for many files in parallel without comparison."""
+        return self._run([(path, path, "") for path in paths], compare=False)
+
+    def _run(
+        self,
+        work: List[Tuple[Hashable, Path, str]],
+        compare: bool = True,
+    ) -> Dict[Hashable, IntegrityResult]:
+        """Dispatch work to the thread pool and collect results."""
+        total = len(work)
+        by_key: Dict[Hashable, IntegrityResult] = {}
+        if not total:
+            return by_key
+
+        completed = 0
+        if self.max_workers <= 1 or total == 1:
+            for key, path, expected in work:
+                result = self._verify_one(key, path, expected, compare)
+                by_key[key] = result
+                completed += 1
+                self._report(completed, total, result)
+            return by_key
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, total),
+            thread_name_prefix="asit-integrity",
+        ) as pool:
+            futures = [
+                pool.submit(self._verify_one, key, path, expected, compare)
+                for key, path, expected in work
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                by_key[result.key] = result
+                completed += 1
+                self._report(completed, total, result)
+        return {key: by_key[key] for key, _, _ in work}
+
+    def _verify_one(
+        self,
+        key: Hashable,
+        path: Path,
+        expected: str,
+        compare: bool = True,
+    ) -> IntegrityResult:
+        """Verify a single file (or only hash it if not compare); never raises."""
+        expected_hex = normalize_hash(expected) if expected else ""
+        try:
+            digest, size, cached = self.hash_path(path)
+        except FileNotFoundError:
+            return IntegrityResult(
+                key=key, path=path, status=IntegrityStatus.MISSING, expected=expected_hex
+            )
+        except OSError as e:
+            logger.warning(f"Failed to hash {path}: {e}")
+            return IntegrityResult(
+                key=key,
+                path=path,
+                status=IntegrityStatus.UNCHECKED,
+                expected=expected_hex,
+                error=str(e),
+            )
+
+        if digest == expected_hex or not (compare or expected_hex):
+            status = IntegrityStatus.VALID
+        else:
+            status = IntegrityStatus.MODIFIED
+        return IntegrityResult(
+            key=key,
+            path=path,
+            status=status,
+            expected=expected_hex,
+            computed=digest,
+            size_bytes=size,
+            cached=cached,
+        )
+
+    def _report(self, completed: int, total: int, result: IntegrityResult) -> None:
+        """Invoke the progress callback, isolating callback failures."""
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback(completed, total, result)
+        except Exception as e:
+            logger.warning(f"Integrity progress callback failed: {e}")
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "IntegrityStatus",
+    "IntegrityResult",
+    "IntegrityCache",
+    "IntegrityVerifier",
+    "hash_file",
+    "normalize_hash",
+]
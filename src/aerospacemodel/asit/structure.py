@@ -14,11 +14,13 @@ information is organized, identified, and partitioned.
 from __future__ import annotations
 
 import re
+import sys
 import yaml
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -930,6 +932,7 @@ class NamingConventions:
         
         Note: This is a simplified parser. Full S1000D DMC parsing
         requires additional context for proper component extraction.
+        Splitting is memoized per DMC string; each call returns a new dict.
         
         Args:
             dmc: Data Module Code
@@ -937,21 +940,31 @@ class NamingConventions:
         Returns:
             Dictionary with DMC components
         """
-        # Basic validation
-        parts = dmc.split("-")
-        if len(parts) < 8:
-            raise IDValidationError(f"Invalid DMC format: {dmc}")
-        
-        return {
-            "model_ident_code": parts[0],
-            "system_diff_code": parts[1],
-            "system_code": parts[2],
-            "sub_system_code": parts[3],
-            "sub_sub_system_code": parts[4],
-            "assy_code": parts[5],
-            "info_code": parts[6],
-            "item_location_code": parts[7] if len(parts) > 7 else "A"
-        }
+        return dict(zip(_DMC_COMPONENTS, _split_dmc(dmc)))
+
+
+# Component names returned by NamingConventions.parse_dmc
+_DMC_COMPONENTS = (
+    "model_ident_code",
+    "system_diff_code",
+    "system_code",
+    "sub_system_code",
+    "sub_sub_system_code",
+    "assy_code",
+    "info_code",
+    "item_location_code",
+)
+
+
+@lru_cache(maxsize=16384)
+def _split_dmc(dmc: str) -> Tuple[str, ...]:
+    """Split and intern the first eight DMC components."""
+    # Basic validation
+    parts = dmc.split("-")
+    if len(parts) < 8:
+        raise IDValidationError(f"Invalid DMC format: {dmc}")
+    
+    return tuple(map(sys.intern, parts[:8]))
 
 
 # =============================================================================
@@ -0,0 +1,123 @@
+"""
+Test AMPEL360 Q100 Sequence Allocation
+
+Tests block reservation in the memory and SQLite stores, collision-free
+allocation across processes, and IDGenerator/ICNHandler integration.
+
+Author: ASIT (Aircraft Systems Information Transponder)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aerospacemodel.ampel360 import (
+    IDGenerator,
+    MemorySequenceStore,
+    SequenceAllocator,
+    SequenceBlock,
+    SQLiteSequenceStore,
+)
+
+KEY = "MSN001:28-10-00:LC02:REQ"
+
+
+def _allocate_in_worker(args):
+    store, count = args
+    allocator = SequenceAllocator(store, block_size=7)
+    return [allocator.allocate(KEY) for _ in range(count)]
+
+
+class TestSequenceStores:
+    """Test block reservation."""
+
+    @pytest.mark.parametrize("factory", [
+        lambda tmp_path: MemorySequenceStore(),
+        lambda tmp_path: SQLiteSequenceStore(tmp_path / "seq.db"),
+    ])
+    def test_reserve_contiguous_blocks(self, tmp_path, factory):
+        """Test blocks follow each other and reset restarts at 1."""
+        store = factory(tmp_path)
+
+        assert store.reserve(KEY, 10) == SequenceBlock(KEY, 1, 11)
+        assert store.reserve(KEY, 5) == SequenceBlock(KEY, 11, 16)
+        assert store.reserve("other") == SequenceBlock("other", 1, 2)
+        assert store.peek(KEY) == 16
+
+        store.reset(KEY)
+        assert store.peek(KEY) == 1
+
+    def test_sqlite_store_is_persistent(self, tmp_path):
+        """Test a second store on the same file continues the sequence."""
+        SQLiteSequenceStore(tmp_path / "seq.db").reserve(KEY, 4)
+
+        assert SQLiteSequenceStore(tmp_path / "seq.db").reserve(KEY).start == 5
+
+    def test_invalid_block_size(self):
+        """Test zero-size blocks are rejected."""
+        with pytest.raises(ValueError):
+            MemorySequenceStore().reserve(KEY, 0)
+
+
+class TestSequenceAllocator:
+    """Test SequenceAllocator."""
+
+    def test_allocates_from_cached_block(self, tmp_path):
+        """Test one store round trip per block."""
+        store = SQLiteSequenceStore(tmp_path / "seq.db")
+        allocator = SequenceAllocator(store, block_size=4)
+
+        assert [allocator.allocate(KEY) for _ in range(6)] == [1, 2, 3, 4, 5, 6]
+        assert store.peek(KEY) == 9
+
+    def test_parallel_processes_do_not_collide(self, tmp_path):
+        """Test workers sharing a SQLite store get disjoint numbers."""
+        store = SQLiteSequenceStore(tmp_path / "seq.db")
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            batches = list(pool.map(_allocate_in_worker, [(store, 25)] * 8))
+
+        allocated = [n for batch in batches for n in batch]
+        assert len(allocated) == len(set(allocated)) == 200
+
+    def test_explicit_blocks_are_reproducible(self):
+        """Test blocks reserved up front give order-independent numbering."""
+        parent = SequenceAllocator()
+        blocks = [parent.reserve(KEY, 3) for _ in range(2)]
+
+        worker = SequenceAllocator(parent.store)
+        worker.use_block(blocks[1])
+
+        assert [worker.allocate(KEY) for _ in range(3)] == [4, 5, 6]
+
+
+class TestIDGeneratorAllocation:
+    """Test IDGenerator with a shared allocator."""
+
+    def test_generators_share_sequences(self, tmp_path):
+        """Test two generators on one store never repeat a sequence."""
+        store = SQLiteSequenceStore(tmp_path / "seq.db")
+        first = IDGenerator(SequenceAllocator(store, block_size=2))
+        second = IDGenerator(SequenceAllocator(store, block_size=2))
+        args = ("MSN001", "28", "10", "00", "LC02", "REQ")
+
+        sequences = [
+            gen.generate(*args).sequence for gen in (first, second, first, second)
+        ]
+
+        assert sequences == ["001", "003", "002", "004"]
+
+    def test_icn_handler_uses_allocator(self, tmp_path):
+        """Test ICN graphic numbers come from the allocator."""
+        from ASIGT.generators.icn_handler import ICNHandler
+
+        allocator = SequenceAllocator(SQLiteSequenceStore(tmp_path / "seq.db"))
+        config = {"model_ident_code": "HJ1"}
+        handlers = [
+            ICNHandler({"id": "CTR"}, config, tmp_path / "gfx", allocator=allocator),
+            ICNHandler({"id": "CTR"}, config, tmp_path / "gfx", allocator=allocator),
+        ]
+
+        numbers = [h._generate_icn("28").graphic_number for h in handlers]
+
+        assert numbers == ["G0001", "G0002"]
@@ -0,0 +1,171 @@
+"""
+Tests for ASIGT Applicability Processor
+
+Tests the compiled applicability index against per-item evaluation for
+product and serial-effectivity filtering, and batch per-MSN filtering.
+"""
+
+import random
+
+from ASIGT.generators.applicability import (
+    ApplicabilityIndex,
+    ApplicabilityProcessor,
+    IntervalIndex,
+    _applies_to_product,
+    _effectivity_matches,
+)
+
+CONTRACT = {"id": "KITDM-CTR-TEST"}
+
+
+def _processor(products=20):
+    processor = ApplicabilityProcessor(CONTRACT, {"model_ident_code": "HJ1"})
+    for i in range(1, products + 1):
+        processor.add_product(
+            f"SN{i:03d}",
+            f"MSN {i}",
+            {
+                "model": "HJ1",
+                "serialno": str(i),
+                "engine": "CFM1" if i % 2 else "PW1",
+                "config": f"C{i % 3}",
+            },
+        )
+    return processor
+
+
+def _random_items(rng, count=300):
+    items = []
+    for i in range(count):
+        applicability = {}
+        if rng.random() < 0.5:
+            applicability["products"] = [f"SN{rng.randint(1, 20):03d}" for _ in range(3)]
+        if rng.random() < 0.5:
+            applicability["criteria"] = {rng.choice(["engine", "config", "mod"]): rng.choice(
+                ["CFM1", "PW1", "C0", "C1", "C2"]
+            )}
+
+        kind = rng.choice(["none", "string", "and_on", "bounds", "open_bounds"])
+        low = rng.randint(1, 20)
+        high = low + rng.randint(0, 10)
+        effectivity = {
+            "none": {},
+            "string": {"string": f"{low:03d}-{high:03d}, {high + 5:03d}"},
+            "and_on": {"string": f"{low:03d} AND ON"},
+            "bounds": {"from": low, "to": high},
+            "open_bounds": {"from": low},
+        }[kind]
+        items.append({"dm_code": f"DM-{i:04d}", "applicability": applicability,
+                      "effectivity": effectivity})
+    return items
+
+
+class TestIntervalIndex:
+    """Tests for the interval tree."""
+
+    def test_stab_and_overlap_match_brute_force(self):
+        """Test queries equal a linear scan."""
+        rng = random.Random(7)
+        intervals = []
+        for key in range(500):
+            low = rng.randint(0, 1000)
+            intervals.append((low, low + rng.randint(0, 50), key))
+        tree = IntervalIndex(intervals)
+
+        for _ in range(200):
+            a = rng.randint(-10, 1060)
+            b = a + rng.randint(0, 40)
+            assert tree.stab(a) == {k for lo, hi, k in intervals if lo <= a <= hi}
+            assert tree.overlap(a, b) == {k for lo, hi, k in intervals if lo <= b and hi >= a}
+
+
+class TestApplicabilityIndex:
+    """Tests for compiled product and effectivity filtering."""
+
+    def test_product_filter_matches_per_item_evaluation(self):
+        """Test every product gets the same items as per-item evaluation."""
+        processor = _processor()
+        items = _random_items(random.Random(1))
+        index = processor.build_index(items)
+
+        for product_id, product in processor.pct.instances.items():
+            expected = [
+                item["dm_code"] for item in items
+                if _applies_to_product(item["applicability"], product)
+            ]
+            assert processor.filter_by_product(index, product_id).applicable_items == expected
+
+    def test_effectivity_filter_matches_per_item_evaluation(self):
+        """Test serial and serial-range queries against per-item evaluation."""
+        processor = _processor()
+        items = _random_items(random.Random(2))
+        index = processor.build_index(items)
+
+        for serial_from in range(0, 40):
+            for serial_to in (None, serial_from + 3, serial_from - 1):
+                expected = [
+                    item["dm_code"] for item in items
+                    if _effectivity_matches(item["effectivity"], serial_from, serial_to)
+                ]
+                result = processor.filter_by_effectivity(index, serial_from, serial_to)
+                assert result.applicable_items == expected
+                assert result.filtered_out == len(items) - len(expected)
+
+    def test_list_input_still_supported(self):
+        """Test filtering a plain item list."""
+        processor = _processor()
+        items = [
+            {"dm_code": "DM-A", "effectivity": {"string": "001-010"}},
+            {"dm_code": "DM-B", "effectivity": {"string": "020 AND ON"}},
+            {"dm_code": "DM-C", "applicability": {"criteria": {"engine": "PW1"}}},
+        ]
+
+        assert processor.filter_by_effectivity(items, 25).applicable_items == ["DM-B", "DM-C"]
+        assert processor.filter_by_product(items, "SN001").excluded_items == ["DM-C"]
+
+    def test_unhashable_criteria_fall_back(self):
+        """Test unusual criteria values are still evaluated."""
+        processor = _processor()
+        index = ApplicabilityIndex([
+            {"id": "X", "applicability": {"criteria": {"engine": ["CFM1"]}}},
+            {"id": "Y", "effectivity": {"from": "5"}},
+        ])
+
+        assert index.for_product(processor.pct.get_instance("SN001")) == [1]
+        assert len(index) == 2
+
+
+class TestFilterAllProducts:
+    """Tests for batch per-MSN filtering."""
+
+    def test_matches_per_product_filters(self):
+        """Test each product's result equals product AND serial filtering."""
+        processor = _processor()
+        items = _random_items(random.Random(4))
+
+        results = processor.filter_all_products(items)
+
+        assert list(results) == list(processor.pct.instances)
+        for product_id, product in processor.pct.instances.items():
+            serial = int(product.properties["serialno"])
+            by_product = set(processor.filter_by_product(items, product_id).applicable_items)
+            by_serial = set(processor.filter_by_effectivity(items, serial).applicable_items)
+            expected = [i["dm_code"] for i in items if i["dm_code"] in by_product & by_serial]
+            assert results[product_id].applicable_items == expected
+            assert results[product_id].filter_criteria == {"product_id": product_id, "serial": serial}
+
+    def test_pct_criteria_and_missing_serial(self):
+        """Test product selection and products without a serial number."""
+        processor = _processor(products=4)
+        processor.add_product("SPARE", "Spare", {"engine": "PW1"})
+        items = [
+            {"dm_code": "DM-A", "effectivity": {"string": "001-002"}},
+            {"dm_code": "DM-B", "effectivity": {"from": 3}},
+        ]
+
+        results = processor.filter_all_products(processor.build_index(items), {"engine": "PW1"})
+
+        assert sorted(results) == ["SN002", "SN004", "SPARE"]
+        assert results["SN002"].applicable_items == ["DM-A"]
+        assert results["SN004"].applicable_items == ["DM-B"]
+        assert results["SPARE"].applicable_items == ["DM-A", "DM-B"]
@@ -0,0 +1,128 @@
+"""
+Tests for ASIGT Generator Benchmarks
+
+Tests synthetic source shapes, report structure, baseline comparison
+and the command-line entry point.
+"""
+
+import json
+
+import pytest
+
+from aerospacemodel.asigt.benchmarks import (
+    BENCHMARK_SCHEMA_VERSION,
+    SHAPES,
+    compare,
+    main,
+    run_case,
+    run_suite,
+    synthesize_source,
+)
+from aerospacemodel.asigt.generators import GeneratorConfig
+
+
+def _result(name="procedural-10", **metrics):
+    result = {
+        "name": name,
+        "docs_per_second": 100.0,
+        "peak_memory_bytes": 1000,
+        "output_bytes": 500,
+    }
+    result.update(metrics)
+    return result
+
+
+class TestSynthesizeSource:
+    """Tests for synthetic KDB sources."""
+
+    @pytest.mark.parametrize("kind,marker", [
+        ("procedural", "<proceduralStep"),
+        ("ipd", "<itemSeqNumber "),
+        ("fault_isolation", "<para>"),
+    ])
+    def test_size_scales_output(self, kind, marker):
+        """Test N list items produce at least N generated elements."""
+        generator = SHAPES[kind].generator_class(GeneratorConfig(
+            model_ident_code="BENCH", organization_name="Test Org", organization_cage="00000",
+        ))
+
+        result = generator.generate(synthesize_source(kind, 7))
+
+        assert result.success
+        assert result.xml_content.count(marker) >= 7
+
+    def test_unknown_kind(self):
+        """Test an unknown shape is rejected."""
+        with pytest.raises(ValueError):
+            synthesize_source("wiring", 10)
+
+
+class TestRunSuite:
+    """Tests for benchmark execution and reports."""
+
+    def test_run_case_metrics(self):
+        """Test a case records throughput, memory and output size."""
+        result = run_case("descriptive", 5, samples=1)
+
+        assert result.name == "descriptive-5"
+        assert result.generator == "DescriptiveDMGenerator"
+        assert result.docs_per_second > 0
+        assert result.peak_memory_bytes > 0
+        assert result.output_bytes > 0
+
+    def test_report_is_json(self):
+        """Test the report round-trips through JSON."""
+        report = run_suite(kinds=["fault_isolation"], sizes=[2, 4], samples=1)
+
+        assert json.loads(json.dumps(report)) == report
+        assert report["schema_version"] == BENCHMARK_SCHEMA_VERSION
+        assert [r["name"] for r in report["results"]] == [
+            "fault_isolation-2", "fault_isolation-4",
+        ]
+        assert report["results"][0]["output_bytes"] < report["results"][1]["output_bytes"]
+
+
+class TestCompare:
+    """Tests for baseline regression detection."""
+
+    def test_flags_regressions(self):
+        """Test slower, larger or heavier cases are flagged."""
+        baseline = {"results": [_result()]}
+        current = {"results": [_result(
+            docs_per_second=80.0, peak_memory_bytes=1050, output_bytes=600,
+        )]}
+
+        flagged = {r.metric: r for r in compare(current, baseline, threshold=0.10)}
+
+        assert set(flagged) == {"docs_per_second", "output_bytes"}
+        assert flagged["docs_per_second"].change == pytest.approx(-0.2)
+
+    def test_improvements_and_new_cases_pass(self):
+        """Test faster results and cases missing from the baseline are ignored."""
+        baseline = {"results": [_result()]}
+        current = {"results": [
+            _result(docs_per_second=150.0, peak_memory_bytes=500),
+            _result(name="ipd-10", docs_per_second=1.0),
+        ]}
+
+        assert compare(current, baseline) == []
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    def test_writes_report_and_detects_regression(self, tmp_path, capsys):
+        """Test --output writes JSON and --baseline sets the exit code."""
+        output = tmp_path / "bench.json"
+        args = ["--kinds", "descriptive", "--sizes", "2", "--samples", "1"]
+
+        assert main(args + ["--output", str(output)]) == 0
+        report = json.loads(output.read_text())
+        assert report["results"][0]["name"] == "descriptive-2"
+
+        report["results"][0]["docs_per_second"] *= 1000
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(report))
+
+        assert main(args + ["--baseline", str(baseline)]) == 1
+        assert "REGRESSION descriptive-2: docs_per_second" in capsys.readouterr().out
@@ -0,0 +1,170 @@
+"""
+Tests for ASIGT BREX Trend Store
+
+Tests recording BREX violations across runs into the columnar store,
+persistence and compaction, and vectorized trend/regression queries.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from aerospacemodel.asigt.brex_trends import BREXTrendStore, ata_chapter_from_dmc  # noqa: E402
+from aerospacemodel.asigt.validators import (  # noqa: E402
+    BREXRule,
+    BREXSeverity,
+    BREXViolation,
+    ValidationCategory,
+    ValidationType,
+)
+
+DMC_28 = "AERO-A-28-10-00-00A-040A-A"
+DMC_32 = "AERO-A-32-00-00-00A-520A-A"
+START = datetime(2026, 1, 1)
+
+
+def _violations(rule_id: str, count: int):
+    rule = BREXRule(
+        id=rule_id,
+        name=rule_id,
+        description="",
+        severity=BREXSeverity.ERROR,
+        category=ValidationCategory.STRUCTURE,
+        xpath="//dmodule",
+        validation_type=ValidationType.CUSTOM,
+    )
+    return [
+        BREXViolation(rule=rule, element_path="/dmodule", element_tag="dmodule", message="x")
+        for _ in range(count)
+    ]
+
+
+def _record_run(store, run_id, day, baseline_id, counts):
+    for (rule_id, dmc), count in counts.items():
+        store.record(
+            run_id,
+            _violations(rule_id, count),
+            dmc=dmc,
+            contract_id="KITDM-CTR-TEST",
+            baseline_id=baseline_id,
+            run_timestamp=START + timedelta(days=day),
+        )
+
+
+class TestAtaChapter:
+    """Tests for ATA chapter extraction."""
+
+    def test_from_dmc(self):
+        """Test chapter is the system code of the DMC."""
+        assert ata_chapter_from_dmc(DMC_28) == "28"
+        assert ata_chapter_from_dmc(f"DMC-{DMC_32}") == "32"
+        assert ata_chapter_from_dmc("not-a-dmc") == ""
+
+
+class TestBREXTrendStore:
+    """Tests for BREXTrendStore."""
+
+    def _populated(self, tmp_path):
+        store = BREXTrendStore(tmp_path / "trends")
+        _record_run(store, "RUN-1", 0, "FBL-001", {("BREX-001", DMC_28): 3, ("BREX-002", DMC_32): 1})
+        _record_run(store, "RUN-2", 1, "FBL-001", {("BREX-001", DMC_28): 2})
+        _record_run(store, "RUN-3", 2, "FBL-002", {("BREX-001", DMC_28): 1, ("BREX-002", DMC_32): 4})
+        store.flush()
+        return store
+
+    def test_record_aggregates_per_rule(self, tmp_path):
+        """Test one row per rule and DMC with its occurrence count."""
+        store = BREXTrendStore(tmp_path)
+        recorded = store.record("RUN-1", _violations("BREX-001", 3), dmc=DMC_28)
+        store.flush()
+
+        frame = store.load()
+        assert recorded == 3
+        assert len(frame) == 1
+        assert frame.iloc[0]["count"] == 3
+        assert frame.iloc[0]["ata_chapter"] == "28"
+
+    def test_persisted_across_instances(self, tmp_path):
+        """Test history is reloaded from Parquet."""
+        self._populated(tmp_path)
+        reloaded = BREXTrendStore(tmp_path / "trends")
+
+        assert list(reloaded.runs()["run_id"]) == ["RUN-1", "RUN-2", "RUN-3"]
+
+    def test_counts_by_rule(self, tmp_path):
+        """Test per-run counts are pivoted in chronological order."""
+        table = self._populated(tmp_path).counts("rule_id")
+
+        assert list(table.columns) == ["RUN-1", "RUN-2", "RUN-3"]
+        assert table.loc["BREX-001"].tolist() == [3, 2, 1]
+        assert table.loc["BREX-002"].tolist() == [1, 0, 4]
+
+    def test_trend_by_chapter(self, tmp_path):
+        """Test totals per run for a single ATA chapter."""
+        trend = self._populated(tmp_path).trend(ata_chapter="32")
+
+        assert trend.tolist() == [1, 0, 4]
+
+    def test_regressions_since_previous_baseline(self, tmp_path):
+        """Test latest run is compared with the previous baseline's last run."""
+        regressions = self._populated(tmp_path).regressions()
+
+        assert list(regressions.index) == ["BREX-002"]
+        assert regressions.loc["BREX-002"].tolist() == [0, 4, 4]
+
+    def test_regressions_explicit_runs(self, tmp_path):
+        """Test comparing two explicit runs."""
+        regressions = self._populated(tmp_path).regressions(
+            current_run="RUN-3", previous_run="RUN-1"
+        )
+
+        assert regressions.loc["BREX-002", "delta"] == 3
+        assert "BREX-001" not in regressions.index
+
+    def test_compact(self, tmp_path):
+        """Test per-run files are merged into the history file."""
+        store = self._populated(tmp_path)
+        before = store.counts("rule_id")
+
+        store.compact()
+        reloaded = BREXTrendStore(tmp_path / "trends")
+
+        assert not list(reloaded.runs_dir.glob("*.parquet"))
+        assert reloaded.counts("rule_id").equals(before)
+
+    def test_audit_entries(self, tmp_path):
+        """Test failed audit-log decisions are recorded."""
+        store = BREXTrendStore(tmp_path)
+        entries = [
+            {"type": "decision", "rule_id": "STRUCT-001", "passed": False, "action": "block"},
+            {"type": "decision", "rule_id": "STRUCT-002", "passed": True, "action": "allow"},
+            {"type": "cascade", "cascade_id": "C-1"},
+        ]
+
+        assert store.record_audit_entries("RUN-1", entries, dmc=DMC_28) == 1
+        store.flush()
+        assert store.load()["rule_id"].tolist() == ["STRUCT-001"]
+
+    def test_empty_store(self, tmp_path):
+        """Test queries on an empty store."""
+        store = BREXTrendStore(tmp_path)
+
+        assert store.load().empty
+        assert store.regressions().empty
+
+    def test_clean_run_is_recorded(self, tmp_path):
+        """Test a run without violations is part of the history."""
+        store = self._populated(tmp_path)
+        _record_run(store, "RUN-4", 3, "FBL-002", {("BREX-001", DMC_28): 0})
+        store.flush()
+
+        assert list(store.runs()["run_id"]) == ["RUN-1", "RUN-2", "RUN-3", "RUN-4"]
+        assert store.trend().tolist() == [4, 2, 5, 0]
+        table = store.counts("rule_id")
+        assert list(table.index) == ["BREX-001", "BREX-002"]
+        assert table.loc["BREX-002"].tolist() == [1, 0, 4, 0]
+        assert store.regressions().empty
+        assert store.regressions(previous_run="RUN-3").empty
@@ -0,0 +1,334 @@
+"""
+Tests for ASIGT Generators
+
+Tests code value types, XML serialization, batch generation through the
+DMGenerator facade, lean results, and streaming DML/PM writers.
+"""
+
+import hashlib
+import pickle
+
+import pytest
+
+from aerospacemodel.asigt import generators
+from aerospacemodel.asigt.engine import ArtifactType, SourceArtifact
+from aerospacemodel.asigt.generators import (
+    DescriptiveDMGenerator,
+    DMCode,
+    DMGenerator,
+    DMLGenerator,
+    GenerationResult,
+    GeneratorConfig,
+    ICNCode,
+    IPDGenerator,
+    PMCode,
+    PMGenerator,
+)
+from aerospacemodel.asigt.validators import CombinedValidator, ValidatorConfig
+
+
+def _generator_config() -> GeneratorConfig:
+    return GeneratorConfig(
+        model_ident_code="AERO",
+        organization_name="Test Org",
+        organization_cage="00000",
+    )
+
+
+def _sources(tmp_path, count=6):
+    sources = []
+    for i in range(count):
+        path = tmp_path / f"src-{i}.yaml"
+        path.write_text(f"title: Source {i}\n")
+        artifact_type = ArtifactType.TASK if i % 2 else ArtifactType.REQUIREMENT
+        sources.append(SourceArtifact(
+            id=f"SRC-{i:03d}",
+            path=path,
+            artifact_type=artifact_type,
+            content={
+                "title": f"Item {i}",
+                "ata_chapter": f"{20 + i}",
+                "steps": [{"text": "Remove the panel."}],
+            },
+        ))
+    return sources
+
+
+class TestCodeValueTypes:
+    """Tests for immutable, cached DMC/PMC/ICN value types."""
+
+    DMC = "HJONE-A-28-10-00-00A-510A-D"
+
+    def test_dmc_round_trip_and_cache(self):
+        """Test parsing returns a shared instance that renders back unchanged."""
+        dmc = DMCode.from_string(self.DMC)
+
+        assert str(dmc) == self.DMC
+        assert DMCode.from_string(self.DMC) is dmc
+        assert dmc == DMCode(
+            model_ident_code="HJONE", system_code="28", subsystem_code="1",
+            info_code="510", item_location_code="D",
+        )
+
+    def test_dmc_is_immutable_dict_key(self):
+        """Test DMCode hashes, orders and cannot be mutated."""
+        dmc = DMCode.from_string(self.DMC)
+        index = {dmc: "fuel"}
+
+        assert index[DMCode.from_string(self.DMC.lower())] == "fuel"
+        assert sorted([DMCode("B"), DMCode("A")])[0].model_ident_code == "A"
+        with pytest.raises(AttributeError):
+            dmc.info_code = "520"
+        assert pickle.loads(pickle.dumps(dmc)) == dmc
+
+    def test_invalid_dmc(self):
+        """Test invalid codes still raise ValueError."""
+        with pytest.raises(ValueError):
+            DMCode.from_string("not-a-dmc")
+
+    def test_pm_and_icn_parsing(self):
+        """Test PMC and ICN strings parse back to equal codes."""
+        pmc = PMCode("AERO", "00000", "00001")
+        icn = ICNCode("AERO", "28", "F0001", language_code="EN")
+
+        assert PMCode.from_string(f"PMC-{pmc}") == pmc
+        assert ICNCode.from_string(icn.full_code) == icn
+        assert ICNCode.from_string(str(icn)).language_code == "SX"
+
+
+class TestGenerateMany:
+    """Tests for DMGenerator.generate_many."""
+
+    def test_matches_serial_generation_in_order(self, tmp_path):
+        """Test pooled results equal serial results, in input order."""
+        generator = DMGenerator(_generator_config())
+        sources = _sources(tmp_path)
+
+        serial = generator.generate_many(sources, workers=1)
+        pooled = generator.generate_many(sources, workers=3)
+
+        assert [r.dmc for r in pooled] == [r.dmc for r in serial]
+        assert [r.xml_content for r in pooled] == [r.xml_content for r in serial]
+        assert [r.artifact.source_refs for r in pooled] == [[s.id] for s in sources]
+        assert all(r.success for r in pooled)
+
+    def test_validator_runs_in_workers(self, tmp_path):
+        """Test an attached validator is rebuilt and applied in each worker."""
+        generator = DMGenerator(
+            _generator_config(), validator=CombinedValidator(ValidatorConfig())
+        )
+
+        results = generator.generate_many(_sources(tmp_path, count=4), workers=2)
+
+        assert all(r.validated for r in results)
+        assert all(r.schema_result.passed for r in results)
+
+    def test_empty_sources(self):
+        """Test no pool is needed for an empty batch."""
+        assert DMGenerator(_generator_config()).generate_many([], workers=4) == []
+
+
+class TestLeanResults:
+    """Tests for lean results written straight to disk."""
+
+    def test_lean_matches_in_memory(self, tmp_path):
+        """Test written bytes equal the full result and the XML is released."""
+        generator = DMGenerator(_generator_config())
+        sources = _sources(tmp_path)
+        full = generator.generate_many(sources, workers=1)
+
+        lean = generator.generate_many(sources, workers=2, output_dir=tmp_path / "dm")
+
+        for full_result, lean_result in zip(full, lean):
+            expected = full_result.xml_content.encode("utf-8")
+            assert lean_result.lean
+            assert lean_result.dmc == full_result.dmc
+            assert lean_result.artifact.path.read_bytes() == expected
+            assert lean_result.artifact.hash_sha256 == hashlib.sha256(expected).hexdigest()
+            assert lean_result.artifact.size_bytes == len(expected)
+            assert [l.target_id for l in lean_result.trace_links] == [
+                l.target_id for l in full_result.trace_links
+            ]
+            for link in lean_result.trace_links:
+                assert link.target_path == str(lean_result.artifact.path)
+                assert link.target_hash == lean_result.artifact.hash_sha256
+
+    def test_release(self, tmp_path):
+        """Test release drops the XML string and tree only."""
+        result = DMGenerator(_generator_config()).generate(_sources(tmp_path, count=1)[0])
+        assert not result.lean
+
+        assert result.release() is result
+        assert result.lean
+        assert result.success and result.dmc and result.artifact is not None
+
+    def test_write_failure_keeps_payload(self, tmp_path):
+        """Test a failed write marks the result failed and keeps the XML."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+
+        result = DMGenerator(_generator_config()).generate(
+            _sources(tmp_path, count=1)[0], output_dir=blocker
+        )
+
+        assert not result.success
+        assert not result.lean
+        assert result.errors[-1].startswith("Failed to write DM")
+
+    def test_unwritten_result_keeps_payload(self, tmp_path, monkeypatch):
+        """Test a result write_result could not write is not released."""
+        generator = DMGenerator(_generator_config())
+        monkeypatch.setattr(generator._descriptive, "write_result", lambda result, output_dir: None)
+
+        result = generator.generate(_sources(tmp_path, count=1)[0], output_dir=tmp_path / "dm")
+
+        assert result.success
+        assert not result.lean
+        assert result.warnings[-1].startswith("DM not written")
+
+
+class TestXMLSerialization:
+    """Tests for prettify_xml and the streaming write_xml path."""
+
+    def test_prettify_is_reproducible(self, tmp_path):
+        """Test two generations of the same source are byte-identical."""
+        source = _sources(tmp_path, count=1)[0]
+        generator = DescriptiveDMGenerator(_generator_config())
+
+        first = generator.generate(source)
+        second = generator.generate(source)
+
+        assert first.xml_content == second.xml_content
+        assert first.xml_content.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<dmodule')
+        assert "\n  <identAndStatusSection>" in first.xml_content
+
+    def test_prettify_is_idempotent(self, tmp_path):
+        """Test re-serializing an already indented tree is unchanged."""
+        generator = DescriptiveDMGenerator(_generator_config())
+        result = generator.generate(_sources(tmp_path, count=1)[0])
+
+        assert generator.prettify_xml(result.xml_element) == result.xml_content
+
+    def test_write_xml_matches_prettify(self, tmp_path):
+        """Test streamed bytes and digest match the in-memory serialization."""
+        generator = IPDGenerator(_generator_config())
+        source = _sources(tmp_path, count=1)[0]
+        source.content["parts"] = [
+            {"part_number": f"PN-{i:04d}", "description": f"Part {i}"} for i in range(50)
+        ]
+        result = generator.generate(source)
+        path = tmp_path / "out" / "dm.xml"
+
+        digest, size = generator.write_xml(result.xml_element, path)
+
+        expected = result.xml_content.encode("utf-8")
+        assert path.read_bytes() == expected
+        assert digest == hashlib.sha256(expected).hexdigest()
+        assert size == len(expected)
+
+    def test_write_result_updates_artifact(self, tmp_path):
+        """Test write_result records the streamed hash on the artifact."""
+        generator = DescriptiveDMGenerator(_generator_config())
+        result = generator.generate(_sources(tmp_path, count=1)[0])
+
+        path = generator.write_result(result, tmp_path / "out")
+
+        assert path.parent == tmp_path / "out"
+        assert result.artifact.path == path
+        assert result.artifact.hash_sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert result.artifact.hash_sha256 == result.artifact.compute_hash()
+
+    def test_xml_content_constructor_and_cache(self, tmp_path):
+        """Test explicit xml_content is kept and the cache follows a replaced tree."""
+        generator = DescriptiveDMGenerator(_generator_config())
+        assert GenerationResult(success=True, xml_content="<dmodule/>").xml_content == "<dmodule/>"
+
+        result = generator.generate(_sources(tmp_path, count=1)[0])
+        first = result.xml_content
+        result.xml_element = generator.create_xml_element("dmodule")
+
+        assert first.count("<") > 10
+        assert result.xml_content == generator.prettify_xml(result.xml_element)
+
+    def test_xml_content_built_on_demand(self, tmp_path, monkeypatch):
+        """Test generating and writing a DM never builds the document string."""
+        generator = DescriptiveDMGenerator(_generator_config())
+        monkeypatch.setattr(generators, "_prettify", lambda *args: 1 / 0)
+        result = generator.generate(_sources(tmp_path, count=1)[0])
+
+        path = generator.write_result(result, tmp_path / "out")
+
+        monkeypatch.undo()
+        assert result.success, result.errors
+        assert path.read_bytes() == result.xml_content.encode("utf-8")
+
+
+class TestStreamingLists:
+    """Tests for streaming DML and PM writers."""
+
+    def _dmcs(self, count=5):
+        return [DMCode(model_ident_code="AERO", system_code=f"{20 + i}") for i in range(count)]
+
+    def test_dml_stream_matches_in_memory(self, tmp_path):
+        """Test streamed DML bytes equal the in-memory serialization."""
+        generator = DMLGenerator(_generator_config())
+        dmcs = self._dmcs()
+        expected = generator.generate(dm_list=dmcs).xml_content.encode("utf-8")
+
+        result = generator.generate_stream(tmp_path / "dml.xml", iter(dmcs))
+
+        assert result.success
+        assert (tmp_path / "dml.xml").read_bytes() == expected
+        assert result.artifact.hash_sha256 == hashlib.sha256(expected).hexdigest()
+        assert result.artifact.size_bytes == len(expected)
+
+    def test_empty_dml_stream(self, tmp_path):
+        """Test a stream with no entries matches an empty DML."""
+        generator = DMLGenerator(_generator_config())
+        expected = generator.generate(dm_list=[]).xml_content.encode("utf-8")
+
+        generator.generate_stream(tmp_path / "dml.xml", [])
+
+        assert (tmp_path / "dml.xml").read_bytes() == expected
+
+    def test_pm_stream_accepts_dmc_strings(self, tmp_path):
+        """Test PM entries can be pushed as DMC strings after chapters."""
+        generator = PMGenerator(_generator_config())
+        source = _sources(tmp_path, count=1)[0]
+        source.content["chapters"] = [{"ata_chapter": "28", "title": "Fuel"}]
+        dmcs = self._dmcs(3)
+        expected = generator.generate(source, dm_refs=dmcs).xml_content.encode("utf-8")
+
+        with generator.open_stream(tmp_path / "pm.xml", source=source) as stream:
+            for dmc in dmcs:
+                stream.add(str(dmc))
+
+        assert stream.count == 3
+        assert (tmp_path / "pm.xml").read_bytes() == expected
+
+    def test_abort_removes_partial_file(self, tmp_path):
+        """Test an exception inside the stream discards the partial output."""
+        generator = DMLGenerator(_generator_config())
+        path = tmp_path / "dml.xml"
+
+        try:
+            with generator.open_stream(path) as stream:
+                stream.add(self._dmcs(1)[0])
+                raise RuntimeError("transform failed")
+        except RuntimeError:
+            pass
+
+        assert not path.exists()
+        assert stream.result.success is False
+
+    def test_bad_dmc_fails_result(self, tmp_path):
+        """Test a bad DMC fails the streamed result like generate does."""
+        for generator in (DMLGenerator(_generator_config()), PMGenerator(_generator_config())):
+            path = tmp_path / "list.xml"
+            dmcs = [str(self._dmcs(1)[0]), "NOT-A-DMC"]
+
+            result = generator.generate_stream(path, iter(dmcs))
+
+            assert result.success is False
+            assert result.errors and "NOT-A-DMC" in result.errors[0]
+            assert not path.exists()
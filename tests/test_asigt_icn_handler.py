@@ -0,0 +1,169 @@
+"""
+Tests for ASIGT ICN Handler
+
+Tests bulk graphic registration (parallel hashing, input-order ICN
+numbering, content-addressed deduplication) and the ICN <-> DMC
+reference index.
+"""
+
+import os
+
+from ASIGT.generators.dm_generator import DMGenerator, DMType
+from ASIGT.generators.icn_handler import ICNHandler, ICNReferenceIndex, LinkMode
+
+CONTRACT = {"id": "KITDM-CTR-TEST"}
+CONFIG = {"model_ident_code": "HJ1", "cage_code": "00000"}
+DMC_A = "HJ1-A-28-10-00-00A-040A-A"
+DMC_B = "HJ1-A-28-20-00-00A-520A-A"
+
+
+def _graphics(tmp_path, contents):
+    graphics = []
+    for i, content in enumerate(contents):
+        path = tmp_path / "legacy" / f"fig-{i}.png"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(content)
+        graphics.append({"source_path": path, "ata_chapter": "28", "title": f"Figure {i}"})
+    return graphics
+
+
+class TestRegisterBatch:
+    """Tests for ICNHandler.register_batch."""
+
+    def test_matches_serial_registration(self, tmp_path):
+        """Test ICNs and hashes equal one-by-one registration."""
+        graphics = _graphics(tmp_path, [b"a" * 10, b"b" * 20, b"c" * 30])
+        serial = ICNHandler(CONTRACT, CONFIG, graphics_path=tmp_path / "serial")
+        batch = ICNHandler(CONTRACT, CONFIG, graphics_path=tmp_path / "batch")
+
+        expected = [
+            serial.register_graphic(g["source_path"], "28", title=g["title"]) for g in graphics
+        ]
+        results = batch.register_batch(graphics, workers=3)
+
+        assert [r.icn for r in results] == [r.icn for r in expected]
+        assert [r.file_hash for r in results] == [r.file_hash for r in expected]
+        assert all(r.duplicate_of is None for r in results)
+
+    def test_duplicates_are_hard_linked(self, tmp_path):
+        """Test identical content is stored once and linked."""
+        graphics = _graphics(tmp_path, [b"same", b"other", b"same"])
+        handler = ICNHandler(CONTRACT, CONFIG, graphics_path=tmp_path / "repo")
+
+        results = handler.register_batch(graphics)
+
+        first, duplicate = results[0], results[2]
+        assert duplicate.duplicate_of == first.icn
+        assert os.path.samefile(first.registered_path, duplicate.registered_path)
+        assert [str(e.icn) for e in handler.find_by_hash(first.file_hash)] == [
+            str(first.icn), str(duplicate.icn)
+        ]
+        assert handler.find_by_hash("0" * 64) == []
+
+    def test_copy_mode(self, tmp_path):
+        """Test COPY mode keeps independent files."""
+        graphics = _graphics(tmp_path, [b"same", b"same"])
+        handler = ICNHandler(
+            CONTRACT, {**CONFIG, "link_mode": LinkMode.COPY.value}, graphics_path=tmp_path / "repo"
+        )
+
+        first, second = handler.register_batch(graphics)
+
+        assert second.duplicate_of == first.icn
+        assert not os.path.samefile(first.registered_path, second.registered_path)
+
+    def test_reregistering_over_linked_name(self, tmp_path):
+        """Test new content stored under a reused ICN name leaves its old links intact."""
+        repo = tmp_path / "repo"
+        first = ICNHandler(CONTRACT, CONFIG, graphics_path=repo).register_batch(
+            _graphics(tmp_path, [b"AAAA", b"BBBB", b"AAAA"])
+        )
+        (tmp_path / "new").mkdir()
+
+        [second] = ICNHandler(CONTRACT, CONFIG, graphics_path=repo).register_batch(
+            _graphics(tmp_path / "new", [b"NEWCONTENT"])
+        )
+
+        assert second.registered_path == first[0].registered_path
+        assert open(second.registered_path, "rb").read() == b"NEWCONTENT"
+        assert open(first[2].registered_path, "rb").read() == b"AAAA"
+
+    def test_invalid_entries_keep_position(self, tmp_path):
+        """Test failures are reported in place without consuming ICNs."""
+        graphics = _graphics(tmp_path, [b"x"])
+        graphics.insert(0, {"source_path": tmp_path / "missing.png", "ata_chapter": "28"})
+        handler = ICNHandler(CONTRACT, CONFIG, graphics_path=tmp_path / "repo")
+
+        missing, registered = handler.register_batch(graphics)
+
+        assert not missing.success
+        assert registered.icn == "ICN-00000-HJ1-28-G0001-A-001-01"
+
+
+class TestICNReferenceIndex:
+    """Tests for the ICN <-> DMC reference index."""
+
+    def _handler(self, tmp_path, count=3):
+        handler = ICNHandler(CONTRACT, CONFIG, graphics_path=tmp_path / "repo")
+        icns = [r.icn for r in handler.register_batch(
+            _graphics(tmp_path, [bytes([i]) for i in range(count)])
+        )]
+        return handler, icns
+
+    def test_index_data_module(self, tmp_path):
+        """Test graphic references are read from generated DM XML."""
+        handler, icns = self._handler(tmp_path)
+        xml = (
+            f'<dmodule><content><figure><graphic infoEntityIdent="{icns[0]}"/></figure>'
+            f'<figure><graphic infoEntityIdent="ICN-MISSING"/></figure></content></dmodule>'
+        )
+
+        missing = handler.index_data_module(DMC_A, xml)
+
+        assert missing == ["ICN-MISSING"]
+        assert handler.get_referencing_dms(icns[0]) == {DMC_A}
+        assert handler.get_unreferenced_icns() == {icns[1], icns[2]}
+        assert handler.get_icn(icns[0]).referenced_by == [DMC_A]
+
+    def test_incremental_update(self, tmp_path):
+        """Test re-generating a DM applies only the changed references."""
+        handler, icns = self._handler(tmp_path)
+        handler.update_dm_references(DMC_A, icns[:2])
+        handler.add_reference(icns[1], DMC_B)
+
+        added, removed = handler.references.set_dm_references(DMC_A, icns[1:])
+
+        assert (added, removed) == ({icns[2]}, {icns[0]})
+        assert handler.get_referencing_dms(icns[1]) == {DMC_A, DMC_B}
+        assert handler.get_unreferenced_icns() == {icns[0]}
+
+        handler.references.remove_dm(DMC_A)
+        assert handler.references.icns_for(DMC_B) == {icns[1]}
+        assert handler.get_unreferenced_icns() == {icns[0], icns[2]}
+
+    def test_indexed_during_generation(self, tmp_path):
+        """Test DMs generated with a handler update the index."""
+        handler, icns = self._handler(tmp_path)
+        generator = DMGenerator(CONTRACT, CONFIG, icn_handler=handler)
+        sources = [
+            {"id": "S1", "icn": icns[0], "ata_chapter": "28"},
+            {"id": "S2", "icn": "ICN-MISSING", "ata_chapter": "28", "ata_section": "2"},
+        ]
+
+        first, second = generator.generate(sources, DMType.IPD)
+
+        assert handler.get_referencing_dms(icns[0]) == {first.dm_code}
+        assert second.warnings == ["Unregistered ICN referenced: ICN-MISSING"]
+        assert handler.get_unreferenced_icns() == {icns[1], icns[2]}
+
+    def test_persisted_with_registry(self, tmp_path):
+        """Test exporting the registry saves the index as JSON."""
+        handler, icns = self._handler(tmp_path)
+        handler.update_dm_references(DMC_A, [icns[0], "ICN-MISSING"])
+
+        exported = handler.export_registry()
+        index = ICNReferenceIndex.load(tmp_path / "repo" / "icn_references.json")
+
+        assert index.to_dict() == exported["references"]
+        assert index.dangling() == {"ICN-MISSING"}
+        assert index.unreferenced() == {icns[1], icns[2]}
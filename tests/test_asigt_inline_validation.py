@@ -0,0 +1,209 @@
+"""
+Tests for ASIGT Inline Validation
+
+Tests validation of in-memory generator output (Element trees and
+GenerationResult objects) and the TransformStage validate_inline option.
+"""
+
+from datetime import datetime
+from xml.etree import ElementTree as ET
+
+from aerospacemodel.asigt.engine import (
+    ArtifactType,
+    BREXValidationResult,
+    ExecutionContext,
+    OutputArtifact,
+    SourceArtifact,
+)
+from aerospacemodel.asigt.generators import DMGenerator, GenerationResult, GeneratorConfig
+from aerospacemodel.asigt.pipeline import PipelineStageConfig, PipelineStageType, TransformStage
+from aerospacemodel.asigt.validators import (
+    BREXValidator,
+    CombinedValidator,
+    SchemaValidator,
+    ValidatorConfig,
+)
+
+S1000D_NS = "http://www.s1000d.org/S1000D_5-0"
+
+
+def _context(tmp_path) -> ExecutionContext:
+    return ExecutionContext(
+        contract_id="TEST-001",
+        contract_version="1.0",
+        baseline_id="BL-001",
+        authority_reference="TEST",
+        invocation_timestamp=datetime.now(),
+        kdb_root=tmp_path / "KDB",
+        idb_root=tmp_path / "IDB",
+        output_path=tmp_path / "output",
+        run_archive_path=tmp_path / "runs",
+    )
+
+
+def _generator_config() -> GeneratorConfig:
+    return GeneratorConfig(
+        model_ident_code="AERO",
+        organization_name="Test Org",
+        organization_cage="00000",
+    )
+
+
+class TestInMemorySchemaValidation:
+    """Tests for SchemaValidator on in-memory trees."""
+
+    def test_validate_element(self):
+        """Test an Element is validated without serialization."""
+        root = ET.Element(f"{{{S1000D_NS}}}dmodule")
+        validator = SchemaValidator(ValidatorConfig())
+
+        assert validator.validate(root) is False
+        assert validator.errors[0].artifact_id == "<in-memory>"
+
+    def test_validate_result_uses_dmc_label(self):
+        """Test GenerationResult issues are labelled with the DMC."""
+        result = GenerationResult(
+            success=True,
+            xml_element=ET.Element(f"{{{S1000D_NS}}}dmodule"),
+            dmc="AERO-A-28-00-00-00A-040A-A",
+        )
+        schema_result = SchemaValidator(ValidatorConfig()).validate_result(result)
+
+        assert schema_result.passed is False
+        assert schema_result.issues[0].artifact_id == "AERO-A-28-00-00-00A-040A-A"
+
+
+class TestInMemoryBREXValidation:
+    """Tests for BREXValidator on in-memory trees."""
+
+    def test_validate_result(self):
+        """Test a GenerationResult or root element yields a structured result."""
+        root = ET.Element(f"{{{S1000D_NS}}}dmodule")
+        validator = BREXValidator(ValidatorConfig())
+
+        from_result = validator.validate_result(GenerationResult(success=True, xml_element=root))
+        from_root = validator.validate_result(root)
+
+        assert isinstance(from_result, BREXValidationResult)
+        assert from_result == from_root
+
+    def test_validate_generation_skips_file_entry_points(self, monkeypatch):
+        """Test validate_generation uses the in-memory entry points only."""
+        validator = CombinedValidator(ValidatorConfig())
+        for child in (validator.brex_validator, validator.schema_validator):
+            monkeypatch.setattr(child, "validate_file", lambda path: 1 / 0)
+
+        result = GenerationResult(success=True, xml_element=ET.Element(f"{{{S1000D_NS}}}dmodule"))
+
+        brex_result, schema_result = validator.validate_generation(result)
+
+        assert result.brex_result is brex_result
+        assert result.schema_result is schema_result
+        assert schema_result.passed is False
+
+
+class TestGeneratorInlineValidation:
+    """Tests for DMGenerator with an attached validator."""
+
+    def test_generate_records_results(self, tmp_path):
+        """Test validation results are attached to the generation result."""
+        src_path = tmp_path / "req.yaml"
+        src_path.write_text("title: Tank\n")
+        source = SourceArtifact(
+            id="REQ-001",
+            path=src_path,
+            artifact_type=ArtifactType.REQUIREMENT,
+            content={"title": "LH2 Tank", "ata_chapter": "28"},
+        )
+        generator = DMGenerator(
+            _generator_config(), validator=CombinedValidator(ValidatorConfig())
+        )
+
+        result = generator.generate(source)
+
+        assert result.success, result.errors
+        assert result.xml_element is not None
+        assert result.validated
+        assert result.brex_result.passed
+        assert result.schema_result.passed
+
+    def test_generate_without_validator(self, tmp_path):
+        """Test no validation is performed by default."""
+        src_path = tmp_path / "req.yaml"
+        src_path.write_text("title: Tank\n")
+        source = SourceArtifact(
+            id="REQ-001",
+            path=src_path,
+            artifact_type=ArtifactType.REQUIREMENT,
+            content={"title": "LH2 Tank", "ata_chapter": "28"},
+        )
+
+        result = DMGenerator(_generator_config()).generate(source)
+
+        assert result.success
+        assert not result.validated
+
+    def test_validate_generation_flags_artifact(self, tmp_path):
+        """Test an invalid tree marks the output artifact invalid."""
+        artifact = OutputArtifact(
+            id="DM-1",
+            path=tmp_path / "dm.xml",
+            artifact_type=ArtifactType.DM_DESCRIPTIVE,
+        )
+        result = GenerationResult(
+            success=True,
+            artifact=artifact,
+            xml_element=ET.Element(f"{{{S1000D_NS}}}dmodule"),
+        )
+
+        CombinedValidator(ValidatorConfig()).validate_generation(result)
+
+        assert artifact.valid is False
+        assert "Missing required identAndStatusSection" in artifact.validation_errors
+
+
+class TestTransformInlineValidation:
+    """Tests for the TransformStage validate_inline option."""
+
+    def _sources(self):
+        return [
+            {
+                "id": "TEST-001",
+                "type": "requirement",
+                "metadata": {"ata_chapter": "28"},
+                "content": {"title": "Test Requirement", "description": "Test"},
+            }
+        ]
+
+    def test_validate_inline(self, tmp_path):
+        """Test DMs are validated while generated."""
+        config = PipelineStageConfig(
+            stage_type=PipelineStageType.TRANSFORM,
+            name="Transform",
+            description="Transform to S1000D",
+            config={"validate_inline": True},
+        )
+        stage = TransformStage(config)
+        context = _context(tmp_path)
+
+        state = {"normalized_sources": self._sources()}
+        result = stage.execute(context, state)
+
+        assert result.warnings == []
+        assert state["data_modules"][0].valid is True
+        assert stage._validator is not None
+
+    def test_disabled_by_default(self, tmp_path):
+        """Test no validator is built unless requested."""
+        config = PipelineStageConfig(
+            stage_type=PipelineStageType.TRANSFORM,
+            name="Transform",
+            description="Transform to S1000D",
+        )
+        stage = TransformStage(config)
+        context = _context(tmp_path)
+
+        stage.execute(context, {"normalized_sources": self._sources()})
+
+        assert stage.validate_inline is False
+        assert stage._validator is None
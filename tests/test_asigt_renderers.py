@@ -0,0 +1,699 @@
+"""
+Tests for ASIGT Renderers
+
+Tests element conversion, publication rendering to HTML (serial and on
+a process pool), incremental re-rendering driven by the render
+manifest, chunked PDF rendering, the shared parsed-document cache,
+content-hashed CSS/JS assets, streamed IETP archive packaging and
+deduplicated assets.
+"""
+
+import io
+import os
+import re
+import zipfile
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from aerospacemodel.asigt import renderers
+from aerospacemodel.asigt.renderers import (
+    CombinedRenderer,
+    DocumentCache,
+    HTMLRenderer,
+    IETPFormat,
+    IETPPackager,
+    PDFRenderer,
+    RendererConfig,
+    RenderManifest,
+)
+
+CONTRACT = {"id": "KITDM-CTR-TEST", "source": {"baseline": "BL-001"}}
+
+
+def _dm(title):
+    return (
+        '<dmodule><identAndStatusSection><dmAddress><dmAddressItems><dmTitle>'
+        f'<techName>{title}</techName></dmTitle></dmAddressItems></dmAddress>'
+        '</identAndStatusSection><content><description><levelledPara>'
+        f'<title>{title}</title><para>Body of {title}.</para>'
+        '</levelledPara></description></content></dmodule>'
+    )
+
+
+def _pm(systems):
+    return "<pm><content>" + "".join(
+        '<dmRef><dmRefIdent><dmCode modelIdentCode="AERO" '
+        f'systemCode="{system}" infoCode="040"/></dmRefIdent></dmRef>'
+        for system in systems
+    ) + "</content></pm>"
+
+
+def _publication(count=6):
+    # Renderer keys DM refs as modelIdentCode-systemCode-infoCode
+    dmcs = [f"AERO-{20 + i}-040" for i in range(count)]
+    pm = _pm(range(20, 20 + count))
+    return pm, dmcs, {dmc: _dm(f"Title {i}") for i, dmc in enumerate(dmcs)}
+
+
+def _with_graphics(dm, *icns):
+    graphics = "".join(f'<graphic infoEntityIdent="{icn}"/>' for icn in icns)
+    return dm.replace("<para>", "<para>" + graphics, 1)
+
+
+def _pages(output_dir):
+    # Drop the per-page generation timestamp before comparing
+    return {
+        path.name: re.sub(r'name="generated" content="[^"]*"', "", path.read_text())
+        for path in sorted(output_dir.glob("*.html"))
+    }
+
+
+class TestElementConversion:
+    """Tests for dispatch-table element converters."""
+
+    TABLE = (
+        '<table xmlns="{ns}"><title>Torque</title><tgroup cols="2">'
+        "<thead><row><entry>Item</entry><entry>Value</entry></row></thead>"
+        "<tbody><row><entry><para>Bolt &amp; nut</para></entry><entry>5 Nm</entry></row>"
+        "</tbody></tgroup></table>"
+    )
+
+    def test_table(self):
+        """Test table rows and cells convert with escaped text."""
+        renderer = HTMLRenderer(CONTRACT, {})
+
+        html = renderer._element_to_html(ET.fromstring(self.TABLE.format(ns="")), renderer.options)
+
+        assert html == (
+            '<table class="table">\n<caption>Torque</caption>\n<thead>\n<tr>'
+            "\n<th>Item</th>\n<th>Value</th>\n</tr>\n</thead>\n<tbody>\n<tr>"
+            '\n<td><p class="para">Bolt &amp; nut</p></td>\n<td>5 Nm</td>\n</tr>'
+            "\n</tbody>\n</table>"
+        )
+
+    def test_namespaced_tags_share_converters(self):
+        """Test qualified and bare tags convert alike and are cached per tag."""
+        for renderer in (HTMLRenderer(CONTRACT, {}), PDFRenderer(CONTRACT, {})):
+            bare = ET.fromstring(self.TABLE.format(ns=""))
+            qualified = ET.fromstring(self.TABLE.format(ns=renderer.S1000D_NS))
+
+            assert renderer._element_to_html(qualified, renderer.options) == (
+                renderer._element_to_html(bare, renderer.options)
+            )
+            assert renderer._dispatch[f"{{{renderer.S1000D_NS}}}table"] == (
+                renderer._dispatch["table"]
+            )
+
+    def test_unknown_element_uses_default(self):
+        """Test elements without a converter keep their text and children."""
+        renderer = HTMLRenderer(CONTRACT, {})
+        element = ET.fromstring("<custom>a<para>b</para></custom>")
+
+        assert renderer._element_to_html(element, renderer.options) == (
+            '<div class="custom">a<p class="para">b</p></div>'
+        )
+
+
+class TestHTMLRenderPM:
+    """Tests for HTMLRenderer.render_pm."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test pooled rendering writes the same pages as serial rendering."""
+        pm, dmcs, contents = _publication()
+        renderer = HTMLRenderer(CONTRACT, {})
+
+        serial = renderer.render_pm(pm, contents, tmp_path / "serial", workers=1)
+        pooled = renderer.render_pm(pm, contents, tmp_path / "pooled", workers=3)
+
+        assert serial.success and pooled.success
+        assert _pages(tmp_path / "serial") == _pages(tmp_path / "pooled")
+        assert [p.name for p in pooled.asset_files] == [p.name for p in serial.asset_files]
+        assert list(pooled.dm_timings) == dmcs
+        assert all(seconds >= 0 for seconds in pooled.dm_timings.values())
+
+    def test_navigation_and_index(self, tmp_path):
+        """Test pages link to their neighbours and the index lists DM titles."""
+        pm, dmcs, contents = _publication(3)
+
+        result = HTMLRenderer(CONTRACT, {}).render_pm(pm, contents, tmp_path)
+
+        middle = (tmp_path / f"{dmcs[1]}.html").read_text()
+        assert f'href="{dmcs[0]}.html">← Previous' in middle
+        assert f'href="{dmcs[2]}.html">Next →' in middle
+        assert "Title 2</a></li>" in result.html_data
+
+    def test_missing_and_broken_dms(self, tmp_path):
+        """Test missing and unparsable DMs are reported as warnings."""
+        pm, dmcs, contents = _publication(3)
+        del contents[dmcs[0]]
+        contents[dmcs[1]] = "<dmodule>"
+
+        result = HTMLRenderer(CONTRACT, {"workers": 2}).render_pm(pm, contents, tmp_path)
+
+        assert result.success
+        assert result.warnings[0] == f"DM content not found: {dmcs[0]}"
+        assert result.warnings[1].startswith(f"Failed to render DM {dmcs[1]}")
+        assert not (tmp_path / f"{dmcs[1]}.html").exists()
+        assert (tmp_path / f"{dmcs[2]}.html").exists()
+        assert result.to_dict()["dm_timings"].keys() == {dmcs[1], dmcs[2]}
+
+
+class TestRenderManifest:
+    """Tests for incremental re-rendering with RenderManifest."""
+
+    def _render(self, tmp_path, pm, contents, config=None):
+        manifest = RenderManifest(tmp_path / ".render-manifest.json")
+        return HTMLRenderer(CONTRACT, config or {}).render_pm(
+            pm, contents, tmp_path / "html", manifest=manifest
+        )
+
+    def test_unchanged_publication_is_reused(self, tmp_path):
+        """Test a second render with the same inputs rewrites no DM page."""
+        pm, dmcs, contents = _publication(4)
+        first = self._render(tmp_path, pm, contents)
+        pages = _pages(tmp_path / "html")
+
+        second = self._render(tmp_path, pm, contents)
+
+        assert list(first.dm_timings) == dmcs and first.unchanged_dms == []
+        assert second.dm_timings == {} and second.unchanged_dms == dmcs
+        assert _pages(tmp_path / "html") == pages
+        assert "Title 3</a></li>" in second.html_data
+        assert [p.name for p in second.asset_files] == [p.name for p in first.asset_files]
+
+    def test_changed_dm_only(self, tmp_path):
+        """Test editing one DM re-renders only that page."""
+        pm, dmcs, contents = _publication(4)
+        self._render(tmp_path, pm, contents)
+        contents[dmcs[2]] = _dm("Revised")
+
+        result = self._render(tmp_path, pm, contents)
+
+        assert list(result.dm_timings) == [dmcs[2]]
+        assert "Revised" in (tmp_path / "html" / f"{dmcs[2]}.html").read_text()
+
+    def test_inserted_dm_rerenders_neighbours(self, tmp_path):
+        """Test inserting a DM re-renders it and the pages whose navigation changed."""
+        pm, dmcs, contents = _publication(4)
+        self._render(tmp_path, pm, contents)
+        contents["AERO-99-040"] = _dm("Inserted")
+
+        result = self._render(tmp_path, _pm([20, 21, 99, 22, 23]), contents)
+
+        assert set(result.dm_timings) == {dmcs[1], "AERO-99-040", dmcs[2]}
+        assert result.unchanged_dms == [dmcs[0], dmcs[3]]
+
+    def test_removed_dm_is_deleted(self, tmp_path):
+        """Test a DM dropped from the publication loses its page."""
+        pm, dmcs, contents = _publication(3)
+        self._render(tmp_path, pm, contents)
+
+        result = self._render(tmp_path, _pm([20, 22]), contents)
+
+        assert not (tmp_path / "html" / f"{dmcs[1]}.html").exists()
+        assert set(result.dm_timings) == {dmcs[0], dmcs[2]}
+
+    def test_options_change_rerenders_all(self, tmp_path):
+        """Test renderer options are part of every page key."""
+        pm, dmcs, contents = _publication(3)
+        self._render(tmp_path, pm, contents)
+
+        result = self._render(tmp_path, pm, contents, {"primary_color": "#000000"})
+
+        assert list(result.dm_timings) == dmcs
+
+    def test_ietp_repackages_changed_dms(self, tmp_path):
+        """Test the directory packager rewrites only changed DMs."""
+        pm, dmcs, contents = _publication(3)
+        contents[dmcs[0]] = _with_graphics(contents[dmcs[0]], "ICN-AERO-00001")
+        manifest_path = tmp_path / "ietp-manifest.json"
+        IETPPackager(CONTRACT, {}).package_publication(
+            pm, contents, tmp_path / "ietp", manifest=RenderManifest(manifest_path)
+        )
+        contents[dmcs[1]] = _dm("Revised")
+
+        packager = IETPPackager(CONTRACT, {})
+        result = packager.package_publication(
+            pm, contents, tmp_path / "ietp", manifest=RenderManifest(manifest_path)
+        )
+
+        assert result.unchanged_dms == [dmcs[0], dmcs[2]]
+        assert packager._icn_refs == {"ICN-AERO-00001"}
+        assert "Revised" in (tmp_path / "ietp" / "content" / f"{dmcs[1]}.xml").read_text()
+
+
+class TestIETPArchive:
+    """Tests for streamed ZIP/CSP packaging."""
+
+    def _graphics(self, tmp_path):
+        graphics = tmp_path / "graphics"
+        (graphics / "sub").mkdir(parents=True)
+        (graphics / "ICN-AERO-00001.png").write_bytes(b"\x89PNG" + bytes(2048))
+        (graphics / "sub" / "ICN-AERO-00002.svg").write_text("<svg>" + "<g/>" * 500 + "</svg>")
+        return graphics
+
+    def test_archive_matches_directory(self, tmp_path):
+        """Test the archive holds the same entries and sizes as a directory package."""
+        pm, dmcs, contents = _publication(3)
+        contents[dmcs[0]] = _with_graphics(contents[dmcs[0]], "ICN-AERO-00001", "ICN-AERO-00002")
+        graphics = self._graphics(tmp_path)
+        packager = IETPPackager(CONTRACT, {})
+
+        directory = packager.package_publication(
+            pm, contents, tmp_path / "dir", graphics_dir=graphics
+        )
+        archive = packager.package_publication(
+            pm, contents, tmp_path / "AMM", IETPFormat.CSP, graphics_dir=graphics
+        )
+
+        assert archive.success
+        assert archive.output_path == tmp_path / "AMM.csp"
+        assert not (tmp_path / "AMM.csp.tmp").exists()
+        files = {
+            path.relative_to(tmp_path / "dir").as_posix(): path.stat().st_size
+            for path in (tmp_path / "dir").rglob("*") if path.is_file()
+        }
+        with zipfile.ZipFile(archive.output_path) as zf:
+            assert {info.filename: info.file_size for info in zf.infolist()} == files
+            assert zf.getinfo("graphics/ICN-AERO-00001.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("graphics/ICN-AERO-00002.svg").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(f"content/{dmcs[0]}.xml") == (
+                tmp_path / "dir" / "content" / f"{dmcs[0]}.xml"
+            ).read_bytes()
+        assert archive.total_size_bytes == directory.total_size_bytes == sum(files.values())
+        assert archive.icn_count == 2
+
+    def test_failure_leaves_no_archive(self, tmp_path, monkeypatch):
+        """Test a failed run removes the partial archive."""
+        pm, dmcs, contents = _publication(2)
+        packager = IETPPackager(CONTRACT, {})
+
+        def fail(writer, roots):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(packager, "_generate_xref_graph", fail)
+        result = packager.package_publication(pm, contents, tmp_path / "AMM", IETPFormat.ZIP)
+
+        assert not result.success
+        assert result.errors == ["Package error: disk full"]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestIETPAssets:
+    """Tests for referenced-only, linked asset packaging."""
+
+    def _package(self, tmp_path, graphics, config=None, name="ietp"):
+        pm, dmcs, contents = _publication(2)
+        contents[dmcs[0]] = _with_graphics(contents[dmcs[0]], "ICN-A", "ICN-B")
+        contents[dmcs[1]] = _with_graphics(contents[dmcs[1]], "ICN-C")
+        return IETPPackager(CONTRACT, config or {}).package_publication(
+            pm, contents, tmp_path / name, graphics_dir=graphics
+        )
+
+    def _graphics(self, tmp_path):
+        graphics = tmp_path / "graphics"
+        (graphics / "deep" / "er").mkdir(parents=True)
+        (graphics / "ICN-A.png").write_bytes(b"same")
+        (graphics / "deep" / "ICN-B.PNG").write_bytes(b"same")
+        (graphics / "deep" / "er" / "ICN-C.svg").write_text("<svg/>")
+        (graphics / "ICN-UNUSED.png").write_bytes(b"unused")
+        (graphics / "notes.txt").write_text("not an asset")
+        return graphics
+
+    def test_only_referenced_assets(self, tmp_path):
+        """Test only referenced ICNs are packaged, from any depth and suffix case."""
+        graphics = self._graphics(tmp_path)
+
+        result = self._package(tmp_path, graphics)
+        everything = self._package(
+            tmp_path, graphics, {"referenced_assets_only": False}, name="all"
+        )
+
+        assert result.icn_count == 3
+        assert sorted(p.name for p in (tmp_path / "ietp" / "graphics").iterdir()) == [
+            "ICN-A.png", "ICN-B.PNG", "ICN-C.svg",
+        ]
+        assert everything.icn_count == 4
+
+    def test_assets_are_hard_linked(self, tmp_path):
+        """Test assets share storage with their sources and survive repackaging."""
+        graphics = self._graphics(tmp_path)
+
+        self._package(tmp_path, graphics)
+        packaged = tmp_path / "ietp" / "graphics" / "ICN-A.png"
+        assert os.path.samefile(packaged, graphics / "ICN-A.png")
+
+        (graphics / "ICN-A.png").unlink()
+        (graphics / "ICN-A.png").write_bytes(b"changed")
+        self._package(tmp_path, graphics)
+
+        assert packaged.read_bytes() == b"changed"
+        assert (graphics / "deep" / "ICN-B.PNG").read_bytes() == b"same"
+
+    def test_identical_assets_dedup_across_devices(self, tmp_path, monkeypatch):
+        """Test identical assets link to one package copy when sources can't be linked."""
+        graphics = self._graphics(tmp_path)
+        package = tmp_path / "ietp"
+        real_link = renderers._hard_link
+        monkeypatch.setattr(
+            renderers, "_hard_link",
+            lambda source, target: package in source.parents and real_link(source, target),
+        )
+        monkeypatch.setattr(renderers, "_reflink", lambda source, target: False)
+
+        self._package(tmp_path, graphics)
+
+        a = package / "graphics" / "ICN-A.png"
+        b = package / "graphics" / "ICN-B.PNG"
+        assert not os.path.samefile(a, graphics / "ICN-A.png")
+        assert os.path.samefile(a, b)
+
+    def test_link_assets_disabled(self, tmp_path):
+        """Test link_assets=False copies assets."""
+        graphics = self._graphics(tmp_path)
+
+        self._package(tmp_path, graphics, {"link_assets": False})
+
+        packaged = tmp_path / "ietp" / "graphics" / "ICN-A.png"
+        assert packaged.read_bytes() == b"same"
+        assert not os.path.samefile(packaged, graphics / "ICN-A.png")
+
+
+class TestDocumentCache:
+    """Tests for the parsed-document cache shared across renderers."""
+
+    def test_hit_and_changed_content(self):
+        """Test equal content returns the cached tree and edited content reparses."""
+        cache = DocumentCache()
+        text = _dm("One")
+
+        first = cache.parse(text, "DM-1")
+
+        assert cache.parse("".join(text), "DM-1") is first
+        assert cache.parse(_dm("Two"), "DM-1") is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_eviction_bound(self):
+        """Test least recently used trees are evicted past max_bytes."""
+        texts = [_dm(f"Title {i}") for i in range(3)]
+        cache = DocumentCache(max_bytes=2 * len(texts[0]))
+
+        trees = [cache.parse(text, f"DM-{i}") for i, text in enumerate(texts[:2])]
+        cache.parse(texts[0], "DM-0")
+        cache.parse(texts[2], "DM-2")
+
+        assert len(cache) == 2 and cache.evictions == 1
+        assert cache.size_bytes <= cache.max_bytes
+        assert cache.parse(texts[0], "DM-0") is trees[0]
+        assert cache.parse(texts[1], "DM-1") is not trees[1]
+
+    def test_parse_error_not_cached(self):
+        """Test malformed content raises every time."""
+        cache = DocumentCache()
+
+        for _ in range(2):
+            with pytest.raises(ET.ParseError):
+                cache.parse("<dmodule>", "DM-1")
+        assert len(cache) == 0
+
+    def test_publish_parses_each_dm_once(self, tmp_path, monkeypatch):
+        """Test a combined PDF+HTML+IETP publish parses the PM and each DM once."""
+        pm, dmcs, contents = _publication(4)
+        parses = []
+        fromstring = ET.fromstring
+        monkeypatch.setattr(ET, "fromstring", lambda text: parses.append(1) or fromstring(text))
+
+        results = CombinedRenderer(CONTRACT, RendererConfig()).publish(pm, contents, tmp_path)
+
+        assert all(result.success for result in results.values())
+        assert len(parses) == 1 + len(dmcs)
+        assert (tmp_path / "html" / f"{dmcs[0]}.html").exists()
+        assert (tmp_path / "ietp" / "content" / f"{dmcs[0]}.xml").exists()
+
+
+class TestPDFChunkedRendering:
+    """Tests for chunked PDF rendering with page-number fix-up."""
+
+    @staticmethod
+    def _fake_layout(html, options, write=True):
+        # Each DM section lays out to two pages; front matter to 1 + 1 per 3 TOC
+        # entries; the footer overlay to one page per empty footer page
+        sections = html.count('class="data-module"')
+        footer_pages = html.count('class="footer-page"')
+        if footer_pages:
+            pages, anchors = footer_pages, {}
+        elif sections:
+            pages = 2 * sections
+            anchors = {m: 2 * i for i, m in enumerate(re.findall(r'<section class="data-module" id="([^"]+)"', html))}
+        else:
+            pages = 1 + (html.count('class="toc-entry"') + 2) // 3
+            anchors = {}
+        # A page that resets the counter only advances it by an explicit increment
+        reset = re.search(r"counter-reset: page (\d+);(?: counter-increment: page (\d+);)?", html)
+        first = int(reset.group(1)) + int(reset.group(2) or 0) if reset else 1
+        total = re.search(r'" of " "(\d+)"', html)
+        data = f"[{first}+{pages}/{total.group(1) if total else '?'}]"
+        return (data.encode() if write else None), pages, anchors
+
+    def _renderer(self, monkeypatch, config):
+        renderer = PDFRenderer(CONTRACT, config)
+        renderer._engine_available = True
+        merged = {}
+
+        def merge(parts, outline, options, overlay=None, overlay_start=0):
+            merged["outline"] = outline
+            merged["overlay"] = (overlay, overlay_start)
+            return b"".join(parts)
+
+        monkeypatch.setattr(renderer, "_layout_pdf", self._fake_layout)
+        monkeypatch.setattr(renderer, "_check_merge_available", lambda: None)
+        monkeypatch.setattr(renderer, "_merge_pdfs", merge)
+        return renderer, merged
+
+    def test_chapters_are_numbered_in_merged_document(self, monkeypatch):
+        """Test chunk offsets, totals, DM start pages, TOC and outline agree."""
+        refs = lambda *systems: _pm(systems)[len("<pm><content>"):-len("</content></pm>")]
+        pm = (
+            f"<pm><content><pmEntry>{refs(20, 21)}</pmEntry>"
+            f"<pmEntry>{refs(22)}</pmEntry>{refs(23, 24)}</content></pm>"
+        )
+        _, dmcs, contents = _publication(5)
+        renderer, merged = self._renderer(monkeypatch, {"chunk_by": "chapter"})
+        chunk_htmls = []
+        layout = renderer._layout_pdf
+        monkeypatch.setattr(
+            renderer, "_layout_pdf",
+            lambda html, options, write=True: (
+                chunk_htmls.append(html) if 'class="data-module"' in html else None
+            ) or layout(html, options, write),
+        )
+
+        result = renderer.render_pm(pm, contents, workers=1)
+
+        assert result.success, result.errors
+        assert result.chunk_count == 4
+        # Front matter: cover + 5 TOC entries -> 3 pages; each DM 2 pages
+        assert result.page_count == 3 + 10
+        assert result.dm_pages == {dmcs[0]: 4, dmcs[1]: 6, dmcs[2]: 8, dmcs[3]: 10, dmcs[4]: 12}
+        # Chunks are laid out once, unnumbered; the overlay numbers the body pages
+        assert len(chunk_htmls) == 4
+        assert all(renderers.PDF_NO_FOOTER_CSS in html for html in chunk_htmls)
+        assert result.pdf_data == b"[1+3/13][1+4/?][1+2/?][1+2/?][1+2/?]"
+        assert merged["overlay"] == (b"[4+10/13]", 3)
+        assert merged["outline"] == [(f"Title {i}", 3 + 2 * i) for i in range(5)]
+
+    def test_toc_and_lep_show_pages(self, monkeypatch):
+        """Test the front matter lists each DM's first page."""
+        pm, dmcs, contents = _publication(2)
+        renderer, _ = self._renderer(monkeypatch, {"chunk_by": "dm"})
+        fronts = []
+        layout = renderer._layout_pdf
+        monkeypatch.setattr(
+            renderer, "_layout_pdf",
+            lambda html, options, write=True: (
+                fronts.append(html) if 'class="toc-entry"' in html else None
+            ) or layout(html, options, write),
+        )
+
+        result = renderer.render_pm(pm, contents, workers=1)
+
+        assert result.dm_pages == {dmcs[0]: 3, dmcs[1]: 5}
+        assert 'Title 1</a><span class="toc-page">5</span>' in fronts[-1]
+        assert f"<td>{dmcs[1]}</td><td>001</td>" in fronts[-1]
+        assert fronts[-1].count("<th>Page</th>") == 1
+
+    def test_pooled_matches_serial(self):
+        """Test chunk layout on a process pool gives the serial result."""
+        pm, dmcs, contents = _publication(5)
+        del contents[dmcs[2]]
+        renderer = PDFRenderer(CONTRACT, {"chunk_by": "dm"})
+
+        serial = renderer.render_pm(pm, contents, workers=1)
+        pooled = renderer.render_pm(pm, contents, workers=3)
+
+        assert serial.success and pooled.success
+        assert pooled.dm_pages == serial.dm_pages and len(serial.dm_pages) == 4
+        assert pooled.warnings == serial.warnings == [f"DM content not found: {dmcs[2]}"]
+
+    def test_single_document_unchanged(self, monkeypatch):
+        """Test unchunked rendering lays out one document without page fix-up."""
+        pm, dmcs, contents = _publication(3)
+        renderer, _ = self._renderer(monkeypatch, {})
+
+        result = renderer.render_pm(pm, contents)
+
+        assert result.chunk_count == 0 and result.dm_pages == {}
+        assert result.page_count == 6
+        assert result.pdf_data == b"[1+6/?]"
+
+    def test_unsettled_front_matter_is_reported(self, monkeypatch):
+        """Test front matter whose length never settles is laid out last and reported."""
+        pm, _, contents = _publication(1)
+        renderer, _ = self._renderer(monkeypatch, {"chunk_by": "dm"})
+        layout = renderer._layout_pdf
+        front_totals = []
+
+        def oscillating(html, options, write=True):
+            if 'class="data-module"' in html or 'class="footer-page"' in html:
+                return layout(html, options, write)
+            total = int(re.search(r'" of " "(\d+)"', html).group(1))
+            front_totals.append(total)
+            return b"", 3 if total % 2 == 0 else 2, {}
+
+        monkeypatch.setattr(renderer, "_layout_pdf", oscillating)
+
+        result = renderer.render_pm(pm, contents, workers=1)
+
+        assert result.success
+        assert len(front_totals) == 5 and front_totals[-1] == result.page_count == 4
+        assert result.warnings == [
+            "Front matter page count did not settle (2 numbered, 3 laid out); "
+            "page numbers may be off by 1"
+        ]
+
+    def test_merge_stamps_footer_overlay(self):
+        """Test overlay pages are stamped onto the body pages only."""
+        pypdf = pytest.importorskip("pypdf")
+        from pypdf.generic import DecodedStreamObject, NameObject
+
+        def pdf(pages, stamp=b""):
+            writer = pypdf.PdfWriter()
+            for i in range(pages):
+                page = writer.add_blank_page(100, 100)
+                if stamp:
+                    contents = DecodedStreamObject()
+                    contents.set_data(b"BT (" + stamp + str(i).encode() + b") Tj ET")
+                    page[NameObject("/Contents")] = writer._add_object(contents)
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            return buffer.getvalue()
+
+        renderer = PDFRenderer(CONTRACT, {})
+        renderer._engine_available = True
+
+        merged = pypdf.PdfReader(io.BytesIO(renderer._merge_pdfs(
+            [pdf(1), pdf(2)], [], renderer.options,
+            overlay=pdf(2, b"footer "), overlay_start=1,
+        )))
+
+        assert len(merged.pages) == 3
+        assert merged.pages[0].get_contents() is None
+        for i, page in enumerate(merged.pages[1:]):
+            assert f"(footer {i}) Tj".encode() in page.get_contents().get_data()
+
+    def test_unknown_chunking(self):
+        """Test an unknown chunk_by is reported as an error."""
+        pm, _, contents = _publication(1)
+
+        result = PDFRenderer(CONTRACT, {"chunk_by": "page"}).render_pm(pm, contents)
+
+        assert not result.success
+        assert result.errors == ["PDF generation error: Unknown chunk_by: page"]
+
+
+class TestRenderAssets:
+    """Tests for memoized, content-hashed CSS and JavaScript assets."""
+
+    def test_publication_links_one_hashed_asset_per_kind(self, tmp_path, monkeypatch):
+        """Test inline_css pages share one stylesheet and script generated once."""
+        pm, dmcs, contents = _publication(4)
+        renderer = HTMLRenderer(CONTRACT, {"inline_css": True})
+        calls = []
+        generate_css = renderer._generate_css
+        monkeypatch.setattr(
+            renderer, "_generate_css", lambda options: calls.append(1) or generate_css(options)
+        )
+
+        result = renderer.render_pm(pm, contents, tmp_path / "html", workers=1)
+
+        assert result.success
+        assert len(calls) == 1
+        [css] = (tmp_path / "html").glob("styles.*.css")
+        [js] = (tmp_path / "html").glob("scripts.*.js")
+        assert css.read_text() == renderer._generate_css(renderer.options)
+        assert css.name == renderers.hashed_asset_name("styles.css", css.read_text())
+        for page in _pages(tmp_path / "html").values():
+            assert f'<link rel="stylesheet" href="{css.name}">' in page
+            assert f'<script src="{js.name}"></script>' in page
+            assert "<style>" not in page
+
+    def test_options_change_replaces_assets(self, tmp_path):
+        """Test new options write new hashed files and remove the stale ones."""
+        pm, _, contents = _publication(2)
+        HTMLRenderer(CONTRACT, {}).render_pm(pm, contents, tmp_path)
+        [old] = tmp_path.glob("styles.*.css")
+
+        HTMLRenderer(CONTRACT, {"primary_color": "#000000"}).render_pm(pm, contents, tmp_path)
+
+        [new] = tmp_path.glob("styles.*.css")
+        assert new.name != old.name
+        assert "#000000" in new.read_text()
+        assert len(list(tmp_path.glob("scripts.*.js"))) == 1
+
+    def test_single_page_assets(self, tmp_path):
+        """Test render_dm writes the files its page links, or inlines them."""
+        _, _, contents = _publication(1)
+        dm = next(iter(contents.values()))
+
+        linked = HTMLRenderer(CONTRACT, {}).render_dm(dm, tmp_path / "dm.html")
+        inline = HTMLRenderer(CONTRACT, {"inline_css": True}).render_dm(dm)
+
+        assert [p.parent for p in linked.asset_files] == [tmp_path, tmp_path]
+        for path in linked.asset_files:
+            assert path.name in linked.html_data
+        assert "<style>" in inline.html_data and "<script>" in inline.html_data
+
+    def test_pdf_css_memoized(self, monkeypatch):
+        """Test PDF CSS is generated once per options, whatever the chunk numbering."""
+        renderer = PDFRenderer(CONTRACT, {})
+        calls = []
+        generate = renderer._generate_pdf_css
+        monkeypatch.setattr(
+            renderer, "_generate_pdf_css", lambda options: calls.append(options) or generate(options)
+        )
+
+        for _ in range(3):
+            renderer._wrap_html_document("", "T", renderer.options)
+        chunks = [renderer._wrap_html_document("", "T", renderer.options, n, 10) for n in (4, 7)]
+
+        assert calls == [renderer.options]
+        assert len(renderer._assets) == 1
+        assert "counter-reset: page 4;" in chunks[0] and "counter-reset: page 7;" in chunks[1]
+        assert all('" of " "10"' in chunk for chunk in chunks)
+
+    def test_ietp_viewer_assets_are_hashed(self, tmp_path):
+        """Test the viewer links hashed CSS/JS and repackaging leaves no stale copies."""
+        pm, _, contents = _publication(2)
+        packager = IETPPackager(CONTRACT, {})
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "viewer.0123456789ab.css").write_text("old")
+
+        packager.package_publication(pm, contents, tmp_path)
+        packager.package_publication(pm, contents, tmp_path)
+
+        [css] = (tmp_path / "css").glob("viewer.*.css")
+        [js] = (tmp_path / "js").glob("viewer.*.js")
+        index = (tmp_path / "index.html").read_text()
+        assert f'href="css/{css.name}"' in index and f'src="js/{js.name}"' in index
+        assert css.name == renderers.hashed_asset_name("viewer.css", css.read_text())
@@ -0,0 +1,114 @@
+"""
+Tests for ASIGT Search Index
+
+Tests tokenization, field-weighted ranking, phrase queries, sharded
+persistence and IETP packaging of the inverted index.
+"""
+
+import json
+from xml.etree import ElementTree as ET
+
+from aerospacemodel.asigt.renderers import IETPPackager
+from aerospacemodel.asigt.search import SearchIndex, shard_of, tokenize
+
+NS = "http://www.s1000d.org/S1000D_5-0"
+
+
+def _dm(title, body="", warning="", step=""):
+    return ET.fromstring(
+        f'<dmodule xmlns="{NS}"><identAndStatusSection><dmAddress><dmAddressItems>'
+        f"<dmTitle><techName>{title}</techName></dmTitle></dmAddressItems></dmAddress>"
+        "<dmStatus><responsiblePartnerCompany><enterpriseName>Acme Pump Works"
+        "</enterpriseName></responsiblePartnerCompany></dmStatus></identAndStatusSection>"
+        f"<content><procedure><warning><warningAndCautionPara>{warning}</warningAndCautionPara>"
+        f"</warning><proceduralStep><para>{step}</para></proceduralStep>"
+        f"<para>{body}</para></procedure></content></dmodule>"
+    )
+
+
+def _index():
+    index = SearchIndex()
+    index.add_document("DM-1", _dm("Fuel boost pump", body="Remove the panel."), "content/DM-1.xml")
+    index.add_document("DM-2", _dm("Panel removal", body="Check the fuel boost pump pressure."))
+    index.add_document("DM-3", _dm("Hydraulic pump", warning="Fuel vapour hazard.", step="Vent fuel."))
+    return index
+
+
+class TestTokenize:
+    """Tests for tokenize and shard_of."""
+
+    def test_tokenize(self):
+        """Test terms are lowercased letter/digit runs without stopwords."""
+        assert tokenize("Remove the P/N ABC-123_x from Pump.") == [
+            "remove", "p", "n", "abc", "123", "x", "pump",
+        ]
+
+    def test_shard_of_is_fnv1a(self):
+        """Test the shard hash matches 32-bit FNV-1a (shared with the viewer)."""
+        assert shard_of("a", 2 ** 32) == 0xE40C292C
+        assert 0 <= shard_of("pump", 64) < 64
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_all_terms_required(self):
+        """Test only documents containing every term match."""
+        assert {h.dm_code for h in _index().search("fuel pump")} == {"DM-1", "DM-2", "DM-3"}
+        assert [h.dm_code for h in _index().search("panel pressure")] == ["DM-2"]
+        assert _index().search("acme") == []  # status section is not indexed
+
+    def test_field_weights_rank_title_first(self):
+        """Test title hits outrank warning/step hits, which outrank body hits."""
+        hits = _index().search("fuel")
+
+        assert [h.dm_code for h in hits] == ["DM-1", "DM-3", "DM-2"]
+        assert hits[0].title == "Fuel boost pump"
+        assert hits[0].path == "content/DM-1.xml"
+
+    def test_phrase(self):
+        """Test quoted queries match consecutive positions only."""
+        index = _index()
+
+        assert {h.dm_code for h in index.search('"boost pump"')} == {"DM-1", "DM-2"}
+        assert index.search('"pump boost"') == []
+        assert [h.dm_code for h in index.search('"fuel vapour"')] == ["DM-3"]
+
+    def test_write_and_load(self, tmp_path):
+        """Test sharded output loads back to the same results."""
+        index = _index()
+
+        written = index.write(tmp_path / "search", shards=4)
+        loaded = SearchIndex.load(tmp_path / "search")
+
+        assert {p.name for p in written} >= {"manifest.json", "docs.json"}
+        assert len(written) <= 6
+        assert json.loads((tmp_path / "search" / "manifest.json").read_text())["doc_count"] == 3
+        for query in ("fuel", "fuel pump", '"boost pump"', "panel"):
+            assert loaded.search(query) == index.search(query)
+
+
+class TestIETPSearchIndex:
+    """Tests for search index generation in IETPPackager."""
+
+    def test_package_writes_index(self, tmp_path):
+        """Test packaging writes the sharded index and points the viewer at it."""
+        pm = (
+            "<pm><content><dmRef><dmRefIdent><dmCode modelIdentCode=\"AERO\" "
+            'systemCode="28" infoCode="520"/></dmRefIdent></dmRef></content></pm>'
+        )
+        contents = {"AERO-28-520": ET.tostring(_dm("Fuel pump removal"), encoding="unicode")}
+
+        result = IETPPackager({"id": "CTR"}, {"search_shards": 8}).package_publication(
+            pm, contents, tmp_path / "ietp"
+        )
+
+        assert result.success
+        search_dir = tmp_path / "ietp" / "index" / "search"
+        config = json.loads((tmp_path / "ietp" / "config" / "ietp_config.json").read_text())
+        assert config["content"]["search_index"] == "index/search"
+        assert json.loads((search_dir / "manifest.json").read_text())["shards"] == 8
+        assert [h.dm_code for h in SearchIndex.load(search_dir).search("removal")] == [
+            "AERO-28-520"
+        ]
+        assert "class IETPSearch" in next((tmp_path / "ietp" / "js").glob("viewer.*.js")).read_text()
@@ -0,0 +1,143 @@
+"""
+Tests for ASIGT DM Skeleton Templates
+
+Tests skeleton resolution per DM type and info code, compile caching,
+XML escaping of slots, and TransformStage integration.
+"""
+
+from datetime import datetime
+from importlib import resources
+from pathlib import Path
+
+import pytest
+
+from aerospacemodel.asigt.engine import ArtifactType, ASIGTTransformationError, OutputArtifact
+from aerospacemodel.asigt.pipeline import PipelineStageConfig, PipelineStageType, TransformStage
+from aerospacemodel.asigt.templates import (
+    DEFAULT_SKELETON_DIR,
+    GENERIC_SKELETON,
+    SKELETON_PACKAGE,
+    SKELETON_RESOURCE,
+    DMSkeletonLibrary,
+    info_code_from_dmc,
+)
+
+DMC = "AERO-A-28-00-00-00A-040A-A"
+
+
+def _slots(**overrides):
+    slots = {
+        "dmc": DMC,
+        "issue_date": datetime(2026, 3, 1),
+        "title": "Fuel System",
+        "description": "General description.",
+        "citations": [],
+    }
+    slots.update(overrides)
+    return slots
+
+
+class TestDMSkeletonLibrary:
+    """Tests for DMSkeletonLibrary."""
+
+    def test_info_code_from_dmc(self):
+        """Test info code extraction."""
+        assert info_code_from_dmc(DMC) == "040"
+        assert info_code_from_dmc("AERO-A-28-10-00-00A-520A-A") == "520"
+        assert info_code_from_dmc("") == ""
+
+    def test_generic_skeleton(self):
+        """Test the shipped generic skeleton renders a DM."""
+        xml = DMSkeletonLibrary().render(ArtifactType.DM_DESCRIPTIVE, "040", **_slots())
+
+        assert xml.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<dmodule')
+        assert f'<dmCode dmCode="{DMC}"/>' in xml
+        assert "<techName>Fuel System</techName>" in xml
+        assert "<refs>" not in xml
+
+    def test_compiled_once_per_type_and_info_code(self):
+        """Test compiled templates are cached by (type, info code)."""
+        library = DMSkeletonLibrary()
+
+        first = library.get(ArtifactType.DM_DESCRIPTIVE, "040")
+        assert library.get("dm_descriptive", "040") is first
+
+    def test_slots_are_escaped(self):
+        """Test slot values are XML-escaped."""
+        xml = DMSkeletonLibrary().render(
+            ArtifactType.DM_DESCRIPTIVE, "040",
+            **_slots(title="Valves & <Pumps>", citations=[("CS-25", "A&B")]),
+        )
+
+        assert "<techName>Valves &amp; &lt;Pumps&gt;</techName>" in xml
+        assert "<externalPubTitle>A&amp;B</externalPubTitle>" in xml
+        assert "<para>[CS-25] A&amp;B</para>" in xml
+
+    def test_resolution_order(self, tmp_path):
+        """Test info-code skeleton beats type skeleton beats generic."""
+        (tmp_path / "dm.xml.j2").write_text("generic")
+        (tmp_path / "dm_procedural.xml.j2").write_text("procedural")
+        (tmp_path / "dm_procedural_520.xml.j2").write_text("procedural-520")
+        library = DMSkeletonLibrary(tmp_path)
+
+        assert library.render(ArtifactType.DM_PROCEDURAL, "520") == "procedural-520"
+        assert library.render(ArtifactType.DM_PROCEDURAL, "720") == "procedural"
+        assert library.render(ArtifactType.DM_DESCRIPTIVE, "040") == "generic"
+
+    def test_shipped_type_skeletons(self):
+        """Test the built-in per-type skeletons override the generic one."""
+        library = DMSkeletonLibrary()
+
+        assert library.get(ArtifactType.DM_PROCEDURAL, "040").name == "dm_procedural.xml.j2"
+        assert library.get(ArtifactType.DM_FAULT_ISOLATION, "040").name == "dm_fault_isolation.xml.j2"
+        assert library.get(ArtifactType.DM_IPD, "941").name == GENERIC_SKELETON
+
+        xml = library.render(ArtifactType.DM_PROCEDURAL, "040", **_slots())
+        assert "<infoName>Procedure</infoName>" in xml
+        assert "<proceduralStep>\n          <para>General description.</para>" in xml
+        assert "<description>" not in xml
+
+        xml = library.render(ArtifactType.DM_FAULT_ISOLATION, "040", **_slots())
+        assert "<descr>General description.</descr>" in xml
+
+    def test_default_skeletons_are_package_data(self):
+        """Test the built-in skeletons load from the installed package."""
+        template = DMSkeletonLibrary().get(ArtifactType.DM_DESCRIPTIVE, "040")
+
+        assert Path(template.filename).parent == DEFAULT_SKELETON_DIR
+        assert resources.files(SKELETON_PACKAGE).joinpath(
+            SKELETON_RESOURCE, GENERIC_SKELETON
+        ).is_file()
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing skeleton directory is reported."""
+        with pytest.raises(ASIGTTransformationError):
+            DMSkeletonLibrary(tmp_path / "missing")
+
+
+class TestTransformStageSkeletons:
+    """Tests for TransformStage use of compiled skeletons."""
+
+    def test_skeleton_dir_option(self, tmp_path):
+        """Test a project skeleton directory overrides the default."""
+        skeleton_dir = tmp_path / "skeletons"
+        skeleton_dir.mkdir()
+        (skeleton_dir / "dm.xml.j2").write_text('<dmodule dmc="${dmc}"/>\n')
+        stage = TransformStage(PipelineStageConfig(
+            stage_type=PipelineStageType.TRANSFORM,
+            name="Transform",
+            description="Transform to S1000D",
+            config={"skeleton_dir": str(skeleton_dir)},
+        ))
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        artifact = OutputArtifact(
+            id="DM-1",
+            path=output_dir / "dm.xml",
+            artifact_type=ArtifactType.DM_DESCRIPTIVE,
+            dmc=DMC,
+        )
+        stage._generate_dm_xml(artifact, {"content": {"title": "T"}})
+
+        assert artifact.path.read_text() == f'<dmodule dmc="{DMC}"/>\n'
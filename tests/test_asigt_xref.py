@@ -0,0 +1,127 @@
+"""
+Tests for ASIGT Cross-Reference Graph
+
+Tests link extraction, backlinks, dangling-reference detection,
+adjacency persistence and IETP packaging of the graph.
+"""
+
+import json
+from xml.etree import ElementTree as ET
+
+from aerospacemodel.asigt.renderers import IETPPackager
+from aerospacemodel.asigt.xref import DanglingRef, XrefGraph
+
+NS = "http://www.s1000d.org/S1000D_5-0"
+
+
+def _ref(system):
+    return (
+        '<dmRef><dmRefIdent><dmCode modelIdentCode="AERO" '
+        f'systemCode="{system}" infoCode="040"/></dmRefIdent></dmRef>'
+    )
+
+
+def _dm(system, refs=(), internal=(), ids=(), ns=""):
+    xmlns = f' xmlns="{ns}"' if ns else ""
+    return (
+        f"<dmodule{xmlns}><content><description><para>"
+        + "".join(_ref(r) for r in refs)
+        + "".join(f'<internalRef internalRefId="{i}"/>' for i in internal)
+        + "</para>"
+        + "".join(f'<figure id="{i}"/>' for i in ids)
+        + "</description></content></dmodule>"
+    )
+
+
+def _graph():
+    graph = XrefGraph()
+    graph.add_document("AERO-20-040", ET.fromstring(_dm(20, refs=[21, 22, 21, 20])), "a.xml")
+    graph.add_document("AERO-21-040", ET.fromstring(_dm(21, refs=[22, 99], ns=NS)), "b.xml")
+    graph.add_document(
+        "AERO-22-040",
+        ET.fromstring(_dm(22, internal=["fig-1", "fig-2"], ids=["fig-1"])),
+        "c.xml",
+    )
+    return graph
+
+
+class TestXrefGraph:
+    """Tests for XrefGraph."""
+
+    def test_links_and_backlinks(self):
+        """Test forward links are unique and ordered, backlinks follow package order."""
+        graph = _graph()
+
+        assert graph.links("AERO-20-040") == ["AERO-21-040", "AERO-22-040"]
+        assert graph.links("AERO-21-040") == ["AERO-22-040", "AERO-99-040"]
+        assert graph.backlinks("AERO-22-040") == ["AERO-20-040", "AERO-21-040"]
+        assert graph.backlinks("AERO-99-040") == ["AERO-21-040"]
+        assert graph.backlinks("AERO-20-040") == []
+
+    def test_dangling(self):
+        """Test unpackaged DM targets and undefined internal ids are reported."""
+        assert _graph().dangling() == [
+            DanglingRef("AERO-21-040", "AERO-99-040", "dm"),
+            DanglingRef("AERO-22-040", "fig-2", "internal"),
+        ]
+
+    def test_adjacency(self):
+        """Test packaged nodes come first and reverse lists cover dangling targets."""
+        nodes, forward, reverse = _graph().adjacency()
+
+        assert nodes == ["AERO-20-040", "AERO-21-040", "AERO-22-040", "AERO-99-040"]
+        assert forward == [[1, 2], [2, 3], []]
+        assert reverse == [[], [0], [0, 1], [1]]
+
+    def test_write_and_load(self, tmp_path):
+        """Test written adjacency loads back to the same graph."""
+        graph = _graph()
+
+        graph.write(tmp_path)
+        loaded = XrefGraph.load(tmp_path)
+
+        assert json.loads((tmp_path / "reverse.json").read_text()) == [[], [0], [0, 1], [1]]
+        assert loaded.paths == graph.paths
+        assert loaded.dangling() == graph.dangling()
+        assert loaded.backlinks("AERO-22-040") == graph.backlinks("AERO-22-040")
+
+
+class TestIETPXrefGraph:
+    """Tests for cross-reference graph generation in IETPPackager."""
+
+    def test_package_writes_graph_parsing_once(self, tmp_path, monkeypatch):
+        """Test packaging emits the graph and parses each DM only once."""
+        pm = "<pm><content>" + "".join(_ref(s) for s in (20, 21, 22)) + "</content></pm>"
+        contents = {
+            "AERO-20-040": _dm(20, refs=[21]),
+            "AERO-21-040": _dm(21, refs=[20, 77]),
+            "AERO-22-040": _dm(22, refs=[21]),
+        }
+        parses = []
+        fromstring = ET.fromstring
+        monkeypatch.setattr(ET, "fromstring", lambda text: parses.append(1) or fromstring(text))
+
+        result = IETPPackager({"id": "CTR"}, {}).package_publication(pm, contents, tmp_path)
+
+        assert result.success
+        assert len(parses) == 1 + len(contents)
+        assert result.dangling_refs == [DanglingRef("AERO-21-040", "AERO-77-040", "dm")]
+        assert result.to_dict()["dangling_refs"][0]["target"] == "AERO-77-040"
+        config = json.loads((tmp_path / "config" / "ietp_config.json").read_text())
+        assert config["content"]["xref_graph"] == "index/xref"
+        graph = XrefGraph.load(tmp_path / "index" / "xref")
+        assert graph.backlinks("AERO-21-040") == ["AERO-20-040", "AERO-22-040"]
+        assert graph.paths["AERO-20-040"] == "content/AERO-20-040.xml"
+        assert "class IETPXref" in next((tmp_path / "js").glob("viewer.*.js")).read_text()
+
+    def test_no_graph_without_resolution(self, tmp_path):
+        """Test the config only points at the graph when one is written."""
+        pm = "<pm><content>" + _ref(20) + "</content></pm>"
+        packager = IETPPackager({"id": "CTR"}, {"cross_reference_resolution": False})
+
+        result = packager.package_publication(pm, {"AERO-20-040": _dm(20)}, tmp_path)
+
+        assert result.success
+        config = json.loads((tmp_path / "config" / "ietp_config.json").read_text())
+        assert "xref_graph" not in config["content"]
+        assert not (tmp_path / "index" / "xref").exists()
@@ -0,0 +1,222 @@
+"""
+Tests for ASIT Integrity Verification
+
+Tests streaming digests, parallel verification, the mtime/size skip
+cache, progress callbacks, and integration with baseline and trace
+hash verification.
+"""
+
+import hashlib
+import os
+
+from aerospacemodel.asigt.engine import ArtifactType, OutputArtifact, SourceArtifact, TraceMatrix
+from aerospacemodel.asigt.validators import TraceValidator, ValidatorConfig
+from aerospacemodel.asit.baselines import (
+    Baseline,
+    BaselineArtifact,
+    BaselineState,
+    BaselineType,
+)
+from aerospacemodel.asit.integrity import (
+    IntegrityCache,
+    IntegrityStatus,
+    IntegrityVerifier,
+    hash_file,
+)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestHashFile:
+    """Tests for the streaming hash helper."""
+
+    def test_matches_whole_file_digest(self, tmp_path):
+        """Test chunked digest equals a whole-file digest."""
+        data = os.urandom(3 * 1024 + 17)
+        path = tmp_path / "blob.bin"
+        path.write_bytes(data)
+
+        assert hash_file(path, chunk_size=1024) == _sha256(data)
+
+    def test_empty_file(self, tmp_path):
+        """Test digest of an empty file."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+
+        assert hash_file(path) == _sha256(b"")
+
+
+class TestIntegrityVerifier:
+    """Tests for IntegrityVerifier."""
+
+    def test_verify_statuses(self, tmp_path):
+        """Test VALID, MODIFIED and MISSING outcomes."""
+        good = tmp_path / "good.txt"
+        good.write_bytes(b"good")
+        bad = tmp_path / "bad.txt"
+        bad.write_bytes(b"bad")
+
+        verifier = IntegrityVerifier(max_workers=4)
+        results = verifier.verify([
+            ("good", good, f"sha256:{_sha256(b'good')}"),
+            ("bad", bad, _sha256(b"original")),
+            ("gone", tmp_path / "gone.txt", _sha256(b"gone")),
+        ])
+
+        assert list(results) == ["good", "bad", "gone"]
+        assert results["good"].status == IntegrityStatus.VALID
+        assert results["bad"].status == IntegrityStatus.MODIFIED
+        assert results["gone"].status == IntegrityStatus.MISSING
+
+    def test_progress_callback(self, tmp_path):
+        """Test progress callback is invoked once per file."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.txt"
+            path.write_text(str(i))
+            paths.append(path)
+
+        calls = []
+        verifier = IntegrityVerifier(
+            max_workers=3,
+            progress_callback=lambda done, total, result: calls.append((done, total)),
+        )
+        verifier.hash_many(paths)
+
+        assert sorted(done for done, _ in calls) == [1, 2, 3, 4, 5]
+        assert all(total == 5 for _, total in calls)
+
+    def test_skip_cache_reuses_digest(self, tmp_path):
+        """Test unchanged files are served from the cache."""
+        path = tmp_path / "data.txt"
+        path.write_text("content")
+        verifier = IntegrityVerifier(cache=IntegrityCache())
+
+        first = verifier.hash_many([path])[path]
+        second = verifier.hash_many([path])[path]
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.computed == first.computed
+
+    def test_skip_cache_invalidated_on_change(self, tmp_path):
+        """Test a size/mtime change forces a re-read."""
+        path = tmp_path / "data.txt"
+        path.write_text("content")
+        verifier = IntegrityVerifier(cache=IntegrityCache())
+        verifier.hash_many([path])
+
+        path.write_text("changed content")
+        result = verifier.hash_many([path])[path]
+
+        assert result.cached is False
+        assert result.computed == _sha256(b"changed content")
+
+    def test_cache_persistence(self, tmp_path):
+        """Test cache round-trips through its JSON file."""
+        path = tmp_path / "data.txt"
+        path.write_text("content")
+        cache_path = tmp_path / "cache" / "integrity.json"
+
+        cache = IntegrityCache(cache_path)
+        IntegrityVerifier(cache=cache).hash_many([path])
+        cache.save()
+
+        reloaded = IntegrityCache(cache_path)
+        assert len(reloaded) == 1
+        result = IntegrityVerifier(cache=reloaded).hash_many([path])[path]
+        assert result.cached is True
+
+
+class TestBaselineVerification:
+    """Tests for Baseline.verify_integrity using the shared verifier."""
+
+    def test_verify_integrity_counts(self, tmp_path):
+        """Test per-artifact status and summary counts."""
+        (tmp_path / "a.yaml").write_text("a: 1")
+        (tmp_path / "b.yaml").write_text("b: 2")
+        artifact_a = BaselineArtifact.from_file("ART-A", tmp_path / "a.yaml", tmp_path)
+        artifact_b = BaselineArtifact.from_file("ART-B", tmp_path / "b.yaml", tmp_path)
+        (tmp_path / "b.yaml").write_text("b: 3")
+
+        baseline = Baseline(
+            id="FBL-2026-Q1-001",
+            type=BaselineType.FBL,
+            state=BaselineState.RELEASED,
+            artifacts=[artifact_a, artifact_b],
+        )
+        results = baseline.verify_integrity(tmp_path)
+
+        assert results["details"] == {"ART-A": "VALID", "ART-B": "MODIFIED"}
+        assert results["valid_count"] == 1
+        assert results["modified_count"] == 1
+        assert results["valid"] is False
+
+    def test_empty_recorded_hash_is_modified(self, tmp_path):
+        """Test an artifact without a recorded hash does not verify as valid."""
+        (tmp_path / "a.yaml").write_text("a: 1")
+        artifact = BaselineArtifact.from_file("ART-A", tmp_path / "a.yaml", tmp_path)
+        artifact.hash = ""
+
+        baseline = Baseline(
+            id="FBL-2026-Q1-002",
+            type=BaselineType.FBL,
+            state=BaselineState.RELEASED,
+            artifacts=[artifact],
+        )
+        results = baseline.verify_integrity(tmp_path)
+
+        assert results["details"] == {"ART-A": "MODIFIED"}
+        assert results["valid"] is False
+        hashed = IntegrityVerifier().hash_many([tmp_path / "a.yaml"])
+        assert hashed[tmp_path / "a.yaml"].status == IntegrityStatus.VALID
+
+
+class TestTraceFileVerification:
+    """Tests for on-disk hash checks in TraceValidator."""
+
+    def _build(self, tmp_path):
+        source_path = tmp_path / "task.yaml"
+        source_path.write_text("task: remove")
+        output_path = tmp_path / "dm.xml"
+        output_path.write_text("<dmodule/>")
+
+        source = SourceArtifact(id="SRC-1", path=source_path, artifact_type=ArtifactType.TASK)
+        source.compute_hash()
+        output = OutputArtifact(
+            id="DM-1", path=output_path, artifact_type=ArtifactType.DM_PROCEDURAL
+        )
+        output.compute_hash()
+
+        matrix = TraceMatrix(run_id="RUN-1")
+        matrix.add_link(source, output)
+        return matrix, source, output
+
+    def test_unchanged_files_pass(self, tmp_path):
+        """Test no issues when files match recorded hashes."""
+        matrix, source, output = self._build(tmp_path)
+        validator = TraceValidator(ValidatorConfig(verify_file_contents=True))
+
+        assert validator.validate(matrix, [source], [output]) is True
+        assert validator.issues == []
+
+    def test_modified_output_detected(self, tmp_path):
+        """Test on-disk modification is reported even if stored hashes agree."""
+        matrix, source, output = self._build(tmp_path)
+        output.path.write_text("<dmodule>tampered</dmodule>")
+        validator = TraceValidator(ValidatorConfig(verify_file_contents=True))
+        validator.validate(matrix, [source], [output])
+
+        issue_types = {(i.issue_type, i.artifact_id) for i in validator.issues}
+        assert ("content_hash_mismatch", "DM-1") in issue_types
+
+    def test_disabled_by_default(self, tmp_path):
+        """Test files are not re-read unless requested."""
+        matrix, source, output = self._build(tmp_path)
+        output.path.unlink()
+        validator = TraceValidator(ValidatorConfig())
+
+        validator.validate(matrix, [source], [output])
+        assert validator.issues == []